@@ -0,0 +1,36 @@
+"""
+Rebuild per-person weekly attendance timelines from the raw attendance tables.
+
+Run once after deploying the timeline table, and after changes that bypass
+model signals (bulk imports, QuerySet.update, an event's type being changed).
+
+Usage:
+    python manage.py rebuild_attendance_timelines
+    python manage.py rebuild_attendance_timelines --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.attendance.timeline import rebuild_attendance_timelines
+
+
+class Command(BaseCommand):
+    help = "Rebuild attendance timelines (AttendanceTimeline) from attendance records and cluster reports"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many timelines would be written without making changes",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be saved"))
+
+        written = rebuild_attendance_timelines(dry_run=options["dry_run"])
+
+        for source, rows in written.items():
+            self.stdout.write(f"  {source}: {rows} timeline(s)")
+        verb = "Would write" if options["dry_run"] else "Wrote"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {sum(written.values())} timeline(s)"))
@@ -0,0 +1,42 @@
+# Generated by Django 4.2.23 on 2026-10-19 11:05
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('attendance', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceTimeline',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(choices=[('SUNDAY_SERVICE', 'Sunday Service'), ('CLUSTER', 'Cluster Meeting'), ('DOCTRINAL_CLASS', 'Doctrinal Class'), ('SUNDAY_SCHOOL', 'Sunday School')], max_length=20)),
+                ('first_week', models.IntegerField(default=0)),
+                ('weeks', models.BinaryField(default=b'')),
+                ('attended_weeks', models.PositiveIntegerField(default=0)),
+                ('last_week', models.IntegerField(default=0)),
+                ('last_seen', models.DateField(blank=True, null=True)),
+                ('current_run', models.PositiveIntegerField(default=0)),
+                ('longest_streak', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_timelines', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Attendance Timeline',
+                'verbose_name_plural': 'Attendance Timelines',
+                'ordering': ('person', 'source'),
+                'indexes': [models.Index(fields=['source', 'last_week'], name='attendance__source_1065a6_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='attendancetimeline',
+            constraint=models.UniqueConstraint(fields=('person', 'source'), name='attendance_timeline_unique_person_source'),
+        ),
+    ]
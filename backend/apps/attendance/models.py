@@ -1,8 +1,14 @@
 from django.conf import settings
 from django.db import models
 
+from core.tracked_fields import TrackedFieldsMixin
+
+
+class AttendanceRecord(TrackedFieldsMixin, models.Model):
+    # Old weeks are cleared from the attendance timeline
+    # (apps/attendance/signals.py) when a record moves.
+    tracked_fields = ("event", "person", "occurrence_date")
 
-class AttendanceRecord(models.Model):
     class AttendanceStatus(models.TextChoices):
         PRESENT = "PRESENT", "Present"
         ABSENT = "ABSENT", "Absent"
@@ -48,3 +54,51 @@ class AttendanceRecord(models.Model):
             f"{self.person} - {self.event.title} "
             f"({self.occurrence_date.isoformat()})"
         )
+
+
+class AttendanceTimeline(models.Model):
+    """
+    Weekly attendance bitmap for one person and one source.
+
+    Bit ``n`` of ``weeks`` (little-endian) is set when the person attended at
+    least once in week ``first_week + n``; week numbers count Monday-start
+    weeks from ``apps.attendance.timeline.EPOCH_MONDAY``. Streak and
+    last-seen columns are recomputed whenever the bitmap changes, so reads
+    never touch the raw attendance tables (see ``apps.attendance.timeline``).
+    """
+
+    class Source(models.TextChoices):
+        SUNDAY_SERVICE = "SUNDAY_SERVICE", "Sunday Service"
+        CLUSTER = "CLUSTER", "Cluster Meeting"
+        DOCTRINAL_CLASS = "DOCTRINAL_CLASS", "Doctrinal Class"
+        SUNDAY_SCHOOL = "SUNDAY_SCHOOL", "Sunday School"
+
+    person = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="attendance_timelines",
+    )
+    source = models.CharField(max_length=20, choices=Source.choices)
+    first_week = models.IntegerField(default=0)
+    weeks = models.BinaryField(default=b"")
+    attended_weeks = models.PositiveIntegerField(default=0)
+    last_week = models.IntegerField(default=0)
+    last_seen = models.DateField(null=True, blank=True)
+    # Consecutive attended weeks ending at last_week.
+    current_run = models.PositiveIntegerField(default=0)
+    longest_streak = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("person", "source")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["person", "source"], name="attendance_timeline_unique_person_source"
+            ),
+        ]
+        indexes = [models.Index(fields=["source", "last_week"])]
+        verbose_name = "Attendance Timeline"
+        verbose_name_plural = "Attendance Timelines"
+
+    def __str__(self):
+        return f"{self.person_id} {self.source}: {self.attended_weeks} week(s)"
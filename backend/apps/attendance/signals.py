@@ -1,9 +1,24 @@
-from django.db.models.signals import post_delete, post_save
+from collections import defaultdict
+
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_delete,
+    pre_save,
+)
 from django.dispatch import receiver
 
+from apps.clusters.models import ClusterWeeklyReport
+from apps.events.models import Event
 from apps.people.models import Journey
 
-from .models import AttendanceRecord
+from .models import AttendanceRecord, AttendanceTimeline
+from .timeline import (
+    CLUSTER_ATTENDANCE_THROUGH,
+    refresh_attendance_timelines,
+    source_for_event_type,
+)
 
 
 def _build_journey_defaults(record: AttendanceRecord) -> dict:
@@ -92,3 +107,123 @@ def delete_attendance_journey(
             pass
 
 
+# --- Attendance timelines (see apps/attendance/timeline.py) ---
+
+
+def _refresh_record_timelines(entries) -> None:
+    """Refresh timelines for ``(event_type_id, person_id, day)`` entries, one call per source."""
+    touched = defaultdict(list)
+    for event_type_id, person_id, day in entries:
+        source = source_for_event_type(event_type_id)
+        if source:
+            touched[source].append((person_id, day))
+    for source, pairs in touched.items():
+        refresh_attendance_timelines(source, pairs)
+
+
+@receiver(pre_save, sender=AttendanceRecord)
+def store_attendance_record_origin(sender, instance, **kwargs):
+    """Stash where an existing record was before this save (snapshot, no query)."""
+    originals = instance.tracked_original_values()
+    instance._timeline_origin = (
+        originals if instance.pk and instance.tracked_changes(originals) else None
+    )
+
+
+@receiver(post_save, sender=AttendanceRecord)
+def refresh_timeline_on_attendance_save(sender, instance, **kwargs):
+    entries = [(instance.event.event_type_id, instance.person_id, instance.occurrence_date)]
+    origin = getattr(instance, "_timeline_origin", None)
+    if origin:
+        if origin["event"] == instance.event_id:
+            old_event_type = instance.event.event_type_id
+        else:
+            old_event_type = (
+                Event.objects.filter(pk=origin["event"])
+                .values_list("event_type_id", flat=True)
+                .first()
+            )
+        entries.append((old_event_type, origin["person"], origin["occurrence_date"]))
+    _refresh_record_timelines(entries)
+
+
+@receiver(post_delete, sender=AttendanceRecord)
+def refresh_timeline_on_attendance_delete(sender, instance, **kwargs):
+    try:
+        event_type_id = instance.event.event_type_id
+    except Event.DoesNotExist:
+        return
+    _refresh_record_timelines([(event_type_id, instance.person_id, instance.occurrence_date)])
+
+
+def _cluster_attendance_pairs(sender, instance, reverse, pk_set):
+    """``(person_id, meeting_date)`` pairs for an m2m change (``pk_set`` None = all rows)."""
+    if not reverse:
+        person_ids = pk_set
+        if person_ids is None:
+            person_ids = sender.objects.filter(clusterweeklyreport=instance).values_list(
+                "person_id", flat=True
+            )
+        return [(person_id, instance.meeting_date) for person_id in person_ids]
+    report_ids = pk_set
+    if report_ids is None:
+        report_ids = sender.objects.filter(person=instance).values_list(
+            "clusterweeklyreport_id", flat=True
+        )
+    meeting_dates = ClusterWeeklyReport.objects.filter(pk__in=list(report_ids)).values_list(
+        "meeting_date", flat=True
+    )
+    return [(instance.pk, meeting_date) for meeting_date in meeting_dates]
+
+
+@receiver(m2m_changed, sender=ClusterWeeklyReport.members_attended.through)
+@receiver(m2m_changed, sender=ClusterWeeklyReport.visitors_attended.through)
+def refresh_timeline_on_cluster_attendance(sender, instance, action, reverse, pk_set, **kwargs):
+    if action == "pre_clear":
+        instance._timeline_cleared = _cluster_attendance_pairs(sender, instance, reverse, None)
+        return
+    if action == "post_clear":
+        pairs = getattr(instance, "_timeline_cleared", [])
+    elif action in ("post_add", "post_remove") and pk_set:
+        pairs = _cluster_attendance_pairs(sender, instance, reverse, pk_set)
+    else:
+        return
+    refresh_attendance_timelines(AttendanceTimeline.Source.CLUSTER, pairs)
+
+
+def _report_attendee_ids(report) -> set:
+    attendee_ids = set()
+    for through in CLUSTER_ATTENDANCE_THROUGH:
+        attendee_ids.update(
+            through.objects.filter(clusterweeklyreport=report).values_list("person_id", flat=True)
+        )
+    return attendee_ids
+
+
+@receiver(post_save, sender=ClusterWeeklyReport)
+def refresh_timeline_on_meeting_date_change(sender, instance, created, **kwargs):
+    # _original_meeting_date is stashed by the clusters pre_save handler.
+    previous = getattr(instance, "_original_meeting_date", None)
+    if created or previous is None or previous == instance.meeting_date:
+        return
+    attendee_ids = _report_attendee_ids(instance)
+    refresh_attendance_timelines(
+        AttendanceTimeline.Source.CLUSTER,
+        [(person_id, day) for person_id in attendee_ids for day in (previous, instance.meeting_date)],
+    )
+
+
+@receiver(pre_delete, sender=ClusterWeeklyReport)
+def store_report_attendees(sender, instance, **kwargs):
+    instance._timeline_attendee_ids = _report_attendee_ids(instance)
+
+
+@receiver(post_delete, sender=ClusterWeeklyReport)
+def refresh_timeline_on_report_delete(sender, instance, **kwargs):
+    refresh_attendance_timelines(
+        AttendanceTimeline.Source.CLUSTER,
+        [
+            (person_id, instance.meeting_date)
+            for person_id in getattr(instance, "_timeline_attendee_ids", ())
+        ],
+    )
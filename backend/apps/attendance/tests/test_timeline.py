@@ -0,0 +1,205 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.attendance.models import AttendanceRecord, AttendanceTimeline
+from apps.attendance.timeline import week_index
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.events.models import Event
+from apps.people.models import Branch, Person
+
+Source = AttendanceTimeline.Source
+# Consecutive Sundays (the last day of each Monday-start week).
+SUNDAYS = [date(2025, 1, 5) + timedelta(weeks=n) for n in range(8)]
+
+
+class AttendanceTimelineTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Timeline Branch", code="TIME")
+        start = timezone.make_aware(datetime(2025, 1, 5, 9))
+        self.service = Event.objects.create(
+            title="Sunday Service",
+            start_date=start,
+            end_date=start + timedelta(hours=2),
+            event_type_id="SUNDAY_SERVICE",
+        )
+        self.person = self._person("regular")
+
+    def _person(self, username, role="MEMBER"):
+        return Person.objects.create_user(
+            username=username,
+            password="x",
+            first_name=username.title(),
+            last_name="Timeline",
+            role=role,
+            branch=self.branch,
+        )
+
+    def _attend(self, person, *days):
+        return [
+            AttendanceRecord.objects.create(event=self.service, person=person, occurrence_date=day)
+            for day in days
+        ]
+
+    def _timeline(self, person=None, source=Source.SUNDAY_SERVICE):
+        return AttendanceTimeline.objects.get(person=person or self.person, source=source)
+
+    def test_streaks_follow_record_changes(self):
+        records = self._attend(self.person, *SUNDAYS[0:3], *SUNDAYS[4:6])
+
+        timeline = self._timeline()
+        self.assertEqual(timeline.attended_weeks, 5)
+        self.assertEqual(timeline.longest_streak, 3)
+        self.assertEqual(timeline.current_run, 2)
+        self.assertEqual(timeline.last_seen, SUNDAYS[5])
+
+        records[1].delete()
+        self.assertEqual(self._timeline().longest_streak, 2)
+
+        # The last week drops out, so last_seen falls back to the week before.
+        records[4].status = AttendanceRecord.AttendanceStatus.ABSENT
+        records[4].save()
+        timeline = self._timeline()
+        self.assertEqual(timeline.last_seen, SUNDAYS[4])
+        self.assertEqual(timeline.current_run, 1)
+
+        # Moving a record clears its old week and sets the new one.
+        records[0].occurrence_date = SUNDAYS[3]
+        records[0].save()
+        timeline = self._timeline()
+        self.assertEqual(timeline.first_week, week_index(SUNDAYS[2]))
+        self.assertEqual(timeline.longest_streak, 3)
+
+        for record in records[:1] + records[2:]:
+            record.delete()
+        self.assertFalse(AttendanceTimeline.objects.exists())
+
+    def test_cluster_reports_feed_the_cluster_timeline(self):
+        visitor = self._person("visitor", role="VISITOR")
+        cluster = Cluster.objects.create(code="TL-1", name="Timeline Cluster", branch=self.branch)
+        reports = [
+            ClusterWeeklyReport.objects.create(
+                cluster=cluster,
+                year=2025,
+                week_number=day.isocalendar()[1],
+                meeting_date=day - timedelta(days=4),
+                gathering_type="PHYSICAL",
+            )
+            for day in SUNDAYS[:2]
+        ]
+        for report in reports:
+            report.members_attended.add(self.person)
+        reports[0].visitors_attended.add(visitor)
+
+        self.assertEqual(self._timeline(source=Source.CLUSTER).longest_streak, 2)
+        self.assertEqual(self._timeline(visitor, Source.CLUSTER).attended_weeks, 1)
+
+        reports[1].meeting_date = SUNDAYS[3]
+        reports[1].save()
+        timeline = self._timeline(source=Source.CLUSTER)
+        self.assertEqual(timeline.longest_streak, 1)
+        self.assertEqual(timeline.last_seen, SUNDAYS[3])
+
+        reports[0].members_attended.clear()
+        self.assertEqual(self._timeline(source=Source.CLUSTER).attended_weeks, 1)
+
+        reports[1].delete()
+        self.assertFalse(
+            AttendanceTimeline.objects.filter(person=self.person, source=Source.CLUSTER).exists()
+        )
+
+    def test_history_endpoint_respects_profile_scope(self):
+        self._attend(self.person, *SUNDAYS[:3])
+        outsider = self._person("outsider")
+        client = APIClient()
+        client.force_authenticate(user=self.person)
+
+        response = client.get(
+            f"/api/attendance/people/{self.person.pk}/history/",
+            {"as_of": "2025-01-21", "weeks": 4},
+        )
+        self.assertEqual(response.status_code, 200)
+        sunday = next(row for row in response.data["sources"] if row["source"] == Source.SUNDAY_SERVICE)
+        # The running week has no attendance yet, so the streak still counts.
+        self.assertEqual(sunday["current_streak"], 3)
+        self.assertEqual(sunday["last_seen"], "2025-01-19")
+        self.assertEqual(sunday["days_since_last_seen"], 2)
+        self.assertEqual(sunday["rates"]["4"], 100.0)
+        self.assertEqual(
+            [week["attended"] for week in sunday["recent_weeks"]], [True, True, True, False]
+        )
+        self.assertEqual(len(response.data["sources"]), len(Source.values))
+
+        stale = client.get(
+            f"/api/attendance/people/{self.person.pk}/history/", {"as_of": "2025-02-05"}
+        )
+        sunday = next(row for row in stale.data["sources"] if row["source"] == Source.SUNDAY_SERVICE)
+        self.assertEqual(sunday["current_streak"], 0)
+
+        self.assertEqual(
+            client.get(f"/api/attendance/people/{outsider.pk}/history/").status_code, 404
+        )
+
+    def test_frequently_absent_scans_bitmaps(self):
+        sporadic = self._person("sporadic")
+        lapsed = self._person("lapsed")
+        newcomer = self._person("newcomer")
+        self._attend(self.person, *SUNDAYS)
+        self._attend(sporadic, SUNDAYS[0], SUNDAYS[7])
+        self._attend(lapsed, SUNDAYS[0], SUNDAYS[1])
+        self._attend(newcomer, SUNDAYS[6], SUNDAYS[7])
+        admin = self._person("admin", role="ADMIN")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+        params = {"source": "SUNDAY_SERVICE", "as_of": "2025-02-25", "weeks": 8}
+
+        with self.assertNumQueries(1):
+            response = client.get("/api/attendance/frequently-absent/", params)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [row["person_id"] for row in response.data["results"]], [lapsed.pk, sporadic.pk]
+        )
+        self.assertEqual(response.data["results"][0]["missed_rate"], 75.0)
+        self.assertEqual(response.data["results"][0]["eligible_weeks"], 8)
+
+        response = client.get("/api/attendance/frequently-absent/", {**params, "threshold": 80})
+        self.assertEqual(response.data["count"], 0)
+        self.assertEqual(
+            client.get("/api/attendance/frequently-absent/", {"source": "NOPE"}).status_code, 400
+        )
+
+    def test_rebuild_command_matches_incremental_timelines(self):
+        self._attend(self.person, *SUNDAYS[0:2], SUNDAYS[5])
+        self._attend(self._person("other"), SUNDAYS[3])
+        fields = (
+            "person_id",
+            "source",
+            "first_week",
+            "weeks",
+            "attended_weeks",
+            "last_week",
+            "last_seen",
+            "current_run",
+            "longest_streak",
+        )
+
+        def snapshot():
+            return [
+                tuple(bytes(value) if isinstance(value, memoryview) else value for value in row)
+                for row in AttendanceTimeline.objects.order_by("person_id", "source").values_list(*fields)
+            ]
+
+        incremental = snapshot()
+        AttendanceTimeline.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_attendance_timelines", "--dry-run", stdout=out)
+        self.assertIn("Would write 2 timeline(s)", out.getvalue())
+        self.assertFalse(AttendanceTimeline.objects.exists())
+
+        call_command("rebuild_attendance_timelines", stdout=StringIO())
+        self.assertEqual(snapshot(), incremental)
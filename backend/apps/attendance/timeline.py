@@ -0,0 +1,444 @@
+"""
+Per-person weekly attendance timelines (``AttendanceTimeline``).
+
+Every person gets one bitmap per source, with one bit per Monday-start week
+in which they attended at least once:
+
+- Sunday service, doctrinal class, Sunday school: PRESENT ``AttendanceRecord``
+  rows on events of that type, dated by ``occurrence_date``.
+- Cluster: ``ClusterWeeklyReport.members_attended`` / ``visitors_attended``,
+  dated by the report's ``meeting_date``.
+
+The handlers in ``apps/attendance/signals.py`` pass the (person, day) pairs a
+change touched to :func:`refresh_attendance_timelines`. That function re-reads
+only those weeks from the raw tables and rewrites the affected bitmaps along
+with their streak and last-seen columns. Current streak, longest streak,
+last seen and rolling rates are then read from a single row.
+
+Changes that bypass model signals are not picked up. These include
+``bulk_create``, ``QuerySet.update`` and a change to an event's type. Run
+``python manage.py rebuild_attendance_timelines`` after such changes and
+once when the timeline table is first deployed.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from apps.clusters.models import ClusterWeeklyReport
+
+from .models import AttendanceRecord, AttendanceTimeline
+
+Source = AttendanceTimeline.Source
+
+# Week 0 starts on this Monday; week numbers may be negative before it.
+EPOCH_MONDAY = date(2000, 1, 3)
+
+EVENT_TYPE_SOURCES = {
+    "SUNDAY_SERVICE": Source.SUNDAY_SERVICE,
+    "DOCTRINAL_CLASS": Source.DOCTRINAL_CLASS,
+    "SUNDAY_SCHOOL": Source.SUNDAY_SCHOOL,
+}
+SOURCE_EVENT_TYPES = {source: event_type for event_type, source in EVENT_TYPE_SOURCES.items()}
+
+CLUSTER_ATTENDANCE_THROUGH = (
+    ClusterWeeklyReport.members_attended.through,
+    ClusterWeeklyReport.visitors_attended.through,
+)
+
+# Rolling windows (in weeks) reported by attendance_history().
+RATE_WINDOWS = (4, 12, 52)
+
+BITMAP_FIELDS = [
+    "first_week",
+    "weeks",
+    "attended_weeks",
+    "last_week",
+    "last_seen",
+    "current_run",
+    "longest_streak",
+    "updated_at",
+]
+
+
+def week_index(day: date) -> int:
+    return (day - EPOCH_MONDAY).days // 7
+
+
+def week_start(week: int) -> date:
+    return EPOCH_MONDAY + timedelta(weeks=week)
+
+
+def source_for_event_type(event_type_id) -> Optional[str]:
+    return EVENT_TYPE_SOURCES.get(event_type_id)
+
+
+def _as_date(value) -> Optional[date]:
+    """Dates may still be strings on instances saved with raw input."""
+    if value is None or isinstance(value, date):
+        return value
+    return parse_date(str(value))
+
+
+def attended_days(
+    source: str,
+    *,
+    person_ids: Optional[Iterable[int]] = None,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    using: str = "default",
+) -> Iterator[Tuple[int, date]]:
+    """Yield ``(person_id, day)`` for every attendance of ``source`` (``end`` exclusive)."""
+    if source == Source.CLUSTER:
+        querysets = [
+            (through.objects.all(), "clusterweeklyreport__meeting_date")
+            for through in CLUSTER_ATTENDANCE_THROUGH
+        ]
+    else:
+        querysets = [
+            (
+                AttendanceRecord.objects.filter(
+                    event__event_type_id=SOURCE_EVENT_TYPES[source],
+                    status=AttendanceRecord.AttendanceStatus.PRESENT,
+                ),
+                "occurrence_date",
+            )
+        ]
+    for queryset, date_field in querysets:
+        queryset = queryset.using(using)
+        if person_ids is not None:
+            queryset = queryset.filter(person_id__in=list(person_ids))
+        if start is not None:
+            queryset = queryset.filter(**{f"{date_field}__gte": start})
+        if end is not None:
+            queryset = queryset.filter(**{f"{date_field}__lt": end})
+        yield from queryset.order_by().values_list("person_id", date_field).iterator()
+
+
+def decode_weeks(weeks) -> int:
+    # BinaryField values come back as bytes or memoryview depending on the backend.
+    return int.from_bytes(bytes(weeks or b""), "little")
+
+
+def _longest_run(bits: int) -> int:
+    longest = 0
+    while bits:
+        bits &= bits >> 1
+        longest += 1
+    return longest
+
+
+def _trailing_run(bits: int) -> int:
+    """Length of the run of set bits ending at the highest set bit."""
+    width = bits.bit_length()
+    gaps = ~bits & ((1 << width) - 1)
+    return width - gaps.bit_length()
+
+
+def _store_bitmap(timeline: AttendanceTimeline, first_week: int, bits: int) -> None:
+    """Normalize ``bits`` (bit 0 = first attended week) and recompute the cached columns."""
+    shift = (bits & -bits).bit_length() - 1
+    bits >>= shift
+    timeline.first_week = first_week + shift
+    timeline.weeks = bits.to_bytes((bits.bit_length() + 7) // 8, "little")
+    timeline.attended_weeks = bits.bit_count()
+    timeline.last_week = timeline.first_week + bits.bit_length() - 1
+    timeline.current_run = _trailing_run(bits)
+    timeline.longest_streak = _longest_run(bits)
+    timeline.updated_at = timezone.now()
+
+
+def _attended(first_week: int, bits: int, week: int) -> bool:
+    return week >= first_week and bool((bits >> (week - first_week)) & 1)
+
+
+def current_streak(first_week: int, bits: int, last_week: int, current_run: int, as_of: date) -> int:
+    """
+    Consecutive attended weeks up to ``as_of``.
+
+    The running week still counts until it is over, so a streak ending last
+    week is current.
+    """
+    this_week = week_index(as_of)
+    if last_week in (this_week, this_week - 1):
+        return current_run
+    if last_week < this_week:
+        return 0
+    # Attendance recorded after as_of (a past as_of): count back through the bitmap.
+    week = this_week if _attended(first_week, bits, this_week) else this_week - 1
+    streak = 0
+    while _attended(first_week, bits, week):
+        streak += 1
+        week -= 1
+    return streak
+
+
+def attendance_window(first_week: int, bits: int, as_of: date, weeks: int) -> Tuple[int, int]:
+    """
+    ``(attended, eligible)`` weeks over the last ``weeks`` weeks.
+
+    The window ends with the running week only if it was already attended,
+    and never starts before the person's first attended week.
+    """
+    end = week_index(as_of)
+    if not _attended(first_week, bits, end):
+        end -= 1
+    start = max(end - weeks + 1, first_week)
+    if end < start:
+        return 0, 0
+    window = (bits >> (start - first_week)) & ((1 << (end - start + 1)) - 1)
+    return window.bit_count(), end - start + 1
+
+
+def _rate(attended: int, eligible: int) -> Optional[float]:
+    return round(attended * 100 / eligible, 1) if eligible else None
+
+
+@transaction.atomic
+def refresh_attendance_timelines(source: str, touched: Iterable[Tuple[int, object]]) -> int:
+    """
+    Re-read the weeks of ``touched`` ``(person_id, day)`` pairs and update bitmaps.
+
+    Costs one raw read per source table plus one load and at most three writes,
+    however many people are touched. Returns the number of timelines written.
+    """
+    weeks_by_person: Dict[int, set] = defaultdict(set)
+    for person_id, day in touched:
+        day = _as_date(day)
+        if person_id and day:
+            weeks_by_person[person_id].add(week_index(day))
+    if not weeks_by_person:
+        return 0
+
+    touched_weeks = set().union(*weeks_by_person.values())
+    latest: Dict[Tuple[int, int], date] = {}
+    for person_id, day in attended_days(
+        source,
+        person_ids=weeks_by_person,
+        start=week_start(min(touched_weeks)),
+        end=week_start(max(touched_weeks) + 1),
+    ):
+        key = (person_id, week_index(day))
+        if key[1] in weeks_by_person[person_id] and (key not in latest or day > latest[key]):
+            latest[key] = day
+
+    existing = {
+        timeline.person_id: timeline
+        for timeline in AttendanceTimeline.objects.filter(
+            source=source, person_id__in=list(weeks_by_person)
+        )
+    }
+    created: List[AttendanceTimeline] = []
+    updated: List[AttendanceTimeline] = []
+    emptied: List[int] = []
+    for person_id, weeks in weeks_by_person.items():
+        timeline = existing.get(person_id) or AttendanceTimeline(person_id=person_id, source=source)
+        bits = decode_weeks(timeline.weeks) if timeline.pk else 0
+        first_week = timeline.first_week
+        previous_last_week = timeline.last_week if bits else None
+
+        attended = {week for week in weeks if (person_id, week) in latest}
+        if attended:
+            low = min(attended)
+            if not bits:
+                first_week = low
+            elif low < first_week:
+                bits <<= first_week - low
+                first_week = low
+        for week in weeks:
+            if week < first_week:
+                continue
+            mask = 1 << (week - first_week)
+            bits = bits | mask if week in attended else bits & ~mask
+
+        if not bits:
+            if timeline.pk:
+                emptied.append(timeline.pk)
+            continue
+        _store_bitmap(timeline, first_week, bits)
+        if timeline.last_week in weeks:
+            timeline.last_seen = latest[(person_id, timeline.last_week)]
+        elif timeline.last_week != previous_last_week:
+            # The last attended week moved back to a week this change did not read.
+            timeline.last_seen = max(
+                (
+                    day
+                    for _, day in attended_days(
+                        source,
+                        person_ids=[person_id],
+                        start=week_start(timeline.last_week),
+                        end=week_start(timeline.last_week + 1),
+                    )
+                ),
+                default=None,
+            )
+        (updated if timeline.pk else created).append(timeline)
+
+    if emptied:
+        AttendanceTimeline.objects.filter(pk__in=emptied).delete()
+    if created:
+        AttendanceTimeline.objects.bulk_create(created)
+    if updated:
+        AttendanceTimeline.objects.bulk_update(updated, BITMAP_FIELDS)
+    return len(created) + len(updated) + len(emptied)
+
+
+def rebuild_attendance_timelines(*, dry_run: bool = False, using: str = "default") -> Dict[str, int]:
+    """Rebuild every timeline from the raw tables; returns timelines per source."""
+    with transaction.atomic(using=using):
+        return _rebuild_attendance_timelines(dry_run=dry_run, using=using)
+
+
+def _rebuild_attendance_timelines(*, dry_run: bool, using: str) -> Dict[str, int]:
+    written = {}
+    timelines = AttendanceTimeline.objects.using(using)
+    for source in Source.values:
+        latest: Dict[int, Dict[int, date]] = defaultdict(dict)
+        for person_id, day in attended_days(source, using=using):
+            week = week_index(day)
+            days = latest[person_id]
+            if week not in days or day > days[week]:
+                days[week] = day
+
+        rows = []
+        for person_id, days in latest.items():
+            first_week = min(days)
+            bits = 0
+            for week in days:
+                bits |= 1 << (week - first_week)
+            timeline = AttendanceTimeline(person_id=person_id, source=source)
+            _store_bitmap(timeline, first_week, bits)
+            timeline.last_seen = days[timeline.last_week]
+            rows.append(timeline)
+        written[source] = len(rows)
+        if dry_run:
+            continue
+        timelines.filter(source=source).delete()
+        timelines.bulk_create(rows, batch_size=1000)
+    return written
+
+
+def _source_summary(source: str, row: Optional[dict], *, as_of: date, weeks: int) -> dict:
+    this_week = week_index(as_of)
+    if row is None:
+        return {
+            "source": source,
+            "label": Source(source).label,
+            "attended_weeks": 0,
+            "first_seen_week": None,
+            "last_seen": None,
+            "days_since_last_seen": None,
+            "current_streak": 0,
+            "longest_streak": 0,
+            "rates": {str(window): None for window in RATE_WINDOWS},
+            "recent_weeks": [
+                {"week_start": week_start(week).isoformat(), "attended": False}
+                for week in range(this_week - weeks + 1, this_week + 1)
+            ],
+        }
+    first_week = row["first_week"]
+    bits = decode_weeks(row["weeks"])
+    last_seen = row["last_seen"]
+    return {
+        "source": source,
+        "label": Source(source).label,
+        "attended_weeks": row["attended_weeks"],
+        "first_seen_week": week_start(first_week).isoformat(),
+        "last_seen": last_seen.isoformat() if last_seen else None,
+        "days_since_last_seen": (as_of - last_seen).days if last_seen else None,
+        "current_streak": current_streak(
+            first_week, bits, row["last_week"], row["current_run"], as_of
+        ),
+        "longest_streak": row["longest_streak"],
+        "rates": {
+            str(window): _rate(*attendance_window(first_week, bits, as_of, window))
+            for window in RATE_WINDOWS
+        },
+        "recent_weeks": [
+            {
+                "week_start": week_start(week).isoformat(),
+                "attended": _attended(first_week, bits, week),
+            }
+            for week in range(this_week - weeks + 1, this_week + 1)
+        ],
+    }
+
+
+TIMELINE_VALUES = (
+    "person_id",
+    "source",
+    "first_week",
+    "weeks",
+    "attended_weeks",
+    "last_week",
+    "last_seen",
+    "current_run",
+    "longest_streak",
+)
+
+
+def attendance_history(person_id: int, *, as_of: date, weeks: int = 12) -> dict:
+    """Streaks, last seen, rolling rates and the last ``weeks`` weeks per source (one query)."""
+    rows = {
+        row["source"]: row
+        for row in AttendanceTimeline.objects.filter(person_id=person_id).values(*TIMELINE_VALUES)
+    }
+    return {
+        "person_id": person_id,
+        "as_of": as_of.isoformat(),
+        "weeks": weeks,
+        "sources": [
+            _source_summary(source, rows.get(source), as_of=as_of, weeks=weeks)
+            for source in Source.values
+        ],
+    }
+
+
+def find_frequently_absent(
+    timelines, *, as_of: date, weeks: int = 12, min_missed_rate: float = 30
+) -> List[dict]:
+    """
+    People in ``timelines`` (one source) who missed at least ``min_missed_rate``
+    percent of their eligible weeks in the window, most absent first.
+
+    Scans the bitmaps only; people with no attendance for the source at all
+    have no timeline and are not listed.
+    """
+    results = []
+    for row in timelines.order_by().values(
+        *TIMELINE_VALUES, "person__first_name", "person__last_name"
+    ):
+        first_week = row["first_week"]
+        bits = decode_weeks(row["weeks"])
+        attended, eligible = attendance_window(first_week, bits, as_of, weeks)
+        if not eligible:
+            continue
+        missed_rate = round((eligible - attended) * 100 / eligible, 1)
+        if missed_rate < min_missed_rate:
+            continue
+        last_seen = row["last_seen"]
+        results.append(
+            {
+                "person_id": row["person_id"],
+                "name": f"{row['person__first_name']} {row['person__last_name']}".strip(),
+                "attended_weeks": attended,
+                "eligible_weeks": eligible,
+                "missed_rate": missed_rate,
+                "current_streak": current_streak(
+                    first_week, bits, row["last_week"], row["current_run"], as_of
+                ),
+                "longest_streak": row["longest_streak"],
+                "last_seen": last_seen.isoformat() if last_seen else None,
+                "days_since_last_seen": (as_of - last_seen).days if last_seen else None,
+            }
+        )
+    results.sort(
+        key=lambda item: (-item["missed_rate"], item["last_seen"] or "", item["person_id"])
+    )
+    return results
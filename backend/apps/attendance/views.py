@@ -10,9 +10,44 @@ from apps.authentication.permissions import (
     IsMemberOrAbove,
     IsAuthenticatedAndNotVisitor,
 )
+from apps.people.models import Person
+from apps.people.visibility import people_scope
+from core.datetime_utils import church_today
 
-from .models import AttendanceRecord
+from .models import AttendanceRecord, AttendanceTimeline
 from .serializers import AttendanceRecordSerializer
+from .timeline import attendance_history, find_frequently_absent
+
+MAX_TIMELINE_WEEKS = 260
+
+
+def _as_of_param(request):
+    value = request.query_params.get("as_of")
+    if not value:
+        return church_today(), None
+    parsed = parse_date(value)
+    if parsed is None:
+        return None, Response(
+            {"as_of": ["Invalid date format. Use YYYY-MM-DD."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return parsed, None
+
+
+def _int_param(request, name, default, minimum, maximum):
+    value = request.query_params.get(name)
+    if not value:
+        return default, None
+    try:
+        parsed = int(value)
+    except (TypeError, ValueError):
+        parsed = None
+    if parsed is None or not minimum <= parsed <= maximum:
+        return None, Response(
+            {name: [f"Must be an integer between {minimum} and {maximum}."]},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return parsed, None
 
 
 class AttendanceRecordViewSet(viewsets.ModelViewSet):
@@ -50,3 +85,59 @@ class AttendanceRecordViewSet(viewsets.ModelViewSet):
             queryset, many=True, context={"request": request}
         )
         return Response(serializer.data)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"people/(?P<person_id>\d+)/history",
+    )
+    def person_history(self, request, person_id=None):
+        """Per-source streaks, last seen, rolling rates and recent weeks for one person."""
+        people = Person.objects.all()
+        if str(request.user.pk) != person_id:
+            people = people_scope(request.user, for_profile=True).filter(people, request.user)
+        person = get_object_or_404(people, pk=person_id)
+        as_of, error = _as_of_param(request)
+        if error:
+            return error
+        weeks, error = _int_param(request, "weeks", 12, 1, MAX_TIMELINE_WEEKS)
+        if error:
+            return error
+        return Response(attendance_history(person.pk, as_of=as_of, weeks=weeks))
+
+    @action(detail=False, methods=["get"], url_path="frequently-absent")
+    def frequently_absent(self, request):
+        """People in the viewer's profile scope who missed ``threshold``% of recent weeks."""
+        source = request.query_params.get("source") or AttendanceTimeline.Source.SUNDAY_SERVICE
+        if source not in AttendanceTimeline.Source.values:
+            return Response(
+                {"source": [f"Must be one of: {', '.join(AttendanceTimeline.Source.values)}."]},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        as_of, error = _as_of_param(request)
+        if error:
+            return error
+        weeks, error = _int_param(request, "weeks", 12, 1, MAX_TIMELINE_WEEKS)
+        if error:
+            return error
+        threshold, error = _int_param(request, "threshold", 30, 0, 100)
+        if error:
+            return error
+        timelines = people_scope(request.user, for_profile=True).filter(
+            AttendanceTimeline.objects.filter(source=source),
+            request.user,
+            person_field="person",
+        )
+        results = find_frequently_absent(
+            timelines, as_of=as_of, weeks=weeks, min_missed_rate=threshold
+        )
+        return Response(
+            {
+                "source": source,
+                "as_of": as_of.isoformat(),
+                "weeks": weeks,
+                "threshold": threshold,
+                "count": len(results),
+                "results": results,
+            }
+        )
@@ -52,5 +52,10 @@ urlpatterns = [
         views.admin_dashboard_stats_view,
         name="admin_dashboard_stats",
     ),
+    path(
+        "admin/request-metrics/",
+        views.admin_request_metrics_view,
+        name="admin_request_metrics",
+    ),
 ]
 
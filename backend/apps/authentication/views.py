@@ -670,6 +670,34 @@ def admin_dashboard_stats_view(request):
     )
 
 
+@api_view(["GET", "DELETE"])
+@permission_classes([IsAdmin])
+def admin_request_metrics_view(request):
+    """
+    Per-route latency and query-count percentiles collected by
+    RequestMetricsMiddleware in this worker process (admin only).
+    DELETE clears the collected samples.
+    """
+    from django.conf import settings
+    from core.request_metrics import registry
+
+    if request.method == "DELETE":
+        registry.reset()
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    snapshot = registry.snapshot()
+    try:
+        limit = int(request.query_params.get("limit", 25))
+    except (TypeError, ValueError):
+        return Response(
+            {"error": "limit must be an integer."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    snapshot["routes"] = snapshot["routes"][: max(limit, 0)]
+    snapshot["enabled"] = getattr(settings, "REQUEST_METRICS_ENABLED", False)
+    return Response(snapshot, status=status.HTTP_200_OK)
+
+
 @api_view(["POST"])
 @permission_classes([IsAdmin])
 def unlock_account_view(request, user_id):
@@ -1,7 +1,12 @@
 from django.db import models
 
+from core.tracked_fields import TrackedFieldsMixin
+
+
+class Cluster(TrackedFieldsMixin, models.Model):
+    # Compared by the coordinator ModuleCoordinator sync (apps/clusters/signals.py).
+    tracked_fields = ("coordinator",)
 
-class Cluster(models.Model):
     code = models.CharField(max_length=100, unique=True, null=True)
     name = models.CharField(max_length=100, null=True)
     coordinator = models.ForeignKey(
@@ -38,7 +43,13 @@ class Cluster(models.Model):
         ]
 
 
-class ClusterWeeklyReport(models.Model):
+class ClusterWeeklyReport(TrackedFieldsMixin, models.Model):
+    # Stashed by apps/clusters/signals.py. A meeting date change refreshes
+    # attendees' old weeks in the attendance timeline (apps/attendance/signals.py);
+    # a cluster, year or week change re-keys the weekly tally
+    # (apps/evangelism/signals.py).
+    tracked_fields = ("cluster", "year", "week_number", "meeting_date")
+
     cluster = models.ForeignKey(
         Cluster, on_delete=models.CASCADE, related_name="weekly_reports"
     )
@@ -0,0 +1,282 @@
+"""
+Bulk cluster re-assignment (re-districting a branch).
+
+Used by ``POST /api/clusters/clusters/reassign-members/``. Takes a full
+person -> cluster mapping (``None`` for no cluster) and applies it in one
+transaction instead of one ``ClusterSerializer`` save per cluster:
+
+- each person ends up a member of their target cluster only; every other
+  membership, active or inactive, is removed (past journeys are kept);
+- people joining a branch-scoped cluster get its branch, as
+  ``sync_member_branches_to_cluster`` does on cluster save;
+- REPORTER assignments on clusters a person leaves are dropped;
+- people joining a cluster get the same "Added to cluster" Journey rows as
+  ``ClusterSerializer._create_membership_journeys`` creates.
+
+The mapping is validated in memory from four reads (people, target
+clusters, current memberships, reporter assignments). Target clusters, the
+clusters people leave and the people themselves must be inside the user's
+branch scope (``apply_cluster_branch_scope``), as for every other cluster
+action. Any error rejects the whole mapping; a dry run returns the same diff
+without writing. Family auto-add does not apply: the mapping is explicit for
+everyone it lists.
+
+The reads and writes share one transaction, and the people rows are locked
+(``select_for_update``) unless it is a dry run, so concurrent reassignments
+of the same people apply in turn.
+
+Memberships are written with ``bulk_create`` / ``QuerySet.delete``, so the
+m2m_changed handlers do not run; :func:`bump_visibility_generation` is
+called here instead.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Optional
+
+from django.db import transaction
+
+from apps.people.models import Journey, ModuleCoordinator, Person
+from apps.people.visibility import bump_visibility_generation
+from core.datetime_utils import church_today
+
+from .models import Cluster
+from .permissions import apply_cluster_branch_scope
+
+
+@dataclass
+class ClusterReassignmentResult:
+    dry_run: bool
+    people: int = 0
+    unchanged: int = 0
+    memberships_added: int = 0
+    memberships_removed: int = 0
+    branches_updated: int = 0
+    reporter_assignments_removed: int = 0
+    journeys_created: int = 0
+    changes: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+def _cluster_display_name(cluster_id: int, code, name) -> str:
+    """Same fallback as ``ClusterSerializer._get_cluster_display_name``."""
+    return code or name or f"Cluster {cluster_id}"
+
+
+@dataclass
+class _ReassignmentWrite:
+    added_links: list = field(default_factory=list)
+    removed_link_ids: list = field(default_factory=list)
+    branch_moves: Dict[int, list] = field(default_factory=dict)
+    reporter_ids: list = field(default_factory=list)
+    journeys: list = field(default_factory=list)
+
+
+def reassign_cluster_members(
+    assignments: Dict[int, Optional[int]],
+    *,
+    user: Person,
+    dry_run: bool = False,
+) -> ClusterReassignmentResult:
+    """
+    Move every person in ``assignments`` to their target cluster on behalf of ``user``.
+
+    ``user`` scopes the clusters and people and verifies the new journeys.
+    Returns the diff; when ``errors`` is non-empty nothing was written.
+    """
+    result = ClusterReassignmentResult(dry_run=dry_run, people=len(assignments))
+    if not assignments:
+        return result
+
+    with transaction.atomic():
+        people = Person.objects.filter(id__in=list(assignments))
+        if not dry_run:
+            people = people.select_for_update()
+        write = _plan(assignments, people, user, result)
+        if result.errors or dry_run or not result.changes:
+            return result
+
+        if write.removed_link_ids:
+            Cluster.members.through.objects.filter(id__in=write.removed_link_ids).delete()
+        # A link added since the reads (outside this lock) is already what we want.
+        Cluster.members.through.objects.bulk_create(
+            write.added_links, batch_size=1000, ignore_conflicts=True
+        )
+        for branch_id, person_ids in write.branch_moves.items():
+            Person.objects.filter(id__in=person_ids).update(branch_id=branch_id)
+        if write.reporter_ids:
+            ModuleCoordinator.objects.filter(pk__in=write.reporter_ids).delete()
+        Journey.objects.bulk_create(write.journeys, batch_size=1000)
+        if write.removed_link_ids or write.added_links:
+            # bulk writes skip the m2m_changed handlers that do this.
+            bump_visibility_generation()
+    return result
+
+
+def _plan(assignments, people_qs, user, result) -> _ReassignmentWrite:
+    """Validate ``assignments`` into ``result`` and collect the rows to write."""
+    write = _ReassignmentWrite()
+    people = {
+        row["id"]: row
+        for row in people_qs.values("id", "first_name", "last_name", "branch_id")
+    }
+    target_ids = {cluster_id for cluster_id in assignments.values() if cluster_id is not None}
+    targets = {
+        row["id"]: row
+        for row in Cluster.objects.filter(id__in=target_ids).values(
+            "id", "code", "name", "branch_id", "is_active"
+        )
+    }
+    memberships: Dict[int, Dict[int, dict]] = {person_id: {} for person_id in people}
+    for row in Cluster.members.through.objects.filter(person_id__in=list(people)).values(
+        "id",
+        "person_id",
+        "cluster_id",
+        "cluster__code",
+        "cluster__name",
+        "cluster__coordinator_id",
+    ):
+        memberships[row["person_id"]][row["cluster_id"]] = row
+
+    # Same branch scope as the other cluster actions; people without a branch
+    # are checked through their clusters only.
+    touched_ids = target_ids.union(*(links.keys() for links in memberships.values()))
+    scoped_cluster_ids = set(
+        apply_cluster_branch_scope(Cluster.objects.filter(id__in=touched_ids), user).values_list(
+            "id", flat=True
+        )
+    )
+    scoped_person_ids = set(
+        apply_cluster_branch_scope(
+            Person.objects.filter(id__in=list(people), branch__isnull=False), user
+        ).values_list("id", flat=True)
+    )
+
+    for person_id, cluster_id in assignments.items():
+        if person_id not in people:
+            result.errors.append({"person": person_id, "error": "Unknown person."})
+            continue
+        if people[person_id]["branch_id"] is not None and person_id not in scoped_person_ids:
+            result.errors.append(
+                {"person": person_id, "error": "Person is outside your branch."}
+            )
+            continue
+        if any(other_id not in scoped_cluster_ids for other_id in memberships[person_id]):
+            result.errors.append(
+                {"person": person_id, "error": "Person is in a cluster outside your branch."}
+            )
+            continue
+        if cluster_id is not None:
+            target = targets.get(cluster_id)
+            if target is None:
+                result.errors.append({"person": person_id, "error": "Unknown cluster."})
+                continue
+            if cluster_id not in scoped_cluster_ids:
+                result.errors.append(
+                    {"person": person_id, "error": "Cluster is outside your branch."}
+                )
+                continue
+            if not target["is_active"]:
+                result.errors.append(
+                    {"person": person_id, "error": "Cannot move people into an inactive cluster."}
+                )
+                continue
+        coordinated = [
+            link
+            for other_id, link in memberships[person_id].items()
+            if other_id != cluster_id and link["cluster__coordinator_id"] == person_id
+        ]
+        if coordinated:
+            link = coordinated[0]
+            display = _cluster_display_name(
+                link["cluster_id"], link["cluster__code"], link["cluster__name"]
+            )
+            result.errors.append(
+                {
+                    "person": person_id,
+                    "error": (
+                        f"Coordinator of {display} must stay in that cluster; "
+                        "change its coordinator first."
+                    ),
+                }
+            )
+    if result.errors:
+        return write
+
+    today = church_today()
+    removed_pairs = set()
+    for person_id, cluster_id in assignments.items():
+        person = people[person_id]
+        current = memberships[person_id]
+        leaving = [link for other_id, link in current.items() if other_id != cluster_id]
+        joining = cluster_id is not None and cluster_id not in current
+        target = targets.get(cluster_id)
+        new_branch_id = person["branch_id"]
+        if target is not None and target["branch_id"] and target["branch_id"] != new_branch_id:
+            new_branch_id = target["branch_id"]
+        if not leaving and not joining and new_branch_id == person["branch_id"]:
+            result.unchanged += 1
+            continue
+
+        for link in leaving:
+            write.removed_link_ids.append(link["id"])
+            removed_pairs.add((link["cluster_id"], person_id))
+        if joining:
+            write.added_links.append(
+                Cluster.members.through(cluster_id=cluster_id, person_id=person_id)
+            )
+            if current:
+                # Cluster has no default ordering: .first() on the previous ids is the lowest pk.
+                previous = current[min(current)]
+                previous_display = _cluster_display_name(
+                    previous["cluster_id"], previous["cluster__code"], previous["cluster__name"]
+                )
+                description = f"Transferred from {previous_display}."
+            else:
+                description = "Added to this cluster."
+            display = _cluster_display_name(cluster_id, target["code"], target["name"])
+            write.journeys.append(
+                Journey(
+                    user_id=person_id,
+                    title=f"Added to cluster: {display}",
+                    date=today,
+                    type="CLUSTER",
+                    description=description,
+                    verified_by=user,
+                )
+            )
+        if new_branch_id != person["branch_id"]:
+            write.branch_moves.setdefault(new_branch_id, []).append(person_id)
+
+        result.changes.append(
+            {
+                "person": person_id,
+                "name": f"{person['first_name']} {person['last_name']}".strip(),
+                "from_clusters": sorted(current),
+                "to_cluster": cluster_id,
+                "previous_branch": person["branch_id"],
+                "branch": new_branch_id,
+            }
+        )
+
+    if removed_pairs:
+        write.reporter_ids = [
+            pk
+            for pk, resource_id, person_id in ModuleCoordinator.objects.filter(
+                module=ModuleCoordinator.ModuleType.CLUSTER,
+                level=ModuleCoordinator.CoordinatorLevel.REPORTER,
+                person_id__in={person_id for _, person_id in removed_pairs},
+            ).values_list("pk", "resource_id", "person_id")
+            if (resource_id, person_id) in removed_pairs
+        ]
+
+    result.memberships_added = len(write.added_links)
+    result.memberships_removed = len(write.removed_link_ids)
+    result.branches_updated = sum(len(ids) for ids in write.branch_moves.values())
+    result.reporter_assignments_removed = len(write.reporter_ids)
+    result.journeys_created = len(write.journeys)
+    return write
@@ -567,6 +567,29 @@ class ClusterSerializer(serializers.ModelSerializer):
         return instance
 
 
+class ClusterAssignmentSerializer(serializers.Serializer):
+    person = serializers.IntegerField()
+    cluster = serializers.IntegerField(allow_null=True)
+
+
+class ClusterReassignmentSerializer(serializers.Serializer):
+    """Request body for ``reassign-members`` (see ``apps/clusters/reassignment.py``)."""
+
+    assignments = ClusterAssignmentSerializer(many=True, allow_empty=False)
+    dry_run = serializers.BooleanField(default=False)
+
+    def validate_assignments(self, value):
+        seen: set[int] = set()
+        duplicates = sorted(
+            {item["person"] for item in value if item["person"] in seen or seen.add(item["person"])}
+        )
+        if duplicates:
+            raise serializers.ValidationError(
+                f"Each person may be assigned once. Duplicate IDs: {duplicates}"
+            )
+        return value
+
+
 class ClusterWeeklyReportSerializer(serializers.ModelSerializer):
     submitted_by_details = serializers.SerializerMethodField()
     cluster_name = serializers.CharField(source="cluster.name", read_only=True)
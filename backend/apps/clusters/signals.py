@@ -13,19 +13,16 @@ logger = logging.getLogger(__name__)
 
 @receiver(pre_save, sender=Cluster)
 def cluster_store_previous_coordinator(sender, instance, **kwargs):
-    """Stash prior coordinator_id so post_save can sync ModuleCoordinator rows."""
-    if instance.pk:
-        try:
-            previous = Cluster.objects.get(pk=instance.pk)
-            instance._prev_coordinator_id = previous.coordinator_id
-        except Cluster.DoesNotExist:
-            instance._prev_coordinator_id = None
-    else:
-        instance._prev_coordinator_id = None
+    """Stash prior coordinator_id (from the load-time snapshot) for post_save."""
+    originals = instance.tracked_original_values()
+    instance._prev_coordinator_id = originals["coordinator"]
+    instance._coordinator_changed = bool(instance.tracked_changes(originals))
 
 
 @receiver(post_save, sender=Cluster)
-def cluster_sync_coordinator_module_assignment_signal(sender, instance, **kwargs):
+def cluster_sync_coordinator_module_assignment_signal(sender, instance, created, **kwargs):
+    if not created and not getattr(instance, "_coordinator_changed", True):
+        return
     prev = getattr(instance, "_prev_coordinator_id", None)
     try:
         sync_cluster_coordinator_module_assignment(instance, prev)
@@ -38,6 +35,18 @@ def cluster_sync_coordinator_module_assignment_signal(sender, instance, **kwargs
         )
 
 
+@receiver(pre_save, sender=ClusterWeeklyReport)
+def store_weekly_report_original_values(sender, instance, **kwargs):
+    """Stash pre-save tracked values (load-time snapshot, no query) for post_save handlers."""
+    originals = instance.tracked_original_values()
+    changed = instance.pk is not None and bool(instance.tracked_changes(originals))
+    instance._original_cluster_id = originals["cluster"]
+    instance._original_year = originals["year"]
+    instance._original_week_number = originals["week_number"]
+    instance._original_meeting_date = originals["meeting_date"]
+    instance._tracked_fields_changed = changed
+
+
 def _get_cluster_display_name(cluster):
     """Get cluster code, name, or fallback identifier"""
     if cluster.code:
@@ -0,0 +1,192 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.people.models import Branch, Journey, ModuleCoordinator, Person
+from apps.people.visibility import current_visibility_generation
+
+URL = "/api/clusters/clusters/reassign-members/"
+
+
+class ClusterReassignmentTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.branch_a = Branch.objects.create(name="Move Branch A", code="MOV_A", is_active=True)
+        self.branch_b = Branch.objects.create(name="Move Branch B", code="MOV_B", is_active=True)
+        self.admin = self._person("mov_admin", role="ADMIN")
+        self.coordinator = self._person("mov_coord")
+        self.alice = self._person("mov_alice")
+        self.bob = self._person("mov_bob")
+        self.carol = self._person("mov_carol", branch=None)
+        self.north = Cluster.objects.create(
+            code="MOV-N", name="North", branch=self.branch_a, coordinator=self.coordinator
+        )
+        self.south = Cluster.objects.create(code="MOV-S", name="South", branch=self.branch_b)
+        self.old = Cluster.objects.create(
+            code="MOV-OLD", name="Old", branch=self.branch_a, is_active=False
+        )
+        self.north.members.add(self.coordinator, self.alice, self.bob)
+        self.old.members.add(self.bob)
+        ModuleCoordinator.objects.create(
+            person=self.alice,
+            module=ModuleCoordinator.ModuleType.CLUSTER,
+            level=ModuleCoordinator.CoordinatorLevel.REPORTER,
+            resource_id=self.north.id,
+            resource_type="Cluster",
+        )
+        self.client.force_authenticate(user=self.admin)
+
+    def _person(self, username, role="MEMBER", branch=...):
+        return Person.objects.create_user(
+            username=username,
+            password="testpass123",
+            first_name=username.split("_")[1].title(),
+            last_name="Mover",
+            role=role,
+            branch=self.branch_a if branch is ... else branch,
+            status="ACTIVE",
+        )
+
+    def _payload(self, dry_run=False):
+        return {
+            "assignments": [
+                {"person": self.alice.id, "cluster": self.south.id},
+                {"person": self.bob.id, "cluster": self.north.id},
+                {"person": self.carol.id, "cluster": self.north.id},
+                {"person": self.coordinator.id, "cluster": self.north.id},
+            ],
+            "dry_run": dry_run,
+        }
+
+    def _cluster_ids(self, person):
+        return set(person.clusters.values_list("id", flat=True))
+
+    def test_dry_run_returns_diff_without_writing(self):
+        generation = current_visibility_generation()
+        response = self.client.post(URL, self._payload(dry_run=True), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.data
+        self.assertTrue(data["dry_run"])
+        self.assertEqual(data["people"], 4)
+        self.assertEqual(data["unchanged"], 1)
+        self.assertEqual(data["memberships_added"], 2)
+        self.assertEqual(data["memberships_removed"], 2)
+        self.assertEqual(data["branches_updated"], 2)
+        self.assertEqual(data["reporter_assignments_removed"], 1)
+        self.assertEqual(data["journeys_created"], 2)
+        changes = {row["person"]: row for row in data["changes"]}
+        self.assertEqual(changes[self.alice.id]["from_clusters"], [self.north.id])
+        self.assertEqual(changes[self.alice.id]["branch"], self.branch_b.id)
+        self.assertEqual(changes[self.bob.id]["from_clusters"], [self.north.id, self.old.id])
+
+        self.assertEqual(self._cluster_ids(self.alice), {self.north.id})
+        self.assertEqual(self._cluster_ids(self.bob), {self.north.id, self.old.id})
+        self.assertFalse(Journey.objects.filter(type="CLUSTER", user=self.carol).exists())
+        self.assertEqual(current_visibility_generation(), generation)
+
+    def test_apply_moves_memberships_branches_and_journeys(self):
+        generation = current_visibility_generation()
+        response = self.client.post(URL, self._payload(), format="json")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data["dry_run"])
+
+        self.assertEqual(self._cluster_ids(self.alice), {self.south.id})
+        self.assertEqual(self._cluster_ids(self.bob), {self.north.id})
+        self.assertEqual(self._cluster_ids(self.carol), {self.north.id})
+        self.alice.refresh_from_db()
+        self.carol.refresh_from_db()
+        self.assertEqual(self.alice.branch_id, self.branch_b.id)
+        self.assertEqual(self.carol.branch_id, self.branch_a.id)
+        self.assertFalse(
+            ModuleCoordinator.objects.filter(
+                person=self.alice, level=ModuleCoordinator.CoordinatorLevel.REPORTER
+            ).exists()
+        )
+        journey = Journey.objects.get(type="CLUSTER", user=self.alice, title__startswith="Added")
+        self.assertEqual(journey.title, "Added to cluster: MOV-S")
+        self.assertEqual(journey.description, "Transferred from MOV-N.")
+        self.assertEqual(journey.verified_by, self.admin)
+        journey = Journey.objects.get(type="CLUSTER", user=self.carol, title__startswith="Added")
+        self.assertEqual(journey.description, "Added to this cluster.")
+        self.assertGreater(current_visibility_generation(), generation)
+
+    def test_query_count_does_not_grow_with_the_mapping(self):
+        def post(people):
+            payload = {
+                "assignments": [{"person": p.id, "cluster": self.south.id} for p in people]
+            }
+            with CaptureQueriesContext(connection) as captured:
+                response = self.client.post(URL, payload, format="json")
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(captured)
+
+        movers = [self._person(f"mov_bulk{index}") for index in range(13)]
+        self.north.members.add(*movers)
+        self.assertEqual(post(movers[1:]), post(movers[:1]))
+
+    def test_invalid_assignments_reject_the_whole_mapping(self):
+        payload = {
+            "assignments": [
+                {"person": self.alice.id, "cluster": self.south.id},
+                {"person": self.bob.id, "cluster": self.old.id},
+                {"person": self.coordinator.id, "cluster": self.south.id},
+                {"person": self.carol.id, "cluster": 999999},
+            ]
+        }
+        response = self.client.post(URL, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {row["person"]: row["error"] for row in response.data["errors"]}
+        self.assertEqual(set(errors), {self.bob.id, self.coordinator.id, self.carol.id})
+        self.assertIn("inactive", errors[self.bob.id])
+        self.assertIn("Coordinator of MOV-N", errors[self.coordinator.id])
+        self.assertEqual(self._cluster_ids(self.alice), {self.north.id})
+
+        duplicate = {
+            "assignments": [
+                {"person": self.alice.id, "cluster": self.south.id},
+                {"person": self.alice.id, "cluster": None},
+            ]
+        }
+        response = self.client.post(URL, duplicate, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("assignments", response.data["details"])
+
+    def test_branch_coordinator_cannot_reach_other_branches(self):
+        ModuleCoordinator.objects.create(
+            person=self.coordinator,
+            module=ModuleCoordinator.ModuleType.CLUSTER,
+            level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
+        )
+        far = self._person("mov_far", branch=self.branch_b)
+        self.south.members.add(far)
+        self.client.force_authenticate(user=self.coordinator)
+        payload = {
+            "assignments": [
+                {"person": self.alice.id, "cluster": self.south.id},
+                {"person": far.id, "cluster": self.north.id},
+                {"person": self.bob.id, "cluster": None},
+            ]
+        }
+        response = self.client.post(URL, payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        errors = {row["person"]: row["error"] for row in response.data["errors"]}
+        self.assertEqual(set(errors), {self.alice.id, far.id})
+        self.assertIn("Cluster is outside your branch", errors[self.alice.id])
+        self.assertIn("Person is outside your branch", errors[far.id])
+        self.assertEqual(self._cluster_ids(self.alice), {self.north.id})
+        self.assertEqual(self._cluster_ids(far), {self.south.id})
+
+        # Within the branch the same coordinator can re-district.
+        response = self.client.post(
+            URL, {"assignments": [{"person": self.bob.id, "cluster": None}]}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(self._cluster_ids(self.bob), set())
+
+    def test_members_cannot_reassign(self):
+        self.client.force_authenticate(user=self.bob)
+        response = self.client.post(URL, self._payload(dry_run=True), format="json")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
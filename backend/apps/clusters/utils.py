@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from django.utils import timezone
 
-from core.datetime_utils import church_today
+from core.datetime_utils import church_today, shift_years
 from django.db.models import Q, Count, Avg
 from .models import Cluster, ClusterWeeklyReport
 from apps.people.models import Person
@@ -18,27 +18,31 @@ def get_weeks_in_range(start_date, end_date):
     return weeks
 
 
-def calculate_cluster_compliance(cluster, start_date, end_date):
-    """
-    Calculate compliance metrics for a cluster in a given date range.
+def previous_period(start_date, end_date):
+    """The window of equal length immediately before ``start_date``."""
+    return (
+        start_date - timedelta(days=(end_date - start_date).days + 1),
+        start_date - timedelta(days=1),
+    )
 
-    Returns:
-        dict with compliance metrics
-    """
-    # Get all weeks in the range
-    weeks_in_range = get_weeks_in_range(start_date, end_date)
-    weeks_expected = len(weeks_in_range)
 
-    # Get all reports for this cluster in the date range
-    reports = ClusterWeeklyReport.objects.filter(
-        cluster=cluster, meeting_date__gte=start_date, meeting_date__lte=end_date
-    ).select_related("cluster", "submitted_by")
+def in_windows_q(field: str, windows) -> Q:
+    """``field`` inside any of the ``(start, end)`` windows (inclusive)."""
+    q = Q()
+    for start, end in windows:
+        q |= Q(**{f"{field}__gte": start, f"{field}__lte": end})
+    return q
+
+
+def _compliance_from_reports(weeks_in_range, reports, today):
+    """Compliance metrics for one window from its ``(year, week, meeting_date)`` rows."""
+    weeks_expected = len(weeks_in_range)
 
     # Count submitted reports
-    reports_submitted = reports.count()
+    reports_submitted = len(reports)
 
     # Find missing weeks
-    submitted_weeks = set((r.year, r.week_number) for r in reports)
+    submitted_weeks = set((year, week) for year, week, _ in reports)
     expected_weeks = set(weeks_in_range)
     missing_weeks_list = sorted(
         [week for week in expected_weeks if week not in submitted_weeks]
@@ -82,13 +86,12 @@ def calculate_cluster_compliance(cluster, start_date, end_date):
         status = "PARTIAL"
 
     # Get last report date
-    last_report = reports.order_by("-meeting_date").first()
-    last_report_date = last_report.meeting_date if last_report else None
+    last_report_date = max((meeting_date for _, _, meeting_date in reports), default=None)
 
     # Calculate days since last report
     days_since_last_report = None
     if last_report_date:
-        days_since_last_report = (church_today() - last_report_date).days
+        days_since_last_report = (today - last_report_date).days
 
     return {
         "status": status,
@@ -102,6 +105,89 @@ def calculate_cluster_compliance(cluster, start_date, end_date):
     }
 
 
+def calculate_compliance_for_periods(clusters, periods):
+    """
+    Compliance metrics for every cluster in every ``(start_date, end_date)`` period.
+
+    Reads the reports of all clusters inside the periods (not the gaps between
+    them) in one query and partitions them in Python, so comparing windows (the
+    trend's previous period, last year's window) costs no extra queries.
+
+    Returns:
+        dict of cluster id -> list of compliance dicts, one per period in order
+    """
+    cluster_ids = [cluster.pk for cluster in clusters]
+    periods = list(periods)
+    results = {cluster_id: [] for cluster_id in cluster_ids}
+    if not cluster_ids or not periods:
+        return results
+
+    reports_by_cluster = {cluster_id: [] for cluster_id in cluster_ids}
+    rows = ClusterWeeklyReport.objects.filter(
+        in_windows_q("meeting_date", periods), cluster_id__in=cluster_ids
+    ).values_list("cluster_id", "year", "week_number", "meeting_date")
+    for cluster_id, year, week, meeting_date in rows:
+        reports_by_cluster[cluster_id].append((year, week, meeting_date))
+
+    today = church_today()
+    for start_date, end_date in periods:
+        weeks_in_range = get_weeks_in_range(start_date, end_date)
+        for cluster_id, reports in reports_by_cluster.items():
+            in_period = [
+                report for report in reports if start_date <= report[2] <= end_date
+            ]
+            results[cluster_id].append(
+                _compliance_from_reports(weeks_in_range, in_period, today)
+            )
+    return results
+
+
+def calculate_cluster_compliance(cluster, start_date, end_date):
+    """
+    Calculate compliance metrics for a cluster in a given date range.
+
+    Returns:
+        dict with compliance metrics
+    """
+    return calculate_compliance_for_periods([cluster], [(start_date, end_date)])[
+        cluster.pk
+    ][0]
+
+
+def calculate_compliance_with_trend(clusters, start_date, end_date, *, compare_years=0):
+    """
+    Compliance for ``clusters`` in the window, each with its trend vs the previous window.
+
+    Also computes the same window ``1..compare_years`` years back, all in one
+    report query. Returns ``(current, comparisons)``: ``current`` maps cluster
+    id to its compliance dict (with ``trend``); ``comparisons`` is one
+    ``(start, end, {cluster id: compliance})`` tuple per earlier year.
+    """
+    clusters = list(clusters)
+    periods = [(start_date, end_date), previous_period(start_date, end_date)]
+    periods += [
+        (shift_years(start_date, -offset), shift_years(end_date, -offset))
+        for offset in range(1, compare_years + 1)
+    ]
+    by_cluster = calculate_compliance_for_periods(clusters, periods)
+
+    current = {}
+    for cluster_id, (compliance, previous, *_) in by_cluster.items():
+        current[cluster_id] = {
+            **compliance,
+            "trend": calculate_trend(compliance, previous),
+        }
+    comparisons = [
+        (
+            start,
+            end,
+            {cluster_id: metrics[index] for cluster_id, metrics in by_cluster.items()},
+        )
+        for index, (start, end) in enumerate(periods[2:], start=2)
+    ]
+    return current, comparisons
+
+
 def calculate_trend(current_period_data, previous_period_data):
     """
     Calculate trend by comparing current period compliance with previous period.
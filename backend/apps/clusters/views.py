@@ -1,5 +1,4 @@
 from rest_framework import viewsets, filters, status
-from rest_framework.pagination import PageNumberPagination
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.decorators import action
 from rest_framework.response import Response
@@ -9,23 +8,25 @@ from django.http import HttpResponse
 from datetime import datetime, timedelta
 from django.utils import timezone
 
+from core.pagination import StandardPagination
 from core.datetime_utils import church_today
 import csv
 import io
 from .models import Cluster, ClusterWeeklyReport, ClusterComplianceNote
 from .filters import ClusterFilter
+from .reassignment import reassign_cluster_members
 from .report_membership import sync_report_visitors_to_cluster_members
 from .serializers import (
     ClusterSerializer,
     ClusterListSerializer,
+    ClusterReassignmentSerializer,
     ClusterWeeklyReportSerializer,
     ClusterComplianceSerializer,
     ComplianceSummarySerializer,
     ClusterComplianceNoteSerializer,
 )
 from .utils import (
-    calculate_cluster_compliance,
-    calculate_trend,
+    calculate_compliance_with_trend,
     is_at_risk,
     get_weeks_in_range,
 )
@@ -56,7 +57,7 @@ from apps.clusters.permissions import (
 )
 
 
-class ClusterPagination(PageNumberPagination):
+class ClusterPagination(StandardPagination):
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -166,8 +167,8 @@ class ClusterViewSet(viewsets.ModelViewSet):
         """
         Override to set permissions based on action.
         """
-        if self.action == "create":
-            # Only ADMIN, PASTOR, or Senior Coordinator can create
+        if self.action in ("create", "reassign_members"):
+            # Only ADMIN, PASTOR, or Senior Coordinator can create or re-district
             return [IsAuthenticatedAndNotVisitor(), HasModuleAccess("CLUSTER", "create")]
         elif self.action in ["update", "partial_update"]:
             return [
@@ -263,8 +264,30 @@ class ClusterViewSet(viewsets.ModelViewSet):
             }
         )
 
+    @action(detail=False, methods=["post"], url_path="reassign-members")
+    def reassign_members(self, request):
+        """
+        Move people between clusters in bulk from a full person -> cluster mapping.
 
-class ClusterWeeklyReportPagination(PageNumberPagination):
+        Body: ``{"assignments": [{"person": id, "cluster": id | null}], "dry_run": bool}``.
+        Returns the diff; any invalid assignment rejects the whole mapping (400).
+        """
+        serializer = ClusterReassignmentSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = reassign_cluster_members(
+            {
+                item["person"]: item["cluster"]
+                for item in serializer.validated_data["assignments"]
+            },
+            user=request.user,
+            dry_run=serializer.validated_data["dry_run"],
+        )
+        if result.errors:
+            return Response(result.as_dict(), status=status.HTTP_400_BAD_REQUEST)
+        return Response(result.as_dict())
+
+
+class ClusterWeeklyReportPagination(StandardPagination):
     page_size = 50
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -657,16 +680,14 @@ class ClusterWeeklyReportViewSet(viewsets.ModelViewSet):
             except ValueError:
                 pass
         
-        # Calculate compliance for each cluster
+        # Calculate compliance for each cluster; the current and previous
+        # (trend) windows come from one report query
+        clusters = list(clusters)
+        current, _ = calculate_compliance_with_trend(clusters, start_date, end_date)
         compliance_data = []
         for cluster in clusters:
-            cluster_compliance = calculate_cluster_compliance(cluster, start_date, end_date)
-            
-            # Calculate trend (compare with previous period)
-            previous_start = start_date - timedelta(days=(end_date - start_date).days + 1)
-            previous_end = start_date - timedelta(days=1)
-            previous_compliance = calculate_cluster_compliance(cluster, previous_start, previous_end)
-            trend = calculate_trend(cluster_compliance, previous_compliance)
+            cluster_compliance = current[cluster.pk]
+            trend = cluster_compliance["trend"]
             
             # Get compliance notes for this period
             notes = ClusterComplianceNote.objects.filter(
@@ -781,16 +802,11 @@ class ClusterWeeklyReportViewSet(viewsets.ModelViewSet):
         # Get all clusters
         clusters = Cluster.objects.all()
         
+        clusters = list(clusters)
+        current, _ = calculate_compliance_with_trend(clusters, start_date, end_date)
         at_risk_clusters = []
         for cluster in clusters:
-            compliance = calculate_cluster_compliance(cluster, start_date, end_date)
-            
-            # Calculate trend
-            previous_start = start_date - timedelta(days=(end_date - start_date).days + 1)
-            previous_end = start_date - timedelta(days=1)
-            previous_compliance = calculate_cluster_compliance(cluster, previous_start, previous_end)
-            trend = calculate_trend(compliance, previous_compliance)
-            compliance["trend"] = trend
+            compliance = current[cluster.pk]
             
             # Check if at risk
             is_risk, reason = is_at_risk(compliance, weeks_back)
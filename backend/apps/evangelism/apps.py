@@ -5,3 +5,5 @@ class EvangelismConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.evangelism"
 
+    def ready(self):
+        import apps.evangelism.signals  # noqa: F401
@@ -0,0 +1,268 @@
+"""
+Batch operations on the prospect pipeline.
+
+Drop-off sweeps and multi-prospect stage transitions run as a handful of
+set-based statements per chunk instead of one save (plus one ``DropOff`` /
+``MonthlyConversionTracking`` write) per prospect. Person milestones still go
+through ``Person.save()`` because the journey signals in ``apps.people`` key
+off them.
+"""
+
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from core.datetime_utils import church_today
+
+from .models import DropOff, MonthlyConversionTracking, Prospect
+from .services import drop_off_candidates, ensure_attended_person
+
+DEFAULT_INACTIVITY_DAYS = 30
+BATCH_SIZE = 500
+
+
+def _chunks(items: List, size: int) -> Iterable[List]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _apply_drop_offs(
+    rows: List[tuple],
+    *,
+    as_of: date,
+    reason: str,
+    reason_details: str,
+    batch_size: int,
+) -> Dict[str, int]:
+    """
+    Mark ``(id, pipeline_stage, last_activity_date)`` rows as dropped off.
+
+    Prospects recovered earlier already own a ``DropOff`` (one-to-one); their
+    record is refreshed for the new drop-off instead of inserted.
+    """
+    by_stage: Dict[str, int] = {}
+    now = timezone.now()
+    for chunk in _chunks(rows, batch_size):
+        ids = [row[0] for row in chunk]
+        with transaction.atomic():
+            Prospect.objects.filter(id__in=ids).update(
+                is_dropped_off=True,
+                drop_off_date=as_of,
+                drop_off_stage=F("pipeline_stage"),
+                drop_off_reason=reason,
+                updated_at=now,
+            )
+            existing = {
+                record.prospect_id: record
+                for record in DropOff.objects.filter(prospect_id__in=ids)
+            }
+            to_create = []
+            to_refresh = []
+            for prospect_id, stage, last_activity_date in chunk:
+                by_stage[stage] = by_stage.get(stage, 0) + 1
+                days_inactive = (
+                    (as_of - last_activity_date).days if last_activity_date else 0
+                )
+                record = existing.get(prospect_id)
+                if record is None:
+                    to_create.append(
+                        DropOff(
+                            prospect_id=prospect_id,
+                            drop_off_date=as_of,
+                            drop_off_stage=stage,
+                            days_inactive=days_inactive,
+                            reason=reason,
+                            reason_details=reason_details,
+                        )
+                    )
+                    continue
+                record.drop_off_date = as_of
+                record.drop_off_stage = stage
+                record.days_inactive = days_inactive
+                record.reason = reason
+                record.reason_details = reason_details
+                record.recovered = False
+                record.recovered_date = None
+                record.updated_at = now
+                to_refresh.append(record)
+            DropOff.objects.bulk_create(to_create, ignore_conflicts=True)
+            if to_refresh:
+                DropOff.objects.bulk_update(
+                    to_refresh,
+                    [
+                        "drop_off_date",
+                        "drop_off_stage",
+                        "days_inactive",
+                        "reason",
+                        "reason_details",
+                        "recovered",
+                        "recovered_date",
+                        "updated_at",
+                    ],
+                )
+    return by_stage
+
+
+def bulk_mark_dropped_off(
+    prospect_ids: Iterable[int],
+    *,
+    reason: str = "",
+    reason_details: str = "",
+    as_of: Optional[date] = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Mark the given prospects as dropped off. Prospects that are already
+    dropped off are left alone. Returns the number marked.
+    """
+    rows = list(
+        Prospect.objects.filter(id__in=list(prospect_ids), is_dropped_off=False)
+        .order_by("id")
+        .values_list("id", "pipeline_stage", "last_activity_date")
+    )
+    if not rows:
+        return 0
+    _apply_drop_offs(
+        rows,
+        as_of=as_of or church_today(),
+        reason=reason,
+        reason_details=reason_details,
+        batch_size=batch_size,
+    )
+    return len(rows)
+
+
+def sweep_drop_offs(
+    inactivity_days: int = DEFAULT_INACTIVITY_DAYS,
+    *,
+    as_of: Optional[date] = None,
+    reason: str = DropOff.DropOffReason.NO_CONTACT,
+    reason_details: str = "",
+    dry_run: bool = False,
+    batch_size: int = BATCH_SIZE,
+) -> Dict:
+    """
+    Drop off every prospect inactive for more than ``inactivity_days``.
+
+    With ``dry_run`` nothing is written; the summary reports what would be.
+    """
+    as_of = as_of or church_today()
+    candidates = drop_off_candidates(inactivity_days, as_of)
+    rows = list(
+        candidates.order_by("id").values_list(
+            "id", "pipeline_stage", "last_activity_date"
+        )
+    )
+    if dry_run:
+        by_stage: Dict[str, int] = {}
+        for _, stage, _ in rows:
+            by_stage[stage] = by_stage.get(stage, 0) + 1
+    else:
+        by_stage = _apply_drop_offs(
+            rows,
+            as_of=as_of,
+            reason=reason,
+            reason_details=reason_details,
+            batch_size=batch_size,
+        )
+    return {
+        "as_of": as_of,
+        "cutoff": as_of - timedelta(days=inactivity_days),
+        "inactivity_days": inactivity_days,
+        "dropped_off": len(rows),
+        "by_stage": by_stage,
+        "dry_run": dry_run,
+    }
+
+
+def _apply_visitor_milestone(person, stage: str, activity_date: date) -> None:
+    """Same visitor updates as ``ProspectViewSet.update_progress``."""
+    if person is None or person.role != "VISITOR":
+        return
+    updates = []
+    if stage == Prospect.PipelineStage.INVITED and person.status != "ONGOING":
+        person.status = "ONGOING"
+        updates.append("status")
+    if (
+        stage == Prospect.PipelineStage.BAPTIZED
+        and person.water_baptism_date != activity_date
+    ):
+        person.water_baptism_date = activity_date
+        updates.append("water_baptism_date")
+    if (
+        stage == Prospect.PipelineStage.RECEIVED_HG
+        and person.spirit_baptism_date != activity_date
+    ):
+        person.spirit_baptism_date = activity_date
+        updates.append("spirit_baptism_date")
+    if updates:
+        person.save(update_fields=updates)
+
+
+def bulk_transition_prospects(
+    prospect_ids: Iterable[int],
+    stage: str,
+    *,
+    activity_date: Optional[date] = None,
+    batch_size: int = BATCH_SIZE,
+) -> int:
+    """
+    Move prospects to ``stage`` in one transaction.
+
+    Stage and last activity are written with one UPDATE and the monthly
+    tracking rows with ``bulk_create(ignore_conflicts=True)``. ATTENDED also
+    creates/links the Person like ``mark_prospect_attended``; raises
+    ``ValueError`` (rolling back everything) when a Person cannot be created.
+    Returns the number of prospects moved.
+    """
+    activity_date = activity_date or church_today()
+    with transaction.atomic():
+        prospects = list(
+            Prospect.objects.select_related("person")
+            .filter(id__in=list(prospect_ids))
+            .order_by("id")
+        )
+        if not prospects:
+            return 0
+        ids = [p.id for p in prospects]
+
+        for prospect in prospects:
+            if stage == Prospect.PipelineStage.ATTENDED:
+                ensure_attended_person(prospect, activity_date=activity_date)
+            else:
+                _apply_visitor_milestone(prospect.person, stage, activity_date)
+
+        Prospect.objects.filter(id__in=ids).update(
+            pipeline_stage=stage,
+            last_activity_date=activity_date,
+            updated_at=timezone.now(),
+        )
+
+        tracking = [
+            MonthlyConversionTracking(
+                cluster_id=prospect.inviter_cluster_id or prospect.endorsed_cluster_id,
+                prospect_id=prospect.id,
+                person_id=prospect.person_id,
+                year=activity_date.year,
+                month=activity_date.month,
+                stage=stage,
+                first_date_in_stage=activity_date,
+            )
+            for prospect in prospects
+            if prospect.inviter_cluster_id or prospect.endorsed_cluster_id
+        ]
+        MonthlyConversionTracking.objects.bulk_create(
+            tracking, batch_size=batch_size, ignore_conflicts=True
+        )
+        # Rows that already existed keep the earliest date seen this month.
+        MonthlyConversionTracking.objects.filter(
+            prospect_id__in=ids,
+            year=activity_date.year,
+            month=activity_date.month,
+            stage=stage,
+            first_date_in_stage__gt=activity_date,
+        ).update(first_date_in_stage=activity_date, updated_at=timezone.now())
+    return len(prospects)
@@ -0,0 +1,34 @@
+"""
+Rebuild the stored weekly tallies from the evangelism and cluster report tables.
+
+Run once after deploying the tally tables, and after changes that bypass
+model signals (bulk imports, QuerySet.update).
+
+Usage:
+    python manage.py rebuild_weekly_tallies
+    python manage.py rebuild_weekly_tallies --dry-run
+"""
+
+from django.core.management.base import BaseCommand
+
+from apps.evangelism.tally import rebuild_weekly_tallies
+
+
+class Command(BaseCommand):
+    help = "Rebuild weekly tallies (WeeklyTally) from evangelism and cluster weekly reports"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many tallies would be written without making changes",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be saved"))
+
+        written = rebuild_weekly_tallies(dry_run=options["dry_run"])
+
+        verb = "Would write" if options["dry_run"] else "Wrote"
+        self.stdout.write(self.style.SUCCESS(f"{verb} {written} weekly tally(ies)"))
@@ -0,0 +1,72 @@
+"""
+Management command to mark inactive prospects as dropped off in bulk.
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.evangelism.bulk_pipeline import DEFAULT_INACTIVITY_DAYS, sweep_drop_offs
+from apps.evangelism.models import DropOff
+
+
+class Command(BaseCommand):
+    help = "Mark prospects with no activity for N days as dropped off"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=DEFAULT_INACTIVITY_DAYS,
+            help=f'Inactivity period in days (default {DEFAULT_INACTIVITY_DAYS})'
+        )
+        parser.add_argument(
+            '--as-of',
+            type=str,
+            help='Reference date (YYYY-MM-DD); defaults to today'
+        )
+        parser.add_argument(
+            '--reason',
+            type=str,
+            default=DropOff.DropOffReason.NO_CONTACT,
+            choices=DropOff.DropOffReason.values,
+            help='Drop-off reason recorded on each prospect'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be dropped off without making changes'
+        )
+
+    def handle(self, *args, **options):
+        days = options['days']
+        dry_run = options.get('dry_run', False)
+        as_of = None
+        if options.get('as_of'):
+            try:
+                as_of = date.fromisoformat(options['as_of'])
+            except ValueError:
+                raise CommandError('--as-of must be YYYY-MM-DD')
+        if days < 1:
+            raise CommandError('--days must be at least 1')
+
+        if dry_run:
+            self.stdout.write(self.style.WARNING('DRY RUN MODE - No changes will be saved'))
+
+        summary = sweep_drop_offs(
+            days,
+            as_of=as_of,
+            reason=options['reason'],
+            dry_run=dry_run,
+        )
+
+        self.stdout.write(
+            f"No activity since {summary['cutoff']} "
+            f"({summary['inactivity_days']} days before {summary['as_of']})"
+        )
+        for stage, count in sorted(summary['by_stage'].items()):
+            self.stdout.write(f'  {stage}: {count}')
+
+        verb = 'Would drop off' if dry_run else 'Dropped off'
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {summary['dropped_off']} prospect(s)")
+        )
@@ -0,0 +1,69 @@
+# Generated by Django 4.2.23 on 2026-10-19 12:26
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clusters', '0008_weekly_report_year_week_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('evangelism', '0002_weekly_report_year_week_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WeeklyTally',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.IntegerField()),
+                ('week_number', models.IntegerField()),
+                ('meeting_date', models.DateField(blank=True, null=True)),
+                ('gathering_type', models.CharField(default='UNKNOWN', max_length=20)),
+                ('members_count', models.PositiveIntegerField(default=0)),
+                ('visitors_count', models.PositiveIntegerField(default=0)),
+                ('evangelism_reports_count', models.PositiveIntegerField(default=0)),
+                ('cluster_reports_count', models.PositiveIntegerField(default=0)),
+                ('new_prospects', models.IntegerField(default=0)),
+                ('conversions_this_week', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('cluster', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='weekly_tallies', to='clusters.cluster')),
+            ],
+            options={
+                'verbose_name': 'Weekly Tally',
+                'verbose_name_plural': 'Weekly Tallies',
+                'ordering': ('-year', '-week_number', 'cluster'),
+            },
+        ),
+        migrations.CreateModel(
+            name='WeeklyTallyAttendee',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('MEMBER', 'Member'), ('VISITOR', 'Visitor')], max_length=10)),
+                ('person', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_tally_attendance', to=settings.AUTH_USER_MODEL)),
+                ('tally', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendees', to='evangelism.weeklytally')),
+            ],
+            options={
+                'verbose_name': 'Weekly Tally Attendee',
+                'verbose_name_plural': 'Weekly Tally Attendees',
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='weeklytallyattendee',
+            constraint=models.UniqueConstraint(fields=('tally', 'person', 'kind'), name='weekly_tally_attendee_unique'),
+        ),
+        migrations.AddIndex(
+            model_name='weeklytally',
+            index=models.Index(fields=['year', 'week_number'], name='evangelism__year_f8f386_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='weeklytally',
+            constraint=models.UniqueConstraint(fields=('cluster', 'year', 'week_number'), name='weekly_tally_unique_cluster_week'),
+        ),
+        migrations.AddConstraint(
+            model_name='weeklytally',
+            constraint=models.UniqueConstraint(condition=models.Q(('cluster__isnull', True)), fields=('year', 'week_number'), name='weekly_tally_unique_unassigned_week'),
+        ),
+    ]
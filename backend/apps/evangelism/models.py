@@ -3,9 +3,14 @@ from django.conf import settings
 from django.utils import timezone
 
 from core.datetime_utils import church_today
+from core.tracked_fields import TrackedFieldsMixin
 
 
-class EvangelismGroup(models.Model):
+class EvangelismGroup(TrackedFieldsMixin, models.Model):
+    # Moving a group to another cluster re-keys its weekly tallies
+    # (apps/evangelism/signals.py).
+    tracked_fields = ("cluster",)
+
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
     coordinator = models.ForeignKey(
@@ -90,7 +95,10 @@ class EvangelismSession(models.Model):
         return f"{self.evangelism_group.name} - {self.session_date}"
 
 
-class EvangelismWeeklyReport(models.Model):
+class EvangelismWeeklyReport(TrackedFieldsMixin, models.Model):
+    # The weekly tally key; the old tally is refreshed when any of these change.
+    tracked_fields = ("evangelism_group", "year", "week_number")
+
     evangelism_group = models.ForeignKey(
         EvangelismGroup,
         on_delete=models.CASCADE,
@@ -151,6 +159,91 @@ class EvangelismWeeklyReport(models.Model):
         return f"{self.evangelism_group.name} - {self.year} Week {self.week_number}"
 
 
+class WeeklyTally(models.Model):
+    """
+    Evangelism + cluster weekly report totals for one (cluster, year, week).
+
+    Kept current by the report, group and attendance signals in
+    ``apps/evangelism/signals.py`` (see ``apps.evangelism.tally``), so the
+    weekly tally endpoint reads these rows instead of the report tables.
+    ``cluster`` is null for evangelism groups without a cluster.
+    """
+
+    cluster = models.ForeignKey(
+        "clusters.Cluster",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="weekly_tallies",
+    )
+    year = models.IntegerField()
+    week_number = models.IntegerField()
+    meeting_date = models.DateField(null=True, blank=True)
+    # A report gathering type, or MIXED / UNKNOWN across the week's reports.
+    gathering_type = models.CharField(max_length=20, default="UNKNOWN")
+    members_count = models.PositiveIntegerField(default=0)
+    visitors_count = models.PositiveIntegerField(default=0)
+    evangelism_reports_count = models.PositiveIntegerField(default=0)
+    cluster_reports_count = models.PositiveIntegerField(default=0)
+    new_prospects = models.IntegerField(default=0)
+    conversions_this_week = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("-year", "-week_number", "cluster")
+        constraints = [
+            models.UniqueConstraint(
+                fields=["cluster", "year", "week_number"],
+                name="weekly_tally_unique_cluster_week",
+            ),
+            models.UniqueConstraint(
+                fields=["year", "week_number"],
+                condition=models.Q(cluster__isnull=True),
+                name="weekly_tally_unique_unassigned_week",
+            ),
+        ]
+        indexes = [models.Index(fields=["year", "week_number"])]
+        verbose_name = "Weekly Tally"
+        verbose_name_plural = "Weekly Tallies"
+
+    def __str__(self):
+        return f"{self.cluster_id or 'Unassigned'} - {self.year} Week {self.week_number}"
+
+
+class WeeklyTallyAttendee(models.Model):
+    """
+    One distinct attendee of a weekly tally, so its counts stay exact when the
+    same person is on several of the week's reports.
+    """
+
+    class Kind(models.TextChoices):
+        MEMBER = "MEMBER", "Member"
+        VISITOR = "VISITOR", "Visitor"
+
+    tally = models.ForeignKey(
+        WeeklyTally, on_delete=models.CASCADE, related_name="attendees"
+    )
+    person = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="weekly_tally_attendance",
+    )
+    kind = models.CharField(max_length=10, choices=Kind.choices)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["tally", "person", "kind"],
+                name="weekly_tally_attendee_unique",
+            ),
+        ]
+        verbose_name = "Weekly Tally Attendee"
+        verbose_name_plural = "Weekly Tally Attendees"
+
+    def __str__(self):
+        return f"{self.tally_id}: {self.person_id} ({self.kind})"
+
+
 class Prospect(models.Model):
     class PipelineStage(models.TextChoices):
         INVITED = "INVITED", "Invited"
@@ -343,7 +436,11 @@ class DropOff(models.Model):
         )
 
 
-class Conversion(models.Model):
+class Conversion(TrackedFieldsMixin, models.Model):
+    # Completing, un-completing or moving a conversion refreshes Each1Reach1
+    # goal progress (apps/evangelism/signals.py).
+    tracked_fields = ("cluster", "conversion_date", "is_complete")
+
     person = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
@@ -236,6 +236,7 @@ class EvangelismRecurringSessionSerializer(serializers.Serializer):
         required=False, min_value=0, max_value=6, help_text="0=Monday, 6=Sunday"
     )
     default_topic = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    dry_run = serializers.BooleanField(required=False, default=False)
 
     def validate(self, attrs):
         if not attrs.get("end_date") and not attrs.get("num_occurrences"):
@@ -449,6 +450,46 @@ class ProspectSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class ProspectBulkTransitionSerializer(serializers.Serializer):
+    prospect_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+    )
+    pipeline_stage = serializers.ChoiceField(choices=Prospect.PipelineStage.choices)
+    last_activity_date = serializers.DateField(required=False, allow_null=True)
+
+    def validate_prospect_ids(self, prospect_ids):
+        prospect_ids = list(dict.fromkeys(prospect_ids))
+        found = set(
+            Prospect.objects.filter(id__in=prospect_ids).values_list("id", flat=True)
+        )
+        missing = [pid for pid in prospect_ids if pid not in found]
+        if missing:
+            raise serializers.ValidationError(f"Unknown prospect ids: {missing}")
+        return prospect_ids
+
+
+class ProspectBulkDropOffSerializer(serializers.Serializer):
+    prospect_ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        min_length=1,
+    )
+    reason = serializers.ChoiceField(
+        choices=DropOff.DropOffReason.choices, required=False, allow_blank=True
+    )
+    reason_details = serializers.CharField(required=False, allow_blank=True)
+
+
+class ProspectDropOffSweepSerializer(serializers.Serializer):
+    inactivity_days = serializers.IntegerField(required=False, min_value=1, default=30)
+    reason = serializers.ChoiceField(
+        choices=DropOff.DropOffReason.choices,
+        required=False,
+        default=DropOff.DropOffReason.NO_CONTACT,
+    )
+    dry_run = serializers.BooleanField(required=False, default=False)
+
+
 class FollowUpTaskSerializer(serializers.ModelSerializer):
     prospect = ProspectSerializer(read_only=True)
     prospect_id = serializers.PrimaryKeyRelatedField(
@@ -661,6 +702,8 @@ class Each1Reach1GoalSerializer(serializers.ModelSerializer):
         write_only=True,
     )
     progress_percentage = serializers.FloatField(read_only=True)
+    # Only present on leaderboard rows (window-ranked queryset).
+    rank = serializers.IntegerField(read_only=True)
 
     class Meta:
         model = Each1Reach1Goal
@@ -673,6 +716,7 @@ class Each1Reach1GoalSerializer(serializers.ModelSerializer):
             "achieved_conversions",
             "status",
             "progress_percentage",
+            "rank",
             "created_at",
             "updated_at",
         )
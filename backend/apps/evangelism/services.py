@@ -1,12 +1,18 @@
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 
-from django.db.models import Q, Count
+from django.db import transaction
+from django.db.models import Case, Count, F, OuterRef, Q, Subquery, Sum, Value, When, Window
+from django.db.models.functions import Coalesce, Rank
 from django.utils import timezone
 
 from apps.people.models import Person, Journey
 from apps.people.name_formatting import title_case_name
 from apps.clusters.models import Cluster
+from apps.events.services.recurrence import (
+    bulk_create_sessions_with_events,
+    iter_session_dates,
+)
 from core.datetime_utils import church_today
 
 from .models import (
@@ -222,20 +228,17 @@ def create_invited_prospect_for_cluster(
     return prospect
 
 
-def mark_prospect_attended(
+def ensure_attended_person(
     prospect: Prospect,
     *,
-    activity_date: Optional[date] = None,
+    activity_date: date,
     first_name: Optional[str] = None,
     last_name: Optional[str] = None,
-) -> Prospect:
+) -> None:
     """
-    Mark a prospect as ATTENDED: create/link Person, update stage and monthly tracking.
-    Shared by ProspectViewSet.mark_attended and cluster weekly report promotion.
+    Person side of marking a prospect ATTENDED: create and link the Person, or
+    bring an existing visitor's status and first-attended date up to date.
     """
-    if activity_date is None:
-        activity_date = church_today()
-
     if not prospect.person:
         fn = (first_name or "").strip() or prospect.first_name
         ln = (last_name or "").strip() or prospect.last_name
@@ -264,6 +267,28 @@ def mark_prospect_attended(
                 person.save(update_fields=updates)
         sync_prospect_invitation_journey_note(person, prospect)
 
+
+def mark_prospect_attended(
+    prospect: Prospect,
+    *,
+    activity_date: Optional[date] = None,
+    first_name: Optional[str] = None,
+    last_name: Optional[str] = None,
+) -> Prospect:
+    """
+    Mark a prospect as ATTENDED: create/link Person, update stage and monthly tracking.
+    Shared by ProspectViewSet.mark_attended and cluster weekly report promotion.
+    """
+    if activity_date is None:
+        activity_date = church_today()
+
+    ensure_attended_person(
+        prospect,
+        activity_date=activity_date,
+        first_name=first_name,
+        last_name=last_name,
+    )
+
     prospect.pipeline_stage = Prospect.PipelineStage.ATTENDED
     prospect.last_activity_date = activity_date
     prospect.save(
@@ -528,21 +553,21 @@ def get_cluster_visitors(cluster: Cluster) -> List[Prospect]:
     ).distinct()
 
 
+def drop_off_candidates(inactivity_days: int = 30, as_of: Optional[date] = None):
+    """Active, not-yet-reached prospects with no activity since the cutoff."""
+    cutoff_date = (as_of or church_today()) - timedelta(days=inactivity_days)
+    return Prospect.objects.filter(
+        is_dropped_off=False,
+        last_activity_date__lt=cutoff_date,
+    ).exclude(pipeline_stage=Prospect.PipelineStage.REACHED)
+
+
 def detect_drop_offs(inactivity_days: int = 30) -> List[Prospect]:
     """
     Auto-detect drop-offs based on inactivity period (default 30 days).
     Returns list of prospects that should be marked as dropped off.
     """
-    cutoff_date = church_today() - timedelta(days=inactivity_days)
-    
-    prospects = Prospect.objects.filter(
-        is_dropped_off=False,
-        last_activity_date__lt=cutoff_date
-    ).exclude(
-        pipeline_stage=Prospect.PipelineStage.REACHED
-    )
-
-    return list(prospects)
+    return list(drop_off_candidates(inactivity_days))
 
 
 def check_lesson_completion(prospect: Prospect) -> bool:
@@ -828,9 +853,7 @@ def sync_conversion_pipeline(
                     tracking_date,
                 )
 
-    if is_complete:
-        update_each1reach1_goal(conversion)
-
+    # Goal progress follows the save above (apps/evangelism/signals.py).
     return conversion
 
 
@@ -839,10 +862,133 @@ def get_default_each1reach1_target(cluster: Cluster) -> int:
     Compute default target conversions for a cluster.
     Business rule: target is 2x all non-admin cluster members.
     """
+    annotated = getattr(cluster, "default_each1reach1_target", None)
+    if annotated is not None:
+        return annotated
     member_count = cluster.members.exclude(role="ADMIN").count()
     return member_count * 2
 
 
+def _cluster_member_count_subquery():
+    """Non-admin member count per outer Cluster row (default goal target / 2)."""
+    through = Cluster.members.through
+    return Coalesce(
+        Subquery(
+            through.objects.filter(cluster_id=OuterRef("pk"))
+            .exclude(person__role="ADMIN")
+            .order_by()
+            .values("cluster_id")
+            .annotate(total=Count("person_id"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def _completed_conversions_subquery(cluster_ref: str, year_ref):
+    """Completed conversions per cluster and year, for goal progress."""
+    return Coalesce(
+        Subquery(
+            Conversion.objects.filter(
+                cluster_id=OuterRef(cluster_ref),
+                is_complete=True,
+                conversion_date__year=year_ref,
+            )
+            .order_by()
+            .values("cluster_id")
+            .annotate(total=Count("id"))
+            .values("total")
+        ),
+        0,
+    )
+
+
+def annotate_default_each1reach1_target(clusters_qs):
+    """Annotate ``default_each1reach1_target`` so goal creation needs no per-cluster counts."""
+    return clusters_qs.annotate(
+        default_each1reach1_target=_cluster_member_count_subquery() * 2
+    )
+
+
+def _goal_status(achieved: int, target: int) -> str:
+    if achieved <= 0:
+        return Each1Reach1Goal.Status.NOT_STARTED
+    if achieved >= target:
+        return Each1Reach1Goal.Status.COMPLETED
+    return Each1Reach1Goal.Status.IN_PROGRESS
+
+
+def ensure_each1reach1_goals_for_year(
+    year: int, cluster_ids: Optional[List[int]] = None
+) -> int:
+    """
+    Create every missing (cluster, year) goal with one ``bulk_create``.
+
+    Targets come from annotated member counts and progress from completed
+    conversions, so a whole church needs a single read and a single insert.
+    Returns the number of goals that were missing; a concurrent request may
+    have inserted some of them first, which the unique (cluster, year)
+    constraint turns into no-ops.
+    """
+    clusters = Cluster.objects.exclude(
+        id__in=Each1Reach1Goal.objects.filter(year=year).values("cluster_id")
+    )
+    if cluster_ids is not None:
+        clusters = clusters.filter(id__in=cluster_ids)
+    rows = annotate_default_each1reach1_target(clusters).annotate(
+        achieved=_completed_conversions_subquery("pk", year)
+    ).values_list("id", "default_each1reach1_target", "achieved")
+
+    goals = [
+        Each1Reach1Goal(
+            cluster_id=cluster_id,
+            year=year,
+            target_conversions=target,
+            achieved_conversions=achieved,
+            status=_goal_status(achieved, target),
+        )
+        for cluster_id, target, achieved in rows
+    ]
+    if goals:
+        Each1Reach1Goal.objects.bulk_create(goals, ignore_conflicts=True)
+    return len(goals)
+
+
+def refresh_each1reach1_goal_progress(
+    year: int, cluster_ids: Optional[List[int]] = None
+) -> int:
+    """
+    Recompute ``achieved_conversions`` and ``status`` from ``Conversion`` rows.
+
+    Runs as set-based UPDATEs, so concurrent conversion saves cannot lose
+    increments and re-saving a completed conversion does not count it twice.
+    Returns the number of goals refreshed.
+    """
+    goals = Each1Reach1Goal.objects.filter(year=year)
+    if cluster_ids is not None:
+        goals = goals.filter(cluster_id__in=cluster_ids)
+    now = timezone.now()
+    with transaction.atomic():
+        updated = goals.update(
+            achieved_conversions=_completed_conversions_subquery("cluster_id", year),
+            updated_at=now,
+        )
+        goals.update(
+            status=Case(
+                When(
+                    achieved_conversions__lte=0,
+                    then=Value(Each1Reach1Goal.Status.NOT_STARTED),
+                ),
+                When(
+                    achieved_conversions__gte=F("target_conversions"),
+                    then=Value(Each1Reach1Goal.Status.COMPLETED),
+                ),
+                default=Value(Each1Reach1Goal.Status.IN_PROGRESS),
+            )
+        )
+    return updated
+
+
 def update_each1reach1_goal(conversion: Conversion) -> None:
     """
     Update cluster goal progress when conversion is completed.
@@ -850,29 +996,19 @@ def update_each1reach1_goal(conversion: Conversion) -> None:
     if not conversion.is_complete:
         return
 
-    cluster = conversion.cluster
-    if not cluster:
+    if not conversion.cluster_id:
         return
 
     year = conversion.conversion_date.year
+    ensure_each1reach1_goals_for_year(year, cluster_ids=[conversion.cluster_id])
+    refresh_each1reach1_goal_progress(year, cluster_ids=[conversion.cluster_id])
 
-    goal, created = Each1Reach1Goal.objects.get_or_create(
-        cluster=cluster,
-        year=year,
-        defaults={
-            "target_conversions": get_default_each1reach1_target(cluster),
-            "achieved_conversions": 0,
-            "status": Each1Reach1Goal.Status.NOT_STARTED,
-        }
-    )
 
-    goal.achieved_conversions += 1
-    if goal.achieved_conversions >= goal.target_conversions:
-        goal.status = Each1Reach1Goal.Status.COMPLETED
-    else:
-        goal.status = Each1Reach1Goal.Status.IN_PROGRESS
-    
-    goal.save()
+def ranked_each1reach1_goals(goals_qs):
+    """Annotate competition ``rank`` (1, 1, 3, ...) by achieved conversions."""
+    return goals_qs.annotate(
+        rank=Window(expression=Rank(), order_by=F("achieved_conversions").desc())
+    ).order_by("rank", "cluster__name")
 
 
 def calculate_conversion_rate(
@@ -970,89 +1106,64 @@ def create_recurring_sessions(
     recurrence_pattern: str,
     day_of_week: Optional[int] = None,
     default_topic: str = "",
+    dry_run: bool = False,
 ) -> List[EvangelismSession]:
     """
     Create multiple sessions based on recurrence pattern.
-    Returns list of created sessions.
+    Every date is planned up front; events and sessions are then bulk-inserted.
+    With ``dry_run`` the planned sessions are returned unsaved.
     """
     from apps.events.models import Event
 
-    sessions = []
-    current_date = start_date
-    occurrence_count = 0
     recurring_group_id = f"{evangelism_group.id}_{timezone.now().timestamp()}"
 
-    # Determine end condition
-    if num_occurrences:
-        max_occurrences = num_occurrences
-    elif end_date:
-        max_occurrences = 1000
-    else:
-        max_occurrences = 52
-
     # Get group meeting time
     meeting_time = evangelism_group.meeting_time or timezone.now().time()
 
     # Determine event type based on cluster affiliation
     event_type = "BS/CLUSTER_EVANGELISM" if evangelism_group.cluster else "BIBLE_STUDY"
 
-    while occurrence_count < max_occurrences:
-        if end_date and current_date > end_date:
-            break
+    event_title = evangelism_group.name
+    if default_topic:
+        event_title = f"{event_title} - {default_topic}"
 
-        # For weekly patterns, adjust to the correct day of week
-        if recurrence_pattern == "weekly" and day_of_week is not None:
-            current_weekday = current_date.weekday()
-            days_to_add = (day_of_week - current_weekday) % 7
-            if days_to_add > 0:
-                current_date += timedelta(days=days_to_add)
-            if end_date and current_date > end_date:
-                break
-
-        # Create session
-        session = EvangelismSession.objects.create(
-            evangelism_group=evangelism_group,
-            session_date=current_date,
-            session_time=meeting_time,
-            topic=default_topic,
-            is_recurring_instance=True,
-            recurring_group_id=recurring_group_id,
+    sessions = []
+    events = []
+    for session_date in iter_session_dates(
+        start_date,
+        recurrence_pattern,
+        end_date=end_date,
+        num_occurrences=num_occurrences,
+        day_of_week=day_of_week,
+    ):
+        sessions.append(
+            EvangelismSession(
+                evangelism_group=evangelism_group,
+                session_date=session_date,
+                session_time=meeting_time,
+                topic=default_topic,
+                is_recurring_instance=True,
+                recurring_group_id=recurring_group_id,
+            )
         )
-
-        # Create corresponding Event
-        session_datetime = datetime.combine(current_date, meeting_time)
-        session_datetime = timezone.make_aware(session_datetime)
-        end_datetime = session_datetime + timedelta(hours=1)
-
-        event_title = evangelism_group.name
-        if default_topic:
-            event_title = f"{event_title} - {default_topic}"
-
-        event = Event.objects.create(
-            title=event_title,
-            description=f"Bible Study session for {evangelism_group.name}",
-            start_date=session_datetime,
-            end_date=end_datetime,
-            event_type_id=event_type,
-            location=evangelism_group.location or "",
-            is_recurring=False,
+        session_datetime = timezone.make_aware(
+            datetime.combine(session_date, meeting_time)
+        )
+        events.append(
+            Event(
+                title=event_title,
+                description=f"Bible Study session for {evangelism_group.name}",
+                start_date=session_datetime,
+                end_date=session_datetime + timedelta(hours=1),
+                event_type_id=event_type,
+                location=evangelism_group.location or "",
+                is_recurring=False,
+            )
         )
 
-        session.event = event
-        session.save()
-
-        sessions.append(session)
-        occurrence_count += 1
-
-        # Calculate next date based on pattern
-        if recurrence_pattern == "weekly":
-            current_date += timedelta(weeks=1)
-        elif recurrence_pattern == "bi_weekly":
-            current_date += timedelta(weeks=2)
-        elif recurrence_pattern == "monthly":
-            current_date += timedelta(days=30)
-
-    return sessions
+    if dry_run or not sessions:
+        return sessions
+    return bulk_create_sessions_with_events(EvangelismSession, sessions, events)
 
 
 def generate_each1reach1_report(cluster: Optional[Cluster] = None, year: Optional[int] = None) -> Dict:
@@ -1062,20 +1173,27 @@ def generate_each1reach1_report(cluster: Optional[Cluster] = None, year: Optiona
     if year is None:
         year = timezone.now().year
 
-    goals = Each1Reach1Goal.objects.filter(year=year)
+    goals = Each1Reach1Goal.objects.filter(year=year).select_related("cluster")
     if cluster:
         goals = goals.filter(cluster=cluster)
 
-    total_target = sum(goal.target_conversions for goal in goals)
-    total_achieved = sum(goal.achieved_conversions for goal in goals)
-    completed_goals = goals.filter(status=Each1Reach1Goal.Status.COMPLETED).count()
+    totals = goals.aggregate(
+        total_clusters=Count("id"),
+        total_target=Coalesce(Sum("target_conversions"), 0),
+        total_achieved=Coalesce(Sum("achieved_conversions"), 0),
+        completed_goals=Count(
+            "id", filter=Q(status=Each1Reach1Goal.Status.COMPLETED)
+        ),
+    )
+    total_target = totals["total_target"]
+    total_achieved = totals["total_achieved"]
 
     return {
         "year": year,
-        "total_clusters": goals.count(),
+        "total_clusters": totals["total_clusters"],
         "total_target": total_target,
         "total_achieved": total_achieved,
-        "completed_goals": completed_goals,
+        "completed_goals": totals["completed_goals"],
         "overall_progress": round((total_achieved / total_target * 100), 2) if total_target > 0 else 0.0,
         "goals": [
             {
@@ -1171,6 +1289,112 @@ def build_drop_off_leakage(drop_offs_qs) -> Dict:
     }
 
 
+def _reached_people_by_year(*, branch_id: Optional[int], years: List[int]):
+    """``(person_id, reached_date, role)`` for people who reached all milestones in ``years``."""
+    people = people_meeting_reached_milestones(Person.objects.all())
+    if branch_id is not None:
+        people = people.filter(branch_id=branch_id)
+    return list(
+        annotate_people_reached_date(people)
+        .filter(reached_date__year__in=years)
+        .values_list("id", "reached_date", "role")
+    )
+
+
+def calculate_monthly_trends_for_years(
+    *,
+    branch_id: Optional[int] = None,
+    years: List[int],
+    reached_people: Optional[List] = None,
+) -> Dict[int, List[Dict]]:
+    """
+    Monthly stage statistics (as :func:`calculate_monthly_statistics`) for
+    every month of every year in ``years``.
+
+    Each figure is one grouped query over all the years at once (stage
+    tracking, NCC sessions, reached people and their prospects), so extra
+    years cost no extra queries. ``reached_people`` (from
+    :func:`_reached_people_by_year`) saves the reached-people query when the
+    caller already has it.
+    """
+    from django.db.models.functions import ExtractMonth, ExtractYear
+    from apps.lessons.models import LessonSessionReport
+
+    Stage = MonthlyConversionTracking.Stage
+    tracking = MonthlyConversionTracking.objects.filter(
+        year__in=years,
+        stage__in=[Stage.INVITED, Stage.ATTENDED, Stage.BAPTIZED, Stage.RECEIVED_HG],
+    )
+    if branch_id is not None:
+        tracking = tracking.filter(cluster__branch_id=branch_id)
+    prospects_by_stage: Dict[tuple, set] = {}
+    events_by_stage: Dict[tuple, int] = {}
+    for row in (
+        tracking.order_by()
+        .values("year", "month", "stage", "prospect_id")
+        .annotate(events=Count("id"))
+    ):
+        key = (row["year"], row["month"], row["stage"])
+        prospects_by_stage.setdefault(key, set()).add(row["prospect_id"])
+        events_by_stage[key] = events_by_stage.get(key, 0) + row["events"]
+
+    sessions = LessonSessionReport.objects.filter(session_date__year__in=years)
+    if branch_id is not None:
+        sessions = sessions.filter(student__branch_id=branch_id)
+    taken_ncc = {
+        (row["year"], row["month"]): row["people"]
+        for row in sessions.order_by()
+        .annotate(year=ExtractYear("session_date"), month=ExtractMonth("session_date"))
+        .values("year", "month")
+        .annotate(people=Count("student_id", distinct=True))
+    }
+
+    # REACHED counts each active prospect of a person in the month they reached.
+    if reached_people is None:
+        reached_people = _reached_people_by_year(branch_id=branch_id, years=years)
+    reached_month = {
+        person_id: (reached_date.year, reached_date.month)
+        for person_id, reached_date, _ in reached_people
+    }
+    converted: Dict[tuple, int] = {}
+    for row in (
+        Prospect.objects.filter(is_dropped_off=False, person_id__in=reached_month)
+        .order_by()
+        .values("person_id")
+        .annotate(prospects=Count("id"))
+    ):
+        month_key = reached_month[row["person_id"]]
+        converted[month_key] = converted.get(month_key, 0) + row["prospects"]
+
+    trends = {}
+    for year in years:
+        trend = []
+        for month in range(1, 13):
+            invited = prospects_by_stage.get((year, month, Stage.INVITED), set())
+            attended = prospects_by_stage.get((year, month, Stage.ATTENDED), set())
+            trend.append(
+                {
+                    "year": year,
+                    "month": month,
+                    "cluster_id": None,
+                    "cluster_name": "All Clusters",
+                    # INVITED only counts prospects who have not attended yet.
+                    "invited_count": len(invited - attended),
+                    "attended_count": len(attended),
+                    "taken_ncc_count": taken_ncc.get((year, month), 0),
+                    "baptized_count": events_by_stage.get(
+                        (year, month, Stage.BAPTIZED), 0
+                    ),
+                    "received_hg_count": events_by_stage.get(
+                        (year, month, Stage.RECEIVED_HG), 0
+                    ),
+                    "converted_count": converted.get((year, month), 0),
+                }
+            )
+        trends[year] = trend
+    return trends
+
+
 def calculate_yearly_monthly_trend(
     *,
     branch_id: Optional[int] = None,
@@ -1180,38 +1404,49 @@ def calculate_yearly_monthly_trend(
     if year is None:
         year = timezone.now().year
 
-    trend = []
-    for month in range(1, 13):
-        trend.append(
-            calculate_monthly_statistics(
-                branch_id=branch_id,
-                year=year,
-                month=month,
-            )[0]
-        )
-    return trend
+    return calculate_monthly_trends_for_years(branch_id=branch_id, years=[year])[year]
 
 
-def _count_completed_conversions(*, branch_id: Optional[int], year: int) -> int:
+def _completed_conversions_by_year(
+    *, branch_id: Optional[int], years: List[int]
+) -> Dict[int, int]:
     conversions = Conversion.objects.filter(
         is_complete=True,
-        conversion_date__year=year,
+        conversion_date__year__in=years,
     )
     if branch_id is not None:
         conversions = conversions.filter(cluster__branch_id=branch_id)
-    return conversions.count()
+    counts = conversions.aggregate(
+        **{
+            f"year_{year}": Count("id", filter=Q(conversion_date__year=year))
+            for year in years
+        }
+    )
+    return {year: counts[f"year_{year}"] for year in years}
 
 
-def _count_total_reached(*, branch_id: Optional[int], year: int) -> int:
-    people = people_meeting_reached_milestones(
-        Person.objects.exclude(role="ADMIN")
-    )
+def _drop_offs_by_year(*, branch_id: Optional[int], years: List[int]) -> Dict[int, Dict]:
+    """Drop-off totals and recovery rate per year, as conditional counts in one query."""
+    if not years:
+        return {}
+    drop_offs = DropOff.objects.filter(drop_off_date__year__in=years)
     if branch_id is not None:
-        people = people.filter(branch_id=branch_id)
-    people = annotate_people_reached_date(people).filter(
-        reached_date__year=year,
-    )
-    return people.values("id").distinct().count()
+        drop_offs = drop_offs.filter(_drop_off_branch_q(branch_id))
+    aggregates = {}
+    for year in years:
+        in_year = Q(drop_off_date__year=year)
+        aggregates[f"total_{year}"] = Count("id", filter=in_year)
+        aggregates[f"recovered_{year}"] = Count("id", filter=in_year & Q(recovered=True))
+    counts = drop_offs.aggregate(**aggregates)
+    totals = {}
+    for year in years:
+        total = counts[f"total_{year}"]
+        recovered = counts[f"recovered_{year}"]
+        totals[year] = {
+            "drop_offs": total,
+            "recovery_rate": round((recovered / total * 100), 2) if total > 0 else 0.0,
+        }
+    return totals
 
 
 def _build_v2b_by_cluster(*, branch_id: Optional[int], year: int) -> List[Dict]:
@@ -1251,10 +1486,19 @@ def generate_branch_scoped_v2b_summary(
     branch_id: Optional[int] = None,
     year: Optional[int] = None,
     single_branch_view: bool = False,
+    compare_years: int = 0,
 ) -> Dict:
-    """Build Visitor-to-Brethren analytics for optional branch and year scope."""
+    """
+    Build Visitor-to-Brethren analytics for optional branch and year scope.
+
+    ``comparisons`` holds the yearly summary and monthly trend for each of
+    the ``compare_years`` preceding years. The per-year figures for all
+    years share the same grouped queries. ``active_prospects`` and the
+    funnel are current state, so they are not repeated per year.
+    """
     if year is None:
         year = timezone.now().year
+    years = [year - offset for offset in range(compare_years + 1)]
 
     prospects = Prospect.objects.all()
     if branch_id is not None:
@@ -1266,23 +1510,44 @@ def generate_branch_scoped_v2b_summary(
 
     leakage = build_drop_off_leakage(drop_offs)
 
+    reached_people = _reached_people_by_year(branch_id=branch_id, years=years)
+    total_reached = {y: 0 for y in years}
+    for _, reached_date, role in reached_people:
+        if role != "ADMIN":
+            total_reached[reached_date.year] += 1
+    completed = _completed_conversions_by_year(branch_id=branch_id, years=years)
+    trends = calculate_monthly_trends_for_years(
+        branch_id=branch_id, years=years, reached_people=reached_people
+    )
+    earlier_drop_offs = _drop_offs_by_year(branch_id=branch_id, years=years[1:])
+
     return {
         "year": year,
         "summary": {
             "active_prospects": prospects.filter(is_dropped_off=False).count(),
-            "completed_conversions": _count_completed_conversions(
-                branch_id=branch_id, year=year
-            ),
-            "total_reached": _count_total_reached(branch_id=branch_id, year=year),
+            "completed_conversions": completed[year],
+            "total_reached": total_reached[year],
             "drop_offs": leakage["total_drop_offs"],
             "recovery_rate": leakage["recovery_rate"],
         },
         "funnel": build_pipeline_funnel(prospects),
-        "monthly_trend": calculate_yearly_monthly_trend(branch_id=branch_id, year=year),
+        "monthly_trend": trends[year],
         "leakage": leakage,
         "by_cluster": []
         if single_branch_view
         else _build_v2b_by_cluster(branch_id=branch_id, year=year),
+        "comparisons": [
+            {
+                "year": earlier,
+                "summary": {
+                    "completed_conversions": completed[earlier],
+                    "total_reached": total_reached[earlier],
+                    **earlier_drop_offs[earlier],
+                },
+                "monthly_trend": trends[earlier],
+            }
+            for earlier in years[1:]
+        ],
     }
 
 
@@ -1346,3 +1611,102 @@ def get_evangelism_dashboard_stats(year: int) -> Dict:
         "year": year,
     }
 
+
+BIBLE_SHARERS_COVERAGE_CACHE = "evangelism.bible_sharers_coverage"
+
+
+def bible_sharers_group_rows() -> List[Dict]:
+    """
+    Active Bible Sharers groups with non-admin member counts and coordinator
+    names, in one annotated query.
+
+    This is the part of the coverage report worth caching. The signal
+    handlers in ``apps/evangelism/signals.py`` invalidate it.
+    """
+    rows = (
+        EvangelismGroup.objects.filter(is_bible_sharers_group=True, is_active=True)
+        .order_by("name")
+        .annotate(members_count=Count("members", filter=~Q(members__role="ADMIN")))
+        .values(
+            "id",
+            "name",
+            "cluster_id",
+            "members_count",
+            "coordinator__first_name",
+            "coordinator__last_name",
+        )
+    )
+    groups = []
+    for row in rows:
+        coordinator = None
+        if row["coordinator__first_name"] is not None:
+            coordinator = (
+                f"{row['coordinator__first_name']} {row['coordinator__last_name']}".strip()
+            )
+        groups.append(
+            {
+                "id": row["id"],
+                "name": row["name"],
+                "cluster_id": row["cluster_id"],
+                "coordinator": coordinator,
+                "members_count": row["members_count"],
+            }
+        )
+    return groups
+
+
+def build_bible_sharers_coverage(
+    branch_id: Optional[int] = None, group_rows: Optional[List[Dict]] = None
+) -> Dict:
+    """
+    Which clusters have an active Bible Sharers group.
+
+    Takes one cluster query, plus the group query unless ``group_rows`` (from
+    :func:`bible_sharers_group_rows`, e.g. cached) is given. Clusters are
+    always read live, so cluster edits need no invalidation. With
+    ``branch_id``, only that branch's clusters and their groups are reported.
+    """
+    if group_rows is None:
+        group_rows = bible_sharers_group_rows()
+    clusters = Cluster.objects.order_by("name")
+    if branch_id is not None:
+        clusters = clusters.filter(branch_id=branch_id)
+    clusters = list(clusters.values("id", "name", "code"))
+
+    groups_by_cluster: Dict[int, List[Dict]] = {}
+    for row in group_rows:
+        if row["cluster_id"] is not None:
+            groups_by_cluster.setdefault(row["cluster_id"], []).append(
+                {key: value for key, value in row.items() if key != "cluster_id"}
+            )
+
+    coverage = []
+    clusters_without = []
+    total_groups = 0
+    for cluster in clusters:
+        cluster_groups = groups_by_cluster.get(cluster["id"], [])
+        total_groups += len(cluster_groups)
+        if not cluster_groups:
+            clusters_without.append(cluster["name"])
+        coverage.append(
+            {
+                "cluster": cluster,
+                "has_bible_sharers": bool(cluster_groups),
+                "bible_sharers_groups": cluster_groups,
+                "bible_sharers_count": sum(group["members_count"] for group in cluster_groups),
+            }
+        )
+    if branch_id is None:
+        # Church-wide totals include groups not attached to a cluster.
+        total_groups = len(group_rows)
+
+    return {
+        "coverage": coverage,
+        "summary": {
+            "total_clusters": len(coverage),
+            "clusters_with_bible_sharers": len(coverage) - len(clusters_without),
+            "clusters_without_bible_sharers": len(clusters_without),
+            "clusters_without_names": clusters_without,
+            "total_bible_sharers_groups": total_groups,
+        },
+    }
@@ -0,0 +1,242 @@
+"""
+Signal handlers for cached evangelism analytics (see apps/reports/analytics_cache.py),
+the stored weekly tallies (see apps/evangelism/tally.py) and Each1Reach1 goal
+progress.
+
+Bible Sharers coverage caches the group rows only; clusters are read live.
+Groups, their members and member roles (admins are not counted) invalidate
+the rows. Coordinator name edits are not tracked and show up once the
+cached rows expire.
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.people.models import Person
+from apps.reports.analytics_cache import bump_analytics_generation
+
+from .models import Conversion, EvangelismGroup, EvangelismWeeklyReport, WeeklyTallyAttendee
+from .services import (
+    BIBLE_SHARERS_COVERAGE_CACHE,
+    ensure_each1reach1_goals_for_year,
+    refresh_each1reach1_goal_progress,
+)
+from .tally import refresh_weekly_tallies
+
+
+@receiver(post_save, sender=EvangelismGroup)
+@receiver(post_delete, sender=EvangelismGroup)
+def invalidate_coverage_on_group_change(sender, instance, **kwargs):
+    bump_analytics_generation(BIBLE_SHARERS_COVERAGE_CACHE)
+
+
+@receiver(m2m_changed, sender=EvangelismGroup.members.through)
+def invalidate_coverage_on_members_change(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        bump_analytics_generation(BIBLE_SHARERS_COVERAGE_CACHE)
+
+
+@receiver(post_save, sender=Person)
+def invalidate_coverage_on_role_change(sender, instance, created, **kwargs):
+    # _original_role is stashed by the people pre_save handler.
+    if not created and getattr(instance, "_original_role", instance.role) != instance.role:
+        bump_analytics_generation(BIBLE_SHARERS_COVERAGE_CACHE)
+
+
+# --- Weekly tallies (see apps/evangelism/tally.py) ---
+
+
+def _group_cluster_id(group_id):
+    return (
+        EvangelismGroup.objects.filter(pk=group_id).values_list("cluster_id", flat=True).first()
+    )
+
+
+def _evangelism_report_key(report):
+    # Read the group's cluster from the database: a cached group can be stale.
+    return (_group_cluster_id(report.evangelism_group_id), report.year, report.week_number)
+
+
+def _report_keys(report_model, report_ids):
+    if report_model is EvangelismWeeklyReport:
+        cluster_path = "evangelism_group__cluster_id"
+    else:
+        cluster_path = "cluster_id"
+    return set(
+        report_model.objects.filter(pk__in=list(report_ids)).values_list(
+            cluster_path, "year", "week_number"
+        )
+    )
+
+
+@receiver(pre_save, sender=EvangelismWeeklyReport)
+def store_evangelism_report_original_values(sender, instance, **kwargs):
+    originals = instance.tracked_original_values()
+    instance._original_evangelism_group_id = originals["evangelism_group"]
+    instance._original_year = originals["year"]
+    instance._original_week_number = originals["week_number"]
+    instance._tracked_fields_changed = instance.pk is not None and bool(
+        instance.tracked_changes(originals)
+    )
+
+
+@receiver(post_save, sender=EvangelismWeeklyReport)
+def refresh_tally_on_evangelism_report_save(sender, instance, created, **kwargs):
+    key = _evangelism_report_key(instance)
+    keys = [key]
+    if not created and getattr(instance, "_tracked_fields_changed", False):
+        group_id = instance._original_evangelism_group_id
+        if group_id == instance.evangelism_group_id:
+            cluster_id = key[0]
+        else:
+            cluster_id = _group_cluster_id(group_id)
+        keys.append((cluster_id, instance._original_year, instance._original_week_number))
+    refresh_weekly_tallies(keys)
+
+
+@receiver(pre_delete, sender=EvangelismWeeklyReport)
+def store_evangelism_report_tally_key(sender, instance, **kwargs):
+    instance._tally_key = _evangelism_report_key(instance)
+
+
+@receiver(post_delete, sender=EvangelismWeeklyReport)
+def refresh_tally_on_evangelism_report_delete(sender, instance, **kwargs):
+    refresh_weekly_tallies([instance._tally_key])
+
+
+@receiver(post_save, sender=ClusterWeeklyReport)
+def refresh_tally_on_cluster_report_save(sender, instance, created, **kwargs):
+    # The _original_* values are stashed by the clusters pre_save handler.
+    keys = [(instance.cluster_id, instance.year, instance.week_number)]
+    if not created and getattr(instance, "_tracked_fields_changed", False):
+        keys.append(
+            (instance._original_cluster_id, instance._original_year, instance._original_week_number)
+        )
+    refresh_weekly_tallies(keys)
+
+
+@receiver(post_delete, sender=ClusterWeeklyReport)
+def refresh_tally_on_cluster_report_delete(sender, instance, **kwargs):
+    refresh_weekly_tallies([(instance.cluster_id, instance.year, instance.week_number)])
+
+
+@receiver(m2m_changed, sender=EvangelismWeeklyReport.members_attended.through)
+@receiver(m2m_changed, sender=EvangelismWeeklyReport.visitors_attended.through)
+@receiver(m2m_changed, sender=ClusterWeeklyReport.members_attended.through)
+@receiver(m2m_changed, sender=ClusterWeeklyReport.visitors_attended.through)
+def refresh_tally_on_attendance_change(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if not reverse:
+        if action not in ("post_add", "post_remove", "post_clear"):
+            return
+        if isinstance(instance, EvangelismWeeklyReport):
+            key = _evangelism_report_key(instance)
+        else:
+            key = (instance.cluster_id, instance.year, instance.week_number)
+        refresh_weekly_tallies([key])
+        return
+
+    # Reverse side: ``instance`` is the person and ``pk_set`` holds report ids.
+    report_model = model
+    if action == "pre_clear":
+        report_fk = f"{report_model._meta.model_name}_id"
+        instance._tally_cleared_keys = _report_keys(
+            report_model, sender.objects.filter(person=instance).values_list(report_fk, flat=True)
+        )
+    elif action == "post_clear":
+        refresh_weekly_tallies(getattr(instance, "_tally_cleared_keys", ()))
+    elif action in ("post_add", "post_remove") and pk_set:
+        refresh_weekly_tallies(_report_keys(report_model, pk_set))
+
+
+@receiver(pre_save, sender=EvangelismGroup)
+def store_group_original_cluster(sender, instance, **kwargs):
+    originals = instance.tracked_original_values()
+    instance._original_cluster_id = originals["cluster"]
+    instance._tracked_fields_changed = instance.pk is not None and bool(
+        instance.tracked_changes(originals)
+    )
+
+
+@receiver(post_save, sender=EvangelismGroup)
+def refresh_tallies_on_group_cluster_change(sender, instance, created, **kwargs):
+    if created or not getattr(instance, "_tracked_fields_changed", False):
+        return
+    weeks = set(instance.weekly_reports.values_list("year", "week_number"))
+    refresh_weekly_tallies(
+        (cluster_id, year, week)
+        for cluster_id in (instance._original_cluster_id, instance.cluster_id)
+        for year, week in weeks
+    )
+
+
+@receiver(pre_delete, sender=Cluster)
+def store_cluster_unassigned_weeks(sender, instance, **kwargs):
+    # Deleting a cluster un-assigns its evangelism groups (SET_NULL, no save signals).
+    instance._tally_unassigned_weeks = set(
+        EvangelismWeeklyReport.objects.filter(evangelism_group__cluster=instance).values_list(
+            "year", "week_number"
+        )
+    )
+
+
+@receiver(post_delete, sender=Cluster)
+def refresh_unassigned_tallies_on_cluster_delete(sender, instance, **kwargs):
+    refresh_weekly_tallies(
+        (None, year, week) for year, week in getattr(instance, "_tally_unassigned_weeks", ())
+    )
+
+
+@receiver(pre_delete, sender=Person)
+def store_person_tally_keys(sender, instance, **kwargs):
+    # Report attendance rows are removed by cascade, without m2m_changed.
+    instance._tally_keys = set(
+        WeeklyTallyAttendee.objects.filter(person=instance).values_list(
+            "tally__cluster_id", "tally__year", "tally__week_number"
+        )
+    )
+
+
+@receiver(post_delete, sender=Person)
+def refresh_tallies_on_person_delete(sender, instance, **kwargs):
+    refresh_weekly_tallies(getattr(instance, "_tally_keys", ()))
+
+
+# --- Each1Reach1 goal progress (see services.refresh_each1reach1_goal_progress) ---
+
+
+def _goal_key(cluster_id, conversion_date, is_complete):
+    """(year, cluster) whose goal counts the conversion, or None."""
+    if not is_complete or cluster_id is None or conversion_date is None:
+        return None
+    return (conversion_date.year, cluster_id)
+
+
+def _refresh_goals(keys, *, ensure=()):
+    for year, cluster_id in keys:
+        if (year, cluster_id) in ensure:
+            ensure_each1reach1_goals_for_year(year, cluster_ids=[cluster_id])
+        refresh_each1reach1_goal_progress(year, cluster_ids=[cluster_id])
+
+
+@receiver(pre_save, sender=Conversion)
+def store_conversion_original_values(sender, instance, **kwargs):
+    originals = instance.tracked_original_values()
+    instance._original_goal_key = _goal_key(
+        originals["cluster"], originals["conversion_date"], originals["is_complete"]
+    )
+
+
+@receiver(post_save, sender=Conversion)
+def refresh_goal_progress_on_conversion_save(sender, instance, **kwargs):
+    current = _goal_key(instance.cluster_id, instance.conversion_date, instance.is_complete)
+    previous = getattr(instance, "_original_goal_key", None)
+    # Un-completing or moving a conversion must lower the goal it used to count in.
+    keys = {key for key in (current, previous) if key is not None}
+    _refresh_goals(keys, ensure={current})
+
+
+@receiver(post_delete, sender=Conversion)
+def refresh_goal_progress_on_conversion_delete(sender, instance, **kwargs):
+    key = _goal_key(instance.cluster_id, instance.conversion_date, instance.is_complete)
+    if key is not None:
+        _refresh_goals([key])
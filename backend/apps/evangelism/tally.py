@@ -0,0 +1,357 @@
+"""
+Weekly evangelism + cluster report tallies (``WeeklyTally``).
+
+One row per (cluster, ISO year, ISO week) adds up the week's evangelism
+reports (by their group's cluster) and cluster reports:
+
+- report counts, new prospects and conversions (evangelism reports only);
+- the earliest meeting date and the gathering type (MIXED when the reports
+  disagree);
+- distinct member and visitor counts. The attendees behind them are kept in
+  ``WeeklyTallyAttendee``, one row per person and kind, so a person on several
+  of the week's reports is counted once.
+
+The handlers in ``apps/evangelism/signals.py`` pass the keys a change touched
+to :func:`refresh_weekly_tallies`. That function re-reads only those weeks
+from the report tables and rewrites the affected tallies and attendee rows.
+The tally endpoint then reads the stored rows.
+
+Changes that bypass model signals are not picked up. These include
+``bulk_create`` and ``QuerySet.update``. Run
+``python manage.py rebuild_weekly_tallies`` after such changes and once when
+the tally tables are first deployed.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Min, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from apps.clusters.models import ClusterWeeklyReport
+
+from .models import EvangelismWeeklyReport, WeeklyTally, WeeklyTallyAttendee
+
+TallyKey = Tuple[Optional[int], int, int]
+
+Kind = WeeklyTallyAttendee.Kind
+
+TALLY_FIELDS = [
+    "meeting_date",
+    "gathering_type",
+    "members_count",
+    "visitors_count",
+    "evangelism_reports_count",
+    "cluster_reports_count",
+    "new_prospects",
+    "conversions_this_week",
+]
+
+
+def _new_entry(cluster_id, cluster_name, cluster_code, year: int, week: int) -> dict:
+    if cluster_id is None:
+        cluster_name = cluster_code = "Unassigned"
+    return {
+        "cluster_id": cluster_id,
+        # Blank names/codes are kept; only Unassigned when there is no cluster.
+        "cluster_name": cluster_name,
+        "cluster_code": cluster_code,
+        "year": year,
+        "week_number": week,
+        "meeting_dates": [],
+        "gathering_types": set(),
+        "members": set(),
+        "visitors": set(),
+        "evangelism_reports_count": 0,
+        "cluster_reports_count": 0,
+        "new_prospects": 0,
+        "conversions_this_week": 0,
+    }
+
+
+def collect_weekly_tallies(evangelism_qs, cluster_qs) -> Dict[TallyKey, dict]:
+    """
+    Aggregate the given report querysets per (cluster, year, week).
+
+    One grouped query per report table and one read per attendance table;
+    attendees are returned as ``members`` / ``visitors`` person id sets.
+    """
+    entries: Dict[TallyKey, dict] = {}
+
+    def entry_for(cluster_id, name, code, year, week) -> dict:
+        key = (cluster_id, int(year), int(week))
+        if key not in entries:
+            entries[key] = _new_entry(cluster_id, name, code, int(year), int(week))
+        return entries[key]
+
+    for row in (
+        evangelism_qs.values(
+            "evangelism_group__cluster_id",
+            "evangelism_group__cluster__name",
+            "evangelism_group__cluster__code",
+            "year",
+            "week_number",
+            "gathering_type",
+        )
+        .annotate(
+            reports=Count("id"),
+            prospects=Coalesce(Sum("new_prospects"), 0),
+            conversions=Coalesce(Sum("conversions_this_week"), 0),
+            first_meeting=Min("meeting_date"),
+        )
+        .order_by()
+    ):
+        entry = entry_for(
+            row["evangelism_group__cluster_id"],
+            row["evangelism_group__cluster__name"],
+            row["evangelism_group__cluster__code"],
+            row["year"],
+            row["week_number"],
+        )
+        entry["evangelism_reports_count"] += row["reports"]
+        entry["new_prospects"] += row["prospects"]
+        entry["conversions_this_week"] += row["conversions"]
+        if row["first_meeting"] is not None:
+            entry["meeting_dates"].append(row["first_meeting"])
+        if row["gathering_type"]:
+            entry["gathering_types"].add(row["gathering_type"])
+
+    for row in (
+        cluster_qs.values(
+            "cluster_id", "cluster__name", "cluster__code", "year", "week_number", "gathering_type"
+        )
+        .annotate(reports=Count("id"), first_meeting=Min("meeting_date"))
+        .order_by()
+    ):
+        entry = entry_for(
+            row["cluster_id"],
+            row["cluster__name"],
+            row["cluster__code"],
+            row["year"],
+            row["week_number"],
+        )
+        entry["cluster_reports_count"] += row["reports"]
+        if row["first_meeting"] is not None:
+            entry["meeting_dates"].append(row["first_meeting"])
+        if row["gathering_type"]:
+            entry["gathering_types"].add(row["gathering_type"])
+
+    attendance = (
+        (
+            EvangelismWeeklyReport,
+            "evangelismweeklyreport",
+            "evangelism_group__cluster_id",
+            evangelism_qs,
+        ),
+        (ClusterWeeklyReport, "clusterweeklyreport", "cluster_id", cluster_qs),
+    )
+    for model, report_fk, cluster_path, reports in attendance:
+        for field, kind in (("members_attended", "members"), ("visitors_attended", "visitors")):
+            through = getattr(model, field).through
+            for cluster_id, year, week, person_id in through.objects.filter(
+                **{f"{report_fk}_id__in": reports.values("id")}
+            ).values_list(
+                f"{report_fk}__{cluster_path}",
+                f"{report_fk}__year",
+                f"{report_fk}__week_number",
+                "person_id",
+            ):
+                entry = entries.get((cluster_id, int(year), int(week)))
+                if entry is not None and person_id is not None:
+                    entry[kind].add(person_id)
+    return entries
+
+
+def _gathering_type(gathering_types: set) -> str:
+    if not gathering_types:
+        return "UNKNOWN"
+    if len(gathering_types) == 1:
+        return next(iter(gathering_types))
+    return "MIXED"
+
+
+def _apply_entry(tally: WeeklyTally, entry: dict) -> None:
+    tally.meeting_date = min(entry["meeting_dates"]) if entry["meeting_dates"] else None
+    tally.gathering_type = _gathering_type(entry["gathering_types"])
+    tally.members_count = len(entry["members"])
+    tally.visitors_count = len(entry["visitors"])
+    tally.evangelism_reports_count = entry["evangelism_reports_count"]
+    tally.cluster_reports_count = entry["cluster_reports_count"]
+    tally.new_prospects = entry["new_prospects"]
+    tally.conversions_this_week = entry["conversions_this_week"]
+    tally.updated_at = timezone.now()
+
+
+def _attendee_rows(entry: dict) -> set:
+    return {(person_id, Kind.MEMBER) for person_id in entry["members"]} | {
+        (person_id, Kind.VISITOR) for person_id in entry["visitors"]
+    }
+
+
+def build_weekly_tally_rows(evangelism_qs, cluster_qs) -> List[dict]:
+    """Tally rows computed live from the report querysets, newest week first."""
+    rows = []
+    for entry in collect_weekly_tallies(evangelism_qs, cluster_qs).values():
+        tally = WeeklyTally()
+        _apply_entry(tally, entry)
+        rows.append(
+            {
+                "cluster_id": entry["cluster_id"],
+                "cluster_name": entry["cluster_name"],
+                "cluster_code": entry["cluster_code"],
+                "year": entry["year"],
+                "week_number": entry["week_number"],
+                **{field: getattr(tally, field) for field in TALLY_FIELDS},
+            }
+        )
+    rows.sort(key=lambda r: (r["year"], r["week_number"]), reverse=True)
+    return rows
+
+
+def tally_row(tally: WeeklyTally) -> dict:
+    """A stored tally in the shape of :func:`build_weekly_tally_rows` (``cluster`` selected)."""
+    cluster = tally.cluster
+    return {
+        "cluster_id": tally.cluster_id,
+        "cluster_name": cluster.name if cluster else "Unassigned",
+        "cluster_code": cluster.code if cluster else "Unassigned",
+        "year": tally.year,
+        "week_number": tally.week_number,
+        **{field: getattr(tally, field) for field in TALLY_FIELDS},
+    }
+
+
+def _keys_q(keys: Iterable[TallyKey], cluster_path: str) -> Q:
+    q = Q()
+    for cluster_id, year, week in keys:
+        if cluster_id is None:
+            q |= Q(**{f"{cluster_path}__isnull": True, "year": year, "week_number": week})
+        else:
+            q |= Q(**{cluster_path: cluster_id, "year": year, "week_number": week})
+    return q
+
+
+def refresh_weekly_tallies(keys: Iterable[TallyKey]) -> int:
+    """
+    Re-read the weeks of ``keys`` from the report tables and rewrite their tallies.
+
+    Tallies whose week no longer has any report are deleted. Returns the number
+    of tallies written or deleted.
+
+    The tally row is the week's lock: missing rows are inserted first (an
+    insert racing another refresh waits for it and reuses its row), then every
+    row is locked before the weeks are re-read. Concurrent refreshes of a week
+    therefore run one after the other, each reading the other's reports.
+    """
+    keys = {
+        (cluster_id, int(year), int(week))
+        for cluster_id, year, week in keys
+        if year is not None and week is not None
+    }
+    if not keys:
+        return 0
+
+    cluster_keys = [key for key in keys if key[0] is not None]
+    with transaction.atomic():
+        present = set(
+            WeeklyTally.objects.filter(_keys_q(keys, "cluster_id")).values_list(
+                "cluster_id", "year", "week_number"
+            )
+        )
+        for cluster_id, year, week in keys - present:
+            WeeklyTally.objects.get_or_create(cluster_id=cluster_id, year=year, week_number=week)
+        existing = {
+            (tally.cluster_id, tally.year, tally.week_number): tally
+            for tally in WeeklyTally.objects.select_for_update().filter(
+                _keys_q(keys, "cluster_id")
+            )
+        }
+        entries = collect_weekly_tallies(
+            EvangelismWeeklyReport.objects.filter(_keys_q(keys, "evangelism_group__cluster_id")),
+            ClusterWeeklyReport.objects.filter(_keys_q(cluster_keys, "cluster_id"))
+            if cluster_keys
+            else ClusterWeeklyReport.objects.none(),
+        )
+
+        emptied = [tally.pk for key, tally in existing.items() if key not in entries]
+        if emptied:
+            WeeklyTally.objects.filter(pk__in=emptied).delete()
+
+        updated = []
+        for key, entry in entries.items():
+            tally = existing[key]
+            _apply_entry(tally, entry)
+            updated.append(tally)
+        if updated:
+            WeeklyTally.objects.bulk_update(updated, [*TALLY_FIELDS, "updated_at"])
+
+        _sync_attendees({existing[key].pk: _attendee_rows(entry) for key, entry in entries.items()})
+    return len(entries) + len(emptied)
+
+
+def _sync_attendees(wanted_by_tally: Dict[int, set]) -> None:
+    if not wanted_by_tally:
+        return
+    stale = []
+    present = set()
+    for pk, tally_id, person_id, kind in WeeklyTallyAttendee.objects.filter(
+        tally_id__in=list(wanted_by_tally)
+    ).values_list("pk", "tally_id", "person_id", "kind"):
+        if (person_id, kind) in wanted_by_tally[tally_id]:
+            present.add((tally_id, person_id, kind))
+        else:
+            stale.append(pk)
+    if stale:
+        WeeklyTallyAttendee.objects.filter(pk__in=stale).delete()
+    WeeklyTallyAttendee.objects.bulk_create(
+        [
+            WeeklyTallyAttendee(tally_id=tally_id, person_id=person_id, kind=kind)
+            for tally_id, rows in wanted_by_tally.items()
+            for person_id, kind in rows
+            if (tally_id, person_id, kind) not in present
+        ],
+        ignore_conflicts=True,
+    )
+
+
+def rebuild_weekly_tallies(*, dry_run: bool = False, using: str = "default") -> int:
+    """Rebuild every tally from the report tables; returns the number of tallies."""
+    with transaction.atomic(using=using):
+        return _rebuild_weekly_tallies(dry_run=dry_run, using=using)
+
+
+def _rebuild_weekly_tallies(*, dry_run: bool, using: str) -> int:
+    entries = collect_weekly_tallies(
+        EvangelismWeeklyReport.objects.using(using).all(),
+        ClusterWeeklyReport.objects.using(using).all(),
+    )
+    if dry_run:
+        return len(entries)
+
+    tallies = WeeklyTally.objects.using(using)
+    tallies.all().delete()
+    rows = []
+    for (cluster_id, year, week), entry in entries.items():
+        tally = WeeklyTally(cluster_id=cluster_id, year=year, week_number=week)
+        _apply_entry(tally, entry)
+        rows.append(tally)
+    tallies.bulk_create(rows, batch_size=1000)
+
+    tally_ids = {
+        (cluster_id, year, week): pk
+        for pk, cluster_id, year, week in tallies.values_list(
+            "pk", "cluster_id", "year", "week_number"
+        )
+    }
+    WeeklyTallyAttendee.objects.using(using).bulk_create(
+        (
+            WeeklyTallyAttendee(tally_id=tally_ids[key], person_id=person_id, kind=kind)
+            for key, entry in entries.items()
+            for person_id, kind in _attendee_rows(entry)
+        ),
+        batch_size=1000,
+    )
+    return len(entries)
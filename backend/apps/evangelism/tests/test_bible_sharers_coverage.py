@@ -0,0 +1,137 @@
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.evangelism.models import EvangelismGroup
+from apps.evangelism.services import build_bible_sharers_coverage
+from apps.people.models import Branch, Person
+
+URL = "/api/evangelism/groups/bible_sharers_coverage/"
+
+
+class BibleSharersCoverageTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name="Coverage Branch", code="COV")
+        self.other_branch = Branch.objects.create(name="Other Coverage", code="COV2")
+        self.coordinator = self._person("sharer", first_name="Sharon", last_name="Lee")
+        self.member = self._person("member")
+        self.admin = self._person("admin", role="ADMIN")
+        self.covered = Cluster.objects.create(code="COV-A", name="Alpha", branch=self.branch)
+        self.uncovered = Cluster.objects.create(code="COV-B", name="Beta", branch=self.branch)
+        self.elsewhere = Cluster.objects.create(
+            code="COV-C", name="Gamma", branch=self.other_branch
+        )
+        self.group = self._group("Alpha Sharers", self.covered, coordinator=self.coordinator)
+        self.group.members.add(self.coordinator, self.member, self.admin)
+        # Not counted: inactive, or not a Bible Sharers group.
+        self._group("Old Sharers", self.uncovered, is_active=False)
+        self._group("Outreach", self.uncovered, is_bible_sharers_group=False)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.member)
+
+    def _person(self, username, role="MEMBER", **names):
+        return Person.objects.create_user(
+            username=username,
+            password="x",
+            first_name=names.get("first_name", username.title()),
+            last_name=names.get("last_name", "Coverage"),
+            role=role,
+            branch=self.branch,
+        )
+
+    def _group(self, name, cluster, *, is_active=True, is_bible_sharers_group=True, **extra):
+        return EvangelismGroup.objects.create(
+            name=name,
+            cluster=cluster,
+            is_active=is_active,
+            is_bible_sharers_group=is_bible_sharers_group,
+            **extra,
+        )
+
+    def test_coverage_payload_and_branch_scope(self):
+        self._group("Floating Sharers", None)
+
+        response = self.client.get(URL)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        alpha, beta, gamma = response.data["coverage"]
+        self.assertEqual(alpha["cluster"], {"id": self.covered.id, "name": "Alpha", "code": "COV-A"})
+        self.assertTrue(alpha["has_bible_sharers"])
+        self.assertEqual(alpha["bible_sharers_count"], 2)
+        self.assertEqual(
+            alpha["bible_sharers_groups"],
+            [
+                {
+                    "id": self.group.id,
+                    "name": "Alpha Sharers",
+                    "coordinator": "Sharon Lee",
+                    "members_count": 2,
+                }
+            ],
+        )
+        self.assertFalse(beta["has_bible_sharers"])
+        self.assertEqual(
+            response.data["summary"],
+            {
+                "total_clusters": 3,
+                "clusters_with_bible_sharers": 1,
+                "clusters_without_bible_sharers": 2,
+                "clusters_without_names": ["Beta", "Gamma"],
+                "total_bible_sharers_groups": 2,
+            },
+        )
+
+        scoped = self.client.get(URL, {"branch": self.other_branch.id})
+        self.assertEqual([row["cluster"]["name"] for row in scoped.data["coverage"]], ["Gamma"])
+        self.assertEqual(scoped.data["summary"]["total_bible_sharers_groups"], 0)
+        self.assertEqual(
+            self.client.get(URL, {"branch": "x"}).status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+    def test_builder_query_count_does_not_grow(self):
+        with self.assertNumQueries(2):
+            build_bible_sharers_coverage()
+        for index in range(5):
+            cluster = Cluster.objects.create(
+                code=f"COV-X{index}", name=f"Extra {index}", branch=self.branch
+            )
+            group = self._group(f"Extra Sharers {index}", cluster, coordinator=self.coordinator)
+            group.members.add(self.member)
+        with self.assertNumQueries(2):
+            coverage = build_bible_sharers_coverage(branch_id=self.branch.id)
+        self.assertEqual(coverage["summary"]["clusters_with_bible_sharers"], 6)
+
+    def test_cached_payload_is_invalidated_by_changes(self):
+        self.client.get(URL)
+        with CaptureQueriesContext(connection) as cached:
+            response = self.client.get(URL)
+        self.assertFalse(any("evangelism_evangelismgroup" in q["sql"] for q in cached))
+        self.assertEqual(response.data["summary"]["clusters_with_bible_sharers"], 1)
+
+        beta_group = self._group("Beta Sharers", self.uncovered)
+        self.assertEqual(
+            self.client.get(URL).data["summary"]["clusters_with_bible_sharers"], 2
+        )
+
+        beta_group.members.add(self.member)
+        beta = self.client.get(URL).data["coverage"][1]
+        self.assertEqual(beta["bible_sharers_count"], 1)
+
+        self.uncovered.name = "Bravo"
+        self.uncovered.save()
+        self.assertEqual(self.client.get(URL).data["coverage"][1]["cluster"]["name"], "Bravo")
+
+        self.member.role = "ADMIN"
+        self.member.save()
+        self.assertEqual(self.client.get(URL).data["coverage"][1]["bible_sharers_count"], 0)
+
+    @override_settings(ANALYTICS_CACHE_SECONDS=0)
+    def test_cache_can_be_disabled(self):
+        self.client.get(URL)
+        with CaptureQueriesContext(connection) as uncached:
+            self.client.get(URL)
+        self.assertTrue(any("evangelism_evangelismgroup" in q["sql"] for q in uncached))
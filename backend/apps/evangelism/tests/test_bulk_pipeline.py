@@ -0,0 +1,193 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.evangelism.bulk_pipeline import (
+    bulk_mark_dropped_off,
+    bulk_transition_prospects,
+    sweep_drop_offs,
+)
+from apps.evangelism.models import DropOff, MonthlyConversionTracking, Prospect
+from apps.people.models import Journey, Person
+
+AS_OF = date(2026, 6, 30)
+
+
+class BulkPipelineTests(TestCase):
+    def setUp(self):
+        self.admin = Person.objects.create_user(
+            username="bulk_pipeline_admin", password="pw", role="ADMIN"
+        )
+        self.inviter = Person.objects.create_user(
+            username="bulk_pipeline_inviter", password="pw", role="MEMBER"
+        )
+        self.cluster = Cluster.objects.create(code="BP", name="Bulk Pipeline")
+
+    def _prospect(self, name, *, last_activity, stage=Prospect.PipelineStage.INVITED, **extra):
+        return Prospect.objects.create(
+            first_name=name,
+            last_name="Prospect",
+            invited_by=self.inviter,
+            inviter_cluster=self.cluster,
+            pipeline_stage=stage,
+            last_activity_date=last_activity,
+            **extra,
+        )
+
+    def test_sweep_marks_inactive_prospects_in_constant_queries(self):
+        stale = [self._prospect(f"Stale{i}", last_activity=date(2026, 4, i + 1)) for i in range(5)]
+        self._prospect("Recent", last_activity=date(2026, 6, 20))
+        self._prospect(
+            "Reached",
+            last_activity=date(2026, 1, 1),
+            stage=Prospect.PipelineStage.REACHED,
+        )
+
+        # read candidates + (update prospects, read drop-offs, insert) in a savepoint
+        with self.assertNumQueries(6):
+            summary = sweep_drop_offs(30, as_of=AS_OF)
+
+        self.assertEqual(summary["dropped_off"], 5)
+        self.assertEqual(summary["by_stage"], {"INVITED": 5})
+        self.assertEqual(
+            set(Prospect.objects.filter(is_dropped_off=True).values_list("id", flat=True)),
+            {p.id for p in stale},
+        )
+        record = DropOff.objects.get(prospect=stale[0])
+        self.assertEqual(record.days_inactive, 90)
+        self.assertEqual(record.drop_off_stage, "INVITED")
+        self.assertEqual(record.reason, DropOff.DropOffReason.NO_CONTACT)
+        self.assertEqual(sweep_drop_offs(30, as_of=AS_OF)["dropped_off"], 0)
+
+    def test_sweep_dry_run_writes_nothing(self):
+        self._prospect("Stale", last_activity=date(2026, 1, 1))
+        summary = sweep_drop_offs(30, as_of=AS_OF, dry_run=True)
+        self.assertEqual(summary["dropped_off"], 1)
+        self.assertFalse(DropOff.objects.exists())
+        self.assertFalse(Prospect.objects.filter(is_dropped_off=True).exists())
+
+    def test_redrop_after_recovery_refreshes_existing_record(self):
+        prospect = self._prospect("Again", last_activity=date(2026, 5, 1))
+        bulk_mark_dropped_off([prospect.id], reason="NO_SHOW", as_of=AS_OF)
+        DropOff.objects.filter(prospect=prospect).update(recovered=True)
+        Prospect.objects.filter(id=prospect.id).update(is_dropped_off=False)
+
+        self.assertEqual(
+            bulk_mark_dropped_off([prospect.id], reason="MOVED", as_of=date(2026, 7, 31)),
+            1,
+        )
+        record = DropOff.objects.get(prospect=prospect)
+        self.assertEqual(record.reason, "MOVED")
+        self.assertEqual(record.days_inactive, 91)
+        self.assertFalse(record.recovered)
+
+    def test_bulk_transition_writes_stage_tracking_and_visitor_milestones(self):
+        visitor = Person.objects.create_user(
+            username="bulk_pipeline_visitor", password="pw", role="VISITOR"
+        )
+        with_person = self._prospect("Linked", last_activity=date(2026, 5, 1), person=visitor)
+        plain = self._prospect("Plain", last_activity=date(2026, 5, 1))
+        MonthlyConversionTracking.objects.create(
+            cluster=self.cluster,
+            prospect=plain,
+            year=2026,
+            month=6,
+            stage="BAPTIZED",
+            first_date_in_stage=date(2026, 6, 25),
+        )
+
+        moved = bulk_transition_prospects(
+            [with_person.id, plain.id], "BAPTIZED", activity_date=date(2026, 6, 10)
+        )
+
+        self.assertEqual(moved, 2)
+        self.assertEqual(
+            set(Prospect.objects.values_list("pipeline_stage", "last_activity_date")),
+            {("BAPTIZED", date(2026, 6, 10))},
+        )
+        tracking = MonthlyConversionTracking.objects.filter(stage="BAPTIZED")
+        self.assertEqual(tracking.count(), 2)
+        self.assertEqual(
+            set(tracking.values_list("first_date_in_stage", flat=True)),
+            {date(2026, 6, 10)},
+        )
+        visitor.refresh_from_db()
+        self.assertEqual(visitor.water_baptism_date, date(2026, 6, 10))
+        self.assertTrue(
+            Journey.objects.filter(user=visitor, type="BAPTISM").exists()
+        )
+
+    def test_bulk_transition_to_attended_creates_people(self):
+        prospects = [self._prospect(f"New{i}", last_activity=date(2026, 5, 1)) for i in range(2)]
+        bulk_transition_prospects(
+            [p.id for p in prospects], "ATTENDED", activity_date=date(2026, 6, 7)
+        )
+        for prospect in prospects:
+            prospect.refresh_from_db()
+            self.assertIsNotNone(prospect.person)
+            self.assertEqual(prospect.person.date_first_attended, date(2026, 6, 7))
+            self.assertEqual(prospect.pipeline_stage, "ATTENDED")
+
+    def test_api_bulk_transition_and_sweep_permissions(self):
+        prospect = self._prospect("Api", last_activity=date(2026, 1, 1))
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        response = client.post(
+            "/api/evangelism/prospects/bulk-transition/",
+            {"prospect_ids": [prospect.id, 999999], "pipeline_stage": "TAKEN_NCC"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 400)
+
+        response = client.post(
+            "/api/evangelism/prospects/bulk-transition/",
+            {
+                "prospect_ids": [prospect.id],
+                "pipeline_stage": "TAKEN_NCC",
+                "last_activity_date": "2026-01-10",
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 1)
+
+        response = client.post(
+            "/api/evangelism/prospects/sweep-drop-offs/",
+            {"inactivity_days": 30, "dry_run": True},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["dropped_off"], 1)
+        self.assertTrue(response.data["dry_run"])
+
+        member = APIClient()
+        member.force_authenticate(user=self.inviter)
+        response = member.post("/api/evangelism/prospects/sweep-drop-offs/", {}, format="json")
+        self.assertEqual(response.status_code, 403)
+
+    def test_mark_dropped_off_action_uses_bulk_core(self):
+        prospect = self._prospect("Single", last_activity=date(2026, 1, 1))
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        response = client.post(
+            f"/api/evangelism/prospects/{prospect.id}/mark_dropped_off/",
+            {"reason": "LOST_INTEREST"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["is_dropped_off"])
+        self.assertEqual(DropOff.objects.get(prospect=prospect).reason, "LOST_INTEREST")
+
+    def test_command_dry_run(self):
+        self._prospect("Cmd", last_activity=date(2026, 1, 1))
+        out = StringIO()
+        call_command(
+            "sweep_prospect_drop_offs", "--as-of", "2026-06-30", "--dry-run", stdout=out
+        )
+        self.assertIn("Would drop off 1 prospect(s)", out.getvalue())
+        self.assertFalse(DropOff.objects.exists())
@@ -0,0 +1,181 @@
+from datetime import date
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.evangelism.models import Conversion, Each1Reach1Goal
+from apps.evangelism.services import (
+    ensure_each1reach1_goals_for_year,
+    refresh_each1reach1_goal_progress,
+    update_each1reach1_goal,
+)
+from apps.people.models import Person
+
+
+class Each1Reach1GoalProgressTests(TestCase):
+    year = 2026
+
+    def setUp(self):
+        self.admin = Person.objects.create_user(
+            username="goal_progress_admin", password="password123", role="ADMIN"
+        )
+        self.members = [
+            Person.objects.create_user(
+                username=f"goal_progress_member_{i}",
+                password="password123",
+                role="MEMBER",
+            )
+            for i in range(3)
+        ]
+        self.alpha = Cluster.objects.create(code="GP-A", name="Alpha")
+        self.beta = Cluster.objects.create(code="GP-B", name="Beta")
+        self.gamma = Cluster.objects.create(code="GP-C", name="Gamma")
+        self.alpha.members.add(self.admin, *self.members)
+        self.beta.members.add(self.members[0])
+
+    def _conversion(self, cluster, *, complete=True, on=None):
+        person = Person.objects.create_user(
+            username=f"convert_{Conversion.objects.count()}",
+            password="password123",
+            role="MEMBER",
+        )
+        return Conversion.objects.create(
+            person=person,
+            converted_by=self.members[0],
+            cluster=cluster,
+            conversion_date=on or date(self.year, 3, 1),
+            is_complete=complete,
+        )
+
+    def test_ensure_goals_bulk_creates_missing_with_member_targets(self):
+        Each1Reach1Goal.objects.create(
+            cluster=self.gamma, year=self.year, target_conversions=9
+        )
+        self._conversion(self.beta)
+        self._conversion(self.beta, complete=False)
+        self._conversion(self.beta, on=date(self.year - 1, 5, 1))
+        # Saving the completed conversions already created their goals.
+        Each1Reach1Goal.objects.exclude(cluster=self.gamma).delete()
+
+        with self.assertNumQueries(2):
+            created = ensure_each1reach1_goals_for_year(self.year)
+
+        self.assertEqual(created, 2)
+        alpha = Each1Reach1Goal.objects.get(cluster=self.alpha, year=self.year)
+        beta = Each1Reach1Goal.objects.get(cluster=self.beta, year=self.year)
+        self.assertEqual(alpha.target_conversions, 6)
+        self.assertEqual(alpha.achieved_conversions, 0)
+        self.assertEqual(alpha.status, Each1Reach1Goal.Status.NOT_STARTED)
+        self.assertEqual(beta.target_conversions, 2)
+        self.assertEqual(beta.achieved_conversions, 1)
+        self.assertEqual(beta.status, Each1Reach1Goal.Status.IN_PROGRESS)
+        self.assertEqual(
+            Each1Reach1Goal.objects.get(cluster=self.gamma).target_conversions, 9
+        )
+        self.assertEqual(ensure_each1reach1_goals_for_year(self.year), 0)
+
+    def test_ensure_goals_counts_only_missing_goals(self):
+        self.assertEqual(ensure_each1reach1_goals_for_year(self.year, [self.alpha.id]), 1)
+        self.assertEqual(
+            ensure_each1reach1_goals_for_year(self.year, [self.alpha.id, self.beta.id]), 1
+        )
+
+    def test_repeated_updates_do_not_double_count(self):
+        conversion = self._conversion(self.beta)
+        update_each1reach1_goal(conversion)
+        update_each1reach1_goal(conversion)
+        goal = Each1Reach1Goal.objects.get(cluster=self.beta, year=self.year)
+        self.assertEqual(goal.achieved_conversions, 1)
+
+        second = self._conversion(self.beta)
+        update_each1reach1_goal(second)
+        goal.refresh_from_db()
+        self.assertEqual(goal.achieved_conversions, 2)
+        self.assertEqual(goal.status, Each1Reach1Goal.Status.COMPLETED)
+
+    def test_delete_and_uncomplete_lower_progress(self):
+        first = self._conversion(self.beta)
+        second = self._conversion(self.beta)
+        goal = Each1Reach1Goal.objects.get(cluster=self.beta, year=self.year)
+        self.assertEqual(goal.achieved_conversions, 2)
+        self.assertEqual(goal.status, Each1Reach1Goal.Status.COMPLETED)
+
+        second.is_complete = False
+        second.save(update_fields=["is_complete"])
+        goal.refresh_from_db()
+        self.assertEqual(goal.achieved_conversions, 1)
+        self.assertEqual(goal.status, Each1Reach1Goal.Status.IN_PROGRESS)
+
+        first.delete()
+        goal.refresh_from_db()
+        self.assertEqual(goal.achieved_conversions, 0)
+        self.assertEqual(goal.status, Each1Reach1Goal.Status.NOT_STARTED)
+
+    def test_moving_a_conversion_refreshes_both_goals(self):
+        conversion = self._conversion(self.beta)
+        conversion.cluster = self.alpha
+        conversion.save()
+        progress = dict(
+            Each1Reach1Goal.objects.filter(year=self.year).values_list(
+                "cluster__code", "achieved_conversions"
+            )
+        )
+        self.assertEqual(progress, {"GP-A": 1, "GP-B": 0})
+
+    def test_refresh_recomputes_progress_in_bulk(self):
+        ensure_each1reach1_goals_for_year(self.year)
+        self._conversion(self.alpha)
+        self._conversion(self.beta)
+        Each1Reach1Goal.objects.filter(cluster=self.gamma).update(
+            achieved_conversions=4, status=Each1Reach1Goal.Status.IN_PROGRESS
+        )
+
+        with self.assertNumQueries(4):
+            refreshed = refresh_each1reach1_goal_progress(self.year)
+
+        self.assertEqual(refreshed, 3)
+        progress = dict(
+            Each1Reach1Goal.objects.filter(year=self.year).values_list(
+                "cluster__code", "achieved_conversions"
+            )
+        )
+        self.assertEqual(progress, {"GP-A": 1, "GP-B": 1, "GP-C": 0})
+        self.assertEqual(
+            Each1Reach1Goal.objects.get(cluster=self.gamma).status,
+            Each1Reach1Goal.Status.NOT_STARTED,
+        )
+
+    def test_leaderboard_is_ranked_in_one_query(self):
+        Each1Reach1Goal.objects.create(
+            cluster=self.alpha, year=self.year, target_conversions=6, achieved_conversions=3
+        )
+        Each1Reach1Goal.objects.create(
+            cluster=self.beta, year=self.year, target_conversions=2, achieved_conversions=3
+        )
+        Each1Reach1Goal.objects.create(
+            cluster=self.gamma, year=self.year, target_conversions=2, achieved_conversions=1
+        )
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        with self.assertNumQueries(1):
+            response = client.get(
+                "/api/evangelism/each1reach1-goals/leaderboard/", {"year": self.year}
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(row["cluster"]["code"], row["rank"]) for row in response.data],
+            [("GP-A", 1), ("GP-B", 1), ("GP-C", 3)],
+        )
+
+    def test_list_creates_goals_for_every_cluster(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        response = client.get(
+            "/api/evangelism/each1reach1-goals/", {"year": self.year}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 3)
+        self.assertNotIn("rank", response.data["results"][0])
@@ -0,0 +1,68 @@
+from datetime import date, time
+
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from apps.events.models import Event
+from apps.evangelism.models import EvangelismGroup, EvangelismSession
+from apps.evangelism.services import create_recurring_sessions
+from apps.people.models import Person
+
+
+class RecurringSessionTests(TestCase):
+    def setUp(self):
+        self.admin = Person.objects.create_user(
+            username="recurring_admin", password="password123", role="ADMIN"
+        )
+        self.group = EvangelismGroup.objects.create(
+            name="Recurring Group",
+            location="Hall",
+            meeting_time=time(19, 0),
+        )
+
+    def test_year_of_sessions_is_bulk_inserted_and_linked(self):
+        # savepoint + event insert + session insert + release
+        with self.assertNumQueries(4):
+            sessions = create_recurring_sessions(
+                evangelism_group=self.group,
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 12, 31),
+                num_occurrences=None,
+                recurrence_pattern="weekly",
+                day_of_week=3,
+                default_topic="Gospel",
+            )
+
+        self.assertEqual(len(sessions), 53)
+        self.assertEqual(EvangelismSession.objects.count(), 53)
+        self.assertEqual(Event.objects.count(), 53)
+        first = EvangelismSession.objects.select_related("event").order_by("session_date")[0]
+        self.assertEqual(first.session_date, date(2026, 1, 1))
+        self.assertEqual(first.event.title, "Recurring Group - Gospel")
+        self.assertEqual(first.event.event_type_id, "BIBLE_STUDY")
+        self.assertEqual(first.event.location, "Hall")
+        self.assertFalse(EvangelismSession.objects.filter(event__isnull=True).exists())
+
+    def test_dry_run_previews_calendar_months_without_writing(self):
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+        response = client.post(
+            "/api/evangelism/sessions/create_recurring/",
+            {
+                "evangelism_group_id": self.group.id,
+                "start_date": "2026-01-31",
+                "num_occurrences": 3,
+                "recurrence_pattern": "monthly",
+                "dry_run": True,
+            },
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual(
+            [s["session_date"] for s in response.data["sessions"]],
+            [date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31)],
+        )
+        self.assertFalse(EvangelismSession.objects.exists())
+        self.assertFalse(Event.objects.exists())
@@ -3,8 +3,8 @@ from datetime import date
 from django.test import TestCase
 
 from apps.clusters.models import Cluster, ClusterWeeklyReport
-from apps.evangelism.models import EvangelismGroup, EvangelismWeeklyReport
-from apps.evangelism.views import EvangelismWeeklyReportViewSet
+from apps.evangelism.models import EvangelismGroup, EvangelismWeeklyReport, WeeklyTally
+from apps.evangelism.tally import build_weekly_tally_rows, tally_row
 from apps.people.models import Branch, Person
 
 
@@ -225,7 +225,12 @@ class WeeklyTallyDifferentialTests(TestCase):
         ev = EvangelismWeeklyReport.objects.filter(year=2026)
         cl = ClusterWeeklyReport.objects.filter(year=2026)
         old_rows = _old_build_weekly_tally_rows(ev, cl)
-        new_rows = EvangelismWeeklyReportViewSet._build_weekly_tally_rows(ev, cl)
+        new_rows = build_weekly_tally_rows(ev, cl)
+        # The signal-maintained store holds the same rows.
+        stored_rows = [
+            tally_row(tally)
+            for tally in WeeklyTally.objects.filter(year=2026).select_related("cluster")
+        ]
 
         def row_key(row):
             return (row["cluster_id"], row["year"], row["week_number"])
@@ -235,3 +240,4 @@ class WeeklyTallyDifferentialTests(TestCase):
         self.assertEqual(set(old_map), set(new_map))
         for key, old in old_map.items():
             self.assertEqual(old, new_map[key], msg=f"Mismatch for {key}")
+        self.assertEqual({row_key(r): r for r in stored_rows}, old_map)
@@ -0,0 +1,195 @@
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.evangelism.models import EvangelismGroup, EvangelismWeeklyReport, WeeklyTally
+from apps.evangelism.tally import build_weekly_tally_rows, refresh_weekly_tallies, tally_row
+from apps.people.models import Branch, Person
+
+URL = "/api/evangelism/weekly-reports/tally/"
+
+
+class WeeklyTallyStoreTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Tally Store Branch", code="TSB")
+        self.cluster = Cluster.objects.create(code="TS-1", name="Store One", branch=self.branch)
+        self.other_cluster = Cluster.objects.create(
+            code="TS-2", name="Store Two", branch=self.branch
+        )
+        self.group = EvangelismGroup.objects.create(name="Store Group", cluster=self.cluster)
+        self.member = self._person("store_member")
+        self.other_member = self._person("store_member_b")
+        self.visitor = self._person("store_visitor", role="VISITOR")
+
+    def _person(self, username, role="MEMBER"):
+        return Person.objects.create_user(
+            username=username,
+            password="x",
+            first_name=username.title(),
+            last_name="Store",
+            role=role,
+            branch=self.branch,
+        )
+
+    def _evangelism_report(self, week, **extra):
+        return EvangelismWeeklyReport.objects.create(
+            evangelism_group=extra.pop("group", self.group),
+            year=2026,
+            week_number=week,
+            meeting_date=date(2026, 3, 2) if week == 10 else date(2026, 3, 9),
+            gathering_type=extra.pop("gathering_type", "PHYSICAL"),
+            **extra,
+        )
+
+    def _cluster_report(self, week, **extra):
+        return ClusterWeeklyReport.objects.create(
+            cluster=extra.pop("cluster", self.cluster),
+            year=2026,
+            week_number=week,
+            meeting_date=date(2026, 3, 4) if week == 10 else date(2026, 3, 11),
+            gathering_type=extra.pop("gathering_type", "PHYSICAL"),
+        )
+
+    def _tally(self, cluster=None, week=10):
+        return WeeklyTally.objects.get(cluster=cluster, year=2026, week_number=week)
+
+    def test_attendance_changes_keep_distinct_counts_exact(self):
+        report = self._evangelism_report(10, new_prospects=2, conversions_this_week=1)
+        cluster_report = self._cluster_report(10, gathering_type="ONLINE")
+        report.members_attended.add(self.member, self.other_member)
+        cluster_report.members_attended.add(self.member)
+        # Reverse side of the relation (the person's reports).
+        self.visitor.cluster_reports_as_visitor.add(cluster_report)
+
+        tally = self._tally(self.cluster)
+        self.assertEqual(tally.members_count, 2)
+        self.assertEqual(tally.visitors_count, 1)
+        self.assertEqual(tally.evangelism_reports_count, 1)
+        self.assertEqual(tally.cluster_reports_count, 1)
+        self.assertEqual(tally.new_prospects, 2)
+        self.assertEqual(tally.gathering_type, "MIXED")
+        self.assertEqual(tally.meeting_date, date(2026, 3, 2))
+
+        # Still attending through the cluster report.
+        report.members_attended.remove(self.member)
+        self.assertEqual(self._tally(self.cluster).members_count, 2)
+        cluster_report.members_attended.clear()
+        self.assertEqual(self._tally(self.cluster).members_count, 1)
+
+        self.visitor.cluster_reports_as_visitor.clear()
+        self.assertEqual(self._tally(self.cluster).visitors_count, 0)
+
+        self.other_member.delete()
+        self.assertEqual(self._tally(self.cluster).members_count, 0)
+
+    def test_report_and_group_changes_rekey_tallies(self):
+        report = self._evangelism_report(10)
+        report.members_attended.add(self.member)
+        cluster_report = self._cluster_report(10)
+
+        # The old week keeps its tally while the cluster report still counts there.
+        report.week_number = 11
+        report.save()
+        self.assertEqual(self._tally(self.cluster).evangelism_reports_count, 0)
+        self.assertEqual(self._tally(self.cluster, week=11).members_count, 1)
+
+        cluster_report.delete()
+        self.assertFalse(
+            WeeklyTally.objects.filter(cluster=self.cluster, week_number=10).exists()
+        )
+
+        self.group.cluster = self.other_cluster
+        self.group.save()
+        self.assertFalse(WeeklyTally.objects.filter(cluster=self.cluster).exists())
+        self.assertEqual(self._tally(self.other_cluster, week=11).members_count, 1)
+
+        # Deleting the cluster un-assigns the group's reports.
+        self.other_cluster.delete()
+        self.assertEqual(self._tally(None, week=11).evangelism_reports_count, 1)
+
+        report.delete()
+        self.assertFalse(WeeklyTally.objects.exists())
+
+    def test_refresh_reads_the_week_after_a_racing_refresh_commits(self):
+        self._evangelism_report(10, new_prospects=3).members_attended.add(self.member)
+        WeeklyTally.objects.all().delete()
+        get_or_create = WeeklyTally.objects.get_or_create
+        raced = []
+
+        def racing_get_or_create(**kwargs):
+            if not raced:
+                # Another save for the same new week wins the insert and commits
+                # while this refresh waits on the unique constraint.
+                raced.append(True)
+                other_group = EvangelismGroup.objects.create(
+                    name="Racing Group", cluster=self.cluster
+                )
+                other = self._evangelism_report(10, group=other_group, new_prospects=2)
+                other.members_attended.add(self.other_member)
+            return get_or_create(**kwargs)
+
+        with mock.patch.object(
+            WeeklyTally.objects, "get_or_create", side_effect=racing_get_or_create
+        ):
+            refresh_weekly_tallies([(self.cluster.id, 2026, 10)])
+
+        self.assertTrue(raced)
+        tally = self._tally(self.cluster)
+        self.assertEqual(tally.evangelism_reports_count, 2)
+        self.assertEqual(tally.new_prospects, 5)
+        self.assertEqual(tally.members_count, 2)
+        self.assertEqual(tally.attendees.count(), 2)
+
+    def test_tally_endpoint_reads_the_store(self):
+        for week in (10, 11):
+            report = self._evangelism_report(week)
+            report.members_attended.add(self.member)
+            self._cluster_report(week).visitors_attended.add(self.visitor)
+        admin = self._person("store_admin", role="ADMIN")
+        client = APIClient()
+        client.force_authenticate(user=admin)
+
+        with CaptureQueriesContext(connection) as captured:
+            response = client.get(URL, {"year": 2026, "cluster": self.cluster.id})
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(any("weeklyreport" in query["sql"] for query in captured))
+        self.assertEqual([row["week_number"] for row in response.data], [11, 10])
+        self.assertEqual(response.data[0]["cluster_name"], "Store One")
+        self.assertEqual(response.data[0]["members_count"], 1)
+        self.assertEqual(response.data[0]["visitors_count"], 1)
+
+    def test_rebuild_command_matches_incremental_tallies(self):
+        unassigned = EvangelismGroup.objects.create(name="Loose Group", cluster=None)
+        self._evangelism_report(10, group=unassigned).visitors_attended.add(self.visitor)
+        self._evangelism_report(11).members_attended.add(self.member, self.other_member)
+        self._cluster_report(11, cluster=self.other_cluster).members_attended.add(self.member)
+
+        def snapshot():
+            return sorted(
+                (tally_row(tally) for tally in WeeklyTally.objects.select_related("cluster")),
+                key=lambda row: (row["week_number"], row["cluster_id"] or 0),
+            )
+
+        incremental = snapshot()
+        live = build_weekly_tally_rows(
+            EvangelismWeeklyReport.objects.all(), ClusterWeeklyReport.objects.all()
+        )
+        self.assertEqual(
+            incremental, sorted(live, key=lambda row: (row["week_number"], row["cluster_id"] or 0))
+        )
+        WeeklyTally.objects.all().delete()
+
+        out = StringIO()
+        call_command("rebuild_weekly_tallies", "--dry-run", stdout=out)
+        self.assertIn("Would write 3 weekly tally(ies)", out.getvalue())
+        self.assertFalse(WeeklyTally.objects.exists())
+
+        call_command("rebuild_weekly_tallies", stdout=StringIO())
+        self.assertEqual(snapshot(), incremental)
@@ -1,11 +1,10 @@
 from datetime import date, datetime, timedelta
 from typing import Optional
 
-from django.db.models import Count, Min, Q, Sum
-from django.db.models.functions import Coalesce, Greatest
+from django.db.models import Min, Q
+from django.db.models.functions import Greatest
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
-from rest_framework.pagination import PageNumberPagination
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
@@ -17,6 +16,7 @@ from apps.people.models import Branch, ModuleCoordinator, Person
 from apps.clusters.models import Cluster, ClusterWeeklyReport
 from apps.lessons.models import LessonSessionReport
 from core.datetime_utils import church_calendar_date, church_today
+from core.pagination import StandardPagination
 from apps.authentication.permissions import (
     IsMemberOrAbove,
     IsAuthenticatedAndNotVisitor,
@@ -26,6 +26,7 @@ from apps.authentication.permissions import (
     IsAdmin,
 )
 from apps.people.coordinator_scope import coordinator_assigned_resource_ids_when_all_scoped
+from apps.reports.analytics_cache import cached_analytics
 
 from .models import (
     EvangelismGroup,
@@ -37,6 +38,7 @@ from .models import (
     Conversion,
     MonthlyConversionTracking,
     Each1Reach1Goal,
+    WeeklyTally,
 )
 from .serializers import (
     EvangelismGroupSerializer,
@@ -48,6 +50,9 @@ from .serializers import (
     EvangelismPeopleTallySerializer,
     EvangelismTallyDrilldownSerializer,
     ProspectSerializer,
+    ProspectBulkTransitionSerializer,
+    ProspectBulkDropOffSerializer,
+    ProspectDropOffSweepSerializer,
     FollowUpTaskSerializer,
     DropOffSerializer,
     ConversionSerializer,
@@ -57,7 +62,15 @@ from .serializers import (
     EvangelismSummarySerializer,
     EvangelismDashboardStatsSerializer,
 )
+from .bulk_pipeline import (
+    bulk_mark_dropped_off,
+    bulk_transition_prospects,
+    sweep_drop_offs,
+)
 from .services import (
+    BIBLE_SHARERS_COVERAGE_CACHE,
+    bible_sharers_group_rows,
+    build_bible_sharers_coverage,
     bulk_enroll_members,
     get_inviter_cluster,
     create_person_from_prospect,
@@ -78,6 +91,8 @@ from .services import (
     annotate_people_reached_date,
     people_meeting_reached_milestones,
     get_default_each1reach1_target,
+    ensure_each1reach1_goals_for_year,
+    ranked_each1reach1_goals,
     calculate_conversion_rate,
     get_group_statistics,
     get_cluster_statistics,
@@ -85,6 +100,7 @@ from .services import (
     generate_each1reach1_report,
     get_evangelism_dashboard_stats,
 )
+from .tally import tally_row
 
 
 class EvangelismGroupViewSet(viewsets.ModelViewSet):
@@ -292,86 +308,24 @@ class EvangelismGroupViewSet(viewsets.ModelViewSet):
 
     @action(detail=False, methods=["get"], permission_classes=[IsAuthenticatedAndNotVisitor, IsMemberOrAbove])
     def bible_sharers_coverage(self, request):
-        """Get Bible Sharers coverage across clusters.
+        """Get Bible Sharers coverage across clusters (optionally ``?branch=<id>``).
 
         Returns which clusters have Bible Sharers and which don't.
-        Stats are visible to all authenticated users.
+        Stats are visible to all authenticated users, so the group rows are
+        shared through the analytics cache.
         """
-        from apps.clusters.models import Cluster
-        from .serializers import ClusterSummarySerializer
-
-        # Get all active Bible Sharers groups (use base queryset, not filtered)
-        bible_sharers_groups = EvangelismGroup.objects.filter(
-            is_bible_sharers_group=True, is_active=True
-        ).select_related("cluster")
-
-        # Get clusters that have Bible Sharers
-        clusters_with_bible_sharers = set()
-        bible_sharers_by_cluster = {}
-
-        for group in bible_sharers_groups:
-            if group.cluster:
-                clusters_with_bible_sharers.add(group.cluster.id)
-                if group.cluster.id not in bible_sharers_by_cluster:
-                    bible_sharers_by_cluster[group.cluster.id] = {
-                        "cluster": group.cluster,
-                        "groups": [],
-                    }
-                bible_sharers_by_cluster[group.cluster.id]["groups"].append(group)
-
-        # Get all clusters
-        all_clusters = Cluster.objects.all().order_by("name")
-
-        # Build coverage report
-        coverage = []
-        clusters_without = []
-
-        for cluster in all_clusters:
-            cluster_data = {
-                "cluster": ClusterSummarySerializer(cluster).data,
-                "has_bible_sharers": cluster.id in clusters_with_bible_sharers,
-                "bible_sharers_groups": [],
-                "bible_sharers_count": 0,
-            }
-
-            if cluster.id in bible_sharers_by_cluster:
-                groups_data = []
-                total_members = 0
-                for group in bible_sharers_by_cluster[cluster.id]["groups"]:
-                    members_count = group.members.exclude(role="ADMIN").count()
-                    total_members += members_count
-                    groups_data.append(
-                        {
-                            "id": group.id,
-                            "name": group.name,
-                            "coordinator": (
-                                group.coordinator.get_full_name()
-                                if group.coordinator
-                                else None
-                            ),
-                            "members_count": members_count,
-                        }
-                    )
-
-                cluster_data["bible_sharers_groups"] = groups_data
-                cluster_data["bible_sharers_count"] = total_members
-            else:
-                clusters_without.append(cluster.name)
-
-            coverage.append(cluster_data)
-
-        return Response(
-            {
-                "coverage": coverage,
-                "summary": {
-                    "total_clusters": all_clusters.count(),
-                    "clusters_with_bible_sharers": len(clusters_with_bible_sharers),
-                    "clusters_without_bible_sharers": len(clusters_without),
-                    "clusters_without_names": clusters_without,
-                    "total_bible_sharers_groups": bible_sharers_groups.count(),
-                },
-            }
-        )
+        branch_param = request.query_params.get("branch")
+        branch_id = None
+        if branch_param:
+            try:
+                branch_id = int(branch_param)
+            except (TypeError, ValueError):
+                return Response(
+                    {"branch": "Branch must be a valid integer."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        group_rows = cached_analytics(BIBLE_SHARERS_COVERAGE_CACHE, {}, bible_sharers_group_rows)
+        return Response(build_bible_sharers_coverage(branch_id=branch_id, group_rows=group_rows))
 
 
 class EvangelismSessionViewSet(viewsets.ModelViewSet):
@@ -542,8 +496,21 @@ class EvangelismSessionViewSet(viewsets.ModelViewSet):
             recurrence_pattern=recurrence_pattern,
             day_of_week=day_of_week,
             default_topic=default_topic,
+            dry_run=serializer.validated_data["dry_run"],
         )
 
+        if serializer.validated_data["dry_run"]:
+            return Response(
+                {
+                    "dry_run": True,
+                    "count": len(sessions),
+                    "sessions": [
+                        {"session_date": s.session_date, "session_time": s.session_time}
+                        for s in sessions
+                    ],
+                }
+            )
+
         session_serializer = EvangelismSessionSerializer(sessions, many=True)
         return Response(
             {
@@ -555,7 +522,7 @@ class EvangelismSessionViewSet(viewsets.ModelViewSet):
 
 
 class EvangelismWeeklyReportViewSet(viewsets.ModelViewSet):
-    class DrilldownPagination(PageNumberPagination):
+    class DrilldownPagination(StandardPagination):
         page_size = 20
         page_size_query_param = "page_size"
         max_page_size = 100
@@ -875,231 +842,23 @@ class EvangelismWeeklyReportViewSet(viewsets.ModelViewSet):
         serializer = EvangelismTallyDrilldownSerializer(page, many=True)
         return paginator.get_paginated_response(serializer.data)
 
-    @staticmethod
-    def _build_weekly_tally_rows(evangelism_qs, cluster_qs):
-        """Aggregate evangelism + cluster weekly reports without per-report M2M queries."""
-        tallies = {}
-
-        def ensure_entry(cluster_id, cluster_name, cluster_code, year_val, week_val):
-            key = (cluster_id, int(year_val), int(week_val))
-            if key not in tallies:
-                if cluster_id is None:
-                    resolved_name = "Unassigned"
-                    resolved_code = "Unassigned"
-                else:
-                    # Preserve blank names/codes; only Unassigned when there is no cluster.
-                    resolved_name = cluster_name
-                    resolved_code = cluster_code
-                tallies[key] = {
-                    "cluster_id": cluster_id,
-                    "cluster_name": resolved_name,
-                    "cluster_code": resolved_code,
-                    "year": int(year_val),
-                    "week_number": int(week_val),
-                    "meeting_dates": [],
-                    "gathering_types": set(),
-                    "members_set": set(),
-                    "visitors_set": set(),
-                    "evangelism_reports_count": 0,
-                    "cluster_reports_count": 0,
-                    "new_prospects": 0,
-                    "conversions_this_week": 0,
-                }
-            return tallies[key]
-
-        for row in evangelism_qs.values(
-            "evangelism_group__cluster_id",
-            "evangelism_group__cluster__name",
-            "evangelism_group__cluster__code",
-            "year",
-            "week_number",
-        ).annotate(
-            evangelism_reports_count=Count("id"),
-            new_prospects=Coalesce(Sum("new_prospects"), 0),
-            conversions_this_week=Coalesce(Sum("conversions_this_week"), 0),
-            meeting_date=Min("meeting_date"),
-        ):
-            cluster_id = row["evangelism_group__cluster_id"]
-            entry = ensure_entry(
-                cluster_id,
-                row["evangelism_group__cluster__name"],
-                row["evangelism_group__cluster__code"],
-                row["year"],
-                row["week_number"],
-            )
-            entry["evangelism_reports_count"] += row["evangelism_reports_count"]
-            entry["new_prospects"] += row["new_prospects"] or 0
-            entry["conversions_this_week"] += row["conversions_this_week"] or 0
-            if row["meeting_date"] is not None:
-                entry["meeting_dates"].append(row["meeting_date"])
-
-        for row in cluster_qs.values(
-            "cluster_id",
-            "cluster__name",
-            "cluster__code",
-            "year",
-            "week_number",
-        ).annotate(
-            cluster_reports_count=Count("id"),
-            meeting_date=Min("meeting_date"),
-        ):
-            entry = ensure_entry(
-                row["cluster_id"],
-                row["cluster__name"],
-                row["cluster__code"],
-                row["year"],
-                row["week_number"],
-            )
-            entry["cluster_reports_count"] += row["cluster_reports_count"]
-            if row["meeting_date"] is not None:
-                entry["meeting_dates"].append(row["meeting_date"])
-
-        for cluster_id, year_val, week_val, gathering_type in evangelism_qs.values_list(
-            "evangelism_group__cluster_id",
-            "year",
-            "week_number",
-            "gathering_type",
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and gathering_type:
-                entry["gathering_types"].add(gathering_type)
-
-        for cluster_id, year_val, week_val, gathering_type in cluster_qs.values_list(
-            "cluster_id",
-            "year",
-            "week_number",
-            "gathering_type",
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and gathering_type:
-                entry["gathering_types"].add(gathering_type)
-
-        report_ids = evangelism_qs.values("id")
-        for cluster_id, year_val, week_val, person_id in (
-            EvangelismWeeklyReport.members_attended.through.objects.filter(
-                evangelismweeklyreport_id__in=report_ids
-            ).values_list(
-                "evangelismweeklyreport__evangelism_group__cluster_id",
-                "evangelismweeklyreport__year",
-                "evangelismweeklyreport__week_number",
-                "person_id",
-            )
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and person_id is not None:
-                entry["members_set"].add(person_id)
-
-        for cluster_id, year_val, week_val, person_id in (
-            EvangelismWeeklyReport.visitors_attended.through.objects.filter(
-                evangelismweeklyreport_id__in=report_ids
-            ).values_list(
-                "evangelismweeklyreport__evangelism_group__cluster_id",
-                "evangelismweeklyreport__year",
-                "evangelismweeklyreport__week_number",
-                "person_id",
-            )
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and person_id is not None:
-                entry["visitors_set"].add(person_id)
-
-        cluster_report_ids = cluster_qs.values("id")
-        for cluster_id, year_val, week_val, person_id in (
-            ClusterWeeklyReport.members_attended.through.objects.filter(
-                clusterweeklyreport_id__in=cluster_report_ids
-            ).values_list(
-                "clusterweeklyreport__cluster_id",
-                "clusterweeklyreport__year",
-                "clusterweeklyreport__week_number",
-                "person_id",
-            )
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and person_id is not None:
-                entry["members_set"].add(person_id)
-
-        for cluster_id, year_val, week_val, person_id in (
-            ClusterWeeklyReport.visitors_attended.through.objects.filter(
-                clusterweeklyreport_id__in=cluster_report_ids
-            ).values_list(
-                "clusterweeklyreport__cluster_id",
-                "clusterweeklyreport__year",
-                "clusterweeklyreport__week_number",
-                "person_id",
-            )
-        ):
-            key = (cluster_id, int(year_val), int(week_val))
-            entry = tallies.get(key)
-            if entry is not None and person_id is not None:
-                entry["visitors_set"].add(person_id)
-
-        rows = []
-        for entry in tallies.values():
-            gathering_types = entry["gathering_types"]
-            if not gathering_types:
-                gathering_type = "UNKNOWN"
-            elif len(gathering_types) == 1:
-                gathering_type = next(iter(gathering_types))
-            else:
-                gathering_type = "MIXED"
-
-            meeting_date = min(entry["meeting_dates"]) if entry["meeting_dates"] else None
-
-            rows.append(
-                {
-                    "cluster_id": entry["cluster_id"],
-                    "cluster_name": entry["cluster_name"],
-                    "cluster_code": entry["cluster_code"],
-                    "year": entry["year"],
-                    "week_number": entry["week_number"],
-                    "meeting_date": meeting_date,
-                    "gathering_type": gathering_type,
-                    "members_count": len(entry["members_set"]),
-                    "visitors_count": len(entry["visitors_set"]),
-                    "evangelism_reports_count": entry["evangelism_reports_count"],
-                    "cluster_reports_count": entry["cluster_reports_count"],
-                    "new_prospects": entry["new_prospects"],
-                    "conversions_this_week": entry["conversions_this_week"],
-                }
-            )
-
-        rows.sort(key=lambda r: (r["year"], r["week_number"]), reverse=True)
-        return rows
-
     @action(detail=False, methods=["get"])
     def tally(self, request):
-        """Unified weekly tally for evangelism + cluster reports."""
+        """Unified weekly tally for evangelism + cluster reports (stored ``WeeklyTally`` rows)."""
         cluster_id = request.query_params.get("cluster")
         year = request.query_params.get("year")
         week_number = request.query_params.get("week_number")
 
-        evangelism_qs = EvangelismWeeklyReport.objects.all()
-        cluster_qs = ClusterWeeklyReport.objects.all()
-
+        tallies = WeeklyTally.objects.select_related("cluster")
         if year:
-            evangelism_qs = evangelism_qs.filter(year=year)
-            cluster_qs = cluster_qs.filter(year=year)
+            tallies = tallies.filter(year=year)
         if week_number:
-            evangelism_qs = evangelism_qs.filter(week_number=week_number)
-            cluster_qs = cluster_qs.filter(week_number=week_number)
-
-        cluster = None
-        if cluster_id:
-            try:
-                cluster = Cluster.objects.get(id=cluster_id)
-            except Cluster.DoesNotExist:
-                cluster = None
-
-        if cluster:
-            evangelism_qs = evangelism_qs.filter(evangelism_group__cluster=cluster)
-            cluster_qs = cluster_qs.filter(cluster=cluster)
+            tallies = tallies.filter(week_number=week_number)
+        # An unknown cluster id leaves the cluster filter off, as before.
+        if cluster_id and Cluster.objects.filter(id=cluster_id).exists():
+            tallies = tallies.filter(cluster_id=cluster_id)
 
-        rows = self._build_weekly_tally_rows(evangelism_qs, cluster_qs)
+        rows = [tally_row(tally) for tally in tallies]
         serializer = EvangelismTallySerializer(rows, many=True)
         return Response(serializer.data)
 
@@ -1579,7 +1338,7 @@ class ProspectViewSet(viewsets.ModelViewSet):
     def get_permissions(self):
         if self.action in ["list", "retrieve"]:
             return [IsAuthenticatedAndNotVisitor(), IsMemberOrAbove()]
-        if self.action == "destroy":
+        if self.action in ["destroy", "sweep_drop_offs"]:
             return [IsAuthenticatedAndNotVisitor(), IsAdmin()]
         return [IsAuthenticatedAndNotVisitor(), HasModuleAccess("EVANGELISM", "write")]
 
@@ -1739,26 +1498,58 @@ class ProspectViewSet(viewsets.ModelViewSet):
     def mark_dropped_off(self, request, pk=None):
         """Manually mark visitor as dropped off."""
         prospect = self.get_object()
-        prospect.is_dropped_off = True
-        prospect.drop_off_date = church_today()
-        prospect.drop_off_stage = prospect.pipeline_stage
-        prospect.drop_off_reason = request.data.get("reason", "")
-        prospect.save()
-
-        # Create DropOff record
-        days_inactive = prospect.days_since_last_activity or 0
-        DropOff.objects.create(
-            prospect=prospect,
-            drop_off_date=prospect.drop_off_date,
-            drop_off_stage=prospect.drop_off_stage,
-            days_inactive=days_inactive,
+        bulk_mark_dropped_off(
+            [prospect.pk],
             reason=request.data.get("reason", ""),
             reason_details=request.data.get("reason_details", ""),
         )
+        prospect.refresh_from_db()
 
         serializer = self.get_serializer(prospect)
         return Response(serializer.data)
 
+    @action(detail=False, methods=["post"], url_path="bulk-transition")
+    def bulk_transition(self, request):
+        """Move many prospects to one pipeline stage in a single transaction."""
+        serializer = ProspectBulkTransitionSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        try:
+            updated = bulk_transition_prospects(
+                data["prospect_ids"],
+                data["pipeline_stage"],
+                activity_date=data.get("last_activity_date"),
+            )
+        except ValueError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"updated": updated, "pipeline_stage": data["pipeline_stage"]})
+
+    @action(detail=False, methods=["post"], url_path="bulk-mark-dropped-off")
+    def bulk_mark_dropped_off(self, request):
+        """Mark many prospects as dropped off; already dropped ones are skipped."""
+        serializer = ProspectBulkDropOffSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        marked = bulk_mark_dropped_off(
+            data["prospect_ids"],
+            reason=data.get("reason", ""),
+            reason_details=data.get("reason_details", ""),
+        )
+        return Response({"dropped_off": marked})
+
+    @action(detail=False, methods=["post"], url_path="sweep-drop-offs")
+    def sweep_drop_offs(self, request):
+        """Drop off every prospect inactive for ``inactivity_days`` (admin only)."""
+        serializer = ProspectDropOffSweepSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        summary = sweep_drop_offs(
+            data["inactivity_days"],
+            reason=data["reason"],
+            dry_run=data["dry_run"],
+        )
+        return Response(summary)
+
     @action(detail=True, methods=["post"])
     def recover(self, request, pk=None):
         """Recover a dropped off visitor."""
@@ -2001,7 +1792,7 @@ class MonthlyConversionTrackingViewSet(viewsets.ModelViewSet):
 
 
 class Each1Reach1GoalViewSet(viewsets.ModelViewSet):
-    class GoalPagination(PageNumberPagination):
+    class GoalPagination(StandardPagination):
         page_size = 20
         page_size_query_param = "page_size"
         max_page_size = 100
@@ -2037,21 +1828,7 @@ class Each1Reach1GoalViewSet(viewsets.ModelViewSet):
             raise ValidationError({"year": "Year must be a valid integer."})
 
     def _ensure_yearly_goals(self, year: int) -> None:
-        existing_cluster_ids = set(
-            Each1Reach1Goal.objects.filter(year=year).values_list("cluster_id", flat=True)
-        )
-        missing_clusters = Cluster.objects.exclude(id__in=existing_cluster_ids)
-
-        for cluster in missing_clusters:
-            Each1Reach1Goal.objects.get_or_create(
-                cluster=cluster,
-                year=year,
-                defaults={
-                    "target_conversions": get_default_each1reach1_target(cluster),
-                    "achieved_conversions": 0,
-                    "status": Each1Reach1Goal.Status.NOT_STARTED,
-                },
-            )
+        ensure_each1reach1_goals_for_year(year)
 
     def list(self, request, *args, **kwargs):
         self._ensure_yearly_goals(self._resolve_goal_year())
@@ -2132,9 +1909,7 @@ class Each1Reach1GoalViewSet(viewsets.ModelViewSet):
         year = request.query_params.get("year")
         year_int = int(year) if year else timezone.now().year
 
-        goals = self.queryset.filter(year=year_int).order_by("-achieved_conversions")[
-            :10
-        ]
+        goals = ranked_each1reach1_goals(self.queryset.filter(year=year_int))[:10]
         serializer = self.get_serializer(goals, many=True)
         return Response(serializer.data)
 
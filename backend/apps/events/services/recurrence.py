@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import calendar
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Dict, Iterable, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
+from django.db import transaction
 from django.utils import timezone
 
 from core.datetime_utils import church_calendar_date
@@ -11,6 +13,10 @@ from core.datetime_utils import church_calendar_date
 
 MAX_OCCURRENCE_DAYS = 366
 
+SESSION_RECURRENCE_PATTERNS = ("weekly", "bi_weekly", "monthly")
+MAX_SESSION_OCCURRENCES = 1000
+DEFAULT_SESSION_OCCURRENCES = 52
+
 
 @dataclass
 class Occurrence:
@@ -165,3 +171,74 @@ def generate_occurrences(
         occurrences.append(occurrence)
 
     return occurrences
+
+
+def add_months(day: date, months: int) -> date:
+    """Same day-of-month ``months`` later, clamped to the last day of that month."""
+
+    month_index = day.month - 1 + months
+    year = day.year + month_index // 12
+    month = month_index % 12 + 1
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, min(day.day, last_day))
+
+
+def iter_session_dates(
+    start_date: date,
+    recurrence_pattern: str,
+    *,
+    end_date: Optional[date] = None,
+    num_occurrences: Optional[int] = None,
+    day_of_week: Optional[int] = None,
+) -> Iterator[date]:
+    """
+    Yield the dates of a recurring session series (Sunday school classes,
+    evangelism groups).
+
+    ``weekly`` first moves ``start_date`` forward to ``day_of_week``
+    (0=Monday). ``monthly`` keeps the start's day of month, clamped to short
+    months and measured from the start (Jan 31 -> Feb 28 -> Mar 31). Stops
+    after ``num_occurrences`` dates or past ``end_date``; with neither, yields
+    a year of dates.
+    """
+
+    if recurrence_pattern not in SESSION_RECURRENCE_PATTERNS:
+        raise ValueError(f"Unsupported recurrence pattern: {recurrence_pattern}")
+
+    if num_occurrences:
+        limit = num_occurrences
+    elif end_date:
+        limit = MAX_SESSION_OCCURRENCES
+    else:
+        limit = DEFAULT_SESSION_OCCURRENCES
+
+    first = start_date
+    if recurrence_pattern == "weekly" and day_of_week is not None:
+        first += timedelta(days=(day_of_week - first.weekday()) % 7)
+
+    for index in range(limit):
+        if recurrence_pattern == "monthly":
+            current = add_months(first, index)
+        elif recurrence_pattern == "bi_weekly":
+            current = first + timedelta(weeks=2 * index)
+        else:
+            current = first + timedelta(weeks=index)
+        if end_date and current > end_date:
+            return
+        yield current
+
+
+def bulk_create_sessions_with_events(session_model, sessions: List, events: List) -> List:
+    """
+    Insert ``events`` and ``sessions`` (parallel lists) in one transaction,
+    pointing each session's ``event`` at its event. Returns the sessions.
+    """
+
+    from ..models import Event
+
+    with transaction.atomic():
+        Event.objects.bulk_create(events)
+        for session, event in zip(sessions, events):
+            session.event = event
+        session_model.objects.bulk_create(sessions)
+    return sessions
@@ -1,5 +1,5 @@
 import json
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 from django.test import TestCase
 from django.urls import reverse
@@ -7,7 +7,12 @@ from django.utils import timezone
 from rest_framework.test import APIClient
 
 from apps.events.models import Event
-from apps.events.services.recurrence import clean_weekly_pattern, generate_occurrences
+from apps.events.services.recurrence import (
+    add_months,
+    clean_weekly_pattern,
+    generate_occurrences,
+    iter_session_dates,
+)
 from apps.people.models import Person
 
 
@@ -80,6 +85,39 @@ class RecurrenceServiceTests(TestCase):
         self.assertNotIn("2025-01-19", excluded_dates)
 
 
+class SessionDatePlannerTests(TestCase):
+    def test_weekly_aligns_to_day_of_week_and_stops_at_end_date(self):
+        dates = list(
+            iter_session_dates(
+                date(2025, 1, 1),  # Wednesday
+                "weekly",
+                end_date=date(2025, 1, 26),
+                day_of_week=6,
+            )
+        )
+        self.assertEqual(
+            dates,
+            [date(2025, 1, 5), date(2025, 1, 12), date(2025, 1, 19), date(2025, 1, 26)],
+        )
+
+    def test_monthly_uses_calendar_months_without_drift(self):
+        dates = list(iter_session_dates(date(2025, 1, 31), "monthly", num_occurrences=4))
+        self.assertEqual(
+            dates,
+            [date(2025, 1, 31), date(2025, 2, 28), date(2025, 3, 31), date(2025, 4, 30)],
+        )
+        self.assertEqual(add_months(date(2024, 11, 30), 3), date(2025, 2, 28))
+
+    def test_bi_weekly_defaults_to_a_year_of_dates(self):
+        dates = list(iter_session_dates(date(2025, 1, 6), "bi_weekly"))
+        self.assertEqual(len(dates), 52)
+        self.assertEqual(dates[1] - dates[0], timedelta(weeks=2))
+
+    def test_unknown_pattern_raises(self):
+        with self.assertRaises(ValueError):
+            list(iter_session_dates(date(2025, 1, 6), "daily", num_occurrences=2))
+
+
 class RecurrenceViewSetTests(TestCase):
     def test_exclude_occurrence_action_marks_date_and_updates_occurrences(self):
         client = APIClient()
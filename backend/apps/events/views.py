@@ -39,6 +39,7 @@ class EventTypeViewSet(viewsets.ModelViewSet):
         "sort_order", "code"
     )
     serializer_class = EventTypeSerializer
+    pagination_class = None  # Small reference table
     lookup_field = "code"
     permission_classes = [IsAuthenticatedAndNotVisitor]
 
@@ -4,3 +4,6 @@ class FinanceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.finance'
     verbose_name = 'Finance'
+
+    def ready(self):
+        import apps.finance.signals  # noqa: F401
@@ -0,0 +1,208 @@
+"""
+Monthly giving ledger: pre-summed giving per branch, month and source.
+
+When ``GIVING_LEDGER_ENABLED`` is on, the save/delete signals in
+``apps/finance/signals.py`` re-sum the affected month of the changed source
+(one grouped query) and replace its ``GivingLedgerMonth`` rows, and the
+stewardship trend reads the ledger instead of the finance tables.
+
+Changes that bypass model signals (``QuerySet.update``, ``bulk_create``, a
+donor moving branch, a donor or branch being deleted) are not picked up; run
+``python manage.py rebuild_giving_ledger`` after such changes and when the
+ledger is first enabled.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncMonth
+
+from .models import Donation, GivingLedgerMonth, Offering, PledgeContribution
+
+Source = GivingLedgerMonth.Source
+
+# source -> (model, date field, branch lookup or None for church-wide)
+SOURCE_FIELDS = {
+    Source.DONATION: (Donation, "date", "donor__branch_id"),
+    Source.OFFERING: (Offering, "service_date", None),
+    Source.PLEDGE_CONTRIBUTION: (
+        PledgeContribution,
+        "contribution_date",
+        "pledge__pledger__branch_id",
+    ),
+}
+
+# (year, month) -> (total, count)
+MonthTotals = Dict[Tuple[int, int], Tuple[Decimal, int]]
+
+
+def giving_ledger_enabled() -> bool:
+    return getattr(settings, "GIVING_LEDGER_ENABLED", False)
+
+
+def source_for_model(model) -> Optional[str]:
+    for source, (source_model, _, _) in SOURCE_FIELDS.items():
+        if model is source_model:
+            return source
+    return None
+
+
+def _months_q(year_lookup: str, month_lookup: str, months: Iterable[Tuple[int, int]]) -> Q:
+    condition = Q(pk__in=[])
+    for year, month in months:
+        condition |= Q(**{year_lookup: year, month_lookup: month})
+    return condition
+
+
+def grouped_month_totals(
+    source: str,
+    *,
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    branch_id: Optional[int] = None,
+    months: Optional[Iterable[Tuple[int, int]]] = None,
+    by_branch: bool = False,
+    using: str = "default",
+):
+    """
+    Live totals of ``source`` grouped by month (and branch), one query.
+
+    Yields ``(branch_id, year, month, total, count)``; ``branch_id`` is None
+    unless ``by_branch``.
+    """
+    model, date_field, branch_lookup = SOURCE_FIELDS[source]
+    queryset = model.objects.using(using).all()
+    if start:
+        queryset = queryset.filter(**{f"{date_field}__gte": start})
+    if end:
+        queryset = queryset.filter(**{f"{date_field}__lte": end})
+    if months is not None:
+        queryset = queryset.filter(
+            _months_q(f"{date_field}__year", f"{date_field}__month", months)
+        )
+    if branch_id is not None:
+        if branch_lookup is None:
+            return
+        queryset = queryset.filter(**{branch_lookup: branch_id})
+
+    group_by = ["period"]
+    if by_branch and branch_lookup is not None:
+        group_by.append(branch_lookup)
+    rows = (
+        queryset.order_by()
+        .annotate(period=TruncMonth(date_field))
+        .values(*group_by)
+        .annotate(total=Sum("amount"), count=Count("id"))
+    )
+    for row in rows:
+        period = row["period"]
+        branch = row.get(branch_lookup) if by_branch and branch_lookup else None
+        yield branch, period.year, period.month, row["total"] or Decimal("0.00"), row["count"]
+
+
+def ledger_month_totals(
+    *, years: Iterable[int], branch_id: Optional[int] = None
+) -> Dict[str, MonthTotals]:
+    """Ledger totals for each of ``years`` per source, summed over branches unless ``branch_id``."""
+    queryset = GivingLedgerMonth.objects.filter(year__in=list(years))
+    if branch_id is not None:
+        queryset = queryset.filter(branch_id=branch_id)
+    totals: Dict[str, MonthTotals] = {source: {} for source in SOURCE_FIELDS}
+    for row in (
+        queryset.order_by()
+        .values("source", "year", "month")
+        .annotate(total=Sum("total"), count=Sum("count"))
+    ):
+        totals[row["source"]][(row["year"], row["month"])] = (
+            row["total"] or Decimal("0.00"),
+            row["count"] or 0,
+        )
+    return totals
+
+
+@transaction.atomic
+def refresh_giving_ledger(source: str, months: Iterable[Tuple[int, int]]) -> int:
+    """
+    Re-sum ``months`` of ``source`` from the finance table; returns rows written.
+
+    Each month's no-branch row is locked first (created empty if missing), so
+    concurrent saves in one month refresh it one after another and each sums
+    what the previous one committed. Rows left empty are removed.
+    """
+    months = sorted({month for month in months if month})
+    if not months:
+        return 0
+    locks = {}
+    for year, month in months:
+        lock, _ = GivingLedgerMonth.objects.select_for_update().get_or_create(
+            branch=None, year=year, month=month, source=source
+        )
+        lock.total, lock.count = Decimal("0.00"), 0
+        locks[(year, month)] = lock
+    GivingLedgerMonth.objects.filter(source=source, branch__isnull=False).filter(
+        _months_q("year", "month", months)
+    ).delete()
+    rows = []
+    for branch_id, year, month, total, count in grouped_month_totals(
+        source, months=months, by_branch=True
+    ):
+        if branch_id is None:
+            locks[(year, month)].total, locks[(year, month)].count = total, count
+            continue
+        rows.append(
+            GivingLedgerMonth(
+                branch_id=branch_id,
+                year=year,
+                month=month,
+                source=source,
+                total=total,
+                count=count,
+            )
+        )
+    GivingLedgerMonth.objects.bulk_create(rows)
+    for lock in locks.values():
+        if lock.count:
+            lock.save(update_fields=["total", "count", "updated_at"])
+            rows.append(lock)
+        else:
+            lock.delete()
+    return len(rows)
+
+
+@transaction.atomic
+def rebuild_giving_ledger(
+    *, year: Optional[int] = None, dry_run: bool = False, using: str = "default"
+) -> Dict[str, int]:
+    """Rebuild the ledger (one ``year`` or everything); returns rows per source."""
+    start = date(year, 1, 1) if year else None
+    end = date(year, 12, 31) if year else None
+    written = {}
+    for source in SOURCE_FIELDS:
+        rows = [
+            GivingLedgerMonth(
+                branch_id=branch_id,
+                year=row_year,
+                month=month,
+                source=source,
+                total=total,
+                count=count,
+            )
+            for branch_id, row_year, month, total, count in grouped_month_totals(
+                source, start=start, end=end, by_branch=True, using=using
+            )
+        ]
+        written[source] = len(rows)
+        if dry_run:
+            continue
+        stale = GivingLedgerMonth.objects.using(using).filter(source=source)
+        if year:
+            stale = stale.filter(year=year)
+        stale.delete()
+        GivingLedgerMonth.objects.using(using).bulk_create(rows)
+    return written
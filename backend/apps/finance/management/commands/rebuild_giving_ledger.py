@@ -0,0 +1,53 @@
+"""
+Rebuild the monthly giving ledger from donations, offerings and pledge contributions.
+
+Run once after setting GIVING_LEDGER_ENABLED=True, and after changes that bypass
+model signals (bulk imports, QuerySet.update, donors moving branch).
+
+Usage:
+    python manage.py rebuild_giving_ledger
+    python manage.py rebuild_giving_ledger --year 2025 --dry-run
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.finance.ledger import giving_ledger_enabled, rebuild_giving_ledger
+
+
+class Command(BaseCommand):
+    help = "Rebuild the monthly giving ledger (GivingLedgerMonth) from the finance tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--year",
+            type=int,
+            help="Only rebuild this calendar year",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show how many rows would be written without making changes",
+        )
+
+    def handle(self, *args, **options):
+        year = options["year"]
+        if year is not None and not 1900 <= year <= 3000:
+            raise CommandError("--year must be between 1900 and 3000")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be saved"))
+        if not giving_ledger_enabled():
+            self.stdout.write(
+                self.style.WARNING(
+                    "GIVING_LEDGER_ENABLED is off: the ledger will not be kept in sync"
+                )
+            )
+
+        written = rebuild_giving_ledger(year=year, dry_run=options["dry_run"])
+
+        for source, rows in written.items():
+            self.stdout.write(f"  {source}: {rows} month row(s)")
+        verb = "Would write" if options["dry_run"] else "Wrote"
+        scope = f"for {year}" if year else "for all years"
+        self.stdout.write(
+            self.style.SUCCESS(f"{verb} {sum(written.values())} ledger row(s) {scope}")
+        )
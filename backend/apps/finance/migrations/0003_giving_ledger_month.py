@@ -0,0 +1,41 @@
+# Generated by Django 4.2.23 on 2026-10-19 10:29
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('people', '0021_people_automation_setting'),
+        ('finance', '0002_pledgecontribution'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GivingLedgerMonth',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('year', models.PositiveSmallIntegerField()),
+                ('month', models.PositiveSmallIntegerField()),
+                ('source', models.CharField(choices=[('DONATION', 'Donation'), ('OFFERING', 'Offering'), ('PLEDGE_CONTRIBUTION', 'Pledge Contribution')], max_length=20)),
+                ('total', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=14)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('branch', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='giving_ledger_months', to='people.branch')),
+            ],
+            options={
+                'ordering': ['year', 'month', 'source'],
+                'indexes': [models.Index(fields=['year', 'month'], name='finance_giv_year_0e81bf_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='givingledgermonth',
+            constraint=models.UniqueConstraint(condition=models.Q(('branch__isnull', False)), fields=('branch', 'year', 'month', 'source'), name='finance_ledger_unique_branch_month_source'),
+        ),
+        migrations.AddConstraint(
+            model_name='givingledgermonth',
+            constraint=models.UniqueConstraint(condition=models.Q(('branch__isnull', True)), fields=('year', 'month', 'source'), name='finance_ledger_unique_month_source_no_branch'),
+        ),
+    ]
@@ -7,8 +7,14 @@ from django.db.models import Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
+from core.tracked_fields import TrackedFieldsMixin
+
+
+class Donation(TrackedFieldsMixin, models.Model):
+    # Old months are refreshed by the giving ledger signal handlers
+    # (apps/finance/signals.py) when the date changes.
+    tracked_fields = ("date",)
 
-class Donation(models.Model):
     class PaymentMethod(models.TextChoices):
         CASH = "CASH", "Cash"
         CHECK = "CHECK", "Check"
@@ -54,7 +60,9 @@ class Donation(models.Model):
         return f"Donation {self.receipt_number} - {self.amount}"
 
 
-class Offering(models.Model):
+class Offering(TrackedFieldsMixin, models.Model):
+    tracked_fields = ("service_date",)
+
     service_date = models.DateField(default=timezone.now)
     service_name = models.CharField(max_length=150, help_text="e.g. Sunday AM Service")
     fund = models.CharField(
@@ -170,7 +178,9 @@ class Pledge(models.Model):
         return 0.0
 
 
-class PledgeContribution(models.Model):
+class PledgeContribution(TrackedFieldsMixin, models.Model):
+    tracked_fields = ("contribution_date",)
+
     pledge = models.ForeignKey(
         Pledge,
         on_delete=models.CASCADE,
@@ -207,3 +217,52 @@ class PledgeContribution(models.Model):
 
     def __str__(self) -> str:
         return f"Contribution {self.amount} to {self.pledge}"
+
+
+class GivingLedgerMonth(models.Model):
+    """
+    Pre-summed giving per branch, month and source.
+
+    Maintained from Donation / Offering / PledgeContribution save and delete
+    signals when ``GIVING_LEDGER_ENABLED`` is on (see ``apps.finance.ledger``).
+    Donations and pledge contributions are attributed to the donor's /
+    pledger's branch; offerings are church-wide (``branch`` is null).
+    """
+
+    class Source(models.TextChoices):
+        DONATION = "DONATION", "Donation"
+        OFFERING = "OFFERING", "Offering"
+        PLEDGE_CONTRIBUTION = "PLEDGE_CONTRIBUTION", "Pledge Contribution"
+
+    branch = models.ForeignKey(
+        "people.Branch",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name="giving_ledger_months",
+    )
+    year = models.PositiveSmallIntegerField()
+    month = models.PositiveSmallIntegerField()
+    source = models.CharField(max_length=20, choices=Source.choices)
+    total = models.DecimalField(max_digits=14, decimal_places=2, default=Decimal("0.00"))
+    count = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["year", "month", "source"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["branch", "year", "month", "source"],
+                condition=models.Q(branch__isnull=False),
+                name="finance_ledger_unique_branch_month_source",
+            ),
+            models.UniqueConstraint(
+                fields=["year", "month", "source"],
+                condition=models.Q(branch__isnull=True),
+                name="finance_ledger_unique_month_source_no_branch",
+            ),
+        ]
+        indexes = [models.Index(fields=["year", "month"])]
+
+    def __str__(self) -> str:
+        return f"{self.source} {self.year}-{self.month:02d} ({self.branch_id or 'no branch'}): {self.total}"
@@ -7,7 +7,14 @@ from django.db.models.functions import TruncWeek, Coalesce
 
 from core.datetime_utils import church_calendar_date
 
-from .models import Donation, Offering, Pledge, PledgeContribution
+from .ledger import (
+    SOURCE_FIELDS,
+    MonthTotals,
+    giving_ledger_enabled,
+    grouped_month_totals,
+    ledger_month_totals,
+)
+from .models import Donation, GivingLedgerMonth, Offering, Pledge
 
 
 class OfferingWeeklyTotal(TypedDict):
@@ -174,102 +181,113 @@ def pledge_summaries(
     return summaries
 
 
-def monthly_giving_trend(
+def _monthly_source_totals(
     *,
-    year: int,
+    years: List[int],
     branch_id: Optional[int] = None,
-) -> List[MonthlyGivingTrendPoint]:
-    """Monthly donation, offering, and pledge-contribution totals for a calendar year."""
-    trend: List[MonthlyGivingTrendPoint] = []
-    includes_offerings = branch_id is None
+) -> Dict[str, MonthTotals]:
+    """Per-source (year, month) -> (total, count) for ``years``.
+
+    Reads the ledger, or runs one grouped query per source spanning all years.
+    """
+    if giving_ledger_enabled():
+        return ledger_month_totals(years=years, branch_id=branch_id)
+    start, _ = _year_date_bounds(min(years))
+    _, end = _year_date_bounds(max(years))
+    return {
+        source: {
+            (row_year, month): (total, count)
+            for _, row_year, month, total, count in grouped_month_totals(
+                source, start=start, end=end, branch_id=branch_id
+            )
+            if row_year in years
+        }
+        for source in SOURCE_FIELDS
+    }
 
-    for month in range(1, 13):
-        donation_filters: Dict = {"date__year": year, "date__month": month}
-        if branch_id is not None:
-            donation_filters["donor__branch_id"] = branch_id
 
-        donation_total = float(
-            Donation.objects.filter(**donation_filters).aggregate(
-                total=Sum("amount")
-            )["total"]
-            or 0
+def _year_source_totals(
+    source_totals: Dict[str, MonthTotals], year: int
+) -> Dict[str, tuple]:
+    """Per-source (total, count) summed over the months of ``year``."""
+    totals = {}
+    for source, months in source_totals.items():
+        year_months = [
+            value for (row_year, _), value in months.items() if row_year == year
+        ]
+        totals[source] = (
+            sum((total for total, _ in year_months), Decimal("0.00")),
+            sum(count for _, count in year_months),
         )
+    return totals
 
-        offering_total = 0.0
-        if includes_offerings:
-            offering_total = float(
-                Offering.objects.filter(
-                    service_date__year=year,
-                    service_date__month=month,
-                ).aggregate(total=Sum("amount"))["total"]
-                or 0
-            )
 
-        contribution_qs = PledgeContribution.objects.filter(
-            contribution_date__year=year,
-            contribution_date__month=month,
-        )
-        if branch_id is not None:
-            contribution_qs = contribution_qs.filter(
-                pledge__pledger__branch_id=branch_id
-            )
-        pledge_contribution_total = float(
-            contribution_qs.aggregate(total=Sum("amount"))["total"] or 0
-        )
-
-        trend.append(
-            MonthlyGivingTrendPoint(
-                month=month,
-                donation_total=donation_total,
-                offering_total=offering_total,
-                pledge_contribution_total=pledge_contribution_total,
-            )
+def monthly_giving_trend(
+    *,
+    year: int,
+    branch_id: Optional[int] = None,
+    source_totals: Optional[Dict[str, MonthTotals]] = None,
+) -> List[MonthlyGivingTrendPoint]:
+    """Monthly donation, offering, and pledge-contribution totals for a calendar year."""
+    if source_totals is None:
+        source_totals = _monthly_source_totals(years=[year], branch_id=branch_id)
+
+    def month_total(source: str, month: int) -> float:
+        total, _ = source_totals[source].get((year, month), (0, 0))
+        return float(total or 0)
+
+    return [
+        MonthlyGivingTrendPoint(
+            month=month,
+            donation_total=month_total(GivingLedgerMonth.Source.DONATION, month),
+            offering_total=month_total(GivingLedgerMonth.Source.OFFERING, month),
+            pledge_contribution_total=month_total(
+                GivingLedgerMonth.Source.PLEDGE_CONTRIBUTION, month
+            ),
         )
-
-    return trend
+        for month in range(1, 13)
+    ]
 
 
 def generate_branch_scoped_stewardship_summary(
     *,
     branch_id: Optional[int] = None,
     year: Optional[int] = None,
+    compare_years: int = 0,
 ) -> Dict:
+    """
+    Stewardship analytics for ``year`` with optional branch scope.
+
+    ``comparisons`` holds the collected totals and monthly trend for each of
+    the ``compare_years`` preceding years. They are read by the same monthly
+    per-source queries as ``year``, widened to cover the earlier years.
+    Pledges are current state, so they are not repeated per year.
+    """
     from django.utils import timezone
 
     if year is None:
         year = timezone.now().year
+    years = [year - offset for offset in range(compare_years + 1)]
 
     start, end = _year_date_bounds(year)
     includes_offerings = branch_id is None
 
     donations = donation_stats(start, end, branch_id=branch_id)
     offerings_weekly = weekly_offering_totals(start, end, branch_id=branch_id)
-    monthly_trend = monthly_giving_trend(year=year, branch_id=branch_id)
+    # Offerings are church-wide, so a branch scope yields none (as before).
+    source_totals = _monthly_source_totals(years=years, branch_id=branch_id)
+    monthly_trend = monthly_giving_trend(
+        year=year, branch_id=branch_id, source_totals=source_totals
+    )
     pledges = pledge_summaries(
         status=[Pledge.Status.ACTIVE, Pledge.Status.FULFILLED],
         branch_id=branch_id,
     )
 
-    offering_total = (
-        float(
-            Offering.objects.filter(
-                service_date__gte=start,
-                service_date__lte=end,
-            ).aggregate(total=Sum("amount"))["total"]
-            or 0
-        )
-        if includes_offerings
-        else 0.0
-    )
-
-    offering_count = (
-        Offering.objects.filter(
-            service_date__gte=start,
-            service_date__lte=end,
-        ).count()
-        if includes_offerings
-        else 0
-    )
+    offering_total, offering_count = _year_source_totals(source_totals, year)[
+        GivingLedgerMonth.Source.OFFERING
+    ]
+    offering_total = float(offering_total)
 
     pledge_received_in_year = sum(
         row["pledge_contribution_total"] for row in monthly_trend
@@ -280,6 +298,31 @@ def generate_branch_scoped_stewardship_summary(
     donation_total = donations["total_amount"]
     total_collected = donation_total + offering_total + pledge_received_in_year
 
+    comparisons = []
+    for earlier in years[1:]:
+        totals = _year_source_totals(source_totals, earlier)
+        donation_sum, donation_count = totals[GivingLedgerMonth.Source.DONATION]
+        offering_sum, offering_count_then = totals[GivingLedgerMonth.Source.OFFERING]
+        pledge_sum, _ = totals[GivingLedgerMonth.Source.PLEDGE_CONTRIBUTION]
+        comparisons.append(
+            {
+                "year": earlier,
+                "summary": {
+                    "total_collected": round(
+                        float(donation_sum + offering_sum + pledge_sum), 2
+                    ),
+                    "donation_total": float(donation_sum),
+                    "offering_total": float(offering_sum),
+                    "pledge_received_in_year": round(float(pledge_sum), 2),
+                    "donation_count": donation_count,
+                    "offering_count": offering_count_then,
+                },
+                "monthly_trend": monthly_giving_trend(
+                    year=earlier, branch_id=branch_id, source_totals=source_totals
+                ),
+            }
+        )
+
     return {
         "year": year,
         "summary": {
@@ -305,4 +348,5 @@ def generate_branch_scoped_stewardship_summary(
         ],
         "monthly_trend": monthly_trend,
         "pledges": pledges,
+        "comparisons": comparisons,
     }
@@ -0,0 +1,62 @@
+"""
+Signal handlers keeping the monthly giving ledger in sync (see apps/finance/ledger.py).
+"""
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from apps.finance.ledger import (
+    SOURCE_FIELDS,
+    giving_ledger_enabled,
+    refresh_giving_ledger,
+    source_for_model,
+)
+from apps.finance.models import Donation, Offering, PledgeContribution
+
+
+def _ledger_month(sender, value):
+    """(year, month) of a date field value; accepts strings assigned before save."""
+    source = source_for_model(sender)
+    value = sender._meta.get_field(SOURCE_FIELDS[source][1]).to_python(value)
+    return (value.year, value.month) if value else None
+
+
+def _current_month(sender, instance):
+    return _ledger_month(sender, getattr(instance, SOURCE_FIELDS[source_for_model(sender)][1]))
+
+
+@receiver(pre_save, sender=Donation)
+@receiver(pre_save, sender=Offering)
+@receiver(pre_save, sender=PledgeContribution)
+def store_giving_original_month(sender, instance, **kwargs):
+    """Stash the ledger month the row was in before this save (snapshot, no query)."""
+    if not giving_ledger_enabled():
+        return
+    date_field = SOURCE_FIELDS[source_for_model(sender)][1]
+    instance._original_ledger_month = _ledger_month(
+        sender, instance.tracked_original_values()[date_field]
+    )
+
+
+@receiver(post_save, sender=Donation)
+@receiver(post_save, sender=Offering)
+@receiver(post_save, sender=PledgeContribution)
+def refresh_ledger_on_save(sender, instance, **kwargs):
+    """Re-sum the old and new month of the saved row."""
+    if not giving_ledger_enabled():
+        return
+    refresh_giving_ledger(
+        source_for_model(sender),
+        {
+            getattr(instance, "_original_ledger_month", None),
+            _current_month(sender, instance),
+        },
+    )
+
+
+@receiver(post_delete, sender=Donation)
+@receiver(post_delete, sender=Offering)
+@receiver(post_delete, sender=PledgeContribution)
+def refresh_ledger_on_delete(sender, instance, **kwargs):
+    if not giving_ledger_enabled():
+        return
+    refresh_giving_ledger(source_for_model(sender), {_current_month(sender, instance)})
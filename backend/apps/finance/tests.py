@@ -1,11 +1,20 @@
+from datetime import date
 from decimal import Decimal
+from io import StringIO
 
 from django.contrib.auth import get_user_model
-from django.test import TestCase
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from rest_framework.test import APIClient
 
-from .models import Pledge, PledgeContribution
+from apps.people.models import Branch
+
+from .ledger import refresh_giving_ledger
+from .models import Donation, GivingLedgerMonth, Offering, Pledge, PledgeContribution
+from .services import generate_branch_scoped_stewardship_summary, monthly_giving_trend
 
 
 class PledgeContributionModelTests(TestCase):
@@ -90,8 +99,8 @@ class PledgeContributionAPITests(TestCase):
             {"pledge": self.pledge.id},
         )
         self.assertEqual(list_response.status_code, 200)
-        self.assertEqual(len(list_response.data), 1)
-        contribution_id = list_response.data[0]["id"]
+        self.assertEqual(list_response.data["count"], 1)
+        contribution_id = list_response.data["results"][0]["id"]
 
         delete_response = self.client.delete(
             f"/api/finance/pledge-contributions/{contribution_id}/"
@@ -99,3 +108,169 @@ class PledgeContributionAPITests(TestCase):
         self.assertEqual(delete_response.status_code, 204)
         self.pledge.refresh_from_db()
         self.assertEqual(self.pledge.amount_received, Decimal("0"))
+
+
+class StewardshipTrendAndLedgerTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Ledger Branch", code="LEDG")
+        self.other_branch = Branch.objects.create(name="Other Branch", code="OTHR")
+        self.donor = get_user_model().objects.create_user(
+            username="ledger_donor", password="x", branch=self.branch
+        )
+        self.other_donor = get_user_model().objects.create_user(
+            username="ledger_other", password="x", branch=self.other_branch
+        )
+        self.pledge = Pledge.objects.create(
+            pledger=self.donor,
+            pledge_title="Roof",
+            pledge_amount=Decimal("1000.00"),
+            start_date=date(2025, 1, 1),
+        )
+        self.receipt = 0
+
+    def _donation(self, amount, day, donor=None):
+        self.receipt += 1
+        return Donation.objects.create(
+            amount=Decimal(amount),
+            date=day,
+            donor=donor or self.donor,
+            purpose="Tithe",
+            receipt_number=f"LEDGER-{self.receipt}",
+        )
+
+    def _seed(self):
+        self._donation("100.00", date(2025, 1, 5))
+        self._donation("50.00", date(2025, 1, 20))
+        self._donation("70.00", date(2025, 3, 2), donor=self.other_donor)
+        self._donation("999.00", date(2024, 12, 31))
+        Offering.objects.create(
+            service_date=date(2025, 1, 5), service_name="Sunday", amount=Decimal("40.00")
+        )
+        Offering.objects.create(
+            service_date=date(2025, 2, 9), service_name="Sunday", amount=Decimal("60.00")
+        )
+        PledgeContribution.objects.create(
+            pledge=self.pledge, amount=Decimal("25.00"), contribution_date=date(2025, 3, 15)
+        )
+
+    def _trend_by_month(self, **kwargs):
+        return {row["month"]: row for row in monthly_giving_trend(year=2025, **kwargs)}
+
+    def _assert_seeded_trend(self):
+        trend = self._trend_by_month()
+        self.assertEqual(len(trend), 12)
+        self.assertEqual(trend[1]["donation_total"], 150.0)
+        self.assertEqual(trend[1]["offering_total"], 40.0)
+        self.assertEqual(trend[2]["offering_total"], 60.0)
+        self.assertEqual(trend[3]["donation_total"], 70.0)
+        self.assertEqual(trend[3]["pledge_contribution_total"], 25.0)
+        self.assertEqual(trend[12]["donation_total"], 0.0)
+
+        branch_trend = self._trend_by_month(branch_id=self.branch.pk)
+        self.assertEqual(branch_trend[1]["donation_total"], 150.0)
+        self.assertEqual(branch_trend[1]["offering_total"], 0.0)
+        self.assertEqual(branch_trend[3]["donation_total"], 0.0)
+        self.assertEqual(branch_trend[3]["pledge_contribution_total"], 25.0)
+
+    def test_trend_uses_one_grouped_query_per_source(self):
+        self._seed()
+        with self.assertNumQueries(3):
+            monthly_giving_trend(year=2025)
+        self._assert_seeded_trend()
+
+        summary = generate_branch_scoped_stewardship_summary(year=2025)["summary"]
+        self.assertEqual(summary["offering_total"], 100.0)
+        self.assertEqual(summary["offering_count"], 2)
+        self.assertEqual(summary["total_collected"], 220.0 + 100.0 + 25.0)
+
+    def test_comparison_years_share_the_monthly_queries(self):
+        self._seed()
+        with self.assertNumQueries(3):
+            monthly_giving_trend(year=2025)
+        with CaptureQueriesContext(connection) as single:
+            generate_branch_scoped_stewardship_summary(year=2025)
+        with CaptureQueriesContext(connection) as compared:
+            payload = generate_branch_scoped_stewardship_summary(year=2025, compare_years=2)
+        self.assertEqual(len(compared), len(single))
+        self.assertEqual(payload["summary"]["donation_total"], 220.0)
+
+        last_year, two_years_ago = payload["comparisons"]
+        self.assertEqual(last_year["year"], 2024)
+        self.assertEqual(last_year["summary"]["donation_total"], 999.0)
+        self.assertEqual(last_year["summary"]["donation_count"], 1)
+        self.assertEqual(last_year["summary"]["total_collected"], 999.0)
+        self.assertEqual(last_year["monthly_trend"][11]["donation_total"], 999.0)
+        self.assertEqual(two_years_ago["summary"]["total_collected"], 0.0)
+
+        with override_settings(GIVING_LEDGER_ENABLED=True):
+            call_command("rebuild_giving_ledger", stdout=StringIO())
+            ledger = generate_branch_scoped_stewardship_summary(year=2025, compare_years=2)
+        self.assertEqual(ledger["comparisons"], payload["comparisons"])
+
+    @override_settings(GIVING_LEDGER_ENABLED=True)
+    def test_ledger_is_maintained_on_save_and_delete(self):
+        self._seed()
+        self._assert_seeded_trend()
+        with self.assertNumQueries(1):
+            monthly_giving_trend(year=2025)
+
+        january = GivingLedgerMonth.objects.get(
+            source=GivingLedgerMonth.Source.DONATION, branch=self.branch, year=2025, month=1
+        )
+        self.assertEqual((january.total, january.count), (Decimal("150.00"), 2))
+
+        # Moving a donation to another month refreshes both months.
+        moved = Donation.objects.get(date=date(2025, 1, 20))
+        moved.date = date(2025, 2, 1)
+        moved.save()
+        trend = self._trend_by_month()
+        self.assertEqual(trend[1]["donation_total"], 100.0)
+        self.assertEqual(trend[2]["donation_total"], 50.0)
+
+        moved.delete()
+        Offering.objects.filter(service_date=date(2025, 2, 9)).get().delete()
+        trend = self._trend_by_month()
+        self.assertEqual(trend[2]["donation_total"], 0.0)
+        self.assertEqual(trend[2]["offering_total"], 0.0)
+        self.assertFalse(GivingLedgerMonth.objects.filter(year=2025, month=2).exists())
+
+        summary = generate_branch_scoped_stewardship_summary(year=2025)["summary"]
+        self.assertEqual(summary["offering_count"], 1)
+
+    @override_settings(GIVING_LEDGER_ENABLED=True)
+    def test_month_lock_row_carries_no_branch_totals(self):
+        no_branch = get_user_model().objects.create_user(username="ledger_nobranch", password="x")
+        self._donation("30.00", date(2025, 4, 2), donor=no_branch)
+        branch_donation = self._donation("20.00", date(2025, 4, 9))
+
+        def april():
+            return {
+                (row.branch_id, row.total)
+                for row in GivingLedgerMonth.objects.filter(
+                    source=GivingLedgerMonth.Source.DONATION, year=2025, month=4
+                )
+            }
+
+        self.assertEqual(april(), {(None, Decimal("30.00")), (self.branch.pk, Decimal("20.00"))})
+        # Refreshing over existing rows rewrites them in place.
+        self.assertEqual(
+            refresh_giving_ledger(GivingLedgerMonth.Source.DONATION, [(2025, 4)]), 2
+        )
+        Donation.objects.get(donor=no_branch).delete()
+        self.assertEqual(april(), {(self.branch.pk, Decimal("20.00"))})
+        branch_donation.delete()
+        self.assertEqual(april(), set())
+
+    def test_rebuild_command_backfills_the_ledger(self):
+        self._seed()
+        self.assertFalse(GivingLedgerMonth.objects.exists())
+
+        out = StringIO()
+        call_command("rebuild_giving_ledger", "--year", "2025", "--dry-run", stdout=out)
+        self.assertIn("Would write 5 ledger row(s) for 2025", out.getvalue())
+        self.assertFalse(GivingLedgerMonth.objects.exists())
+
+        call_command("rebuild_giving_ledger", stdout=StringIO())
+        self.assertEqual(GivingLedgerMonth.objects.count(), 6)
+        with override_settings(GIVING_LEDGER_ENABLED=True):
+            self._assert_seeded_trend()
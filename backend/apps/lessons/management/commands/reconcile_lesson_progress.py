@@ -0,0 +1,92 @@
+"""
+Reconcile lesson progress with LESSON session reports for a whole cohort.
+
+Run after a lesson version change (``Lesson.is_latest``) or a bulk report
+import: completes progress that has a LESSON report, reverts completions that
+lost theirs, syncs Person.has_finished_lessons and clears commitment forms
+that no longer have every lesson completed.
+
+Usage:
+    python manage.py reconcile_lesson_progress --branch MAIN --dry-run
+    python manage.py reconcile_lesson_progress --force-report-rules
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.lessons.models import Lesson, PersonLessonProgress
+from apps.lessons.reconciliation import (
+    ProgressReconciliationResult,
+    reconcile_lesson_progress,
+)
+from apps.people.models import Branch
+
+
+class Command(BaseCommand):
+    help = "Reconcile lesson progress with LESSON session reports in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--branch",
+            type=str,
+            help="Only students of this branch (code)",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Show what would change without making changes",
+        )
+        parser.add_argument(
+            "--force-report-rules",
+            action="store_true",
+            help=(
+                "Also reconcile students with no LESSON reports "
+                "(reverts legacy completions that have no report)"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Students reconciled per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be saved"))
+
+        progress = PersonLessonProgress.objects.filter(
+            lesson__in=Lesson.objects.filter(is_latest=True, is_active=True)
+        )
+        if options["branch"]:
+            branch = Branch.objects.filter(code=options["branch"]).first()
+            if branch is None:
+                raise CommandError(f"Unknown branch code '{options['branch']}'")
+            progress = progress.filter(person__branch=branch)
+        student_ids = list(
+            progress.order_by("person_id").values_list("person_id", flat=True).distinct()
+        )
+
+        total = ProgressReconciliationResult(dry_run=options["dry_run"])
+        batch_size = options["batch_size"]
+        for start in range(0, len(student_ids), batch_size):
+            total.merge(
+                reconcile_lesson_progress(
+                    student_ids[start : start + batch_size],
+                    force_report_rules=options["force_report_rules"],
+                    dry_run=options["dry_run"],
+                )
+            )
+
+        verb = "Would reconcile" if options["dry_run"] else "Reconciled"
+        self.stdout.write(
+            f"{verb} {total.students} of {len(student_ids)} student(s) with progress: "
+            f"{total.completed} completed, {total.reverted} reverted, "
+            f"{total.journeys_created} journeys created, {total.journeys_updated} updated, "
+            f"{total.journeys_deleted} deleted, {total.people_updated} people updated, "
+            f"{total.commitments_cleared} commitment form(s) cleared"
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(total.changed_student_ids)} student(s) changed")
+        )
@@ -2,6 +2,7 @@ from django.db import models
 from django.db.models import Q
 
 from apps.people.models import Journey, Person
+from core.tracked_fields import TrackedFieldsMixin
 
 
 class Lesson(models.Model):
@@ -271,11 +272,14 @@ class LessonSettings(models.Model):
         return "Lesson Settings"
 
 
-class LessonSessionReport(models.Model):
+class LessonSessionReport(TrackedFieldsMixin, models.Model):
     """
     Records a 1:1 lesson session between a teacher and student.
     """
 
+    # Teacher/student pairs widen teachers' people scopes (apps/people/signals.py).
+    tracked_fields = ("teacher", "student")
+
     class SessionType(models.TextChoices):
         LESSON = "LESSON", "Lesson"
         PRE_LESSON = "PRE_LESSON", "Pre-lesson"
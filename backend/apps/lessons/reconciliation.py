@@ -0,0 +1,269 @@
+"""
+Cohort-level reconciliation of lesson progress with LESSON session reports.
+
+Same rules as the per-student reconciliation that runs when a session report
+is saved or deleted, applied to many students at once:
+
+- a progress row on an active latest lesson with a LESSON report is completed
+  (completion journey created or refreshed, dated by the latest report);
+- a COMPLETED row without a report is reverted to ASSIGNED and its journey
+  deleted;
+- ``Person.has_finished_lessons`` / ``lessons_finished_at`` follow the result;
+- a signed commitment form is cleared when not every lesson is completed.
+
+Students with no LESSON reports are left alone unless ``force_report_rules``
+(legacy students may be completed without reports).
+
+Lessons, progress rows, reports, enrollments and people are loaded with one
+grouped query each and every change is written with bulk operations, so the
+query count does not grow with the number of students. Used by
+``reconcile_student_progress_from_reports`` and the
+``reconcile_lesson_progress`` management command (e.g. after a lesson version
+change flips ``Lesson.is_latest``).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from django.db import transaction
+from django.utils import timezone
+
+from apps.people.models import Journey, Person
+from core.datetime_utils import church_calendar_date
+
+from .models import (
+    Lesson,
+    LessonJourney,
+    LessonSessionReport,
+    LessonStudentEnrollment,
+    PersonLessonProgress,
+)
+
+COMMITMENT_JOURNEY_TITLE = "Commitment Form Signed"
+
+
+@dataclass
+class ProgressReconciliationResult:
+    dry_run: bool = False
+    students: int = 0
+    completed: int = 0
+    reverted: int = 0
+    journeys_created: int = 0
+    journeys_updated: int = 0
+    journeys_deleted: int = 0
+    people_updated: int = 0
+    commitments_cleared: int = 0
+    changed_student_ids: list = field(default_factory=list)
+
+    def merge(self, other: "ProgressReconciliationResult") -> None:
+        for name in (
+            "students",
+            "completed",
+            "reverted",
+            "journeys_created",
+            "journeys_updated",
+            "journeys_deleted",
+            "people_updated",
+            "commitments_cleared",
+        ):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.changed_student_ids.extend(other.changed_student_ids)
+
+
+def _journey_configs(lessons: list[Lesson], needed_ids: set[int], *, dry_run: bool) -> dict:
+    """LessonJourney per lesson id; missing configs for ``needed_ids`` are created."""
+    configs = {
+        config.lesson_id: config
+        for config in LessonJourney.objects.filter(lesson__in=lessons)
+    }
+    missing = [
+        LessonJourney(lesson=lesson, journey_type="LESSON", title_template="", note_template="")
+        for lesson in lessons
+        if lesson.id in needed_ids and lesson.id not in configs
+    ]
+    if missing and not dry_run:
+        LessonJourney.objects.bulk_create(missing)
+    configs.update({config.lesson_id: config for config in missing})
+    return configs
+
+
+@transaction.atomic
+def reconcile_lesson_progress(
+    student_ids: Iterable[int],
+    *,
+    force_report_rules: bool = False,
+    dry_run: bool = False,
+) -> ProgressReconciliationResult:
+    """Reconcile progress for ``student_ids`` (see module docstring)."""
+    result = ProgressReconciliationResult(dry_run=dry_run)
+    student_ids = list(dict.fromkeys(student_ids))
+    lessons = list(Lesson.objects.filter(is_latest=True, is_active=True))
+    if not lessons or not student_ids:
+        return result
+    lessons_by_id = {lesson.id: lesson for lesson in lessons}
+
+    progress_by_student = defaultdict(list)
+    for progress in (
+        PersonLessonProgress.objects.filter(
+            person_id__in=student_ids, lesson_id__in=lessons_by_id
+        )
+        .select_related("journey")
+        .order_by("lesson__order", "id")
+    ):
+        progress_by_student[progress.person_id].append(progress)
+
+    # Latest LESSON report day per (student, lesson): the completion milestone.
+    report_dates = {}
+    for row in (
+        LessonSessionReport.objects.filter(
+            student_id__in=progress_by_student,
+            session_type=LessonSessionReport.SessionType.LESSON,
+            lesson_id__in=lessons_by_id,
+        )
+        .order_by("-session_date", "-session_start", "-id")
+        .values_list("student_id", "lesson_id", "session_date")
+    ):
+        report_dates.setdefault((row[0], row[1]), row[2])
+    reported_students = {student_id for student_id, _ in report_dates}
+
+    now = timezone.now()
+    to_complete = []
+    to_revert = []
+    for student_id, progresses in progress_by_student.items():
+        if student_id not in reported_students and not force_report_rules:
+            # Legacy students may remain completed without session report records.
+            continue
+        result.students += 1
+        for progress in progresses:
+            has_report = (student_id, progress.lesson_id) in report_dates
+            if has_report and progress.status != PersonLessonProgress.Status.COMPLETED:
+                to_complete.append(progress)
+            elif not has_report and progress.status == PersonLessonProgress.Status.COMPLETED:
+                to_revert.append(progress)
+
+    configs = _journey_configs(
+        lessons, {progress.lesson_id for progress in to_complete}, dry_run=dry_run
+    )
+    new_journeys = []
+    updated_journeys = []
+    for progress in to_complete:
+        config = configs[progress.lesson_id]
+        progress.status = PersonLessonProgress.Status.COMPLETED
+        progress.completed_at = progress.completed_at or now
+        if progress.started_at is None:
+            progress.started_at = progress.completed_at
+        progress.updated_at = now
+        journey = progress.journey or Journey(user_id=progress.person_id)
+        journey.type = config.journey_type
+        journey.title = config.title_template or lessons_by_id[progress.lesson_id].title
+        journey.description = progress.notes or config.note_template
+        journey.date = report_dates[(progress.person_id, progress.lesson_id)]
+        journey.verified_by_id = progress.completed_by_id
+        journey.updated_at = now
+        if progress.journey is None:
+            progress.journey = journey
+            new_journeys.append(journey)
+        else:
+            updated_journeys.append(journey)
+
+    stale_journey_ids = [progress.journey_id for progress in to_revert if progress.journey_id]
+    for progress in to_revert:
+        progress.status = PersonLessonProgress.Status.ASSIGNED
+        progress.completed_at = None
+        progress.completed_by = None
+        progress.journey = None
+        progress.updated_at = now
+
+    changed_ids = sorted({progress.person_id for progress in to_complete + to_revert})
+    people_to_update = _sync_lessons_finished(
+        changed_ids, progress_by_student, report_dates, len(lessons)
+    )
+    enrollments_to_clear = list(
+        LessonStudentEnrollment.objects.filter(
+            student_id__in=[
+                student_id
+                for student_id, progresses in progress_by_student.items()
+                if (student_id in reported_students or force_report_rules)
+                and not (
+                    len(progresses) == len(lessons)
+                    and all(p.status == PersonLessonProgress.Status.COMPLETED for p in progresses)
+                )
+            ],
+            is_active=True,
+            commitment_signed=True,
+        ).values_list("id", "student_id")
+    )
+
+    result.completed = len(to_complete)
+    result.reverted = len(to_revert)
+    result.journeys_created = len(new_journeys)
+    result.journeys_updated = len(updated_journeys)
+    result.journeys_deleted = len(stale_journey_ids)
+    result.people_updated = len(people_to_update)
+    result.commitments_cleared = len(enrollments_to_clear)
+    result.changed_student_ids = sorted(
+        set(changed_ids) | {student_id for _, student_id in enrollments_to_clear}
+    )
+    if dry_run:
+        return result
+
+    Journey.objects.bulk_create(new_journeys)
+    Journey.objects.bulk_update(
+        updated_journeys, ["type", "title", "description", "date", "verified_by", "updated_at"]
+    )
+    PersonLessonProgress.objects.bulk_update(
+        to_complete + to_revert,
+        ["status", "completed_at", "completed_by", "started_at", "journey", "updated_at"],
+    )
+    Journey.objects.filter(id__in=stale_journey_ids).delete()
+    Person.objects.bulk_update(people_to_update, ["has_finished_lessons", "lessons_finished_at"])
+    if enrollments_to_clear:
+        LessonStudentEnrollment.objects.filter(
+            id__in=[enrollment_id for enrollment_id, _ in enrollments_to_clear]
+        ).update(
+            commitment_signed=False,
+            commitment_signed_at=None,
+            commitment_signed_by=None,
+            updated_at=now,
+        )
+        Journey.objects.filter(
+            user_id__in=[student_id for _, student_id in enrollments_to_clear],
+            type="NOTE",
+            title=COMMITMENT_JOURNEY_TITLE,
+        ).delete()
+    return result
+
+
+def _sync_lessons_finished(student_ids, progress_by_student, report_dates, lesson_count) -> list:
+    """People whose has_finished_lessons / lessons_finished_at must change."""
+    if not student_ids:
+        return []
+    people = Person.objects.filter(pk__in=student_ids).only(
+        "id", "has_finished_lessons", "lessons_finished_at"
+    )
+    changed = []
+    for person in people:
+        progresses = progress_by_student[person.pk]
+        all_completed = len(progresses) == lesson_count and all(
+            progress.status == PersonLessonProgress.Status.COMPLETED for progress in progresses
+        )
+        if all_completed:
+            milestones = [
+                milestone
+                for progress in progresses
+                if (
+                    milestone := report_dates.get((person.pk, progress.lesson_id))
+                    or church_calendar_date(progress.completed_at)
+                )
+                is not None
+            ]
+            finished = (True, max(milestones) if milestones else None)
+        else:
+            finished = (False, None)
+        if (person.has_finished_lessons, person.lessons_finished_at) != finished:
+            person.has_finished_lessons, person.lessons_finished_at = finished
+            changed.append(person)
+    return changed
@@ -17,9 +17,9 @@ from .models import (
     PersonLessonProgress,
 )
 from .services import (
+    assignment_eligibility_errors,
     clear_enrollment_commitment_signed,
     ensure_lesson_enrollment,
-    person_assignment_eligibility_error,
     set_enrollment_commitment_signed,
     mark_progress_completed,
     revert_progress_completion,
@@ -546,8 +546,9 @@ class LessonBulkAssignSerializer(serializers.Serializer):
     lesson_id = serializers.PrimaryKeyRelatedField(
         queryset=Lesson.objects.all(), source="lesson"
     )
-    person_ids = serializers.PrimaryKeyRelatedField(
-        queryset=Person.objects.all(), many=True, source="persons"
+    # Resolved in one query (a many=True related field fetches each id separately).
+    person_ids = serializers.ListField(
+        child=serializers.IntegerField(), source="persons"
     )
     teacher_id = serializers.PrimaryKeyRelatedField(
         queryset=Person.objects.exclude(role="VISITOR").exclude(role="ADMIN"),
@@ -556,15 +557,24 @@ class LessonBulkAssignSerializer(serializers.Serializer):
         allow_null=True,
     )
 
+    def validate_person_ids(self, value):
+        found = Person.objects.in_bulk(value)
+        missing = [pk for pk in value if pk not in found]
+        if missing:
+            raise serializers.ValidationError(
+                f'Invalid pk "{missing[0]}" - object does not exist.'
+            )
+        return [found[pk] for pk in dict.fromkeys(value)]
+
     def validate(self, attrs: Dict[str, Any]) -> Dict[str, Any]:
         persons = attrs.get("persons") or []
         lesson = attrs.get("lesson")
-        ineligible_labels = []
-        for person in persons:
-            reason = person_assignment_eligibility_error(person, lesson=lesson)
-            if reason:
-                display_name = person.get_full_name() or person.username
-                ineligible_labels.append(f"{display_name} ({reason})")
+        ineligible = assignment_eligibility_errors(persons, lesson=lesson)
+        ineligible_labels = [
+            f"{person.get_full_name() or person.username} ({ineligible[person.pk]})"
+            for person in persons
+            if person.pk in ineligible
+        ]
         if ineligible_labels:
             raise serializers.ValidationError(
                 {
@@ -577,11 +587,12 @@ class LessonBulkAssignSerializer(serializers.Serializer):
             )
 
         teacher = attrs.get("teacher")
-        needs_teacher = [
-            person
-            for person in persons
-            if not LessonStudentEnrollment.objects.filter(student=person).exists()
-        ]
+        enrolled_ids = set(
+            LessonStudentEnrollment.objects.filter(
+                student__in=persons
+            ).values_list("student_id", flat=True)
+        )
+        needs_teacher = [person for person in persons if person.pk not in enrolled_ids]
         if needs_teacher and not teacher:
             raise serializers.ValidationError(
                 {
@@ -19,6 +19,7 @@ from .models import (
     LessonTeacherTransfer,
     PersonLessonProgress,
 )
+from .reconciliation import reconcile_lesson_progress
 
 
 @dataclass
@@ -400,13 +401,56 @@ def person_assignment_eligibility_error(
     """
     Return a human-readable reason when a person cannot receive lesson assignment.
     """
-    if person.has_finished_lessons:
-        return "has finished lessons"
-    if lesson is not None and PersonLessonProgress.objects.filter(
-        person=person, lesson=lesson
-    ).exists():
-        return "already has lesson progress"
-    return None
+    return assignment_eligibility_errors([person], lesson=lesson).get(person.pk)
+
+
+def assignment_eligibility_errors(
+    persons: Iterable[Person],
+    *,
+    lesson: Lesson | None = None,
+) -> dict[int, str]:
+    """
+    Set-based :func:`person_assignment_eligibility_error`: ``{person_id: reason}``
+    for every ineligible person, in at most one query.
+    """
+    persons = list(persons)
+    errors = {
+        person.pk: "has finished lessons"
+        for person in persons
+        if person.has_finished_lessons
+    }
+    if lesson is not None:
+        remaining = [person.pk for person in persons if person.pk not in errors]
+        if remaining:
+            for person_id in PersonLessonProgress.objects.filter(
+                lesson=lesson, person_id__in=remaining
+            ).values_list("person_id", flat=True):
+                errors[person_id] = "already has lesson progress"
+    return errors
+
+
+@dataclass
+class LessonAssignmentResult:
+    """
+    Per-person diff of a :func:`bulk_assign_lessons` call.
+
+    ``changes`` has one entry per person: ``progress`` is ``created``,
+    ``reactivated`` (SKIPPED -> ASSIGNED), ``updated`` (assigned_by only) or
+    ``unchanged``; ``fields`` maps each changed field to ``[old, new]``.
+    """
+
+    changes: list[dict]
+
+    def person_ids(self, progress: str) -> list[int]:
+        return [change["person"] for change in self.changes if change["progress"] == progress]
+
+    @property
+    def created_count(self) -> int:
+        return len(self.person_ids("created"))
+
+    @property
+    def enrollments_created(self) -> int:
+        return sum(1 for change in self.changes if change["enrollment_created"])
 
 
 @transaction.atomic
@@ -416,43 +460,98 @@ def bulk_assign_lessons(
     *,
     assigned_by: Optional[Person] = None,
     teacher: Optional[Person] = None,
-) -> int:
+) -> LessonAssignmentResult:
     """
     Ensures each target person has an assignment entry for the given lesson.
-    Returns the number of records created.
     When teacher is provided, creates lesson enrollment for students who lack one.
+
+    Existing enrollment and progress rows for the whole cohort are read in two
+    queries; missing rows are bulk-created and reactivations written with one
+    bulk_update, so the query count does not grow with the cohort size.
     """
 
-    created_count = 0
+    persons = list({person.pk: person for person in persons}.values())
+    person_ids = [person.pk for person in persons]
+    existing_progress = {
+        progress.person_id: progress
+        for progress in PersonLessonProgress.objects.filter(
+            lesson=lesson, person_id__in=person_ids
+        )
+    }
+    enrolled_ids = set()
+    if teacher:
+        enrolled_ids = set(
+            LessonStudentEnrollment.objects.filter(
+                student_id__in=person_ids
+            ).values_list("student_id", flat=True)
+        )
+
+    new_enrollments = LessonStudentEnrollment.objects.bulk_create(
+        [
+            LessonStudentEnrollment(
+                student=person, teacher=teacher, assigned_by=assigned_by
+            )
+            for person in persons
+            if teacher and person.pk not in enrolled_ids
+        ]
+    )
+    LessonTeacherTransfer.objects.bulk_create(
+        [
+            LessonTeacherTransfer(
+                enrollment=enrollment,
+                from_teacher=None,
+                to_teacher=teacher,
+                transferred_by=assigned_by,
+                note="Initial teacher assignment.",
+            )
+            for enrollment in new_enrollments
+        ]
+    )
+    enrolled_now = {enrollment.student_id for enrollment in new_enrollments}
+
+    now = timezone.now()
+    assigned_by_id = assigned_by.pk if assigned_by else None
+    to_create = []
+    to_update = []
+    changes = []
     for person in persons:
-        if teacher and not LessonStudentEnrollment.objects.filter(student=person).exists():
-            ensure_lesson_enrollment(
-                person,
-                teacher,
-                assigned_by=assigned_by,
+        change = {
+            "person": person.pk,
+            "enrollment_created": person.pk in enrolled_now,
+            "progress": "unchanged",
+            "fields": {},
+        }
+        changes.append(change)
+        progress = existing_progress.get(person.pk)
+        if progress is None:
+            to_create.append(
+                PersonLessonProgress(
+                    person=person,
+                    lesson=lesson,
+                    status=PersonLessonProgress.Status.ASSIGNED,
+                    assigned_by=assigned_by,
+                )
             )
+            change["progress"] = "created"
+            continue
 
-        progress, created = PersonLessonProgress.objects.get_or_create(
-            person=person,
-            lesson=lesson,
-            defaults={
-                "status": PersonLessonProgress.Status.ASSIGNED,
-                "assigned_by": assigned_by,
-            },
+        if progress.status == PersonLessonProgress.Status.SKIPPED:
+            change["fields"]["status"] = [progress.status, PersonLessonProgress.Status.ASSIGNED]
+            progress.status = PersonLessonProgress.Status.ASSIGNED
+        if assigned_by and progress.assigned_by_id != assigned_by_id:
+            change["fields"]["assigned_by"] = [progress.assigned_by_id, assigned_by_id]
+            progress.assigned_by_id = assigned_by_id
+        if change["fields"]:
+            change["progress"] = "reactivated" if "status" in change["fields"] else "updated"
+            progress.updated_at = now
+            to_update.append(progress)
+
+    PersonLessonProgress.objects.bulk_create(to_create)
+    if to_update:
+        PersonLessonProgress.objects.bulk_update(
+            to_update, ["status", "assigned_by", "updated_at"]
         )
-        if created:
-            created_count += 1
-        else:
-            updates = {}
-            if progress.status == PersonLessonProgress.Status.SKIPPED:
-                updates["status"] = PersonLessonProgress.Status.ASSIGNED
-            if assigned_by and progress.assigned_by_id != assigned_by.id:
-                updates["assigned_by"] = assigned_by
-            if updates:
-                for field, value in updates.items():
-                    setattr(progress, field, value)
-                progress.save(update_fields=[*updates.keys(), "updated_at"])
-    return created_count
+    return LessonAssignmentResult(changes=changes)
 
 
 @transaction.atomic
@@ -493,7 +592,6 @@ def backfill_missing_completed_lessons_for_person(
     return created_count
 
 
-@transaction.atomic
 def reconcile_student_progress_from_reports(
     student: Person, *, force_report_rules: bool = False
 ) -> None:
@@ -503,75 +601,10 @@ def reconcile_student_progress_from_reports(
     Legacy safeguard:
     - If the student has zero LESSON-type reports, do not mutate progress statuses
       unless force_report_rules=True (used by report-deletion paths).
-    """
-    active_latest_lessons = list(
-        Lesson.objects.filter(is_latest=True, is_active=True).only("id")
-    )
-    if not active_latest_lessons:
-        return
 
-    lesson_ids = {lesson.id for lesson in active_latest_lessons}
-    progresses = list(
-        PersonLessonProgress.objects.filter(person=student, lesson_id__in=lesson_ids)
-        .select_related("lesson", "completed_by")
-        .order_by("lesson__order", "id")
-    )
-    if not progresses:
-        return
-
-    report_lesson_ids = set(
-        LessonSessionReport.objects.filter(
-            student=student,
-            session_type=LessonSessionReport.SessionType.LESSON,
-            lesson_id__isnull=False,
-            lesson_id__in=lesson_ids,
-        ).values_list("lesson_id", flat=True)
-    )
-
-    if not report_lesson_ids and not force_report_rules:
-        # Legacy students may remain completed without session report records.
-        return
-
-    for progress in progresses:
-        has_report = progress.lesson_id in report_lesson_ids
-        if has_report:
-            if progress.status != PersonLessonProgress.Status.COMPLETED:
-                completed_by = progress.completed_by
-                completed_at = progress.completed_at or timezone.now()
-                mark_progress_completed(
-                    progress,
-                    completed_by=completed_by,
-                    note=progress.notes,
-                    completed_at=completed_at,
-                    completion_date=_session_date_for_progress(progress),
-                )
-            continue
-
-        previous_status = progress.status
-        if previous_status == PersonLessonProgress.Status.COMPLETED:
-            progress.status = PersonLessonProgress.Status.ASSIGNED
-            progress.save(update_fields=["status", "updated_at"])
-            revert_progress_completion(progress, previous_status=previous_status)
-
-    enrollment = (
-        LessonStudentEnrollment.objects.filter(student=student, is_active=True).first()
-    )
-    if not enrollment or not enrollment.commitment_signed:
-        return
-
-    refreshed_progresses = PersonLessonProgress.objects.filter(
-        person=student,
-        lesson_id__in=lesson_ids,
-    )
-    all_completed = (
-        refreshed_progresses.exists()
-        and refreshed_progresses.count() == len(lesson_ids)
-        and not refreshed_progresses.exclude(
-            status=PersonLessonProgress.Status.COMPLETED
-        ).exists()
-    )
-    if not all_completed:
-        clear_enrollment_commitment_signed(enrollment)
+    Single-student case of :func:`apps.lessons.reconciliation.reconcile_lesson_progress`.
+    """
+    reconcile_lesson_progress([student.pk], force_report_rules=force_report_rules)
 
 
 def build_lesson_progress_summary(
@@ -616,41 +649,50 @@ def build_lesson_progress_summary(
     active_latest_queryset = queryset.filter(
         lesson__is_latest=True,
         lesson__is_active=True,
-    ).select_related("lesson")
+    )
 
-    cohort_person_ids = list(
+    cohort_person_ids = (
         active_latest_queryset.filter(assigned_at__lte=year_end)
         .filter(Q(completed_at__isnull=True) | Q(completed_at__gte=year_start))
-        .values_list("person_id", flat=True)
-        .distinct()
+        .values("person_id")
     )
 
-    cohort_records = active_latest_queryset.filter(person_id__in=cohort_person_ids)
-    records_by_person: dict = {}
-    for progress in cohort_records:
-        records_by_person.setdefault(progress.person_id, []).append(progress)
-
     lessons_in_scope_count = (
         active_latest_queryset.values("lesson_id").distinct().count()
     )
+
+    # One row per cohort person with their completed count, folded into the
+    # ASSIGNED / IN_PROGRESS / COMPLETED split by the database.
+    per_person = (
+        active_latest_queryset.filter(person_id__in=cohort_person_ids)
+        .order_by()
+        .values("person_id")
+        .annotate(
+            completed_count=Count(
+                "id", filter=Q(status=PersonLessonProgress.Status.COMPLETED)
+            )
+        )
+    )
+    person_split = per_person.aggregate(
+        participants=Count("person_id"),
+        not_started=Count("person_id", filter=Q(completed_count=0)),
+        finished=Count(
+            "person_id",
+            filter=Q(completed_count__gt=0)
+            & Q(completed_count__gte=max(lessons_in_scope_count, 1)),
+        ),
+    )
+    total_participants = person_split["participants"] or 0
     person_status_totals = {
         status: 0 for status, _ in PersonLessonProgress.Status.choices
     }
-
-    for person_id in cohort_person_ids:
-        person_records = records_by_person.get(person_id, [])
-        completed_count = sum(
-            1
-            for record in person_records
-            if record.status == PersonLessonProgress.Status.COMPLETED
-        )
-
-        if completed_count == 0:
-            person_status_totals[PersonLessonProgress.Status.ASSIGNED] += 1
-        elif lessons_in_scope_count > 0 and completed_count >= lessons_in_scope_count:
-            person_status_totals[PersonLessonProgress.Status.COMPLETED] += 1
-        else:
-            person_status_totals[PersonLessonProgress.Status.IN_PROGRESS] += 1
+    person_status_totals[PersonLessonProgress.Status.ASSIGNED] = person_split["not_started"] or 0
+    person_status_totals[PersonLessonProgress.Status.COMPLETED] = person_split["finished"] or 0
+    person_status_totals[PersonLessonProgress.Status.IN_PROGRESS] = (
+        total_participants
+        - person_status_totals[PersonLessonProgress.Status.ASSIGNED]
+        - person_status_totals[PersonLessonProgress.Status.COMPLETED]
+    )
 
     lesson_breakdown = (
         queryset.values(
@@ -672,7 +714,7 @@ def build_lesson_progress_summary(
 
     return {
         "overall": person_status_totals,
-        "total_participants": len(cohort_person_ids),
+        "total_participants": total_participants,
         "year": target_year,
         "overall_records": record_status_totals,
         "total_records": queryset.count(),
@@ -104,7 +104,7 @@ class LessonsBranchScopeTests(TestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.progress_url, {"branch_id": self.branch_a.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        person_ids = {row["person"]["id"] for row in response.data if row.get("person")}
+        person_ids = {row["person"]["id"] for row in response.data["results"] if row.get("person")}
         self.assertIn(self.student_a.id, person_ids)
         self.assertNotIn(self.student_b.id, person_ids)
 
@@ -114,7 +114,7 @@ class LessonsBranchScopeTests(TestCase):
             self.progress_url, {"branch_id": self.branch_b.id}
         )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        person_ids = {row["person"]["id"] for row in response.data if row.get("person")}
+        person_ids = {row["person"]["id"] for row in response.data["results"] if row.get("person")}
         self.assertIn(self.student_a.id, person_ids)
         self.assertNotIn(self.student_b.id, person_ids)
 
@@ -135,7 +135,7 @@ class LessonsBranchScopeTests(TestCase):
         self.client.force_authenticate(user=user_no_branch)
         response = self.client.get(self.progress_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 0)
+        self.assertEqual(response.data["count"], 0)
 
     def test_admin_filters_session_reports_by_branch(self):
         LessonSessionReport.objects.create(
@@ -157,7 +157,7 @@ class LessonsBranchScopeTests(TestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.session_url, {"branch_id": self.branch_a.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        student_ids = {row["student"]["id"] for row in response.data if row.get("student")}
+        student_ids = {row["student"]["id"] for row in response.data["results"] if row.get("student")}
         self.assertIn(self.student_a.id, student_ids)
         self.assertNotIn(self.student_b.id, student_ids)
 
@@ -170,6 +170,6 @@ class LessonsBranchScopeTests(TestCase):
         self.client.force_authenticate(user=self.admin)
         response = self.client.get(self.enrollment_url, {"branch_id": self.branch_b.id})
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        student_ids = {row["student"]["id"] for row in response.data if row.get("student")}
+        student_ids = {row["student"]["id"] for row in response.data["results"] if row.get("student")}
         self.assertIn(self.student_b.id, student_ids)
         self.assertNotIn(self.student_a.id, student_ids)
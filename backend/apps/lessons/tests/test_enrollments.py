@@ -10,6 +10,7 @@ from apps.lessons.models import (
     LessonTeacherTransfer,
     PersonLessonProgress,
 )
+from apps.lessons.services import bulk_assign_lessons
 from apps.people.models import (
     Branch,
     Journey,
@@ -251,6 +252,84 @@ class LessonEnrollmentAPITests(TestCase):
         enrollment = LessonStudentEnrollment.objects.get(student=self.student)
         self.assertEqual(enrollment.teacher_id, self.teacher_a.id)
 
+    def test_assign_reports_per_person_diff(self):
+        LessonStudentEnrollment.objects.create(student=self.other_student, teacher=self.teacher_a)
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.post(
+            reverse("lessons:lesson-progress-assign"),
+            {
+                "lesson_id": self.lesson.id,
+                "person_ids": [self.student.id, self.other_student.id],
+                "teacher_id": self.teacher_b.id,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["enrollments_created"], 1)
+        self.assertEqual(
+            response.data["changes"],
+            [
+                {"person": self.student.id, "enrollment_created": True, "progress": "created", "fields": {}},
+                {"person": self.other_student.id, "enrollment_created": False, "progress": "created", "fields": {}},
+            ],
+        )
+        self.assertEqual(
+            LessonTeacherTransfer.objects.get(enrollment__student=self.student).note,
+            "Initial teacher assignment.",
+        )
+
+    def test_bulk_assign_reactivates_skipped_progress_with_constant_queries(self):
+        skipped = PersonLessonProgress.objects.create(
+            person=self.student,
+            lesson=self.lesson,
+            status=PersonLessonProgress.Status.SKIPPED,
+            assigned_by=self.teacher_a,
+        )
+        PersonLessonProgress.objects.create(
+            person=self.other_student,
+            lesson=self.lesson,
+            status=PersonLessonProgress.Status.IN_PROGRESS,
+            assigned_by=self.admin,
+        )
+
+        def cohort(size, prefix):
+            return [
+                Person.objects.create_user(
+                    username=f"{prefix}{n}", first_name="Cohort", last_name=str(n), role="MEMBER"
+                )
+                for n in range(size)
+            ]
+
+        small_cohort = [self.student, self.other_student, *cohort(2, "small")]
+        large_cohort = cohort(40, "large")
+
+        with self.assertNumQueries(8):
+            small = bulk_assign_lessons(
+                self.lesson,
+                small_cohort,
+                assigned_by=self.admin,
+                teacher=self.teacher_a,
+            )
+        with self.assertNumQueries(7):
+            # Ten times the cohort; nothing to reactivate, so no bulk_update.
+            bulk_assign_lessons(self.lesson, large_cohort, teacher=self.teacher_a)
+
+        self.assertEqual(small.created_count, 2)
+        self.assertEqual(small.person_ids("reactivated"), [self.student.id])
+        self.assertEqual(small.person_ids("unchanged"), [self.other_student.id])
+        self.assertEqual(
+            small.changes[0]["fields"],
+            {
+                "status": [PersonLessonProgress.Status.SKIPPED, PersonLessonProgress.Status.ASSIGNED],
+                "assigned_by": [self.teacher_a.id, self.admin.id],
+            },
+        )
+        skipped.refresh_from_db()
+        self.assertEqual(skipped.status, PersonLessonProgress.Status.ASSIGNED)
+        self.assertEqual(skipped.assigned_by, self.admin)
+        self.assertEqual(LessonStudentEnrollment.objects.count(), 44)
+
     def test_transfer_updates_teacher_and_creates_history(self):
         enrollment = LessonStudentEnrollment.objects.create(
             student=self.student,
@@ -309,7 +388,7 @@ class LessonEnrollmentAPITests(TestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         person_ids = {
             row["person"]["id"]
-            for row in response.data
+            for row in response.data["results"]
             if row.get("person") and row["person"].get("id")
         }
         self.assertEqual(person_ids, {self.student.id})
@@ -0,0 +1,107 @@
+from django.db import connection
+from django.db.models.signals import post_init
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.lessons.models import Lesson, PersonLessonProgress
+from apps.lessons.services import build_lesson_progress_summary
+from apps.people.models import Branch, Person
+
+Status = PersonLessonProgress.Status
+
+
+class LessonProgressSummaryTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Summary Branch", code="SUM")
+        self.lessons = list(
+            Lesson.objects.filter(is_latest=True, is_active=True).order_by("order")
+        )
+        self.assertGreater(len(self.lessons), 1)
+        # assigned_at is auto_now_add, so the cohort year is the current one.
+        self.now = timezone.now()
+
+    def _students(self, count, prefix):
+        return Person.objects.bulk_create(
+            Person(
+                username=f"{prefix}{n}",
+                first_name="Summary",
+                last_name=f"{prefix}{n}",
+                role="VISITOR",
+                branch=self.branch,
+                password="!",
+            )
+            for n in range(count)
+        )
+
+    def _progress_rows(self, students, statuses):
+        """One row per (student, lesson) with the lesson's status from ``statuses``."""
+        rows = []
+        for student in students:
+            for lesson, status in zip(self.lessons, statuses):
+                rows.append(
+                    PersonLessonProgress(
+                        person=student,
+                        lesson=lesson,
+                        status=status,
+                        completed_at=self.now if status == Status.COMPLETED else None,
+                    )
+                )
+        PersonLessonProgress.objects.bulk_create(rows, batch_size=2000)
+
+    def _summary(self):
+        return build_lesson_progress_summary(
+            PersonLessonProgress.objects.filter(person__branch=self.branch), year=self.now.year
+        )
+
+    def test_people_are_split_by_completed_lessons(self):
+        every_lesson = len(self.lessons)
+        self._progress_rows(self._students(2, "fresh"), [Status.ASSIGNED] * every_lesson)
+        self._progress_rows(
+            self._students(3, "midway"),
+            [Status.COMPLETED] + [Status.IN_PROGRESS] * (every_lesson - 1),
+        )
+        self._progress_rows(self._students(1, "done"), [Status.COMPLETED] * every_lesson)
+
+        summary = self._summary()
+
+        self.assertEqual(summary["total_participants"], 6)
+        self.assertEqual(summary["overall"][Status.ASSIGNED], 2)
+        self.assertEqual(summary["overall"][Status.IN_PROGRESS], 3)
+        self.assertEqual(summary["overall"][Status.COMPLETED], 1)
+        self.assertEqual(summary["total_records"], 6 * every_lesson)
+
+    def test_summary_runs_fixed_aggregate_queries(self):
+        # Shape only; the 10k+ cohort is covered by the lessons_progress_summary
+        # benchmark (run_benchmarks --scale 1 --only lessons_progress_summary).
+        small_cohort = self._other_branch_progress()
+        with CaptureQueriesContext(connection) as small_run:
+            build_lesson_progress_summary(small_cohort, year=self.now.year)
+        self._progress_rows(self._students(25, "bulk"), [Status.COMPLETED, Status.ASSIGNED])
+
+        instantiated = []
+
+        def count_instances(sender, **kwargs):
+            instantiated.append(sender)
+
+        post_init.connect(count_instances, sender=PersonLessonProgress)
+        try:
+            with CaptureQueriesContext(connection) as large_run:
+                summary = self._summary()
+        finally:
+            post_init.disconnect(count_instances, sender=PersonLessonProgress)
+
+        self.assertEqual(instantiated, [])
+        self.assertEqual(len(large_run), len(small_run))
+        for query in large_run:
+            self.assertIn("COUNT(", query["sql"].upper())
+        self.assertEqual(summary["total_participants"], 25)
+        self.assertEqual(summary["overall"][Status.IN_PROGRESS], 25)
+
+    def _other_branch_progress(self):
+        other = Branch.objects.create(name="Small Branch", code="SMALL")
+        student = Person.objects.create_user(
+            username="small", first_name="Small", last_name="Cohort", branch=other
+        )
+        self._progress_rows([student], [Status.COMPLETED])
+        return PersonLessonProgress.objects.filter(person__branch=other)
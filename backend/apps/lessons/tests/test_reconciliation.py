@@ -0,0 +1,158 @@
+from datetime import date, datetime, timedelta
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from apps.lessons.models import (
+    Lesson,
+    LessonSessionReport,
+    LessonStudentEnrollment,
+    PersonLessonProgress,
+)
+from apps.lessons.reconciliation import reconcile_lesson_progress
+from apps.people.models import Branch, Journey, Person
+
+
+class LessonProgressReconciliationTests(TestCase):
+    def setUp(self):
+        self.branch = Branch.objects.create(name="Recon Branch", code="RECON")
+        self.lessons = list(
+            Lesson.objects.filter(is_latest=True, is_active=True).order_by("order")
+        )
+        self.assertGreater(len(self.lessons), 1)
+        self.session_start = timezone.make_aware(datetime(2026, 3, 1, 10, 0))
+
+    def _student(self, username, *, branch=None):
+        return Person.objects.create_user(
+            username=username,
+            first_name="Recon",
+            last_name=username,
+            role="MEMBER",
+            branch=branch or self.branch,
+        )
+
+    def _progress(self, student, lesson, status=PersonLessonProgress.Status.ASSIGNED, **extra):
+        return PersonLessonProgress.objects.create(
+            person=student, lesson=lesson, status=status, **extra
+        )
+
+    def _report(self, student, lesson, session_date):
+        return LessonSessionReport.objects.create(
+            student=student,
+            lesson=lesson,
+            session_type=LessonSessionReport.SessionType.LESSON,
+            session_date=session_date,
+            session_start=self.session_start,
+        )
+
+    def _fully_reported_student(self, username, **kwargs):
+        student = self._student(username, **kwargs)
+        for index, lesson in enumerate(self.lessons):
+            self._progress(student, lesson)
+            self._report(student, lesson, date(2026, 3, 1) + timedelta(days=index))
+        return student
+
+    def test_completes_reverts_and_clears_commitment_for_a_cohort(self):
+        finished = self._fully_reported_student("finished")
+
+        # A completion that lost its report, plus a signed commitment form.
+        lapsed = self._student("lapsed")
+        stale_journey = Journey.objects.create(
+            user=lapsed, type="LESSON", title="Old", date=date(2026, 1, 1)
+        )
+        self._progress(
+            lapsed,
+            self.lessons[0],
+            PersonLessonProgress.Status.COMPLETED,
+            completed_at=timezone.now(),
+            journey=stale_journey,
+        )
+        self._progress(lapsed, self.lessons[1])
+        self._report(lapsed, self.lessons[1], date(2026, 3, 5))
+        LessonStudentEnrollment.objects.create(
+            student=lapsed, commitment_signed=True, commitment_signed_at=timezone.now()
+        )
+        Journey.objects.create(
+            user=lapsed, type="NOTE", title="Commitment Form Signed", date=date(2026, 2, 1)
+        )
+
+        result = reconcile_lesson_progress([finished.pk, lapsed.pk])
+
+        self.assertEqual(result.completed, len(self.lessons) + 1)
+        self.assertEqual(result.reverted, 1)
+        self.assertEqual(result.commitments_cleared, 1)
+        self.assertEqual(result.changed_student_ids, sorted([finished.pk, lapsed.pk]))
+
+        finished.refresh_from_db()
+        self.assertTrue(finished.has_finished_lessons)
+        self.assertEqual(
+            finished.lessons_finished_at, date(2026, 3, 1) + timedelta(days=len(self.lessons) - 1)
+        )
+        progress = PersonLessonProgress.objects.get(person=finished, lesson=self.lessons[0])
+        self.assertEqual(progress.status, PersonLessonProgress.Status.COMPLETED)
+        self.assertEqual(progress.journey.date, date(2026, 3, 1))
+        config = getattr(self.lessons[0], "journey_config", None)
+        self.assertEqual(
+            progress.journey.title,
+            (config.title_template if config else "") or self.lessons[0].title,
+        )
+
+        reverted = PersonLessonProgress.objects.get(person=lapsed, lesson=self.lessons[0])
+        self.assertEqual(reverted.status, PersonLessonProgress.Status.ASSIGNED)
+        self.assertIsNone(reverted.journey)
+        self.assertFalse(Journey.objects.filter(pk=stale_journey.pk).exists())
+        self.assertFalse(
+            Journey.objects.filter(user=lapsed, title="Commitment Form Signed").exists()
+        )
+        self.assertFalse(LessonStudentEnrollment.objects.get(student=lapsed).commitment_signed)
+
+    def test_legacy_students_without_reports_are_left_alone(self):
+        legacy = self._student("legacy")
+        self._progress(
+            legacy,
+            self.lessons[0],
+            PersonLessonProgress.Status.COMPLETED,
+            completed_at=timezone.now(),
+        )
+
+        self.assertEqual(reconcile_lesson_progress([legacy.pk]).students, 0)
+        forced = reconcile_lesson_progress([legacy.pk], force_report_rules=True)
+        self.assertEqual(forced.reverted, 1)
+
+    def test_query_count_does_not_grow_with_the_cohort(self):
+        small = [self._fully_reported_student(f"small{n}").pk for n in range(2)]
+        large = [self._fully_reported_student(f"large{n}").pk for n in range(12)]
+
+        with CaptureQueriesContext(connection) as small_run:
+            reconcile_lesson_progress(small)
+        with CaptureQueriesContext(connection) as large_run:
+            reconcile_lesson_progress(large)
+        self.assertEqual(len(small_run), len(large_run))
+
+    def test_command_dry_run_and_branch_filter(self):
+        student = self._fully_reported_student("cmd")
+        other_branch = Branch.objects.create(name="Elsewhere", code="ELSE")
+        outsider = self._fully_reported_student("outsider", branch=other_branch)
+
+        out = StringIO()
+        call_command("reconcile_lesson_progress", "--branch", "RECON", "--dry-run", stdout=out)
+        self.assertIn(f"Would reconcile 1 of 1 student(s) with progress: {len(self.lessons)} completed", out.getvalue())
+        self.assertFalse(
+            PersonLessonProgress.objects.filter(status=PersonLessonProgress.Status.COMPLETED).exists()
+        )
+
+        call_command("reconcile_lesson_progress", "--branch", "RECON", stdout=StringIO())
+        self.assertEqual(
+            set(
+                PersonLessonProgress.objects.filter(
+                    status=PersonLessonProgress.Status.COMPLETED
+                ).values_list("person_id", flat=True)
+            ),
+            {student.pk},
+        )
+        outsider.refresh_from_db()
+        self.assertFalse(outsider.has_finished_lessons)
@@ -125,6 +125,7 @@ def lesson_teacher_roster(request):
 class LessonViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedAndNotVisitor]
     serializer_class = LessonSerializer
+    pagination_class = None  # Curriculum is a short, fixed list
     
     def get_permissions(self):
         """
@@ -279,7 +280,7 @@ class PersonLessonProgressViewSet(
         assigned_by = request.user if isinstance(request.user, Person) else None
 
         teacher = serializer.validated_data.get("teacher")
-        created_count = bulk_assign_lessons(
+        result = bulk_assign_lessons(
             lesson,
             persons,
             assigned_by=assigned_by,
@@ -287,8 +288,12 @@ class PersonLessonProgressViewSet(
         )
 
         return Response(
-            {"created": created_count},
-            status=status.HTTP_201_CREATED if created_count else status.HTTP_200_OK,
+            {
+                "created": result.created_count,
+                "enrollments_created": result.enrollments_created,
+                "changes": result.changes,
+            },
+            status=status.HTTP_201_CREATED if result.created_count else status.HTTP_200_OK,
         )
 
     @action(detail=False, methods=["get"], url_path="summary")
@@ -5,6 +5,8 @@ from __future__ import annotations
 from typing import Iterable, Optional
 
 from django.db import transaction
+from django.db.models import Exists, OuterRef
+from django.utils import timezone
 
 from apps.people.models import Branch, ModuleCoordinator, Person
 from apps.lessons.branch_scope import can_pick_lessons_branch
@@ -26,23 +28,27 @@ def is_ncc_ministry(ministry: Ministry | None) -> bool:
     return bool(ministry.is_ncc_roster)
 
 
+def _ncc_ministry_defaults() -> dict:
+    return {
+        "name": NCC_MINISTRY_NAME,
+        "scope": MinistryScope.BRANCH,
+        "is_system": True,
+        "category": MinistryCategory.CARE,
+        "activity_cadence": MinistryCadence.WEEKLY,
+        "description": (
+            "New Converts Course / Lessons teachers roster for this branch."
+        ),
+        "is_active": True,
+    }
+
+
 @transaction.atomic
 def ensure_ncc_ministry(branch: Branch) -> Ministry:
     """Get or create the BRANCH-scoped NCC / Lessons roster ministry for a branch."""
     ministry, created = Ministry.objects.get_or_create(
         code=NCC_MINISTRY_CODE,
         branch=branch,
-        defaults={
-            "name": NCC_MINISTRY_NAME,
-            "scope": MinistryScope.BRANCH,
-            "is_system": True,
-            "category": MinistryCategory.CARE,
-            "activity_cadence": MinistryCadence.WEEKLY,
-            "description": (
-                "New Converts Course / Lessons teachers roster for this branch."
-            ),
-            "is_active": True,
-        },
+        defaults=_ncc_ministry_defaults(),
     )
     update_fields = []
     if not ministry.is_system:
@@ -59,30 +65,39 @@ def ensure_ncc_ministry(branch: Branch) -> Ministry:
     return ministry
 
 
+@transaction.atomic
 def seed_ncc_ministries_for_all_branches() -> int:
-    """Ensure an NCC ministry exists for every active branch. Returns created count."""
-    created = 0
-    for branch in Branch.objects.filter(is_active=True).iterator():
-        _, was_created = Ministry.objects.get_or_create(
-            code=NCC_MINISTRY_CODE,
-            branch=branch,
-            defaults={
-                "name": NCC_MINISTRY_NAME,
-                "scope": MinistryScope.BRANCH,
-                "is_system": True,
-                "category": MinistryCategory.CARE,
-                "activity_cadence": MinistryCadence.WEEKLY,
-                "description": (
-                    "New Converts Course / Lessons teachers roster for this branch."
-                ),
-                "is_active": True,
-            },
+    """
+    Ensure an NCC ministry exists for every active branch. Returns created count.
+
+    Set-based: branches without a roster are found with one anti-join and
+    created with one ``bulk_create``; existing rosters that lost their system
+    flag or BRANCH scope are repaired with one ``update``. Custom names are kept.
+    """
+    missing = list(
+        Branch.objects.filter(is_active=True)
+        .exclude(
+            Exists(
+                Ministry.objects.filter(
+                    code=NCC_MINISTRY_CODE, branch_id=OuterRef("pk")
+                )
+            )
         )
-        if was_created:
-            created += 1
-        else:
-            ensure_ncc_ministry(branch)
-    return created
+        .values_list("pk", flat=True)
+    )
+    Ministry.objects.filter(
+        code=NCC_MINISTRY_CODE, branch__is_active=True
+    ).exclude(is_system=True, scope=MinistryScope.BRANCH).update(
+        is_system=True, scope=MinistryScope.BRANCH, updated_at=timezone.now()
+    )
+    # New rosters have no coordinators, so skipping post_save sync is safe.
+    Ministry.objects.bulk_create(
+        [
+            Ministry(code=NCC_MINISTRY_CODE, branch_id=branch_id, **_ncc_ministry_defaults())
+            for branch_id in missing
+        ]
+    )
+    return len(missing)
 
 
 def grant_lessons_teacher_access(person: Person) -> Optional[ModuleCoordinator]:
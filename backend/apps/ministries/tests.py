@@ -6,6 +6,7 @@ from rest_framework.exceptions import ValidationError
 
 from .models import Ministry, MinistryMember, MinistryRole
 from .serializers import MinistrySerializer
+from .utils import sync_coordinators_to_members
 
 
 class MinistrySerializerTests(TestCase):
@@ -404,6 +405,57 @@ class CoordinatorSyncTests(TestCase):
         self.assertEqual(support_membership.role, MinistryRole.COORDINATOR)
 
 
+    def test_sync_applies_roster_diff_in_bulk(self):
+        """Roster sync costs the same few queries however many coordinators change."""
+        ministry = Ministry.objects.create(
+            name="Hospitality",
+            activity_cadence="weekly",
+            scope="NATIONAL",
+            primary_coordinator=self.primary,
+        )
+        ministry.support_coordinators.add(self.support1)
+        MinistryMember.objects.create(
+            ministry=ministry,
+            member=self.team_member,
+            role=MinistryRole.TEAM_MEMBER,
+            is_active=False,
+        )
+
+        # support1 is promoted, the old primary and team_member become support,
+        # support2 is new; reading support coordinators, the diff, one insert, one update.
+        Ministry.objects.filter(pk=ministry.pk).update(primary_coordinator=self.support1)
+        ministry.refresh_from_db()
+        ministry.support_coordinators.through.objects.filter(ministry=ministry).delete()
+        ministry.support_coordinators.through.objects.bulk_create(
+            [
+                ministry.support_coordinators.through(ministry=ministry, person=person)
+                for person in (self.primary, self.team_member, self.support2)
+            ]
+        )
+        with self.assertNumQueries(4):
+            sync_coordinators_to_members(ministry)
+
+        roles = dict(
+            MinistryMember.objects.filter(ministry=ministry).values_list("member_id", "role")
+        )
+        self.assertEqual(
+            roles,
+            {
+                self.support1.pk: MinistryRole.PRIMARY_COORDINATOR,
+                self.primary.pk: MinistryRole.COORDINATOR,
+                self.team_member.pk: MinistryRole.COORDINATOR,
+                self.support2.pk: MinistryRole.COORDINATOR,
+            },
+        )
+        self.assertTrue(
+            MinistryMember.objects.get(ministry=ministry, member=self.team_member).is_active
+        )
+
+        # Nothing changed: no writes at all.
+        with self.assertNumQueries(2):
+            sync_coordinators_to_members(ministry)
+
+
 class MinistryScopeVisibilityAPITests(TestCase):
     """Branch vs national list/create rules for ministries."""
 
@@ -598,6 +650,48 @@ class MinistryScopeVisibilityAPITests(TestCase):
         self.assertIn("National Youth", names)
         self.assertNotIn("Local B Worship", names)
 
+    def test_coord_visibility_is_one_flat_query(self):
+        """Support and assigned ministries are resolved to ids; no DISTINCT/OR-of-joins."""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        from apps.people.models import ModuleCoordinator
+
+        support_a = Ministry.objects.create(
+            name="Support A Ushers", code="SUP-A", scope="BRANCH", branch=self.branch_a
+        )
+        support_a.support_coordinators.add(self.coord_a)
+        assigned_a = Ministry.objects.create(
+            name="Assigned A Media", code="ASG-A", scope="BRANCH", branch=self.branch_a
+        )
+        Ministry.objects.create(
+            name="Unrelated A Prayer", code="UNR-A", scope="BRANCH", branch=self.branch_a
+        )
+        ModuleCoordinator.objects.create(
+            person=self.coord_a,
+            module=ModuleCoordinator.ModuleType.MINISTRIES,
+            level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
+            resource_id=assigned_a.pk,
+            resource_type="Ministry",
+        )
+        self.client.force_authenticate(user=self.coord_a)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/api/ministries/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            sorted(self._names(response)),
+            ["Assigned A Media", "Local A Worship", "National Youth", "Support A Ushers"],
+        )
+        listing = [q["sql"] for q in queries if 'FROM "ministries_ministry"' in q["sql"]]
+        self.assertTrue(listing)
+        self.assertFalse(any("DISTINCT" in sql for sql in listing))
+
+        members = self.client.get("/api/ministries/members/")
+        self.assertEqual(members.status_code, 200)
+        rows = members.data["results"] if isinstance(members.data, dict) else members.data
+        self.assertEqual({row["ministry"] for row in rows}, {self.local_a.pk, self.national.pk, support_a.pk})
+
     def test_national_create_forbids_keeping_branch(self):
         self.client.force_authenticate(user=self.admin)
         response = self.client.post(
@@ -2,11 +2,20 @@
 Utility functions for the ministries app.
 """
 
+from typing import Optional
+
 from django.db.models import Q
 
 from apps.people.models import ModuleCoordinator
 
-from .models import MinistryMember, MinistryRole, MinistryScope
+from .models import (
+    NCC_MINISTRY_CODE,
+    Ministry,
+    MinistryMember,
+    MinistryRole,
+    MinistryScope,
+)
+from .ncc import user_is_lessons_roster_manager
 
 
 def user_can_set_national_ministry_scope(user) -> bool:
@@ -24,16 +33,50 @@ def user_can_set_national_ministry_scope(user) -> bool:
     return False
 
 
-def apply_ministry_branch_visibility(queryset, user):
+def ministry_branch_q(user) -> Q:
+    """NATIONAL ministries plus the user's own branch."""
+    if getattr(user, "branch_id", None):
+        return Q(scope=MinistryScope.NATIONAL) | Q(branch_id=user.branch_id)
+    return Q(scope=MinistryScope.NATIONAL)
+
+
+COORDINATOR_ROLES = (MinistryRole.PRIMARY_COORDINATOR, MinistryRole.COORDINATOR)
+
+
+def ministry_visibility_q(user) -> Optional[Q]:
     """
-    Restrict to NATIONAL ministries plus the user's own branch.
-    Callers who may see all branches should skip this helper.
+    One flat filter for the ministries a non-admin user may see, or ``None``.
+
+    Ministry coordinators see the ministries they lead or are assigned to;
+    their support-coordinator ministries are resolved to ids first, so the
+    filter is ``primary_coordinator = user OR id IN (...)`` on indexed columns
+    rather than an OR of joined/subquery branches needing ``DISTINCT``.
+    Members and pastors see :func:`ministry_branch_q`, and Lessons
+    roster managers also see the NCC rosters of visible branches. Callers who
+    may see all branches should skip this helper.
     """
-    if getattr(user, "branch_id", None):
-        return queryset.filter(
-            Q(scope=MinistryScope.NATIONAL) | Q(branch_id=user.branch_id)
+    branch_q = ministry_branch_q(user)
+    visible = None
+    assigned = list(
+        user.module_coordinator_assignments.filter(
+            module=ModuleCoordinator.ModuleType.MINISTRIES
+        ).values_list("resource_id", flat=True)
+    )
+    if assigned:
+        ministry_ids = {resource_id for resource_id in assigned if resource_id}
+        ministry_ids.update(
+            Ministry.support_coordinators.through.objects.filter(
+                person_id=user.pk
+            ).values_list("ministry_id", flat=True)
         )
-    return queryset.filter(scope=MinistryScope.NATIONAL)
+        visible = (Q(primary_coordinator=user) | Q(pk__in=ministry_ids)) & branch_q
+    elif user.role in ("MEMBER", "PASTOR"):
+        visible = branch_q
+
+    if user_is_lessons_roster_manager(user):
+        ncc_q = Q(code=NCC_MINISTRY_CODE, is_system=True) & branch_q
+        visible = ncc_q if visible is None else visible | ncc_q
+    return visible
 
 
 def sync_coordinators_to_members(ministry):
@@ -41,51 +84,50 @@ def sync_coordinators_to_members(ministry):
     Sync primary_coordinator and support_coordinators to MinistryMember entries.
     This ensures coordinator assignments automatically create/update MinistryMember records.
 
+    The desired coordinator roles are diffed against the ministry's existing
+    coordinator rows (one query), then applied with one ``bulk_create`` for
+    new members and one ``bulk_update`` for role/active changes; removed
+    coordinators stay on the roster as TEAM_MEMBER.
+
     This function is shared between serializers and signals to avoid code duplication.
     """
-    # Track current coordinators
-    current_primary = ministry.primary_coordinator
-    current_support = set(ministry.support_coordinators.all())
-
-    # Sync primary coordinator
-    if current_primary:
-        MinistryMember.objects.update_or_create(
-            ministry=ministry,
-            member=current_primary,
-            defaults={
-                "role": MinistryRole.PRIMARY_COORDINATOR,
-                "is_active": True,
-            },
-        )
+    # Support coordinators come from the prefetch cache when the caller has one.
+    desired = {
+        person.pk: MinistryRole.COORDINATOR
+        for person in ministry.support_coordinators.all()
+    }
+    if ministry.primary_coordinator_id:
+        desired[ministry.primary_coordinator_id] = MinistryRole.PRIMARY_COORDINATOR
 
-    # Sync support coordinators
-    for support_coord in current_support:
-        # Only set as COORDINATOR if they're not the primary coordinator
-        if current_primary and support_coord.pk == current_primary.pk:
-            continue
-        MinistryMember.objects.update_or_create(
-            ministry=ministry,
-            member=support_coord,
-            defaults={
-                "role": MinistryRole.COORDINATOR,
-                "is_active": True,
-            },
-        )
+    existing = {
+        membership.member_id: membership
+        for membership in MinistryMember.objects.filter(ministry=ministry)
+        .filter(Q(member_id__in=list(desired)) | Q(role__in=COORDINATOR_ROLES))
+        .only("id", "member_id", "role", "is_active")
+    }
 
-    # Handle removed coordinators: update their role to TEAM_MEMBER if they still have a membership
-    all_memberships = MinistryMember.objects.filter(ministry=ministry)
-    for membership in all_memberships:
-        # If they were a coordinator but are no longer
-        if membership.role in [
-            MinistryRole.PRIMARY_COORDINATOR,
-            MinistryRole.COORDINATOR,
-        ]:
-            is_still_primary = (
-                current_primary and membership.member.pk == current_primary.pk
+    to_create = []
+    to_update = []
+    for member_id, role in desired.items():
+        membership = existing.get(member_id)
+        if membership is None:
+            to_create.append(
+                MinistryMember(
+                    ministry=ministry, member_id=member_id, role=role, is_active=True
+                )
             )
-            is_still_support = membership.member in current_support
+        elif membership.role != role or not membership.is_active:
+            membership.role = role
+            membership.is_active = True
+            to_update.append(membership)
+
+    # Removed from coordinator positions: keep the membership as TEAM_MEMBER.
+    for member_id, membership in existing.items():
+        if member_id not in desired and membership.role in COORDINATOR_ROLES:
+            membership.role = MinistryRole.TEAM_MEMBER
+            to_update.append(membership)
 
-            if not is_still_primary and not is_still_support:
-                # They were removed from coordinator positions, update to TEAM_MEMBER
-                membership.role = MinistryRole.TEAM_MEMBER
-                membership.save(update_fields=["role"])
+    if to_create:
+        MinistryMember.objects.bulk_create(to_create)
+    if to_update:
+        MinistryMember.objects.bulk_update(to_update, ["role", "is_active"])
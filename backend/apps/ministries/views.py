@@ -11,17 +11,12 @@ from apps.authentication.permissions import (
     IsAdmin,
 )
 from apps.people.models import ModuleCoordinator
-from apps.ministries.models import NCC_MINISTRY_CODE
 
 from .models import Ministry, MinistryMember
-from .ncc import (
-    is_ncc_ministry,
-    user_can_manage_ncc_ministry,
-    user_is_lessons_roster_manager,
-)
+from .ncc import is_ncc_ministry, user_can_manage_ncc_ministry
 from .permissions import CanWriteMinistryOrNccRoster
 from .serializers import MinistryMemberSerializer, MinistrySerializer
-from .utils import apply_ministry_branch_visibility
+from .utils import ministry_visibility_q
 
 
 class MinistryViewSet(viewsets.ModelViewSet):
@@ -78,46 +73,10 @@ class MinistryViewSet(viewsets.ModelViewSet):
         if user.role == "ADMIN" or user.can_see_all_branches():
             return queryset
 
-        # Lessons roster managers: include NCC ministries in visible branches
-        ncc_extra = Ministry.objects.none()
-        if user_is_lessons_roster_manager(user):
-            ncc_qs = queryset.filter(code=NCC_MINISTRY_CODE, is_system=True)
-            ncc_extra = apply_ministry_branch_visibility(ncc_qs, user)
-
-        # Ministry Coordinator: assigned / primary / support, then branch+national
-        coordinator_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.MINISTRIES
-        )
-        if coordinator_assignments.exists():
-            ministry_ids = [
-                assignment.resource_id
-                for assignment in coordinator_assignments
-                if assignment.resource_id
-            ]
-            primary_coordinator_ministries = queryset.filter(primary_coordinator=user)
-            support_coordinator_ministries = queryset.filter(support_coordinators=user)
-            if ministry_ids:
-                assigned_ministries = queryset.filter(id__in=ministry_ids)
-                scoped = (
-                    primary_coordinator_ministries
-                    | support_coordinator_ministries
-                    | assigned_ministries
-                ).distinct()
-            else:
-                scoped = (
-                    primary_coordinator_ministries | support_coordinator_ministries
-                ).distinct()
-            scoped = apply_ministry_branch_visibility(scoped, user)
-            return (scoped | ncc_extra).distinct()
-
-        # Member / branch pastor: own branch + national (+ NCC for lessons managers)
-        if user.role in ("MEMBER", "PASTOR"):
-            scoped = apply_ministry_branch_visibility(queryset, user)
-            return (scoped | ncc_extra).distinct()
-
-        if ncc_extra.exists():
-            return ncc_extra
-        return queryset.none()
+        visible = ministry_visibility_q(user)
+        if visible is None:
+            return queryset.none()
+        return queryset.filter(visible)
 
     def get_permissions(self):
         """
@@ -179,41 +138,12 @@ class MinistryMemberViewSet(viewsets.ModelViewSet):
         if user.role == "ADMIN" or user.can_see_all_branches():
             return queryset
 
-        ministry_qs = Ministry.objects.all()
-        coordinator_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.MINISTRIES
-        )
-        ncc_extra = Ministry.objects.none()
-        if user_is_lessons_roster_manager(user):
-            ncc_extra = apply_ministry_branch_visibility(
-                ministry_qs.filter(code=NCC_MINISTRY_CODE, is_system=True),
-                user,
-            )
-
-        if coordinator_assignments.exists():
-            ministry_ids = [
-                assignment.resource_id
-                for assignment in coordinator_assignments
-                if assignment.resource_id
-            ]
-            primary = ministry_qs.filter(primary_coordinator=user)
-            support = ministry_qs.filter(support_coordinators=user)
-            if ministry_ids:
-                assigned = ministry_qs.filter(id__in=ministry_ids)
-                scoped = (primary | support | assigned).distinct()
-            else:
-                scoped = (primary | support).distinct()
-            scoped = apply_ministry_branch_visibility(scoped, user)
-            scoped = (scoped | ncc_extra).distinct()
-        elif user.role in ("MEMBER", "PASTOR"):
-            scoped = apply_ministry_branch_visibility(ministry_qs, user)
-            scoped = (scoped | ncc_extra).distinct()
-        elif ncc_extra.exists():
-            scoped = ncc_extra
-        else:
+        visible = ministry_visibility_q(user)
+        if visible is None:
             return queryset.none()
-
-        return queryset.filter(ministry_id__in=scoped.values_list("pk", flat=True))
+        return queryset.filter(
+            ministry_id__in=Ministry.objects.filter(visible).values("pk")
+        )
 
     def get_permissions(self):
         action = getattr(self, "action", None)
@@ -24,3 +24,28 @@ class NotificationDismissal(models.Model):
 
     def __str__(self):
         return f"{self.user_id}:{self.notification_key}"
+
+
+class NotificationEvent(models.Model):
+    """Fan-out row for ``DatabasePollingBroker`` (multi-worker stream delivery)."""
+
+    topic = models.CharField(max_length=64)
+    user_ids = models.JSONField(null=True, blank=True)
+    roles = models.JSONField(null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+
+    def __str__(self):
+        return f"{self.id}:{self.topic}"
+
+    def to_feed_event(self):
+        from .pubsub import FeedEvent
+
+        return FeedEvent(
+            id=self.id,
+            topic=self.topic,
+            user_ids=frozenset(self.user_ids) if self.user_ids is not None else None,
+            roles=frozenset(self.roles) if self.roles is not None else None,
+        )
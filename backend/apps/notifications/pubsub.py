@@ -0,0 +1,225 @@
+"""Pub/sub fan-out for the notification stream.
+
+Writers call :func:`publish` after a relevant row changes; open stream
+connections wait on the broker with the id of the last event they handled and
+rebuild their feed only when a relevant event arrives.
+
+``settings.NOTIFICATIONS_BROKER`` selects the backend:
+
+- :class:`InProcessBroker` (default) keeps a bounded event history in memory.
+  Only streams served by the same process see the events, so it suits a single
+  ASGI worker.
+- :class:`DatabasePollingBroker` appends ``NotificationEvent`` rows and polls
+  for ``id > cursor``, so every worker sees every event.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import FrozenSet, Iterable, List, Optional
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BROKER = "apps.notifications.pubsub.InProcessBroker"
+DEFAULT_HISTORY_SIZE = 500
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    """A change that may alter some users' notification feeds."""
+
+    id: int
+    topic: str
+    user_ids: Optional[FrozenSet[int]] = None
+    roles: Optional[FrozenSet[str]] = None
+
+    def is_relevant_to(self, user) -> bool:
+        """Broadcast when no audience is set; otherwise match user id or role."""
+        if self.user_ids is None and self.roles is None:
+            return True
+        if self.user_ids and user.pk in self.user_ids:
+            return True
+        if self.roles and getattr(user, "role", None) in self.roles:
+            return True
+        return False
+
+
+def _frozen(values: Optional[Iterable]) -> Optional[frozenset]:
+    if values is None:
+        return None
+    return frozenset(v for v in values if v is not None)
+
+
+class InProcessBroker:
+    """
+    Thread-safe broker for a single process.
+
+    ``publish`` runs on request threads; ``wait`` runs on the ASGI event loop,
+    so waiters are woken with ``call_soon_threadsafe``.
+    """
+
+    def __init__(self, history_size: int = DEFAULT_HISTORY_SIZE):
+        self._lock = threading.Lock()
+        self._history: deque[FeedEvent] = deque(maxlen=history_size)
+        self._last_id = 0
+        self._waiters: set = set()
+
+    def publish(self, topic, *, user_ids=None, roles=None) -> FeedEvent:
+        with self._lock:
+            self._last_id += 1
+            event = FeedEvent(
+                id=self._last_id,
+                topic=topic,
+                user_ids=_frozen(user_ids),
+                roles=_frozen(roles),
+            )
+            self._history.append(event)
+            waiters = list(self._waiters)
+        for loop, flag in waiters:
+            try:
+                loop.call_soon_threadsafe(flag.set)
+            except RuntimeError:
+                # Event loop already closed (client gone); nothing to wake.
+                pass
+        return event
+
+    def latest_id(self) -> int:
+        return self._last_id
+
+    def events_since(self, cursor: int) -> Optional[List[FeedEvent]]:
+        """
+        Events with ``id > cursor``, oldest first.
+
+        Returns ``None`` when the history no longer reaches back to ``cursor``
+        (or the cursor came from another process), so the caller must resync.
+        """
+        with self._lock:
+            if cursor > self._last_id:
+                return None
+            oldest = self._history[0].id if self._history else self._last_id + 1
+            if cursor < oldest - 1:
+                return None
+            return [e for e in self._history if e.id > cursor]
+
+    async def wait(self, cursor: int, timeout: float) -> Optional[List[FeedEvent]]:
+        """Block until events after ``cursor`` exist or ``timeout`` elapses."""
+        flag = asyncio.Event()
+        waiter = (asyncio.get_running_loop(), flag)
+        with self._lock:
+            self._waiters.add(waiter)
+        try:
+            events = self.events_since(cursor)
+            if events is None or events:
+                return events
+            try:
+                await asyncio.wait_for(flag.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+            return self.events_since(cursor)
+        finally:
+            with self._lock:
+                self._waiters.discard(waiter)
+
+
+class DatabasePollingBroker:
+    """
+    Broker for multi-worker deployments: events are ``NotificationEvent`` rows.
+
+    Each publish prunes rows older than ``history_size`` events, so the table
+    stays small. Waiters poll every ``poll_interval`` seconds.
+    """
+
+    def __init__(
+        self,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        poll_interval: Optional[float] = None,
+    ):
+        self.history_size = history_size
+        self.poll_interval = (
+            poll_interval
+            if poll_interval is not None
+            else getattr(settings, "NOTIFICATIONS_BROKER_POLL_SECONDS", 2.0)
+        )
+
+    def publish(self, topic, *, user_ids=None, roles=None) -> FeedEvent:
+        from .models import NotificationEvent
+
+        row = NotificationEvent.objects.create(
+            topic=topic,
+            user_ids=sorted(_frozen(user_ids)) if user_ids is not None else None,
+            roles=sorted(_frozen(roles)) if roles is not None else None,
+        )
+        NotificationEvent.objects.filter(id__lte=row.id - self.history_size).delete()
+        return row.to_feed_event()
+
+    def latest_id(self) -> int:
+        from .models import NotificationEvent
+
+        return (
+            NotificationEvent.objects.order_by("-id").values_list("id", flat=True).first()
+            or 0
+        )
+
+    def events_since(self, cursor: int) -> Optional[List[FeedEvent]]:
+        from .models import NotificationEvent
+
+        oldest = NotificationEvent.objects.order_by("id").values_list("id", flat=True).first()
+        if oldest is None:
+            return [] if cursor <= 0 else None
+        if cursor < oldest - 1:
+            return None
+        rows = list(
+            NotificationEvent.objects.filter(id__gt=cursor).order_by("id")[
+                : self.history_size
+            ]
+        )
+        if not rows and cursor > self.latest_id():
+            return None
+        return [row.to_feed_event() for row in rows]
+
+    async def wait(self, cursor: int, timeout: float) -> Optional[List[FeedEvent]]:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            events = await sync_to_async(self.events_since)(cursor)
+            if events is None or events:
+                return events
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return []
+            await asyncio.sleep(min(self.poll_interval, remaining))
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker():
+    """Process-wide broker instance built from ``NOTIFICATIONS_BROKER``."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                path = getattr(settings, "NOTIFICATIONS_BROKER", DEFAULT_BROKER)
+                _broker = import_string(path)()
+    return _broker
+
+
+def publish(topic: str, *, user_ids=None, roles=None) -> Optional[FeedEvent]:
+    """
+    Announce a feed-relevant change. Never raises: a broker failure must not
+    break the write that triggered it; streams resync on their next event.
+    """
+    try:
+        return get_broker().publish(topic, user_ids=user_ids, roles=roles)
+    except Exception as e:
+        logger.error("Failed to publish notification event %s: %s", topic, e, exc_info=True)
+        return None
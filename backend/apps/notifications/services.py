@@ -85,6 +85,29 @@ def count_unread_alerts(items: List[NotificationItem]) -> int:
     return sum(1 for i in items if i.category == "alert")
 
 
+def diff_feed(
+    previous_items: List[Dict[str, Any]], current_items: List[Dict[str, Any]]
+) -> Dict[str, List[Any]]:
+    """
+    Delta between two serialized feeds for the notification stream.
+
+    ``occurred_at`` is ignored when comparing: due/overdue alerts stamp "now"
+    on every rebuild, which is not a change the client needs to hear about.
+    """
+
+    def signature(item):
+        return {k: v for k, v in item.items() if k != "occurred_at"}
+
+    previous = {i["key"]: signature(i) for i in previous_items}
+    current_keys = {i["key"] for i in current_items}
+    return {
+        "upserted": [
+            i for i in current_items if previous.get(i["key"]) != signature(i)
+        ],
+        "removed": [key for key in previous if key not in current_keys],
+    }
+
+
 def _build_admin_alerts(user) -> List[NotificationItem]:
     if getattr(user, "role", None) != "ADMIN":
         return []
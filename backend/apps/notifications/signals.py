@@ -0,0 +1,47 @@
+"""Publish notification stream events when feed-relevant rows change."""
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from apps.authentication.models import AccountLockout, PasswordResetRequest
+from apps.clusters.models import ClusterWeeklyReport
+from apps.evangelism.models import EvangelismWeeklyReport, FollowUpTask
+
+from .pubsub import publish
+
+
+def _publish_on_commit(topic, **audience):
+    # Streams rebuild the feed from the DB, so only announce committed rows.
+    transaction.on_commit(lambda: publish(topic, **audience))
+
+
+@receiver(post_save, sender=ClusterWeeklyReport)
+@receiver(post_delete, sender=ClusterWeeklyReport)
+def cluster_report_changed(sender, instance, **kwargs):
+    # Due (coordinators), overdue (oversight) and activity (submitter) items.
+    _publish_on_commit("cluster_report")
+
+
+@receiver(post_save, sender=EvangelismWeeklyReport)
+@receiver(post_delete, sender=EvangelismWeeklyReport)
+def evangelism_report_changed(sender, instance, **kwargs):
+    _publish_on_commit("evangelism_report")
+
+
+@receiver(post_save, sender=FollowUpTask)
+@receiver(post_delete, sender=FollowUpTask)
+def follow_up_task_changed(sender, instance, **kwargs):
+    _publish_on_commit("follow_up_task", user_ids=[instance.assigned_to_id])
+
+
+@receiver(post_save, sender=AccountLockout)
+@receiver(post_delete, sender=AccountLockout)
+def account_lockout_changed(sender, instance, **kwargs):
+    _publish_on_commit("account_lockout", roles=["ADMIN"])
+
+
+@receiver(post_save, sender=PasswordResetRequest)
+@receiver(post_delete, sender=PasswordResetRequest)
+def password_reset_request_changed(sender, instance, **kwargs):
+    _publish_on_commit("password_reset_request", roles=["ADMIN"])
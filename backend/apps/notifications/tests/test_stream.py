@@ -0,0 +1,288 @@
+import asyncio
+import json
+import threading
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.authentication.models import PasswordResetRequest
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.notifications import pubsub
+from apps.notifications.models import NotificationEvent
+from apps.notifications.pubsub import (
+    DatabasePollingBroker,
+    FeedEvent,
+    InProcessBroker,
+)
+from apps.notifications.services import diff_feed
+from apps.people.models import ModuleCoordinator, ModuleSetting
+
+Person = get_user_model()
+
+
+def _parse_sse(chunk):
+    text = chunk.decode() if isinstance(chunk, bytes) else chunk
+    fields = {}
+    for line in text.strip().splitlines():
+        if line.startswith(":"):
+            return {"comment": line[1:].strip()}
+        name, _, value = line.partition(": ")
+        fields[name] = value
+    if "data" in fields:
+        fields["data"] = json.loads(fields["data"])
+    return fields
+
+
+class InProcessBrokerTests(TestCase):
+    def test_events_since_returns_newer_events_in_order(self):
+        broker = InProcessBroker()
+        first = broker.publish("cluster_report")
+        second = broker.publish("follow_up_task", user_ids=[5])
+        self.assertEqual(broker.latest_id(), second.id)
+        self.assertEqual(broker.events_since(0), [first, second])
+        self.assertEqual(broker.events_since(first.id), [second])
+        self.assertEqual(broker.events_since(second.id), [])
+
+    def test_trimmed_or_foreign_cursor_requires_resync(self):
+        broker = InProcessBroker(history_size=2)
+        for _ in range(4):
+            broker.publish("cluster_report")
+        self.assertIsNone(broker.events_since(0))
+        self.assertIsNone(broker.events_since(99))
+        self.assertEqual(len(broker.events_since(2)), 2)
+
+    def test_wait_wakes_on_publish_from_another_thread(self):
+        broker = InProcessBroker()
+
+        async def scenario():
+            timer = threading.Timer(0.05, broker.publish, args=("cluster_report",))
+            timer.start()
+            return await broker.wait(0, timeout=5)
+
+        events = asyncio.run(scenario())
+        self.assertEqual([e.topic for e in events], ["cluster_report"])
+
+    def test_wait_times_out_with_empty_list(self):
+        broker = InProcessBroker()
+        self.assertEqual(asyncio.run(broker.wait(0, timeout=0.01)), [])
+
+    def test_event_relevance(self):
+        admin = Person(pk=1, role="ADMIN")
+        member = Person(pk=2, role="MEMBER")
+        broadcast = FeedEvent(id=1, topic="cluster_report")
+        admins_only = FeedEvent(id=2, topic="account_lockout", roles=frozenset({"ADMIN"}))
+        member_only = FeedEvent(id=3, topic="follow_up_task", user_ids=frozenset({2}))
+        self.assertTrue(broadcast.is_relevant_to(member))
+        self.assertTrue(admins_only.is_relevant_to(admin))
+        self.assertFalse(admins_only.is_relevant_to(member))
+        self.assertTrue(member_only.is_relevant_to(member))
+        self.assertFalse(member_only.is_relevant_to(admin))
+
+
+class DatabasePollingBrokerTests(TestCase):
+    def test_publish_and_read_back(self):
+        broker = DatabasePollingBroker(poll_interval=0.01)
+        event = broker.publish("follow_up_task", user_ids=[3, None])
+        self.assertEqual(broker.latest_id(), event.id)
+        self.assertEqual(event.user_ids, frozenset({3}))
+        self.assertIsNone(event.roles)
+        self.assertEqual(broker.events_since(event.id - 1), [event])
+        self.assertEqual(broker.events_since(event.id), [])
+
+    def test_publish_prunes_old_rows(self):
+        broker = DatabasePollingBroker(history_size=3, poll_interval=0.01)
+        events = [broker.publish("cluster_report") for _ in range(6)]
+        self.assertEqual(NotificationEvent.objects.count(), 3)
+        self.assertIsNone(broker.events_since(events[0].id))
+        self.assertEqual(len(broker.events_since(events[3].id - 1)), 3)
+
+
+class DiffFeedTests(TestCase):
+    def test_ignores_occurred_at_and_reports_changes(self):
+        old = [
+            {"key": "a", "title": "A", "occurred_at": "2025-01-01T00:00:00"},
+            {"key": "b", "title": "B", "occurred_at": "2025-01-01T00:00:00"},
+        ]
+        new = [
+            {"key": "a", "title": "A", "occurred_at": "2025-01-02T00:00:00"},
+            {"key": "c", "title": "C", "occurred_at": "2025-01-02T00:00:00"},
+        ]
+        delta = diff_feed(old, new)
+        self.assertEqual([i["key"] for i in delta["upserted"]], ["c"])
+        self.assertEqual(delta["removed"], ["b"])
+
+
+@override_settings(
+    NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS=0.05,
+    NOTIFICATIONS_STREAM_MAX_SECONDS=5,
+)
+class NotificationStreamTests(TestCase):
+    def setUp(self):
+        self.broker = InProcessBroker()
+        patcher = mock.patch.object(pubsub, "_broker", self.broker)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.coord = Person.objects.create_user(
+            username="stream_coord",
+            email="stream_coord@example.com",
+            password="password123",
+            role="MEMBER",
+        )
+        self.cluster = Cluster.objects.create(
+            code="SA", name="Stream Alpha", coordinator=self.coord
+        )
+        ModuleSetting.objects.update_or_create(
+            module=ModuleCoordinator.ModuleType.CLUSTER,
+            defaults={"is_enabled": True},
+        )
+        token = RefreshToken.for_user(self.coord).access_token
+        self.auth_headers = {"Authorization": f"Bearer {token}"}
+
+    def _submit_report(self):
+        today = timezone.now().date()
+        iso = today.isocalendar()
+        return ClusterWeeklyReport.objects.create(
+            cluster=self.cluster,
+            year=iso[0],
+            week_number=iso[1],
+            meeting_date=today,
+            gathering_type="PHYSICAL",
+            submitted_by=self.coord,
+        )
+
+    async def _next_event(self, stream):
+        while True:
+            message = _parse_sse(await asyncio.wait_for(stream.__anext__(), 5))
+            if "comment" in message or "event" not in message:
+                continue
+            return message
+
+    def test_report_save_publishes_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self._submit_report()
+        self.assertEqual(
+            [e.topic for e in self.broker.events_since(0)], ["cluster_report"]
+        )
+
+    def test_password_reset_event_targets_admins(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            PasswordResetRequest.objects.create(user=self.coord, status="PENDING")
+        (event,) = self.broker.events_since(0)
+        self.assertEqual(event.roles, frozenset({"ADMIN"}))
+
+    def test_dismiss_notifies_other_tabs(self):
+        client = APIClient()
+        client.force_authenticate(user=self.coord)
+        key = client.get("/api/notifications/").data["items"][0]["key"]
+        client.post(f"/api/notifications/{key}/dismiss/")
+        (event,) = self.broker.events_since(0)
+        self.assertEqual(event.user_ids, frozenset({self.coord.pk}))
+
+    def test_wsgi_request_is_rejected(self):
+        response = self.client.get(
+            "/api/notifications/stream/", headers=self.auth_headers
+        )
+        self.assertEqual(response.status_code, 503)
+
+    async def test_unauthenticated_and_visitor_denied(self):
+        response = await self.async_client.get("/api/notifications/stream/")
+        self.assertEqual(response.status_code, 401)
+
+        visitor = await sync_to_async(Person.objects.create_user)(
+            username="stream_visitor",
+            email="stream_visitor@example.com",
+            password="password123",
+            role="VISITOR",
+        )
+        token = RefreshToken.for_user(visitor).access_token
+        response = await self.async_client.get(
+            "/api/notifications/stream/",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        self.assertEqual(response.status_code, 403)
+
+    async def test_snapshot_then_delta_on_report_submission(self):
+        response = await self.async_client.get(
+            "/api/notifications/stream/", headers=self.auth_headers
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+        try:
+            snapshot = await self._next_event(stream)
+            self.assertEqual(snapshot["event"], "snapshot")
+            due_keys = [
+                i["key"]
+                for i in snapshot["data"]["items"]
+                if i["type"] == "cluster_report_due"
+            ]
+            self.assertEqual(len(due_keys), 1)
+
+            await sync_to_async(self._submit_report)()
+            event = self.broker.publish("cluster_report")
+
+            delta = await self._next_event(stream)
+            self.assertEqual(delta["event"], "delta")
+            self.assertEqual(delta["id"], str(event.id))
+            self.assertEqual(delta["data"]["removed"], due_keys)
+            self.assertEqual(
+                [i["type"] for i in delta["data"]["upserted"]],
+                ["cluster_report_submitted"],
+            )
+            self.assertEqual(delta["data"]["unread_count"], 0)
+        finally:
+            await stream.aclose()
+
+    async def test_irrelevant_events_send_heartbeats_only(self):
+        response = await self.async_client.get(
+            "/api/notifications/stream/", headers=self.auth_headers
+        )
+        stream = response.streaming_content
+        try:
+            await self._next_event(stream)
+            self.broker.publish("account_lockout", roles=["ADMIN"])
+            message = _parse_sse(await asyncio.wait_for(stream.__anext__(), 5))
+            self.assertEqual(message, {"comment": "heartbeat"})
+        finally:
+            await stream.aclose()
+
+    async def test_reconnect_with_last_event_id_resumes_with_delta(self):
+        response = await self.async_client.get(
+            "/api/notifications/stream/", headers=self.auth_headers
+        )
+        stream = response.streaming_content
+        snapshot = await self._next_event(stream)
+        await stream.aclose()
+
+        await sync_to_async(self._submit_report)()
+        self.broker.publish("cluster_report")
+
+        response = await self.async_client.get(
+            "/api/notifications/stream/",
+            headers={**self.auth_headers, "Last-Event-ID": snapshot["id"]},
+        )
+        stream = response.streaming_content
+        try:
+            resumed = await self._next_event(stream)
+            self.assertEqual(resumed["event"], "delta")
+            self.assertEqual(len(resumed["data"]["removed"]), 1)
+        finally:
+            await stream.aclose()
+
+    async def test_unknown_last_event_id_falls_back_to_snapshot(self):
+        response = await self.async_client.get(
+            "/api/notifications/stream/",
+            headers={**self.auth_headers, "Last-Event-ID": "12345"},
+        )
+        stream = response.streaming_content
+        try:
+            first = await self._next_event(stream)
+            self.assertEqual(first["event"], "snapshot")
+        finally:
+            await stream.aclose()
@@ -6,6 +6,7 @@ app_name = "notifications"
 
 urlpatterns = [
     path("", views.notification_list_view, name="list"),
+    path("stream/", views.notification_stream_view, name="stream"),
     path("dismiss-all/", views.notification_dismiss_all_view, name="dismiss_all"),
     path(
         "<path:notification_key>/dismiss/",
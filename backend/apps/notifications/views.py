@@ -1,18 +1,34 @@
+import asyncio
+import json
 from urllib.parse import unquote
 
-from rest_framework import status
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import close_old_connections, connection
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import exceptions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
+from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.authentication.permissions import IsAuthenticatedAndNotVisitor
 
 from .models import NotificationDismissal
+from .pubsub import get_broker, publish
 from .services import (
     build_notification_feed,
     count_unread_alerts,
+    diff_feed,
     filter_dismissed,
 )
 
+STREAM_HEARTBEAT_SECONDS = 15
+STREAM_MAX_SECONDS = 300
+STREAM_RETRY_MS = 3000
+
 
 def _dismissed_keys_for_user(user):
     return set(
@@ -51,6 +67,8 @@ def notification_dismiss_view(request, notification_key):
         user=request.user,
         notification_key=key,
     )
+    # Other open tabs of the same user drop the item from their stream.
+    publish("notification_dismissed", user_ids=[request.user.pk])
     return Response(_feed_response(request.user))
 
 
@@ -65,4 +83,157 @@ def notification_dismiss_all_view(request):
             user=request.user,
             notification_key=item.key,
         )
+    publish("notification_dismissed", user_ids=[request.user.pk])
     return Response(_feed_response(request.user))
+
+
+def _stream_user(request):
+    """Session user, else JWT bearer user; ``None`` when unauthenticated."""
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except exceptions.AuthenticationFailed:
+        return None
+    return result[0] if result else None
+
+
+def _stream_feed(user):
+    try:
+        return _feed_response(user)
+    finally:
+        # A stream outlives its request cycle; don't pin a DB connection to it
+        # between rebuilds (never close one mid-transaction, e.g. in tests).
+        if not connection.in_atomic_block:
+            close_old_connections()
+
+
+def _stream_state_key(user, event_id):
+    return f"notifications:stream:{user.pk}:{event_id}"
+
+
+def _sse(event, data, event_id):
+    payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return f"id: {event_id}\nevent: {event}\ndata: {payload}\n\n"
+
+
+def _counts(payload):
+    return {
+        "unread_count": payload["unread_count"],
+        "alert_count": payload["alert_count"],
+        "activity_count": payload["activity_count"],
+    }
+
+
+async def _feed_event_stream(user, last_event_id):
+    """
+    Server-sent events for one connection.
+
+    - ``snapshot``: full feed (same shape as ``GET /api/notifications/``).
+    - ``delta``: ``upserted`` items, ``removed`` keys and fresh counts.
+
+    Event ids are broker cursors. The feed sent at each id is kept in the
+    cache, so a reconnect with ``Last-Event-ID`` resumes with a delta; an
+    unknown id falls back to a snapshot.
+    """
+    broker = get_broker()
+    heartbeat = getattr(
+        settings, "NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS", STREAM_HEARTBEAT_SECONDS
+    )
+    max_seconds = getattr(
+        settings, "NOTIFICATIONS_STREAM_MAX_SECONDS", STREAM_MAX_SECONDS
+    )
+    state_ttl = int(max_seconds * 2) + 60
+
+    cursor = await sync_to_async(broker.latest_id)()
+    payload = await sync_to_async(_stream_feed)(user)
+    baseline = None
+    if last_event_id is not None:
+        baseline = await cache.aget(_stream_state_key(user, last_event_id))
+
+    yield f"retry: {STREAM_RETRY_MS}\n\n"
+    if baseline is None:
+        yield _sse("snapshot", payload, cursor)
+    else:
+        delta = diff_feed(baseline, payload["items"])
+        yield _sse("delta", {**delta, **_counts(payload)}, cursor)
+    await cache.aset(_stream_state_key(user, cursor), payload["items"], state_ttl)
+
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + max_seconds
+    while True:
+        remaining = deadline - loop.time()
+        if remaining <= 0:
+            # Client reconnects with Last-Event-ID and resumes from the cache.
+            return
+        events = await broker.wait(cursor, min(heartbeat, remaining))
+        if events is None:
+            # History gap (broker restarted or trimmed): resync from scratch.
+            cursor = await sync_to_async(broker.latest_id)()
+            payload = await sync_to_async(_stream_feed)(user)
+            yield _sse("snapshot", payload, cursor)
+            await cache.aset(
+                _stream_state_key(user, cursor), payload["items"], state_ttl
+            )
+            continue
+        if not events:
+            yield ": heartbeat\n\n"
+            continue
+        cursor = events[-1].id
+        if not any(event.is_relevant_to(user) for event in events):
+            continue
+        previous = payload
+        payload = await sync_to_async(_stream_feed)(user)
+        delta = diff_feed(previous["items"], payload["items"])
+        if not delta["upserted"] and not delta["removed"]:
+            if _counts(previous) == _counts(payload):
+                continue
+        yield _sse("delta", {**delta, **_counts(payload)}, cursor)
+        await cache.aset(_stream_state_key(user, cursor), payload["items"], state_ttl)
+
+
+def _parse_last_event_id(request):
+    raw = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    try:
+        return int(raw) if raw not in (None, "") else None
+    except (TypeError, ValueError):
+        return None
+
+
+async def notification_stream_view(request):
+    """
+    ``GET /api/notifications/stream/`` — push feed changes as server-sent events.
+
+    Requires an ASGI server (``core.asgi``); under WSGI clients keep polling
+    ``GET /api/notifications/``.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"detail": f'Method "{request.method}" not allowed.'},
+            status=status.HTTP_405_METHOD_NOT_ALLOWED,
+        )
+    user = await sync_to_async(_stream_user)(request)
+    if user is None or not user.is_active:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."},
+            status=status.HTTP_401_UNAUTHORIZED,
+        )
+    if user.role == "VISITOR":
+        return JsonResponse(
+            {"detail": "You do not have permission to perform this action."},
+            status=status.HTTP_403_FORBIDDEN,
+        )
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"detail": "Notification streaming requires an ASGI server."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+
+    response = StreamingHttpResponse(
+        _feed_event_stream(user, _parse_last_event_id(request)),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
@@ -0,0 +1,617 @@
+"""
+Bulk people import from CSV/XLSX spreadsheets.
+
+Used by ``POST /api/people/people/bulk-import/`` and the ``import_people``
+management command. Rows are streamed from the file and processed in chunks:
+each chunk is validated row by row, matched against existing people with the
+possible-duplicates keys (LAMP ID church-wide, first+last name within the
+row's branch), then written with ``bulk_create`` in one transaction: people,
+new families, family/cluster memberships and the Journey rows the post_save /
+m2m_changed signals would have derived (baptism, spirit baptism, first
+attended, invited, added to family). Signals do not fire for these rows.
+
+Invalid rows, rows matching an existing person and repeats of an earlier row
+in the same file are reported and skipped; they never abort the import.
+Imported people get an unusable password (set one via password reset).
+"""
+
+from __future__ import annotations
+
+import codecs
+import csv
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from functools import reduce
+from operator import or_
+from typing import Iterable, Iterator, Optional
+
+from django.contrib.auth.hashers import make_password
+from django.db import DatabaseError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower, Trim
+from rest_framework import serializers
+
+from apps.clusters.models import Cluster
+from apps.people.duplicate_people import member_id_match_key, name_match_key
+from apps.people.models import Branch, Family, Journey, Person
+from apps.people.name_formatting import PERSON_NAME_FIELDS, apply_title_case_name_fields
+from apps.people.signals import INVITED_JOURNEY_TITLE
+from apps.people.visibility import bump_visibility_generation
+from core.datetime_utils import church_today
+
+DEFAULT_CHUNK_SIZE = 500
+REQUIRED_COLUMNS = ("first_name", "last_name")
+# Keeps the username prefix lookup well under SQLite's expression depth limit.
+_USERNAME_LOOKUP_BATCH = 100
+
+
+class ImportFileError(Exception):
+    """The file as a whole cannot be read (format, encoding, missing columns)."""
+
+
+class PersonImportRowSerializer(serializers.Serializer):
+    first_name = serializers.CharField(max_length=150)
+    last_name = serializers.CharField(max_length=150)
+    middle_name = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    suffix = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    nickname = serializers.CharField(max_length=150, required=False, allow_blank=True)
+    gender = serializers.ChoiceField(
+        choices=["MALE", "FEMALE"], required=False, allow_blank=True
+    )
+    email = serializers.EmailField(required=False, allow_blank=True)
+    phone = serializers.CharField(max_length=20, required=False, allow_blank=True)
+    address = serializers.CharField(required=False, allow_blank=True)
+    country = serializers.CharField(max_length=100, required=False, allow_blank=True)
+    member_id = serializers.CharField(max_length=20, required=False, allow_blank=True)
+    role = serializers.ChoiceField(
+        choices=["MEMBER", "VISITOR", "PASTOR"], required=False, default="MEMBER"
+    )
+    status = serializers.ChoiceField(
+        choices=[choice for choice, _ in Person._meta.get_field("status").choices],
+        required=False,
+        allow_blank=True,
+    )
+    date_of_birth = serializers.DateField(required=False, allow_null=True)
+    date_first_invited = serializers.DateField(required=False, allow_null=True)
+    date_first_attended = serializers.DateField(required=False, allow_null=True)
+    water_baptism_date = serializers.DateField(required=False, allow_null=True)
+    spirit_baptism_date = serializers.DateField(required=False, allow_null=True)
+    branch = serializers.CharField(max_length=20, required=False, allow_blank=True)
+    family = serializers.CharField(max_length=100, required=False, allow_blank=True)
+    cluster = serializers.CharField(max_length=100, required=False, allow_blank=True)
+
+    DATE_FIELDS = (
+        "date_of_birth",
+        "date_first_invited",
+        "date_first_attended",
+        "water_baptism_date",
+        "spirit_baptism_date",
+    )
+    UPPERCASE_FIELDS = ("gender", "role", "status")
+
+    def to_internal_value(self, data):
+        data = dict(data)
+        for name in self.UPPERCASE_FIELDS:
+            if isinstance(data.get(name), str):
+                data[name] = data[name].upper()
+        for name in self.DATE_FIELDS:
+            if data.get(name) == "":
+                data[name] = None
+        if data.get("role") == "":
+            data.pop("role")
+        return super().to_internal_value(data)
+
+    def validate(self, attrs):
+        today = church_today()
+        future = {
+            name: "Cannot be in the future."
+            for name in self.DATE_FIELDS
+            if attrs.get(name) and attrs[name] > today
+        }
+        if future:
+            raise serializers.ValidationError(future)
+        apply_title_case_name_fields(attrs, PERSON_NAME_FIELDS)
+        # Same rule as the baptism signal: a baptized visitor becomes a member.
+        if attrs.get("water_baptism_date") and attrs["role"] == "VISITOR":
+            attrs["role"] = "MEMBER"
+            attrs["status"] = "ACTIVE"
+        return attrs
+
+
+@dataclass
+class PeopleImportResult:
+    dry_run: bool
+    rows: int = 0
+    created: int = 0
+    families_created: int = 0
+    memberships_created: int = 0
+    journeys_created: int = 0
+    matched: list = field(default_factory=list)
+    errors: list = field(default_factory=list)
+    ignored_columns: list = field(default_factory=list)
+
+    def as_dict(self) -> dict:
+        return asdict(self)
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _ChunkWrite:
+    """What one committed chunk added; applied to the importer after commit."""
+
+    created: int
+    families: dict
+    memberships: int
+    journeys: int
+
+
+def _normalise_header(value) -> str:
+    return str(value or "").strip().lower().replace(" ", "_").replace("-", "_")
+
+
+def _normalise_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        # Spreadsheet numbers (LAMP IDs, phone numbers) come back as floats.
+        return str(int(value))
+    return str(value).strip()
+
+
+def _rows_from_table(rows: Iterator[Iterable]) -> tuple[list[str], Iterator[tuple[int, dict]]]:
+    try:
+        header = [_normalise_header(cell) for cell in next(rows)]
+    except StopIteration:
+        raise ImportFileError("The file is empty.")
+    missing = [name for name in REQUIRED_COLUMNS if name not in header]
+    if missing:
+        raise ImportFileError(f"Missing required column(s): {', '.join(missing)}.")
+
+    def records():
+        # Row numbers are spreadsheet rows: the header is row 1.
+        for row_number, cells in enumerate(rows, start=2):
+            values = [_normalise_cell(cell) for cell in cells]
+            if not any(value != "" for value in values):
+                continue
+            yield row_number, {
+                name: value for name, value in zip(header, values) if name
+            }
+
+    return header, records()
+
+
+def read_csv_rows(fileobj) -> tuple[list[str], Iterator[tuple[int, dict]]]:
+    """Header and a lazy ``(row_number, record)`` iterator for a binary CSV file."""
+    lines = codecs.iterdecode(fileobj, "utf-8-sig")
+
+    def decoded():
+        try:
+            yield from csv.reader(lines)
+        except UnicodeDecodeError:
+            raise ImportFileError("CSV files must be UTF-8 encoded.")
+
+    return _rows_from_table(decoded())
+
+
+def read_xlsx_rows(fileobj) -> tuple[list[str], Iterator[tuple[int, dict]]]:
+    """Header and a lazy record iterator for the first sheet of an XLSX workbook."""
+    try:
+        from openpyxl import load_workbook
+    except ImportError:
+        raise ImportFileError("XLSX import requires openpyxl (see requirements.txt).")
+    try:
+        workbook = load_workbook(fileobj, read_only=True, data_only=True)
+    except Exception:
+        raise ImportFileError("Could not read the file as an XLSX workbook.")
+    return _rows_from_table(workbook.active.iter_rows(values_only=True))
+
+
+def read_import_rows(fileobj, filename: str):
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return read_csv_rows(fileobj)
+    if name.endswith(".xlsx"):
+        return read_xlsx_rows(fileobj)
+    raise ImportFileError("Upload a .csv or .xlsx file.")
+
+
+# ---------------------------------------------------------------------------
+# Importer
+# ---------------------------------------------------------------------------
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _username_base(first_name: str, last_name: str) -> str:
+    # Same scheme as PersonSerializer.create.
+    return f"{first_name[:2].lower()}{last_name.lower()}"
+
+
+def _field_errors(detail) -> dict:
+    return {
+        name: [str(message) for message in (messages if isinstance(messages, list) else [messages])]
+        for name, messages in detail.items()
+    }
+
+
+class PeopleImporter:
+    """
+    Streams records through chunked validation and bulk writes.
+
+    Branch, cluster, family and username lookups are cached for the whole
+    import, so each chunk costs a fixed number of queries.
+    """
+
+    def __init__(
+        self,
+        *,
+        default_branch: Optional[Branch] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        dry_run: bool = False,
+    ):
+        self.default_branch = default_branch
+        self.chunk_size = max(1, chunk_size)
+        self.dry_run = dry_run
+        self.result = PeopleImportResult(dry_run=dry_run)
+        self._branches: dict[str, Optional[Branch]] = {}
+        self._clusters: dict[str, Optional[Cluster]] = {}
+        self._families: dict[tuple, Family] = {}
+        self._planned_families: set[tuple] = set()  # dry runs only
+        self._taken_usernames: set[str] = set()
+        self._checked_username_bases: set[str] = set()
+        # Match key -> row number of the first row in this file that used it.
+        self._seen_keys: dict[tuple, int] = {}
+        self._today = church_today()
+
+    def run(self, records: Iterable[tuple[int, dict]], header: Iterable[str] = ()) -> PeopleImportResult:
+        known = set(PersonImportRowSerializer().fields)
+        self.result.ignored_columns = sorted(
+            {name for name in header if name and name not in known}
+        )
+        for chunk in _chunks(records, self.chunk_size):
+            self.result.rows += len(chunk)
+            self._import_chunk(chunk)
+        return self.result
+
+    # -- chunk pipeline -----------------------------------------------------
+
+    def _import_chunk(self, chunk):
+        valid = []
+        for row_number, record in chunk:
+            serializer = PersonImportRowSerializer(data=record)
+            if serializer.is_valid():
+                valid.append((row_number, serializer.validated_data))
+            else:
+                self._error(row_number, _field_errors(serializer.errors))
+
+        valid = self._resolve_references(valid)
+        valid = self._skip_duplicates(valid)
+        if not valid:
+            return
+        if self.dry_run:
+            self._plan(valid)
+            return
+        people = self._build_people([data for _, data in valid])
+        try:
+            with transaction.atomic():
+                written = self._write(valid, people)
+        except DatabaseError as exc:
+            # Nothing from this chunk exists: let later rows reuse its keys.
+            self._taken_usernames.difference_update(person.username for person in people)
+            chunk_rows = {row_number for row_number, _ in valid}
+            for key in [k for k, row in self._seen_keys.items() if row in chunk_rows]:
+                del self._seen_keys[key]
+            for row_number, _ in valid:
+                self._error(row_number, {"non_field_errors": [f"Could not save: {exc}"]})
+            return
+        self._families.update(written.families)
+        self.result.created += written.created
+        self.result.families_created += len(written.families)
+        self.result.memberships_created += written.memberships
+        self.result.journeys_created += written.journeys
+
+    def _error(self, row_number, errors):
+        self.result.errors.append({"row": row_number, "errors": errors})
+
+    def _resolve_references(self, valid):
+        branch_codes = {data.get("branch") for _, data in valid} - {None, ""}
+        cluster_codes = {data.get("cluster") for _, data in valid} - {None, ""}
+        missing = branch_codes - self._branches.keys()
+        if missing:
+            found = {b.code: b for b in Branch.objects.filter(code__in=missing)}
+            self._branches.update({code: found.get(code) for code in missing})
+        missing = cluster_codes - self._clusters.keys()
+        if missing:
+            found = {c.code: c for c in Cluster.objects.filter(code__in=missing)}
+            self._clusters.update({code: found.get(code) for code in missing})
+
+        resolved = []
+        for row_number, data in valid:
+            errors = {}
+            code = data.get("branch")
+            branch = self._branches.get(code) if code else self.default_branch
+            if branch is None:
+                errors["branch"] = (
+                    [f"Unknown branch code '{code}'."] if code else ["Branch is required."]
+                )
+            code = data.get("cluster")
+            cluster = self._clusters.get(code) if code else None
+            if code and cluster is None:
+                errors["cluster"] = [f"Unknown cluster code '{code}'."]
+            if errors:
+                self._error(row_number, errors)
+                continue
+            data["branch"] = branch
+            data["cluster"] = cluster
+            resolved.append((row_number, data))
+        return resolved
+
+    def _skip_duplicates(self, valid):
+        """Drop rows that match an existing person or an earlier row of the file."""
+        member_keys = {member_id_match_key(data.get("member_id")) for _, data in valid} - {None}
+        existing_by_member_id = {}
+        if member_keys:
+            for row in (
+                Person.objects.annotate(mid=Lower(Trim("member_id")))
+                .filter(mid__in=member_keys)
+                .order_by("id")
+                .values("id", "mid")
+            ):
+                existing_by_member_id.setdefault(row["mid"], row["id"])
+
+        last_names = {data["last_name"].strip().lower() for _, data in valid}
+        existing_by_name = {}
+        for row in (
+            Person.objects.annotate(fn=Lower(Trim("first_name")), ln=Lower(Trim("last_name")))
+            .filter(ln__in=last_names, branch__in={data["branch"].pk for _, data in valid})
+            .order_by("id")
+            .values("id", "fn", "ln", "branch_id")
+        ):
+            key = (row["branch_id"], f"{row['fn']}|{row['ln']}")
+            existing_by_name.setdefault(key, row["id"])
+
+        unique = []
+        for row_number, data in valid:
+            member_key = member_id_match_key(data.get("member_id"))
+            name_key = (data["branch"].pk, name_match_key(data["first_name"], data["last_name"]))
+            if member_key and member_key in existing_by_member_id:
+                self.result.matched.append(
+                    {"row": row_number, "id": existing_by_member_id[member_key], "match": "member_id"}
+                )
+                continue
+            if name_key in existing_by_name:
+                self.result.matched.append(
+                    {"row": row_number, "id": existing_by_name[name_key], "match": "name"}
+                )
+                continue
+            keys = [("member_id", member_key)] if member_key else []
+            keys.append(("name", name_key))
+            earlier = next((self._seen_keys[k] for k in keys if k in self._seen_keys), None)
+            if earlier is not None:
+                self._error(
+                    row_number,
+                    {"non_field_errors": [f"Duplicate of row {earlier} in this file."]},
+                )
+                continue
+            for key in keys:
+                self._seen_keys[key] = row_number
+            unique.append((row_number, data))
+        return unique
+
+    def _plan_usernames(self, rows) -> list[str]:
+        bases = {_username_base(data["first_name"], data["last_name"]) for data in rows}
+        unchecked = sorted(bases - self._checked_username_bases)
+        for start in range(0, len(unchecked), _USERNAME_LOOKUP_BATCH):
+            batch = unchecked[start : start + _USERNAME_LOOKUP_BATCH]
+            query = reduce(or_, (Q(username__startswith=base) for base in batch))
+            self._taken_usernames.update(
+                Person.objects.filter(query).values_list("username", flat=True)
+            )
+        self._checked_username_bases.update(unchecked)
+
+        usernames = []
+        for data in rows:
+            base = username = _username_base(data["first_name"], data["last_name"])
+            counter = 1
+            while username in self._taken_usernames:
+                username = f"{base}{counter}"
+                counter += 1
+            self._taken_usernames.add(username)
+            usernames.append(username)
+        return usernames
+
+    def _new_family_keys(self, valid) -> set:
+        keys = {
+            (data["branch"].pk, data["family"].strip().lower())
+            for _, data in valid
+            if data.get("family", "").strip()
+        }
+        missing = keys - self._families.keys()
+        if missing:
+            for family in (
+                Family.objects.annotate(lname=Lower(Trim("name")))
+                .filter(
+                    branch__in={branch_id for branch_id, _ in missing},
+                    lname__in={name for _, name in missing},
+                    is_active=True,
+                )
+                .select_related("leader")
+                .order_by("id")
+            ):
+                self._families.setdefault((family.branch_id, family.lname), family)
+        return keys - self._families.keys()
+
+    # -- writes -------------------------------------------------------------
+
+    def _build_people(self, rows) -> list[Person]:
+        usernames = self._plan_usernames(rows)
+        return [
+            Person(
+                username=username,
+                password=make_password(None),
+                **{
+                    name: value
+                    for name, value in data.items()
+                    if name not in ("family", "cluster") and value not in ("", None)
+                },
+            )
+            for username, data in zip(usernames, rows)
+        ]
+
+    def _plan(self, valid):
+        """Dry run: count what :meth:`_write` would create, without writing."""
+        rows = [data for _, data in valid]
+        people = self._build_people(rows)
+        self.result.created += len(people)
+        new_families = self._new_family_keys(valid) - self._planned_families
+        self._planned_families.update(new_families)
+        self.result.families_created += len(new_families)
+        in_family = [bool(data.get("family", "").strip()) for data in rows]
+        self.result.memberships_created += sum(in_family) + sum(
+            1 for data in rows if data.get("cluster")
+        )
+        self.result.journeys_created += sum(in_family) + sum(
+            len(self._derived_journeys(person, None)) for person in people
+        )
+
+    def _write(self, valid, people) -> _ChunkWrite:
+        """
+        Write one chunk. Runs inside the caller's transaction, so importer
+        state is only returned here and applied once the chunk has committed.
+        """
+        rows = [data for _, data in valid]
+        Person.objects.bulk_create(people)
+
+        new_family_keys = self._new_family_keys(valid)
+        family_rows = [
+            ((data["branch"].pk, data["family"].strip().lower()), data["family"].strip(), person)
+            for person, data in zip(people, rows)
+            if data.get("family", "").strip()
+        ]
+        new_families = {}
+        for key, name, person in family_rows:
+            if key in new_family_keys and key not in new_families:
+                new_families[key] = Family(name=name, branch=person.branch, leader=person)
+        Family.objects.bulk_create(list(new_families.values()))
+        families = {key: new_families.get(key) or self._families[key] for key, _, _ in family_rows}
+
+        family_links = [
+            Family.members.through(family_id=families[key].pk, person_id=person.pk)
+            for key, _, person in family_rows
+        ]
+        cluster_links = [
+            Cluster.members.through(cluster_id=data["cluster"].pk, person_id=person.pk)
+            for person, data in zip(people, rows)
+            if data.get("cluster")
+        ]
+        Family.members.through.objects.bulk_create(family_links)
+        Cluster.members.through.objects.bulk_create(cluster_links)
+        if family_links or cluster_links:
+            # bulk_create skips the m2m_changed handlers that do this.
+            bump_visibility_generation()
+
+        families_by_person = {person.pk: families[key] for key, _, person in family_rows}
+        journeys = []
+        for person in people:
+            journeys.extend(self._derived_journeys(person, families_by_person.get(person.pk)))
+        Journey.objects.bulk_create(journeys)
+        return _ChunkWrite(
+            created=len(people),
+            families=new_families,
+            memberships=len(family_links) + len(cluster_links),
+            journeys=len(journeys),
+        )
+
+    def _derived_journeys(self, person: Person, family: Optional[Family]) -> list[Journey]:
+        """The Journey rows the Person/Family signals create for a new person."""
+        journeys = []
+        if person.water_baptism_date:
+            journeys.append(
+                Journey(
+                    user=person,
+                    type="BAPTISM",
+                    date=person.water_baptism_date,
+                    title="Baptized in Jesus' name",
+                    description="Water baptism",
+                )
+            )
+        if person.spirit_baptism_date:
+            journeys.append(
+                Journey(
+                    user=person,
+                    type="SPIRIT",
+                    date=person.spirit_baptism_date,
+                    title="Received the Holy Ghost",
+                    description="Spirit baptism",
+                )
+            )
+        if person.date_first_attended:
+            journeys.append(
+                Journey(
+                    user=person,
+                    type="EVENT_ATTENDANCE",
+                    date=person.date_first_attended,
+                    title="First Attended",
+                    description="First attendance",
+                )
+            )
+        if person.role == "VISITOR" and person.status != "DECEASED":
+            journeys.append(
+                Journey(
+                    user=person,
+                    type="NOTE",
+                    date=person.date_first_invited or self._today,
+                    title=INVITED_JOURNEY_TITLE,
+                    description="Invited.",
+                )
+            )
+        if family is not None:
+            leader = family.leader
+            leader_name = (leader.get_full_name() or leader.username) if leader else None
+            journeys.append(
+                Journey(
+                    user=person,
+                    type="NOTE",
+                    date=self._today,
+                    title=f"Added to family: {family.name}",
+                    description=(
+                        f"Added to family led by {leader_name}."
+                        if leader_name
+                        else "Added to family."
+                    ),
+                )
+            )
+        return journeys
+
+
+def import_people(
+    fileobj,
+    filename: str,
+    *,
+    default_branch: Optional[Branch] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    dry_run: bool = False,
+) -> PeopleImportResult:
+    """Import people from a CSV/XLSX file object. Raises ImportFileError for unreadable files."""
+    header, records = read_import_rows(fileobj, filename)
+    importer = PeopleImporter(
+        default_branch=default_branch, chunk_size=chunk_size, dry_run=dry_run
+    )
+    return importer.run(records, header)
@@ -0,0 +1,46 @@
+"""
+Namespaced generation counters for shared caches.
+
+A cache that must be dropped by every worker at once embeds
+:func:`current_generation` of its namespace in its keys and calls
+:func:`bump_generation` when the rows behind it change (usually from signal
+handlers). Bumps are plain UPDATEs, so they take effect for other workers
+when the surrounding transaction commits.
+
+Namespaces in use: ``people.visibility`` (apps/people/visibility.py) and
+``analytics.<name>`` (apps/reports/analytics_cache.py).
+"""
+
+from __future__ import annotations
+
+import secrets
+
+from django.db.models import F
+
+from .models import CacheGeneration
+
+
+def _initial_value() -> int:
+    # Leaves headroom below the BigIntegerField maximum for bumps.
+    return secrets.randbits(62)
+
+
+def current_generation(namespace: str) -> int:
+    value = (
+        CacheGeneration.objects.filter(pk=namespace).values_list("value", flat=True).first()
+    )
+    if value is None:
+        value = CacheGeneration.objects.get_or_create(
+            pk=namespace, defaults={"value": _initial_value()}
+        )[0].value
+    return value
+
+
+def bump_generation(*namespaces: str) -> None:
+    """Invalidate every cache entry keyed by ``namespaces``."""
+    for namespace in namespaces:
+        updated = CacheGeneration.objects.filter(pk=namespace).update(value=F("value") + 1)
+        if not updated:
+            CacheGeneration.objects.get_or_create(
+                pk=namespace, defaults={"value": _initial_value()}
+            )
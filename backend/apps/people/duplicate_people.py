@@ -38,6 +38,20 @@ def _person_summary(person: Person) -> Dict[str, Any]:
     }
 
 
+def name_match_key(first_name: Optional[str], last_name: Optional[str]) -> Optional[str]:
+    """Key for the "name" match (same as the possible-duplicates audit), or None."""
+    first = (first_name or "").strip().lower()
+    last = (last_name or "").strip().lower()
+    if not first or not last:
+        return None
+    return f"{first}|{last}"
+
+
+def member_id_match_key(member_id: Optional[str]) -> Optional[str]:
+    """Key for the "member_id" (LAMP ID) match, or None when blank."""
+    return (member_id or "").strip().lower() or None
+
+
 def _group_same_branch(people: List[Person]) -> bool:
     branch_ids = {p.branch_id for p in people}
     return len(branch_ids) == 1
@@ -0,0 +1,575 @@
+"""
+Deterministic, production-sized dataset for performance work.
+
+Used by the ``generate_load_dataset`` management command. Every row (M2M
+through rows included) is written with ``bulk_create``, so ``save()`` and the
+post_save / m2m_changed signals never run: no journeys, notifications or
+coordinator assignments are derived. The generated content depends only on the
+seed, the counts and the end date, so the same options give the same rows on
+SQLite and PostgreSQL (only auto timestamps and primary keys differ).
+
+Generated rows are tagged (``load_`` usernames, ``LOAD-`` codes and receipt
+numbers, ``LOAD_NOTE`` in free-text fields) so :func:`clear_load_dataset`
+can remove them without touching real data.
+"""
+
+from __future__ import annotations
+
+import random
+import time as _time
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+
+from apps.attendance.models import AttendanceRecord
+from apps.attendance.timeline import rebuild_attendance_timelines
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.events.models import Event, EventType
+from apps.evangelism.models import Prospect
+from apps.evangelism.tally import rebuild_weekly_tallies
+from apps.finance.ledger import rebuild_giving_ledger
+from apps.finance.models import Donation, Offering, Pledge, PledgeContribution
+from apps.lessons.models import Lesson, PersonLessonProgress
+from apps.people.models import Branch, Person
+from core.datetime_utils import get_church_timezone
+
+USERNAME_PREFIX = "load_"
+CODE_PREFIX = "LOAD-"
+LOAD_NOTE = "Generated by generate_load_dataset"
+SAMPLE_PASSWORD = "password123"
+
+DEFAULT_END_DATE = date(2025, 12, 28)
+DEFAULT_COUNTS = {
+    "branches": 5,
+    "people": 50_000,
+    "clusters": 800,
+    "years": 5,
+    "prospects": 10_000,
+    "donations": 20_000,
+    "pledges": 2_000,
+}
+DEFAULT_EVENT_ATTENDANCE = 0.2
+DEFAULT_BATCH_SIZE = 2_000
+
+FIRST_NAMES = [
+    "Juan", "Maria", "Jose", "Ana", "Pedro", "Rosa", "Mark", "Grace", "Paolo",
+    "Joy", "Miguel", "Carmen", "Rafael", "Liza", "Daniel", "Faith", "Gabriel",
+    "Hope", "Samuel", "Ruth", "Joshua", "Esther", "David", "Leah",
+]
+LAST_NAMES = [
+    "Santos", "Reyes", "Cruz", "Bautista", "Garcia", "Mendoza", "Torres",
+    "Flores", "Villanueva", "Ramos", "Aquino", "Castillo", "Domingo", "Navarro",
+    "Salazar", "Lopez", "Dela Cruz", "Gonzales", "Fernandez", "Rivera",
+]
+ROLE_WEIGHTS = (("MEMBER", 85), ("VISITOR", 14), ("PASTOR", 1))
+STATUS_WEIGHTS = (("ACTIVE", 60), ("SEMIACTIVE", 20), ("INACTIVE", 15), ("DORMANT", 5))
+GATHERING_WEIGHTS = (("PHYSICAL", 70), ("ONLINE", 15), ("HYBRID", 15))
+STAGE_WEIGHTS = (
+    (Prospect.PipelineStage.INVITED, 40),
+    (Prospect.PipelineStage.ATTENDED, 25),
+    (Prospect.PipelineStage.TAKEN_NCC, 15),
+    (Prospect.PipelineStage.BAPTIZED, 10),
+    (Prospect.PipelineStage.RECEIVED_HG, 5),
+    (Prospect.PipelineStage.REACHED, 5),
+)
+
+
+def scaled_counts(scale: float = 1.0, **overrides) -> dict:
+    """Default counts multiplied by ``scale``; explicit overrides win."""
+    counts = {
+        key: max(1, round(value * scale)) if key != "years" else value
+        for key, value in DEFAULT_COUNTS.items()
+    }
+    counts.update({key: value for key, value in overrides.items() if value is not None})
+    return counts
+
+
+def load_dataset_exists(using: str = "default") -> bool:
+    return Person.objects.using(using).filter(username__startswith=USERNAME_PREFIX).exists()
+
+
+def _raw_delete(queryset) -> int:
+    # Leaf tables with millions of rows: skip the collector (and the delete
+    # signals) the same way Django's own fast-delete path does.
+    return queryset._raw_delete(queryset.db)
+
+
+def clear_load_dataset(using: str = "default") -> dict:
+    """Remove every tagged row created by :class:`LoadDatasetGenerator`."""
+    people = Person.objects.using(using).filter(username__startswith=USERNAME_PREFIX)
+    clusters = Cluster.objects.using(using).filter(code__startswith=CODE_PREFIX)
+    events = Event.objects.using(using).filter(description=LOAD_NOTE)
+    reports = ClusterWeeklyReport.objects.using(using).filter(cluster__in=clusters)
+    report_through = (
+        ClusterWeeklyReport.members_attended.through,
+        ClusterWeeklyReport.visitors_attended.through,
+    )
+
+    deleted = {}
+    with transaction.atomic(using=using):
+        deleted["attendance_records"] = _raw_delete(
+            AttendanceRecord.objects.using(using).filter(event__in=events)
+        )
+        for through in report_through:
+            _raw_delete(through.objects.using(using).filter(clusterweeklyreport__in=reports))
+        deleted["weekly_reports"] = _raw_delete(reports)
+        _raw_delete(Cluster.members.through.objects.using(using).filter(cluster__in=clusters))
+        deleted["lesson_progress"] = _raw_delete(
+            PersonLessonProgress.objects.using(using).filter(person__in=people)
+        )
+        deleted["pledge_contributions"] = _raw_delete(
+            PledgeContribution.objects.using(using).filter(pledge__notes=LOAD_NOTE)
+        )
+        deleted["pledges"] = _raw_delete(Pledge.objects.using(using).filter(notes=LOAD_NOTE))
+        deleted["offerings"] = _raw_delete(Offering.objects.using(using).filter(notes=LOAD_NOTE))
+        deleted["donations"] = _raw_delete(
+            Donation.objects.using(using).filter(receipt_number__startswith=CODE_PREFIX)
+        )
+        deleted["prospects"] = _raw_delete(Prospect.objects.using(using).filter(notes=LOAD_NOTE))
+        deleted["events"] = _raw_delete(events)
+        # Parents go through the collector so anything added on top of the
+        # dataset (journeys, edits made through the API) is cleaned up too.
+        deleted["clusters"] = clusters.delete()[0]
+        deleted["people"] = people.delete()[0]
+        deleted["branches"] = (
+            Branch.objects.using(using).filter(code__startswith=CODE_PREFIX).delete()[0]
+        )
+    return deleted
+
+
+class LoadDatasetGenerator:
+    """
+    Build the dataset section by section from a single seeded RNG.
+
+    Sections run in a fixed order and draw from the RNG in a fixed order, so
+    the output is a pure function of (seed, counts, end_date).
+    """
+
+    def __init__(
+        self,
+        *,
+        seed: int = 42,
+        counts: dict | None = None,
+        end_date: date = DEFAULT_END_DATE,
+        event_attendance: float = DEFAULT_EVENT_ATTENDANCE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        using: str = "default",
+        log=None,
+    ):
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.counts = counts or scaled_counts()
+        self.end_date = end_date
+        self.start_date = end_date - timedelta(weeks=52 * self.counts["years"])
+        self.event_attendance = event_attendance
+        self.batch_size = batch_size
+        self.using = using
+        self.log = log or (lambda message: None)
+        self.tz = get_church_timezone()
+        self.summary: dict = {}
+
+    # ------------------------------------------------------------------ helpers
+
+    def _weighted(self, options):
+        values, weights = zip(*options)
+        return self.rng.choices(values, weights=weights)[0]
+
+    def _date_between(self, start: date, end: date) -> date:
+        span = (end - start).days
+        return start + timedelta(days=self.rng.randint(0, max(span, 0)))
+
+    def _money(self, low: int, high: int) -> Decimal:
+        return Decimal(self.rng.randint(low * 100, high * 100)) / 100
+
+    def _aware(self, day: date, hour: int) -> datetime:
+        return datetime.combine(day, time(hour, 0), tzinfo=self.tz)
+
+    def _bulk(self, model, objs) -> list:
+        if not objs:
+            return []
+        return model.objects.using(self.using).bulk_create(objs, batch_size=self.batch_size)
+
+    def _mondays(self) -> list[date]:
+        last_monday = self.end_date - timedelta(days=self.end_date.weekday())
+        weeks = 52 * self.counts["years"]
+        return [last_monday - timedelta(weeks=k) for k in range(weeks - 1, -1, -1)]
+
+    def _section(self, name, func):
+        started = _time.monotonic()
+        with transaction.atomic(using=self.using):
+            rows = func()
+        self.summary[name] = rows
+        self.log(f"{name}: {rows} rows ({_time.monotonic() - started:.1f}s)")
+
+    # ----------------------------------------------------------------- sections
+
+    def run(self) -> dict:
+        self._section("branches", self._branches)
+        self._section("people", self._people)
+        self._section("cluster_memberships", self._clusters)
+        self._section("weekly_report_attendance", self._weekly_reports)
+        self._section("prospects", self._prospects)
+        self._section("lesson_progress", self._lesson_progress)
+        self._section("event_attendance", self._events)
+        self._section("finance_entries", self._finance)
+        self._section("attendance_timelines", self._attendance_timelines)
+        self._section("weekly_tallies", self._weekly_tallies)
+        self._section("giving_ledger", self._giving_ledger)
+        return self.summary
+
+    def _branches(self) -> int:
+        self.branches = self._bulk(
+            Branch,
+            [
+                Branch(
+                    name=f"Load Branch {index + 1}",
+                    code=f"{CODE_PREFIX}B{index + 1:02d}",
+                )
+                for index in range(self.counts["branches"])
+            ],
+        )
+        return len(self.branches)
+
+    def _people(self) -> int:
+        password = make_password(SAMPLE_PASSWORD, salt=f"loadseed{self.seed}")
+        people = []
+        for index in range(self.counts["people"]):
+            role = self._weighted(ROLE_WEIGHTS)
+            first_attended = self._date_between(self.start_date, self.end_date)
+            baptized = role != "VISITOR" and self.rng.random() < 0.6
+            people.append(
+                Person(
+                    username=f"{USERNAME_PREFIX}{index:06d}",
+                    password=password,
+                    first_name=self.rng.choice(FIRST_NAMES),
+                    last_name=self.rng.choice(LAST_NAMES),
+                    gender=self.rng.choice(("MALE", "FEMALE")),
+                    role=role,
+                    status="ONGOING" if role == "VISITOR" else self._weighted(STATUS_WEIGHTS),
+                    branch=self.branches[index % len(self.branches)],
+                    member_id=f"L{index:07d}",
+                    date_of_birth=self._date_between(date(1950, 1, 1), date(2015, 12, 31)),
+                    date_first_attended=first_attended,
+                    water_baptism_date=(
+                        self._date_between(first_attended, self.end_date) if baptized else None
+                    ),
+                    first_login=False,
+                )
+            )
+        self.people = self._bulk(Person, people)
+
+        self.members_by_branch = defaultdict(list)
+        self.visitors_by_branch = defaultdict(list)
+        for person in self.people:
+            if person.role == "MEMBER":
+                self.members_by_branch[person.branch_id].append(person)
+            elif person.role == "VISITOR":
+                self.visitors_by_branch[person.branch_id].append(person)
+        self.members = [p for p in self.people if p.role == "MEMBER"]
+        self.visitors = [p for p in self.people if p.role == "VISITOR"]
+        return len(self.people)
+
+    def _clusters(self) -> int:
+        clusters = [
+            Cluster(
+                code=f"{CODE_PREFIX}C{index + 1:04d}",
+                name=f"Load Cluster {index + 1}",
+                branch=self.branches[index % len(self.branches)],
+                meeting_schedule="Weekly",
+                description=LOAD_NOTE,
+            )
+            for index in range(self.counts["clusters"])
+        ]
+        clusters_by_branch = defaultdict(list)
+        for cluster in clusters:
+            clusters_by_branch[cluster.branch.pk].append(cluster)
+
+        # Round-robin each branch's members and visitors into its clusters.
+        self.roster = defaultdict(lambda: {"members": [], "visitors": []})
+        for branch in self.branches:
+            branch_clusters = clusters_by_branch.get(branch.pk) or []
+            if not branch_clusters:
+                continue
+            for kind, pool in (
+                ("members", self.members_by_branch[branch.pk]),
+                ("visitors", self.visitors_by_branch[branch.pk]),
+            ):
+                for position, person in enumerate(pool):
+                    cluster = branch_clusters[position % len(branch_clusters)]
+                    self.roster[cluster.code][kind].append(person)
+        for cluster in clusters:
+            members = self.roster[cluster.code]["members"]
+            cluster.coordinator = members[0] if members else None
+
+        self.clusters = self._bulk(Cluster, clusters)
+        self.cluster_of = {}
+        through = Cluster.members.through
+        rows = []
+        for cluster in self.clusters:
+            roster = self.roster[cluster.code]
+            for person in roster["members"] + roster["visitors"]:
+                self.cluster_of[person.pk] = cluster
+                rows.append(through(cluster_id=cluster.pk, person_id=person.pk))
+        self._bulk(through, rows)
+        return len(rows)
+
+    def _weekly_reports(self) -> int:
+        mondays = self._mondays()
+        member_through = ClusterWeeklyReport.members_attended.through
+        visitor_through = ClusterWeeklyReport.visitors_attended.through
+        attendance_rows = 0
+        pending = []
+
+        def flush():
+            nonlocal attendance_rows
+            reports = self._bulk(ClusterWeeklyReport, [report for report, _, _ in pending])
+            member_rows = []
+            visitor_rows = []
+            for report, (_, attended, visited) in zip(reports, pending):
+                member_rows.extend(
+                    member_through(clusterweeklyreport_id=report.pk, person_id=person.pk)
+                    for person in attended
+                )
+                visitor_rows.extend(
+                    visitor_through(clusterweeklyreport_id=report.pk, person_id=person.pk)
+                    for person in visited
+                )
+            self._bulk(member_through, member_rows)
+            self._bulk(visitor_through, visitor_rows)
+            attendance_rows += len(member_rows) + len(visitor_rows)
+            pending.clear()
+
+        for offset, cluster in enumerate(self.clusters):
+            roster = self.roster[cluster.code]
+            weekday = offset % 7
+            for monday in mondays:
+                if self.rng.random() < 0.05:
+                    continue  # missed report (keeps compliance views honest)
+                meeting_date = monday + timedelta(days=weekday)
+                iso_year, iso_week, _ = meeting_date.isocalendar()
+                members = roster["members"]
+                attended = self.rng.sample(
+                    members, round(len(members) * self.rng.uniform(0.5, 0.9))
+                )
+                visited = self.rng.sample(
+                    roster["visitors"], min(len(roster["visitors"]), self.rng.randint(0, 3))
+                )
+                report = ClusterWeeklyReport(
+                    cluster=cluster,
+                    year=iso_year,
+                    week_number=iso_week,
+                    meeting_date=meeting_date,
+                    gathering_type=self._weighted(GATHERING_WEIGHTS),
+                    offerings=self._money(100, 2_000),
+                    submitted_by=cluster.coordinator,
+                )
+                pending.append((report, attended, visited))
+            if len(pending) >= self.batch_size:
+                flush()
+        if pending:
+            flush()
+        return attendance_rows
+
+    def _prospects(self) -> int:
+        if not self.members:
+            self.log("  no members to invite prospects; skipping prospects")
+            return 0
+        available_visitors = list(self.visitors)
+        prospects = []
+        for index in range(self.counts["prospects"]):
+            inviter = self.rng.choice(self.members)
+            stage = self._weighted(STAGE_WEIGHTS)
+            invited_on = self._date_between(self.start_date, self.end_date)
+            last_activity = self._date_between(invited_on, self.end_date)
+            dropped = (
+                stage in (Prospect.PipelineStage.INVITED, Prospect.PipelineStage.ATTENDED)
+                and self.rng.random() < 0.15
+            )
+            person = None
+            if stage != Prospect.PipelineStage.INVITED and available_visitors:
+                person = available_visitors.pop()
+            prospects.append(
+                Prospect(
+                    first_name=self.rng.choice(FIRST_NAMES),
+                    last_name=self.rng.choice(LAST_NAMES),
+                    gender=self.rng.choice(("MALE", "FEMALE")),
+                    invited_by=inviter,
+                    inviter_cluster=self.cluster_of.get(inviter.pk),
+                    person=person,
+                    pipeline_stage=stage,
+                    date_first_invited=invited_on,
+                    last_activity_date=last_activity,
+                    is_dropped_off=dropped,
+                    drop_off_date=last_activity + timedelta(days=30) if dropped else None,
+                    drop_off_stage=stage if dropped else None,
+                    notes=LOAD_NOTE,
+                )
+            )
+        return len(self._bulk(Prospect, prospects))
+
+    def _lesson_progress(self) -> int:
+        lessons = list(
+            Lesson.objects.using(self.using)
+            .filter(is_latest=True, is_active=True)
+            .order_by("order", "code")
+        )
+        if not lessons:
+            self.log("  no active lessons; skipping lesson progress")
+            return 0
+        recent_cutoff = self.end_date - timedelta(days=730)
+        students = self.visitors + [
+            p for p in self.members if p.date_first_attended >= recent_cutoff
+        ]
+        rows = []
+        for person in students:
+            completed = self.rng.randint(0, len(lessons))
+            day = person.date_first_attended
+            for position, lesson in enumerate(lessons):
+                if position < completed:
+                    day = min(day + timedelta(days=self.rng.randint(5, 21)), self.end_date)
+                    status = PersonLessonProgress.Status.COMPLETED
+                    started_at = self._aware(day, 9)
+                    completed_at = self._aware(day, 11)
+                elif position == completed:
+                    status = PersonLessonProgress.Status.IN_PROGRESS
+                    started_at, completed_at = self._aware(day, 9), None
+                else:
+                    status = PersonLessonProgress.Status.ASSIGNED
+                    started_at = completed_at = None
+                rows.append(
+                    PersonLessonProgress(
+                        person=person,
+                        lesson=lesson,
+                        status=status,
+                        started_at=started_at,
+                        completed_at=completed_at,
+                    )
+                )
+        return len(self._bulk(PersonLessonProgress, rows))
+
+    def _events(self) -> int:
+        if not EventType.objects.using(self.using).filter(code="SUNDAY_SERVICE").exists():
+            self.log("  SUNDAY_SERVICE event type missing; skipping events")
+            return 0
+        sundays = [monday + timedelta(days=6) for monday in self._mondays()]
+        events = [
+            Event(
+                title=f"{branch.name} Sunday Service",
+                description=LOAD_NOTE,
+                start_date=self._aware(sunday, 9),
+                end_date=self._aware(sunday, 11),
+                event_type_id="SUNDAY_SERVICE",
+                location=branch.name,
+                branch=branch,
+            )
+            for branch in self.branches
+            for sunday in sundays
+        ]
+        events = self._bulk(Event, events)
+
+        rows = 0
+        pending = []
+        for event in events:
+            pool = (
+                self.members_by_branch[event.branch.pk]
+                + self.visitors_by_branch[event.branch.pk]
+            )
+            attendees = self.rng.sample(pool, round(len(pool) * self.event_attendance))
+            occurrence = event.start_date.date()
+            pending.extend(
+                AttendanceRecord(event=event, person=person, occurrence_date=occurrence)
+                for person in attendees
+            )
+            if len(pending) >= self.batch_size * 5:
+                rows += len(self._bulk(AttendanceRecord, pending))
+                pending = []
+        rows += len(self._bulk(AttendanceRecord, pending))
+        return rows
+
+    def _attendance_timelines(self) -> int:
+        # Attendance above was bulk-created, so the timeline signals never ran.
+        return sum(rebuild_attendance_timelines(using=self.using).values())
+
+    def _weekly_tallies(self) -> int:
+        # Same for the weekly reports: their tally signals never ran.
+        return rebuild_weekly_tallies(using=self.using)
+
+    def _giving_ledger(self) -> int:
+        # And for the giving above: the ledger signals never ran.
+        return sum(rebuild_giving_ledger(using=self.using).values())
+
+    def _finance(self) -> int:
+        offerings = [
+            Offering(
+                service_date=monday + timedelta(days=6),
+                service_name=f"{branch.name} Sunday AM Service",
+                fund="General",
+                amount=self._money(5_000, 60_000),
+                notes=LOAD_NOTE,
+            )
+            for branch in self.branches
+            for monday in self._mondays()
+        ]
+        donations = []
+        for index in range(self.counts["donations"]):
+            # Without members every donation is anonymous.
+            anonymous = not self.members or self.rng.random() < 0.1
+            donations.append(
+                Donation(
+                    amount=self._money(100, 20_000),
+                    date=self._date_between(self.start_date, self.end_date),
+                    donor=None if anonymous else self.rng.choice(self.members),
+                    purpose=self.rng.choice(("Tithe", "Building Fund", "Missions", "Love Gift")),
+                    is_anonymous=anonymous,
+                    payment_method=self.rng.choice(Donation.PaymentMethod.values),
+                    receipt_number=f"{CODE_PREFIX}D{index:07d}",
+                )
+            )
+
+        pledges = []
+        contributions = []
+        if not self.members:
+            self.log("  no members to pledge; skipping pledges")
+        for index in range(self.counts["pledges"] if self.members else 0):
+            start = self._date_between(self.start_date, self.end_date - timedelta(days=30))
+            amount = self._money(1_000, 50_000)
+            installments = [
+                self._money(100, 5_000) for _ in range(self.rng.randint(0, 12))
+            ]
+            received = sum(installments, Decimal("0.00"))
+            pledge = Pledge(
+                pledger=self.rng.choice(self.members),
+                pledge_title=f"Pledge {index + 1}",
+                pledge_amount=amount,
+                amount_received=received,
+                start_date=start,
+                target_date=start + timedelta(days=365),
+                status=(
+                    Pledge.Status.FULFILLED if received >= amount else Pledge.Status.ACTIVE
+                ),
+                notes=LOAD_NOTE,
+            )
+            pledges.append(pledge)
+            contributions.extend(
+                (pledge, installment, min(start + timedelta(days=30 * (n + 1)), self.end_date))
+                for n, installment in enumerate(installments)
+            )
+        self._bulk(Pledge, pledges)
+        contribution_rows = [
+            PledgeContribution(
+                pledge=pledge,
+                contributor=pledge.pledger,
+                amount=amount,
+                contribution_date=day,
+            )
+            for pledge, amount, day in contributions
+        ]
+        return (
+            len(self._bulk(Offering, offerings))
+            + len(self._bulk(Donation, donations))
+            + len(pledges)
+            + len(self._bulk(PledgeContribution, contribution_rows))
+        )
@@ -0,0 +1,155 @@
+"""
+Generate a large, reproducible dataset for performance work.
+
+Writes people, clusters with weekly reports and attendance, prospects, lesson
+progress, Sunday services with attendance, and finance ledgers via bulk_create
+(signals do not fire). Development/benchmark databases only.
+
+Usage:
+    python manage.py generate_load_dataset                   # full size (50k people)
+    python manage.py generate_load_dataset --scale 0.02      # ~1k people, same shape
+    python manage.py generate_load_dataset --clear --seed 7 --database default
+"""
+
+from datetime import date
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.people.load_dataset import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COUNTS,
+    DEFAULT_END_DATE,
+    DEFAULT_EVENT_ATTENDANCE,
+    SAMPLE_PASSWORD,
+    LoadDatasetGenerator,
+    clear_load_dataset,
+    load_dataset_exists,
+    scaled_counts,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate a deterministic, production-sized dataset with bulk_create "
+        "(signals bypassed). Development/benchmark databases only."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed", type=int, default=42, help="Random seed (default: 42)"
+        )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            default=1.0,
+            help="Multiply every default count (except --years) by this factor",
+        )
+        for name in ("branches", "people", "clusters", "prospects", "donations", "pledges"):
+            parser.add_argument(
+                f"--{name}",
+                type=int,
+                help=f"Number of {name} (default: {DEFAULT_COUNTS[name]:,} x scale)",
+            )
+        parser.add_argument(
+            "--years",
+            type=int,
+            help=f"Years of weekly history (default: {DEFAULT_COUNTS['years']})",
+        )
+        parser.add_argument(
+            "--end-date",
+            type=str,
+            default=DEFAULT_END_DATE.isoformat(),
+            help=(
+                "Last day of generated history, YYYY-MM-DD "
+                f"(default: {DEFAULT_END_DATE.isoformat()}; fixed so runs are reproducible)"
+            ),
+        )
+        parser.add_argument(
+            "--event-attendance",
+            type=float,
+            default=DEFAULT_EVENT_ATTENDANCE,
+            help=(
+                "Share of each branch marked present at every Sunday service "
+                f"(default: {DEFAULT_EVENT_ATTENDANCE})"
+            ),
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Rows per INSERT (default: {DEFAULT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--database",
+            default="default",
+            help="Database alias to write to (SQLite or PostgreSQL)",
+        )
+        parser.add_argument(
+            "--clear",
+            action="store_true",
+            help="Remove a previously generated load dataset before generating",
+        )
+        parser.add_argument(
+            "--clear-only",
+            action="store_true",
+            help="Remove a previously generated load dataset and exit",
+        )
+
+    def handle(self, *args, **options):
+        using = options["database"]
+        if using not in settings.DATABASES:
+            raise CommandError(f"Unknown database alias '{using}'")
+        try:
+            end_date = date.fromisoformat(options["end_date"])
+        except ValueError:
+            raise CommandError("--end-date must be YYYY-MM-DD")
+        if options["scale"] <= 0:
+            raise CommandError("--scale must be positive")
+        if not 0 <= options["event_attendance"] <= 1:
+            raise CommandError("--event-attendance must be between 0 and 1")
+
+        if options["clear"] or options["clear_only"]:
+            self.stdout.write("Clearing previous load dataset...")
+            deleted = clear_load_dataset(using=using)
+            for name, count in deleted.items():
+                if count:
+                    self.stdout.write(f"  {name}: {count}")
+            if options["clear_only"]:
+                self.stdout.write(self.style.SUCCESS("Load dataset cleared"))
+                return
+        elif load_dataset_exists(using=using):
+            raise CommandError(
+                "A load dataset already exists in this database (use --clear to replace it)"
+            )
+
+        counts = scaled_counts(
+            options["scale"],
+            **{name: options[name] for name in DEFAULT_COUNTS},
+        )
+        for name, value in counts.items():
+            if value < 1:
+                raise CommandError(f"--{name} must be at least 1")
+
+        self.stdout.write(
+            f"Generating load dataset (seed {options['seed']}, "
+            f"{counts['people']:,} people, {counts['clusters']:,} clusters, "
+            f"{counts['years']} years ending {end_date}) on '{using}'..."
+        )
+        generator = LoadDatasetGenerator(
+            seed=options["seed"],
+            counts=counts,
+            end_date=end_date,
+            event_attendance=options["event_attendance"],
+            batch_size=options["batch_size"],
+            using=using,
+            log=lambda message: self.stdout.write(f"  {message}"),
+        )
+        summary = generator.run()
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Load dataset ready: {sum(summary.values()):,} rows. "
+                f"Sample user password: {SAMPLE_PASSWORD}"
+            )
+        )
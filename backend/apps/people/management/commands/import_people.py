@@ -0,0 +1,106 @@
+"""
+Import people from a CSV/XLSX spreadsheet in bulk.
+
+Rows are validated in chunks, matched against existing people (LAMP ID, or
+first+last name within the branch) and written with bulk_create, together with
+families, family/cluster memberships and the derived Journey rows. Per-row
+errors are reported without aborting the import.
+
+Columns: first_name, last_name (required); middle_name, suffix, nickname,
+gender, email, phone, address, country, member_id, role, status,
+date_of_birth, date_first_invited, date_first_attended, water_baptism_date,
+spirit_baptism_date, branch (code), family (name), cluster (code).
+
+Usage:
+    python manage.py import_people members.csv --branch MAIN
+    python manage.py import_people members.xlsx --branch MAIN --dry-run
+"""
+
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.people.bulk_import import DEFAULT_CHUNK_SIZE, ImportFileError, import_people
+from apps.people.models import Branch
+
+
+class Command(BaseCommand):
+    help = "Bulk import people from a CSV/XLSX file (per-row errors do not abort)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", type=str, help="Path to a .csv or .xlsx file")
+        parser.add_argument(
+            "--branch",
+            type=str,
+            help="Branch code for rows without a branch column value",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Rows validated and written per transaction (default: {DEFAULT_CHUNK_SIZE})",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Validate and match rows without writing anything",
+        )
+        parser.add_argument(
+            "--errors-json",
+            type=str,
+            help="Also write the per-row errors and matches to this JSON file",
+        )
+
+    def handle(self, *args, **options):
+        default_branch = None
+        if options["branch"]:
+            default_branch = Branch.objects.filter(code=options["branch"]).first()
+            if default_branch is None:
+                raise CommandError(f"Unknown branch code '{options['branch']}'")
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+        if options["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY RUN MODE - No changes will be saved"))
+
+        try:
+            with open(options["path"], "rb") as handle:
+                result = import_people(
+                    handle,
+                    options["path"],
+                    default_branch=default_branch,
+                    chunk_size=options["chunk_size"],
+                    dry_run=options["dry_run"],
+                )
+        except OSError as exc:
+            raise CommandError(f"Could not open {options['path']}: {exc.strerror}")
+        except ImportFileError as exc:
+            raise CommandError(str(exc))
+
+        if result.ignored_columns:
+            self.stdout.write(
+                self.style.WARNING(f"Ignored columns: {', '.join(result.ignored_columns)}")
+            )
+        for error in result.errors:
+            details = "; ".join(
+                f"{name}: {' '.join(messages)}" for name, messages in error["errors"].items()
+            )
+            self.stdout.write(self.style.ERROR(f"  Row {error['row']}: {details}"))
+        for match in result.matched:
+            self.stdout.write(
+                f"  Row {match['row']}: matches person {match['id']} by {match['match']} (skipped)"
+            )
+        if options["errors_json"]:
+            with open(options["errors_json"], "w") as handle:
+                json.dump(
+                    {"errors": result.errors, "matched": result.matched}, handle, indent=2
+                )
+
+        verb = "Would create" if result.dry_run else "Created"
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{result.rows} row(s) read. {verb} {result.created} people, "
+                f"{result.families_created} families, {result.memberships_created} "
+                f"memberships and {result.journeys_created} journeys; "
+                f"{len(result.matched)} matched existing, {len(result.errors)} error(s)."
+            )
+        )
@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 
 from apps.people.coordinator_assignment_validation import RESOURCE_SCOPED_MODULES
 from apps.people.models import ModuleCoordinator
+from apps.people.visibility import bump_visibility_generation
 
 
 class Command(BaseCommand):
@@ -48,6 +49,8 @@ class Command(BaseCommand):
         updated = qs.update(
             level=ModuleCoordinator.CoordinatorLevel.SENIOR_COORDINATOR
         )
+        if updated:
+            bump_visibility_generation()
         self.stdout.write(
             self.style.SUCCESS(f"Promoted {updated} module-wide coordinator row(s).")
         )
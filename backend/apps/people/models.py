@@ -1,6 +1,8 @@
 from django.db import models
 from django.contrib.auth.models import AbstractUser, Group, Permission
 
+from core.tracked_fields import TrackedFieldsMixin
+
 
 class Branch(models.Model):
     """Represents a church branch/location"""
@@ -34,7 +36,19 @@ class Branch(models.Model):
         return self.name
 
 
-class Person(AbstractUser):
+class Person(TrackedFieldsMixin, AbstractUser):
+    # Compared by the journey signal handlers (apps/people/signals.py).
+    tracked_fields = (
+        "water_baptism_date",
+        "spirit_baptism_date",
+        "date_first_invited",
+        "date_first_attended",
+        "first_activity_attended",
+        "role",
+        "status",
+        "inviter",
+    )
+
     middle_name = models.CharField(blank=True, max_length=150)
     suffix = models.CharField(blank=True, max_length=150)
     nickname = models.CharField(blank=True, max_length=150)
@@ -367,3 +381,25 @@ class PeopleAutomationSetting(models.Model):
     def __str__(self):
         status = "Enabled" if self.auto_status_updates_enabled else "Disabled"
         return f"Auto status updates: {status}"
+
+
+class CacheGeneration(models.Model):
+    """
+    Generation counter per cache namespace (see apps/people/cache_generation.py).
+
+    Cache keys embed the namespace's value; signal handlers bump it when the
+    rows behind the namespace change, so every worker drops stale entries at
+    once. Counters start at a random value, so keys stay unique across
+    database resets that keep the shared cache.
+    """
+
+    namespace = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Cache Generation"
+        verbose_name_plural = "Cache Generations"
+
+    def __str__(self):
+        return f"{self.namespace}: {self.value}"
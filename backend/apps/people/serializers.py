@@ -1104,18 +1104,14 @@ class PersonSerializer(serializers.ModelSerializer):
         if self.context.get("profile_all_visible"):
             return True
 
-        profile_visible_ids = self.context.get("profile_visible_ids")
-        if profile_visible_ids is not None:
-            return obj.pk in profile_visible_ids
+        profile_scope = self.context.get("profile_scope")
+        if profile_scope is not None:
+            return profile_scope.allows(obj, user)
 
         # retrieve/create/update responses: if the object was returned, allow.
         view = self.context.get("view")
-        if view is not None and hasattr(view, "_scoped_people_queryset"):
-            return (
-                view._scoped_people_queryset(for_profile=True)
-                .filter(pk=obj.pk)
-                .exists()
-            )
+        if view is not None and hasattr(view, "_people_scope"):
+            return view._people_scope(for_profile=True).allows(obj, user)
 
         return True
 
@@ -1192,17 +1188,13 @@ class PersonListSerializer(serializers.ModelSerializer):
         if self.context.get("profile_all_visible"):
             return True
 
-        profile_visible_ids = self.context.get("profile_visible_ids")
-        if profile_visible_ids is not None:
-            return obj.pk in profile_visible_ids
+        profile_scope = self.context.get("profile_scope")
+        if profile_scope is not None:
+            return profile_scope.allows(obj, user)
 
         view = self.context.get("view")
-        if view is not None and hasattr(view, "_scoped_people_queryset"):
-            return (
-                view._scoped_people_queryset(for_profile=True)
-                .filter(pk=obj.pk)
-                .exists()
-            )
+        if view is not None and hasattr(view, "_people_scope"):
+            return view._people_scope(for_profile=True).allows(obj, user)
 
         return True
 
@@ -2,15 +2,19 @@
 Signal handlers for automatic person status updates based on attendance.
 """
 from django.db.models import Q
-from django.db.models.signals import post_save, pre_save, m2m_changed
+from django.db.models.signals import post_delete, post_save, pre_save, m2m_changed
 from django.dispatch import receiver
 from apps.attendance.models import AttendanceRecord
-from apps.clusters.models import ClusterWeeklyReport
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.evangelism.models import EvangelismGroup
+from apps.lessons.models import LessonSessionReport
+from apps.sunday_school.models import SundaySchoolClassMember
 from apps.people.utils import update_person_status
 from django.utils import timezone
 
 from core.datetime_utils import church_today
-from apps.people.models import Person, Journey, Family
+from apps.people.models import Person, Journey, Family, ModuleCoordinator
+from apps.people.visibility import bump_visibility_generation
 import logging
 
 logger = logging.getLogger(__name__)
@@ -52,39 +56,19 @@ def update_status_on_cluster_attendance(sender, instance, action, pk_set, **kwar
 @receiver(pre_save, sender=Person)
 def store_person_original_values(sender, instance, **kwargs):
     """
-    Store original values of date fields before save to detect changes.
+    Stash pre-save values of the tracked fields to detect changes.
+    Values come from the snapshot taken when the row was loaded (no query).
     """
-    if instance.pk:
-        try:
-            original = Person.objects.get(pk=instance.pk)
-            instance._original_water_baptism_date = original.water_baptism_date
-            instance._original_spirit_baptism_date = original.spirit_baptism_date
-            instance._original_date_first_invited = original.date_first_invited
-            instance._original_date_first_attended = original.date_first_attended
-            instance._original_first_activity_attended = original.first_activity_attended_id
-            instance._original_role = original.role
-            instance._original_status = original.status
-            instance._original_inviter_id = original.inviter_id
-        except Person.DoesNotExist:
-            # New instance, no original values
-            instance._original_water_baptism_date = None
-            instance._original_spirit_baptism_date = None
-            instance._original_date_first_invited = None
-            instance._original_date_first_attended = None
-            instance._original_first_activity_attended = None
-            instance._original_role = None
-            instance._original_status = None
-            instance._original_inviter_id = None
-    else:
-        # New instance, no original values
-        instance._original_water_baptism_date = None
-        instance._original_spirit_baptism_date = None
-        instance._original_date_first_invited = None
-        instance._original_date_first_attended = None
-        instance._original_first_activity_attended = None
-        instance._original_role = None
-        instance._original_status = None
-        instance._original_inviter_id = None
+    originals = instance.tracked_original_values()
+    instance._original_water_baptism_date = originals["water_baptism_date"]
+    instance._original_spirit_baptism_date = originals["spirit_baptism_date"]
+    instance._original_date_first_invited = originals["date_first_invited"]
+    instance._original_date_first_attended = originals["date_first_attended"]
+    instance._original_first_activity_attended = originals["first_activity_attended"]
+    instance._original_role = originals["role"]
+    instance._original_status = originals["status"]
+    instance._original_inviter_id = originals["inviter"]
+    instance._tracked_fields_changed = bool(instance.tracked_changes(originals))
 
 
 @receiver(post_save, sender=Person)
@@ -93,6 +77,20 @@ def manage_baptism_journeys(sender, instance, created, **kwargs):
     Automatically create, update, or delete Journey entries when baptism dates or 
     first attendance date are set, changed, or cleared.
     """
+    if not created and not getattr(instance, "_tracked_fields_changed", True):
+        # Nothing tracked changed, but still back-fill a missing Invited journey.
+        if instance.role == "VISITOR" and instance.status != "DECEASED":
+            try:
+                _handle_invited_journey(
+                    instance, created, instance.role, instance.status, instance.inviter_id,
+                    instance.date_first_invited,
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error managing invited journey for person {instance.id}: {str(e)}",
+                    exc_info=True,
+                )
+        return
     try:
         # Get original values (stored in pre_save)
         original_water_baptism = getattr(instance, '_original_water_baptism_date', None)
@@ -407,3 +405,54 @@ def create_family_member_journeys(sender, instance: Family, action, pk_set, **kw
     )
 
 
+# ---------------------------------------------------------------------------
+# Visibility scope invalidation (apps/people/visibility.py)
+# ---------------------------------------------------------------------------
+
+MEMBERSHIP_M2M_ACTIONS = {"post_add", "post_remove", "post_clear"}
+
+
+@receiver(post_save, sender=ModuleCoordinator)
+@receiver(post_delete, sender=ModuleCoordinator)
+@receiver(post_delete, sender=Cluster)
+@receiver(post_delete, sender=Family)
+@receiver(post_delete, sender=EvangelismGroup)
+@receiver(post_save, sender=SundaySchoolClassMember)
+@receiver(post_delete, sender=SundaySchoolClassMember)
+@receiver(post_delete, sender=LessonSessionReport)
+def invalidate_visibility_on_change(sender, **kwargs):
+    """
+    Coordinator assignments, rosters and lesson students. Deleting a cluster,
+    family or group drops its member rows without m2m_changed.
+    """
+    bump_visibility_generation()
+
+
+@receiver(pre_save, sender=LessonSessionReport)
+def store_lesson_report_scope_change(sender, instance, **kwargs):
+    instance._scope_changed = instance.pk is None or bool(
+        instance.tracked_changes(instance.tracked_original_values())
+    )
+
+
+@receiver(post_save, sender=LessonSessionReport)
+def invalidate_visibility_on_lesson_report(sender, instance, created, **kwargs):
+    # Only the teacher/student pair feeds a scope; notes or dates do not.
+    if created or getattr(instance, "_scope_changed", True):
+        bump_visibility_generation()
+
+
+@receiver(post_save, sender=Cluster)
+def invalidate_visibility_on_cluster_coordinator(sender, instance, created, **kwargs):
+    # _coordinator_changed is set by the clusters pre_save handler.
+    if created or getattr(instance, "_coordinator_changed", True):
+        bump_visibility_generation()
+
+
+@receiver(m2m_changed, sender=Cluster.members.through)
+@receiver(m2m_changed, sender=Cluster.families.through)
+@receiver(m2m_changed, sender=Family.members.through)
+@receiver(m2m_changed, sender=EvangelismGroup.members.through)
+def invalidate_visibility_on_membership(sender, action, **kwargs):
+    if action in MEMBERSHIP_M2M_ACTIONS:
+        bump_visibility_generation()
@@ -0,0 +1,266 @@
+"""Bulk people import (CSV/XLSX) API and command."""
+
+import io
+from datetime import date
+from io import StringIO
+from unittest import mock
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import DatabaseError, connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.people.bulk_import import PeopleImporter, read_csv_rows
+from apps.people.models import Branch, Family, Journey, Person
+
+HEADER = (
+    "First Name,Last Name,member_id,role,status,water_baptism_date,"
+    "date_first_attended,date_first_invited,family,cluster,branch\n"
+)
+
+
+def csv_upload(body, header=HEADER, name="people.csv"):
+    return SimpleUploadedFile(name, (header + body).encode("utf-8"), content_type="text/csv")
+
+
+class PeopleBulkImportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.branch = Branch.objects.create(name="Main", code="MAIN")
+        cls.other_branch = Branch.objects.create(name="North", code="NORTH")
+        cls.cluster = Cluster.objects.create(code="C-1", name="Cluster 1", branch=cls.branch)
+        cls.admin = Person.objects.create_user(
+            username="import_admin",
+            password="x",
+            first_name="Import",
+            last_name="Admin",
+            role="ADMIN",
+            branch=cls.branch,
+        )
+        cls.existing = Person.objects.create_user(
+            username="jusantos",
+            password="x",
+            first_name="Juan",
+            last_name="Santos",
+            role="MEMBER",
+            branch=cls.branch,
+            member_id="LAMP-9",
+        )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def post(self, upload, **data):
+        return self.client.post(
+            "/api/people/people/bulk-import/",
+            {"file": upload, "branch": self.branch.pk, **data},
+            format="multipart",
+        )
+
+    def test_import_creates_people_families_memberships_and_journeys(self):
+        response = self.post(
+            csv_upload(
+                "maria,CRUZ,,visitor,,2024-03-01,2024-01-07,2023-12-20,Cruz Family,C-1,\n"
+                "Pedro,Cruz,LAMP-1,MEMBER,ACTIVE,,,,cruz family,,\n"
+                "Juana,Santos,,VISITOR,,,,2024-02-01,,,NORTH\n"
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        self.assertEqual(response.data["created"], 3)
+        self.assertEqual(response.data["errors"], [])
+        self.assertEqual(response.data["families_created"], 1)
+        # Two family memberships and one cluster membership.
+        self.assertEqual(response.data["memberships_created"], 3)
+
+        maria = Person.objects.get(username="macruz")
+        self.assertEqual((maria.first_name, maria.last_name), ("Maria", "Cruz"))
+        # Baptized visitors are imported as members, like the baptism signal does.
+        self.assertEqual((maria.role, maria.status), ("MEMBER", "ACTIVE"))
+        self.assertEqual(maria.branch, self.branch)
+        self.assertFalse(maria.has_usable_password())
+        self.assertEqual(list(maria.clusters.all()), [self.cluster])
+        family = Family.objects.get()
+        self.assertEqual(family.leader, maria)
+        self.assertEqual(set(family.members.all()), {maria, Person.objects.get(username="pecruz")})
+
+        self.assertEqual(
+            sorted(maria.journeys.values_list("type", "title", "date")),
+            [
+                ("BAPTISM", "Baptized in Jesus' name", date(2024, 3, 1)),
+                ("EVENT_ATTENDANCE", "First Attended", date(2024, 1, 7)),
+                ("NOTE", "Added to family: Cruz Family", maria.journeys.get(type="NOTE").date),
+            ],
+        )
+        juana = Person.objects.get(first_name="Juana")
+        self.assertEqual(juana.branch, self.other_branch)
+        self.assertEqual(
+            list(juana.journeys.values_list("title", "date")),
+            [("Invited", date(2024, 2, 1))],
+        )
+        self.assertEqual(Journey.objects.count(), response.data["journeys_created"])
+
+    def test_per_row_errors_and_matches_do_not_abort_the_batch(self):
+        response = self.post(
+            csv_upload(
+                "Juan,Santos,,,,,,,,,\n"  # existing person, same branch (name)
+                "Johnny,Santos,lamp-9,,,,,,,,\n"  # existing LAMP ID
+                ",NoFirst,,,,,,,,,\n"
+                "Ana,Reyes,,CHIEF,,,,,,,\n"
+                "Ana,Lopez,,,,2999-01-01,,,,,\n"
+                "Ana,Diaz,,,,,,,,C-404,\n"
+                "Ana,Ramos,,,,,,,,,NOPE\n"
+                "Rosa,Lim,,,,,,,,,\n"
+                "ROSA,LIM,,,,,,,,,\n"
+            )
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["rows"], 9)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(
+            response.data["matched"],
+            [
+                {"row": 2, "id": self.existing.pk, "match": "name"},
+                {"row": 3, "id": self.existing.pk, "match": "member_id"},
+            ],
+        )
+        errors = {error["row"]: error["errors"] for error in response.data["errors"]}
+        self.assertEqual(set(errors), {4, 5, 6, 7, 8, 10})
+        self.assertIn("first_name", errors[4])
+        self.assertIn("role", errors[5])
+        self.assertEqual(errors[6], {"water_baptism_date": ["Cannot be in the future."]})
+        self.assertEqual(errors[7], {"cluster": ["Unknown cluster code 'C-404'."]})
+        self.assertEqual(errors[8], {"branch": ["Unknown branch code 'NOPE'."]})
+        self.assertEqual(errors[10], {"non_field_errors": ["Duplicate of row 9 in this file."]})
+        self.assertTrue(Person.objects.filter(username="rolim").exists())
+
+    def test_same_name_in_another_branch_is_not_a_match(self):
+        response = self.post(csv_upload("Juan,Santos,,,,,,,,,NORTH\n"))
+
+        self.assertEqual(response.data["created"], 1)
+        # Username scheme matches PersonSerializer.create (first free suffix).
+        self.assertTrue(Person.objects.filter(username="jusantos1", branch=self.other_branch).exists())
+
+    def test_dry_run_writes_nothing(self):
+        people_before = Person.objects.count()
+
+        response = self.post(
+            csv_upload("Maria,Cruz,,VISITOR,,,,,Cruz Family,C-1,\nPedro,Cruz,,,,,,,Cruz Family,,\n"),
+            dry_run="true",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data["dry_run"])
+        self.assertEqual(response.data["created"], 2)
+        self.assertEqual(response.data["families_created"], 1)
+        self.assertEqual(response.data["memberships_created"], 3)
+        self.assertEqual(response.data["journeys_created"], 3)
+        self.assertEqual(Person.objects.count(), people_before)
+        self.assertFalse(Family.objects.exists())
+        self.assertFalse(Journey.objects.exists())
+
+    def test_queries_do_not_grow_with_rows_in_a_chunk(self):
+        def run(count, offset):
+            body = "".join(
+                f"Person{offset + n},Family{offset + n},,,,2024-01-01,2024-01-02,,Fam {offset + n},C-1,\n"
+                for n in range(count)
+            )
+            header, records = read_csv_rows(io.BytesIO((HEADER + body).encode()))
+            importer = PeopleImporter(default_branch=self.branch)
+            with CaptureQueriesContext(connection) as captured:
+                result = importer.run(records, header)
+            self.assertEqual(result.created, count)
+            return len(captured)
+
+        # Small enough that SQLite does not split the INSERTs into batches.
+        self.assertEqual(run(3, 0), run(20, 100))
+
+    def test_failed_chunk_does_not_leak_into_later_chunks(self):
+        body = (
+            "Ana,Cruz,,,,,,,Cruz,,\n"
+            "Ben,Reyes,,,,,,,,,\n"
+            "Ana,Cruz,,,,,,,Cruz,,\n"
+            "Carla,Cruz,,,,,,,Cruz,,\n"
+        )
+        header, records = read_csv_rows(io.BytesIO((HEADER + body).encode()))
+        bulk_create = Journey.objects.bulk_create
+        calls = []
+
+        def fail_first_chunk(objs, *args, **kwargs):
+            calls.append(len(objs))
+            if len(calls) == 1:
+                raise DatabaseError("boom")
+            return bulk_create(objs, *args, **kwargs)
+
+        importer = PeopleImporter(default_branch=self.branch, chunk_size=2)
+        with mock.patch.object(Journey.objects, "bulk_create", side_effect=fail_first_chunk):
+            result = importer.run(records, header)
+
+        self.assertEqual([error["row"] for error in result.errors], [2, 3])
+        self.assertEqual(result.created, 2)
+        self.assertEqual(result.families_created, 1)
+        self.assertEqual(result.memberships_created, 2)
+        self.assertEqual(result.journeys_created, 2)
+        self.assertFalse(Person.objects.filter(first_name="Ben").exists())
+        ana = Person.objects.get(first_name="Ana", last_name="Cruz")
+        self.assertEqual(ana.username, "ancruz")
+        family = Family.objects.get(name="Cruz")
+        self.assertEqual(family.leader, ana)
+        self.assertEqual(
+            set(family.members.values_list("first_name", flat=True)), {"Ana", "Carla"}
+        )
+
+    def test_xlsx_upload(self):
+        from openpyxl import Workbook
+
+        workbook = Workbook()
+        sheet = workbook.active
+        sheet.append(["first_name", "last_name", "member_id", "date_first_attended"])
+        sheet.append(["Lea", "Tan", 12345, date(2024, 5, 5)])
+        buffer = io.BytesIO()
+        workbook.save(buffer)
+
+        response = self.post(SimpleUploadedFile("people.xlsx", buffer.getvalue()))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.data)
+        person = Person.objects.get(username="letan")
+        self.assertEqual((person.member_id, person.date_first_attended), ("12345", date(2024, 5, 5)))
+
+    def test_rejects_unreadable_files_and_non_admins(self):
+        response = self.post(csv_upload("x\n", header="name\n"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("first_name", response.data["detail"])
+
+        response = self.post(SimpleUploadedFile("people.txt", b"first_name,last_name\n"))
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.client.force_authenticate(user=self.existing)
+        response = self.post(csv_upload("Ana,Tan,,,,,,,,,\n"))
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_management_command(self):
+        upload = csv_upload("Ana,Tan,,,,,,,,,\n,Broken,,,,,,,,,\n")
+        path = self._write_temp(upload.read())
+        out = StringIO()
+
+        call_command("import_people", path, "--branch", "MAIN", stdout=out)
+
+        self.assertTrue(Person.objects.filter(username="antan", branch=self.branch).exists())
+        self.assertIn("Row 3: first_name", out.getvalue())
+        self.assertIn("Created 1 people", out.getvalue())
+
+    def _write_temp(self, content):
+        import os
+        import tempfile
+
+        handle, path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, "wb") as temp:
+            temp.write(content)
+        self.addCleanup(os.remove, path)
+        return path
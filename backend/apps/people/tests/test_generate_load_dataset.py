@@ -0,0 +1,105 @@
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db.models import Count, Sum
+from django.test import TestCase
+
+from apps.attendance.models import AttendanceRecord
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.evangelism.models import Prospect
+from apps.finance.models import Donation, GivingLedgerMonth, Offering, Pledge
+from apps.lessons.models import PersonLessonProgress
+from apps.people.models import Branch, Journey, ModuleCoordinator, Person
+
+SMALL = [
+    "--branches", "2",
+    "--people", "80",
+    "--clusters", "4",
+    "--years", "1",
+    "--prospects", "15",
+    "--donations", "10",
+    "--pledges", "4",
+    "--seed", "7",
+]
+
+
+def fingerprint():
+    """Content of the generated dataset, independent of primary keys."""
+    return {
+        "people": list(
+            Person.objects.filter(username__startswith="load_")
+            .order_by("username")
+            .values_list("username", "first_name", "role", "branch__code", "date_first_attended")
+        ),
+        "rosters": list(
+            Cluster.objects.filter(code__startswith="LOAD-")
+            .order_by("code")
+            .annotate(size=Count("members"))
+            .values_list("code", "coordinator__username", "size")
+        ),
+        "reports": list(
+            ClusterWeeklyReport.objects.order_by("cluster__code", "year", "week_number")
+            .annotate(present=Count("members_attended"))
+            .values_list("cluster__code", "year", "week_number", "present", "offerings")
+        ),
+        "prospects": list(
+            Prospect.objects.order_by("invited_by__username", "date_first_invited", "first_name")
+            .values_list("invited_by__username", "pipeline_stage", "date_first_invited")
+        ),
+        "progress": PersonLessonProgress.objects.count(),
+        "attendance": AttendanceRecord.objects.count(),
+        "offerings": Offering.objects.aggregate(total=Sum("amount"))["total"],
+        "donations": list(Donation.objects.order_by("receipt_number").values_list("receipt_number", "amount")),
+        "pledges": list(Pledge.objects.order_by("pledge_title").values_list("pledge_title", "amount_received")),
+    }
+
+
+class GenerateLoadDatasetTests(TestCase):
+    def test_generates_every_section_without_signal_side_effects(self):
+        call_command("generate_load_dataset", *SMALL, stdout=StringIO())
+
+        self.assertEqual(Person.objects.filter(username__startswith="load_").count(), 80)
+        self.assertEqual(Branch.objects.filter(code__startswith="LOAD-").count(), 2)
+        self.assertEqual(Cluster.objects.filter(code__startswith="LOAD-").count(), 4)
+        self.assertGreater(ClusterWeeklyReport.objects.count(), 150)
+        self.assertTrue(ClusterWeeklyReport.members_attended.through.objects.exists())
+        self.assertEqual(Prospect.objects.count(), 15)
+        self.assertTrue(PersonLessonProgress.objects.exists())
+        self.assertTrue(AttendanceRecord.objects.exists())
+        self.assertEqual(Offering.objects.count(), 2 * 52)
+        self.assertEqual(Donation.objects.count(), 10)
+        for pledge in Pledge.objects.all():
+            self.assertEqual(pledge.amount_received, pledge.contributions_total())
+        self.assertEqual(
+            GivingLedgerMonth.objects.filter(source="DONATION").aggregate(total=Sum("total")),
+            Donation.objects.aggregate(total=Sum("amount")),
+        )
+        # bulk_create bypasses save() signals: nothing derived was written.
+        self.assertFalse(Journey.objects.exists())
+        self.assertFalse(ModuleCoordinator.objects.exists())
+
+    def test_dataset_without_members_skips_member_sections(self):
+        with mock.patch("apps.people.load_dataset.ROLE_WEIGHTS", (("VISITOR", 1),)):
+            call_command("generate_load_dataset", *SMALL, stdout=StringIO())
+
+        self.assertFalse(Person.objects.filter(role="MEMBER").exists())
+        self.assertFalse(Prospect.objects.exists())
+        self.assertFalse(Pledge.objects.exists())
+        self.assertEqual(Donation.objects.filter(is_anonymous=True, donor=None).count(), 10)
+
+    def test_same_seed_reproduces_the_same_dataset(self):
+        call_command("generate_load_dataset", *SMALL, stdout=StringIO())
+        first = fingerprint()
+
+        with self.assertRaises(CommandError):
+            call_command("generate_load_dataset", *SMALL, stdout=StringIO())
+
+        call_command("generate_load_dataset", *SMALL, "--clear", stdout=StringIO())
+        self.assertEqual(fingerprint(), first)
+
+        call_command("generate_load_dataset", "--clear-only", stdout=StringIO())
+        self.assertFalse(Person.objects.filter(username__startswith="load_").exists())
+        self.assertFalse(ClusterWeeklyReport.objects.exists())
+        self.assertFalse(AttendanceRecord.objects.exists())
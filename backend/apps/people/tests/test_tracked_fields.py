@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.db import IntegrityError, transaction
+from django.test import TestCase
+
+from apps.clusters.models import Cluster
+from apps.people.models import Journey, ModuleCoordinator, Person
+
+
+class PersonTrackedFieldsTests(TestCase):
+    def setUp(self):
+        Person.objects.create_user(
+            username="tracked_visitor",
+            password="pw",
+            role="VISITOR",
+            status="ONGOING",
+            date_first_attended=date(2026, 1, 4),
+        )
+        self.person = Person.objects.get(username="tracked_visitor")
+
+    def test_untracked_edit_saves_with_a_single_query(self):
+        Person.objects.create_user(username="tracked_member", password="pw", role="MEMBER")
+        member = Person.objects.get(username="tracked_member")
+        member.first_name = "Renamed"
+        with self.assertNumQueries(1):
+            member.save()
+
+    def test_untracked_edit_backfills_a_missing_invited_journey(self):
+        Journey.objects.filter(user=self.person, title="Invited").delete()
+        self.person.first_name = "Renamed"
+        self.person.save()
+        self.assertTrue(Journey.objects.filter(user=self.person, title="Invited").exists())
+
+    def test_failed_save_keeps_the_snapshot_for_the_retry(self):
+        Person.objects.create_user(username="tracked_taken", password="pw", role="MEMBER")
+        self.person.water_baptism_date = date(2026, 2, 1)
+        self.person.username = "tracked_taken"
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            self.person.save()
+        self.assertFalse(Journey.objects.filter(user=self.person, type="BAPTISM").exists())
+
+        self.person.username = "tracked_visitor"
+        self.person.save()
+        self.assertTrue(Journey.objects.filter(user=self.person, type="BAPTISM").exists())
+
+    def test_baptism_date_change_is_detected_without_refetch(self):
+        self.person.water_baptism_date = date(2026, 2, 1)
+        self.person.save()
+
+        self.person.refresh_from_db()
+        self.assertEqual(self.person.role, "MEMBER")
+        self.assertEqual(self.person.status, "ACTIVE")
+        journey = Journey.objects.get(user=self.person, type="BAPTISM")
+        self.assertEqual(journey.date, date(2026, 2, 1))
+
+        # The snapshot follows each save: clearing the date is seen as a change.
+        self.person.water_baptism_date = None
+        self.person.save()
+        self.assertFalse(Journey.objects.filter(user=self.person, type="BAPTISM").exists())
+        self.person.refresh_from_db()
+        self.assertEqual(self.person.role, "VISITOR")
+
+    def test_instance_not_loaded_from_db_falls_back_to_one_lookup(self):
+        detached = Person(pk=self.person.pk)
+        self.assertEqual(detached.tracked_original_values()["role"], "VISITOR")
+
+    def test_deferred_tracked_field_is_fetched_once(self):
+        partial = Person.objects.only("id", "first_name").get(pk=self.person.pk)
+        with self.assertNumQueries(1):
+            originals = partial.tracked_original_values()
+        self.assertEqual(originals["date_first_attended"], date(2026, 1, 4))
+
+
+class ClusterTrackedCoordinatorTests(TestCase):
+    def setUp(self):
+        self.first = Person.objects.create_user(username="tracked_coord_a", password="pw", role="MEMBER")
+        self.second = Person.objects.create_user(username="tracked_coord_b", password="pw", role="MEMBER")
+        Cluster.objects.create(code="TRK", name="Tracked", coordinator=self.first)
+        self.cluster = Cluster.objects.get(code="TRK")
+
+    def _coordinator_ids(self):
+        return set(
+            ModuleCoordinator.objects.filter(
+                module=ModuleCoordinator.ModuleType.CLUSTER,
+                resource_id=self.cluster.id,
+                level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
+            ).values_list("person_id", flat=True)
+        )
+
+    def test_unchanged_coordinator_skips_sync(self):
+        self.cluster.name = "Renamed"
+        with self.assertNumQueries(1):
+            self.cluster.save()
+        self.assertEqual(self._coordinator_ids(), {self.first.id})
+
+    def test_coordinator_change_moves_assignment(self):
+        self.cluster.coordinator = self.second
+        self.cluster.save()
+        self.assertEqual(self._coordinator_ids(), {self.second.id})
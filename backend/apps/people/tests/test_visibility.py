@@ -0,0 +1,172 @@
+"""Cached per-viewer visibility scopes (apps/people/visibility.py)."""
+
+import pickle
+from datetime import date, datetime, timezone
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.evangelism.models import EvangelismGroup
+from apps.lessons.models import LessonSessionReport
+from apps.people.models import (
+    Branch,
+    CacheGeneration,
+    Family,
+    Journey,
+    ModuleCoordinator,
+    Person,
+)
+from apps.people.visibility import PersonIdSet, current_visibility_generation, people_scope
+from apps.reports.analytics_cache import analytics_generation, bump_analytics_generation
+
+
+class VisibilityScopeTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.branch = Branch.objects.create(name="Scope Branch", code="SCOPE")
+        self.other_branch = Branch.objects.create(name="Far Branch", code="FAR")
+        self.coordinator = self._person("coord")
+        self.member = self._person("member")
+        self.outsider = self._person("outsider")
+        self.far_member = self._person("far", branch=self.other_branch)
+        self.cluster = Cluster.objects.create(
+            code="SC-1", name="Scope Cluster", branch=self.branch, coordinator=self.coordinator
+        )
+        self.cluster.members.add(self.member, self.far_member)
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.coordinator)
+
+    def _person(self, username, *, role="MEMBER", branch=None):
+        return Person.objects.create_user(
+            username=username,
+            password="x",
+            first_name=username.title(),
+            last_name="Scope",
+            role=role,
+            branch=branch or self.branch,
+        )
+
+    def _list_rows(self):
+        response = self.client.get("/api/people/people/", {"page_size": 100})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return {row["id"]: row for row in response.data["results"]}
+
+    def test_person_id_set_is_sorted_and_pickles_compactly(self):
+        ids = PersonIdSet([9, 3, None, 3, 27])
+        self.assertEqual(list(ids), [3, 9, 27])
+        self.assertIn(9, ids)
+        self.assertNotIn(10, ids)
+        restored = pickle.loads(pickle.dumps(ids))
+        self.assertEqual(restored, ids)
+        self.assertLess(len(pickle.dumps(PersonIdSet(range(10_000)))), 100_000)
+
+    def test_coordinator_lists_branch_but_opens_only_cluster_profiles(self):
+        rows = self._list_rows()
+        self.assertTrue(rows[self.member.id]["can_view_profile"])
+        self.assertFalse(rows[self.outsider.id]["can_view_profile"])
+        # The other-branch cluster member is in the ID set but outside the branch.
+        self.assertNotIn(self.far_member.id, rows)
+
+        self.assertEqual(
+            self.client.get(f"/api/people/people/{self.member.id}/").status_code,
+            status.HTTP_200_OK,
+        )
+        self.assertEqual(
+            self.client.get(f"/api/people/people/{self.outsider.id}/").status_code,
+            status.HTTP_404_NOT_FOUND,
+        )
+
+    def test_cached_scope_skips_resolution_queries(self):
+        people_scope(self.coordinator, for_profile=True)
+        # Only the generation lookup runs once the scope is cached.
+        with self.assertNumQueries(1):
+            scope = people_scope(self.coordinator, for_profile=True)
+        self.assertIn(self.member.id, scope.ids)
+
+    def test_generations_are_namespaced(self):
+        generation = current_visibility_generation()
+        bump_analytics_generation("scope-test")
+        self.assertEqual(current_visibility_generation(), generation)
+
+        analytics = analytics_generation("scope-test")
+        self.cluster.members.add(self.outsider)
+        self.assertGreater(current_visibility_generation(), generation)
+        self.assertEqual(analytics_generation("scope-test"), analytics)
+        self.assertEqual(
+            set(CacheGeneration.objects.values_list("namespace", flat=True)),
+            {"people.visibility", "analytics.scope-test"},
+        )
+
+    def test_membership_and_assignment_changes_invalidate(self):
+        people_scope(self.coordinator, for_profile=True)
+        generation = current_visibility_generation()
+
+        self.cluster.members.add(self.outsider)
+        self.assertGreater(current_visibility_generation(), generation)
+        self.assertTrue(self._list_rows()[self.outsider.id]["can_view_profile"])
+
+        family = Family.objects.create(name="Scope Family")
+        generation = current_visibility_generation()
+        family.members.add(self.member)
+        self.assertGreater(current_visibility_generation(), generation)
+
+        generation = current_visibility_generation()
+        ModuleCoordinator.objects.create(
+            person=self.member,
+            module=ModuleCoordinator.ModuleType.EVANGELISM,
+            level=ModuleCoordinator.CoordinatorLevel.BIBLE_SHARER,
+        )
+        self.assertGreater(current_visibility_generation(), generation)
+
+    def test_deleting_a_family_or_group_invalidates(self):
+        family = Family.objects.create(name="Doomed Family")
+        family.members.add(self.member)
+        group = EvangelismGroup.objects.create(name="Doomed Group", cluster=self.cluster)
+        group.members.add(self.member)
+
+        for doomed in (family, group):
+            generation = current_visibility_generation()
+            doomed.delete()
+            self.assertGreater(current_visibility_generation(), generation)
+
+    def test_lesson_report_edits_invalidate_only_for_teacher_or_student(self):
+        report = LessonSessionReport.objects.create(
+            teacher=self.coordinator,
+            student=self.outsider,
+            session_date=date(2026, 1, 4),
+            session_start=datetime(2026, 1, 4, 9, tzinfo=timezone.utc),
+        )
+        report = LessonSessionReport.objects.get(pk=report.pk)
+        generation = current_visibility_generation()
+        report.remarks = "Went well"
+        report.save()
+        self.assertEqual(current_visibility_generation(), generation)
+
+        report.student = self.member
+        report.save()
+        self.assertGreater(current_visibility_generation(), generation)
+
+    def test_role_and_branch_are_applied_live(self):
+        self.assertTrue(self._list_rows()[self.member.id]["can_view_profile"])
+        self.member.role = "ADMIN"
+        self.member.save()
+        # No invalidation needed: ADMINs are excluded at query time.
+        self.assertNotIn(self.member.id, self._list_rows())
+
+    def test_journeys_follow_the_cached_scope(self):
+        own = Journey.objects.create(user=self.coordinator, title="Own", date="2025-01-01", type="NOTE")
+        member = Journey.objects.create(user=self.member, title="Member", date="2025-01-01", type="NOTE")
+        outsider = Journey.objects.create(
+            user=self.outsider, title="Outsider", date="2025-01-01", type="NOTE"
+        )
+        # Cluster.coordinator already synced a CLUSTER COORDINATOR assignment.
+        response = self.client.get("/api/people/journeys/")
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        results = response.data["results"] if isinstance(response.data, dict) else response.data
+        ids = {row["id"] for row in results}
+        self.assertIn(own.id, ids)
+        self.assertIn(member.id, ids)
+        self.assertNotIn(outsider.id, ids)
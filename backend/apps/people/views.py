@@ -1,7 +1,7 @@
 from django.db.models import Q, Count
 from rest_framework import viewsets, filters, status
 from rest_framework.decorators import api_view, permission_classes, action
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.parsers import FormParser, MultiPartParser
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
@@ -15,6 +15,7 @@ from .models import (
     PeopleAutomationSetting,
 )
 from .filters import PersonFilter, FamilyFilter
+from .visibility import journey_scope, people_scope
 from .serializers import (
     BranchSerializer,
     PersonSerializer,
@@ -27,6 +28,7 @@ from .serializers import (
     PeopleAutomationSettingSerializer,
     ModuleCoordinatorBulkCreateSerializer,
 )
+from core.pagination import StandardPagination
 from apps.authentication.permissions import (
     IsMemberOrAbove,
     IsAdminOrPastor,
@@ -39,7 +41,7 @@ from apps.authentication.permissions import (
 )
 
 
-class PersonPagination(PageNumberPagination):
+class PersonPagination(StandardPagination):
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -97,6 +99,13 @@ class PersonViewSet(viewsets.ModelViewSet):
             return PersonListSerializer
         return PersonSerializer
 
+    def _people_scope(self, *, for_profile=False):
+        """Viewer's cached scope (see apps/people/visibility.py), once per request."""
+        scopes = self.__dict__.setdefault("_people_scopes", {})
+        if for_profile not in scopes:
+            scopes[for_profile] = people_scope(self.request.user, for_profile=for_profile)
+        return scopes[for_profile]
+
     def _scoped_people_queryset(self, *, for_profile=False):
         """
         Scope people for list/search vs profile/mutation access.
@@ -105,189 +114,9 @@ class PersonViewSet(viewsets.ModelViewSet):
         assign members), but profile retrieve/update stays limited to people in
         their managed cluster(s) (plus other module scopes).
         """
-        user = self.request.user
-        queryset = super().get_queryset()
-
-        # ADMIN users: Can see all people (including other ADMINs)
-        if user.role == "ADMIN":
-            return queryset
-
-        # Non-ADMIN users: Exclude ADMIN users (they're invisible to non-admins)
-        queryset = queryset.exclude(role="ADMIN")
-
-        # Apply branch filtering helper function
-        def apply_branch_filter(qs):
-            """Apply branch filtering based on user's branch access"""
-            if user.can_see_all_branches():
-                return qs
-            if user.branch:
-                return qs.filter(branch=user.branch)
-            # If user has no branch, return empty queryset for safety
-            return qs.none()
-
-        # PASTOR: Filter by branch unless from headquarters
-        if user.role == "PASTOR":
-            return apply_branch_filter(queryset)
-
-        # Senior Coordinator: Filter by branch unless from headquarters
-        if user.is_senior_coordinator():
-            return apply_branch_filter(queryset)
-
-        # Collect people from all module assignments
-        people_querysets = []
-
-        # 1. Cluster Coordinator
-        from apps.clusters.models import Cluster
-        from apps.clusters.permissions import is_non_senior_cluster_coordinator
-
-        coordinator_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.CLUSTER,
-            level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
-        )
-        is_cluster_coord = (
-            coordinator_assignments.exists()
-            or Cluster.objects.filter(coordinator=user).exists()
+        return self._people_scope(for_profile=for_profile).filter(
+            super().get_queryset(), self.request.user
         )
-        if is_cluster_coord and is_non_senior_cluster_coordinator(user):
-            if for_profile:
-                # Profile: only members (and family members) of managed clusters
-                cluster_ids = [
-                    assignment.resource_id
-                    for assignment in coordinator_assignments
-                    if assignment.resource_id
-                ]
-                coordinator_clusters = Cluster.objects.filter(coordinator=user)
-                if cluster_ids:
-                    assigned_clusters = Cluster.objects.filter(id__in=cluster_ids)
-                    all_clusters = (coordinator_clusters | assigned_clusters).distinct()
-                else:
-                    all_clusters = coordinator_clusters
-
-                cluster_member_ids = all_clusters.values_list(
-                    "members__id", flat=True
-                ).distinct()
-                family_member_ids = all_clusters.values_list(
-                    "families__members__id", flat=True
-                ).distinct()
-                all_member_ids = list(
-                    set(list(cluster_member_ids) + list(family_member_ids))
-                )
-                if all_member_ids:
-                    people_querysets.append(queryset.filter(id__in=all_member_ids))
-            else:
-                # List/search: all same-branch people (branch filter applied below)
-                people_querysets.append(queryset)
-
-        # 2. Sunday School Teacher: Students in classes where they are teacher/assistant
-        sunday_school_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.SUNDAY_SCHOOL,
-            level=ModuleCoordinator.CoordinatorLevel.TEACHER,
-        )
-        if sunday_school_assignments.exists():
-            from apps.sunday_school.models import SundaySchoolClassMember
-
-            # Get class IDs from assignments
-            class_ids = [
-                assignment.resource_id
-                for assignment in sunday_school_assignments
-                if assignment.resource_id
-            ]
-            if class_ids:
-                # Get students from these classes
-                student_ids = (
-                    SundaySchoolClassMember.objects.filter(
-                        sunday_school_class_id__in=class_ids, role__in=["STUDENT"]
-                    )
-                    .values_list("person_id", flat=True)
-                    .distinct()
-                )
-                if student_ids:
-                    people_querysets.append(queryset.filter(id__in=student_ids))
-            else:
-                # Module-wide: Get all students from classes where user is teacher/assistant
-                teacher_class_ids = (
-                    SundaySchoolClassMember.objects.filter(
-                        person=user, role__in=["TEACHER", "ASSISTANT_TEACHER"]
-                    )
-                    .values_list("sunday_school_class_id", flat=True)
-                    .distinct()
-                )
-                if teacher_class_ids:
-                    student_ids = (
-                        SundaySchoolClassMember.objects.filter(
-                            sunday_school_class_id__in=teacher_class_ids, role="STUDENT"
-                        )
-                        .values_list("person_id", flat=True)
-                        .distinct()
-                    )
-                    if student_ids:
-                        people_querysets.append(queryset.filter(id__in=student_ids))
-
-        # 3. Lessons Teacher: Students in their lesson sessions
-        lessons_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.LESSONS,
-            level=ModuleCoordinator.CoordinatorLevel.TEACHER,
-        )
-        if lessons_assignments.exists():
-            from apps.lessons.models import LessonSessionReport
-
-            # Get students where user is the teacher
-            student_ids = (
-                LessonSessionReport.objects.filter(teacher=user)
-                .values_list("student_id", flat=True)
-                .distinct()
-            )
-            if student_ids:
-                people_querysets.append(queryset.filter(id__in=student_ids))
-
-        # 4. Bible Sharer: Members of assigned evangelism groups
-        bible_sharer_assignments = user.module_coordinator_assignments.filter(
-            module=ModuleCoordinator.ModuleType.EVANGELISM,
-            level=ModuleCoordinator.CoordinatorLevel.BIBLE_SHARER,
-        )
-        if bible_sharer_assignments.exists():
-            from apps.evangelism.models import EvangelismGroup
-
-            group_ids = [
-                assignment.resource_id
-                for assignment in bible_sharer_assignments
-                if assignment.resource_id
-            ]
-            if group_ids:
-                member_ids = (
-                    EvangelismGroup.objects.filter(id__in=group_ids)
-                    .values_list("members__id", flat=True)
-                    .distinct()
-                )
-                if member_ids:
-                    people_querysets.append(queryset.filter(id__in=member_ids))
-
-        # Combine all querysets using union
-        if people_querysets:
-            combined_queryset = people_querysets[0]
-            for qs in people_querysets[1:]:
-                combined_queryset = combined_queryset | qs
-            return apply_branch_filter(combined_queryset).distinct()
-
-        # MEMBER: Only themselves and family members
-        if user.role == "MEMBER":
-            # Get all family members (excluding ADMINs)
-            family_member_ids = (
-                Person.objects.filter(families__members=user)
-                .exclude(role="ADMIN")
-                .values_list("id", flat=True)
-                .distinct()
-            )
-            # Include themselves and family members
-            all_ids = list(family_member_ids) + [user.id]
-            member_queryset = queryset.filter(id__in=all_ids)
-            # Apply branch filtering
-            if user.branch:
-                return member_queryset.filter(branch=user.branch)
-            return member_queryset
-
-        # Default: empty queryset for safety
-        return queryset.none()
 
     def get_queryset(self):
         # List/search may be wider than profile for cluster coordinators.
@@ -325,20 +154,15 @@ class PersonViewSet(viewsets.ModelViewSet):
             if user.role in ("ADMIN", "PASTOR") or user.is_senior_coordinator():
                 context["profile_all_visible"] = True
             else:
-                profile_ids = set(
-                    self._scoped_people_queryset(for_profile=True).values_list(
-                        "pk", flat=True
-                    )
-                )
-                profile_ids.add(user.pk)
-                context["profile_visible_ids"] = profile_ids
+                # Sorted ID array from the visibility cache, not a fresh set per page.
+                context["profile_scope"] = self._people_scope(for_profile=True)
         return context
 
     def get_permissions(self):
         """
         Override to set permissions based on action.
         """
-        if self.action == "possible_duplicates":
+        if self.action in ("possible_duplicates", "bulk_import"):
             return [IsAuthenticatedAndNotVisitor(), IsAdmin()]
         if self.action in ["list", "retrieve"]:
             # Read: All authenticated non-visitors
@@ -394,8 +218,53 @@ class PersonViewSet(viewsets.ModelViewSet):
         )
         return Response({"groups": groups, "count": len(groups)})
 
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="bulk-import",
+        parser_classes=[MultiPartParser, FormParser],
+    )
+    def bulk_import(self, request):
+        """
+        ADMIN-only: import people from a CSV/XLSX upload (``file``).
+
+        ``branch`` (id) is used for rows without a branch code; ``dry_run``
+        validates and matches without writing. Invalid and matching rows are
+        reported per row and do not abort the import.
+        """
+        from apps.people.bulk_import import ImportFileError, import_people
+
+        upload = request.FILES.get("file")
+        if upload is None:
+            return Response(
+                {"file": "Upload a .csv or .xlsx file."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        default_branch = None
+        branch_raw = request.data.get("branch")
+        if branch_raw not in (None, ""):
+            try:
+                default_branch = Branch.objects.get(pk=int(branch_raw))
+            except (TypeError, ValueError, Branch.DoesNotExist):
+                return Response(
+                    {"branch": "Unknown branch."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        dry_run = str(request.data.get("dry_run", "")).lower() in ("1", "true", "yes")
+
+        try:
+            result = import_people(
+                upload,
+                upload.name,
+                default_branch=default_branch,
+                dry_run=dry_run,
+            )
+        except ImportFileError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return Response(result.as_dict())
+
 
-class FamilyPagination(PageNumberPagination):
+class FamilyPagination(StandardPagination):
     page_size = 25
     page_size_query_param = "page_size"
     max_page_size = 100
@@ -611,63 +480,11 @@ class JourneyViewSet(viewsets.ModelViewSet):
         3. Cluster Coordinators can see journeys for members of their assigned cluster(s) + their own
         4. Users can always see their own journeys
         5. Otherwise, return empty queryset
+
+        The viewer's scope is cached (apps/people/visibility.py).
         """
         user = self.request.user
-        queryset = super().get_queryset()
-
-        # Helper function to filter journeys by branch
-        def filter_journeys_by_branch(qs):
-            """Filter journeys based on user's branch"""
-            if user.can_see_all_branches():
-                return qs
-            if user.branch:
-                return qs.filter(user__branch=user.branch)
-            return qs.none()
-
-        # 1. ADMIN - full access
-        if user.role == "ADMIN":
-            return queryset
-
-        # PASTOR - filter by branch unless from headquarters
-        if user.role == "PASTOR":
-            return filter_journeys_by_branch(queryset)
-
-        # 2. Senior Coordinators in allowed modules - filter by branch unless from headquarters
-        allowed_modules = [
-            ModuleCoordinator.ModuleType.CLUSTER,
-            ModuleCoordinator.ModuleType.EVANGELISM,
-            ModuleCoordinator.ModuleType.SUNDAY_SCHOOL,
-            ModuleCoordinator.ModuleType.LESSONS,
-        ]
-        for module in allowed_modules:
-            if user.is_senior_coordinator(module):
-                return filter_journeys_by_branch(queryset)
-
-        # 3. Cluster Coordinator - can see journeys for members of their cluster(s) + their own
-        if user.is_module_coordinator(
-            ModuleCoordinator.ModuleType.CLUSTER,
-            level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
-        ):
-            from apps.clusters.models import Cluster
-            from apps.clusters.permissions import managed_cluster_ids_for_coordinator
-
-            cluster_ids = managed_cluster_ids_for_coordinator(user)
-            if not cluster_ids:
-                return queryset.filter(user=user)
-            cluster_member_ids = (
-                Cluster.objects.filter(id__in=cluster_ids)
-                .values_list("members__id", flat=True)
-                .distinct()
-            )
-            cluster_journeys = queryset.filter(
-                user__id__in=list(cluster_member_ids) + [user.id]
-            ).distinct()
-            if user.branch:
-                return cluster_journeys.filter(user__branch=user.branch)
-            return cluster_journeys
-
-        # 4. Otherwise - only own journeys
-        return queryset.filter(user=user)
+        return journey_scope(user).filter(super().get_queryset(), user, person_field="user")
 
     @action(detail=True, methods=['post'])
     def update_status(self, request, pk=None):
@@ -733,6 +550,7 @@ class ModuleSettingViewSet(viewsets.ModelViewSet):
 
     queryset = ModuleSetting.objects.select_related("updated_by").all()
     serializer_class = ModuleSettingSerializer
+    pagination_class = None  # One row per module
     permission_classes = [IsAuthenticatedAndNotVisitor]
     http_method_names = ["get", "put", "patch", "head", "options"]
     ordering = ["module"]
@@ -779,6 +597,7 @@ class BranchViewSet(viewsets.ModelViewSet):
 
     queryset = Branch.objects.all()
     serializer_class = BranchSerializer
+    pagination_class = None  # Small reference table
     permission_classes = [IsAuthenticatedAndNotVisitor]
     filter_backends = [DjangoFilterBackend, filters.SearchFilter]
     filterset_fields = ["is_headquarters", "is_active"]
@@ -0,0 +1,343 @@
+"""
+Per-viewer visibility scopes for people lists, profiles and journeys.
+
+Which people a non-admin viewer may see depends on their role, coordinator
+assignments and the memberships behind them (managed clusters and their
+families, Sunday school classes, lesson session reports, Bible-sharer
+groups, own families). Resolving that takes a dozen queries, so the result
+is cached per viewer as a :class:`PersonScope` whose explicit IDs are kept
+as a sorted int64 array.
+
+Cache keys embed the ``people.visibility`` cache generation
+(apps/people/cache_generation.py). The
+handlers in ``apps/people/signals.py`` bump it on every change that can
+widen or narrow a scope, so all workers stop using stale scopes at once.
+Code that changes memberships with ``bulk_create`` / ``QuerySet.update``
+calls :func:`bump_visibility_generation` itself.
+
+Role and branch rules are applied in SQL at query time (and to loaded
+objects by :meth:`PersonScope.allows`), so role or branch edits on people
+never leave a cached scope stale.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from .cache_generation import bump_generation, current_generation
+from .models import ModuleCoordinator, Person
+
+CACHE_KEY_PREFIX = "people:visibility"
+GENERATION_NAMESPACE = "people.visibility"
+DEFAULT_CACHE_SECONDS = 600
+
+# Branch rules applied on top of the scope's IDs.
+ANY_BRANCH = "any"
+# can_see_all_branches(), else the viewer's branch, else nobody.
+VIEWER_BRANCHES = "viewer"
+# The viewer's branch when they have one, else any branch.
+OWN_BRANCH_IF_SET = "own_if_set"
+
+
+class PersonIdSet:
+    """Sorted person IDs in an int64 array; membership is a binary search."""
+
+    __slots__ = ("_ids",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._ids = array("q", sorted({pk for pk in ids if pk is not None}))
+
+    def __contains__(self, pk) -> bool:
+        index = bisect_left(self._ids, pk)
+        return index < len(self._ids) and self._ids[index] == pk
+
+    def __iter__(self):
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PersonIdSet) and self._ids == other._ids
+
+    def __getstate__(self):
+        return self._ids.tobytes()
+
+    def __setstate__(self, state):
+        self._ids = array("q")
+        self._ids.frombytes(state)
+
+
+@dataclass(frozen=True)
+class PersonScope:
+    """
+    People a viewer may see.
+
+    ``ids`` None means not limited to explicit IDs; ``empty`` means nobody.
+    """
+
+    ids: Optional[PersonIdSet] = None
+    branch_rule: str = ANY_BRANCH
+    exclude_admins: bool = False
+    empty: bool = False
+
+    def filter(self, queryset, viewer, person_field: Optional[str] = None):
+        """Restrict ``queryset`` (people, or rows pointing at people via ``person_field``)."""
+        if self.empty:
+            return queryset.none()
+
+        def path(name):
+            return f"{person_field}__{name}" if person_field else name
+
+        if self.exclude_admins:
+            queryset = queryset.exclude(**{path("role"): "ADMIN"})
+        if self.ids is not None:
+            queryset = queryset.filter(**{path("pk__in"): list(self.ids)})
+        if self.branch_rule == VIEWER_BRANCHES:
+            if viewer.can_see_all_branches():
+                return queryset
+            if not viewer.branch_id:
+                return queryset.none()
+            return queryset.filter(**{path("branch_id"): viewer.branch_id})
+        if self.branch_rule == OWN_BRANCH_IF_SET and viewer.branch_id:
+            return queryset.filter(**{path("branch_id"): viewer.branch_id})
+        return queryset
+
+    def allows(self, person, viewer) -> bool:
+        """In-memory equivalent of :meth:`filter` for a loaded person."""
+        if self.empty:
+            return False
+        if self.exclude_admins and person.role == "ADMIN":
+            return False
+        if self.ids is not None and person.pk not in self.ids:
+            return False
+        if self.branch_rule == VIEWER_BRANCHES:
+            if viewer.can_see_all_branches():
+                return True
+            return bool(viewer.branch_id) and person.branch_id == viewer.branch_id
+        if self.branch_rule == OWN_BRANCH_IF_SET and viewer.branch_id:
+            return person.branch_id == viewer.branch_id
+        return True
+
+
+ALL_PEOPLE = PersonScope()
+NOBODY = PersonScope(empty=True)
+
+
+def current_visibility_generation() -> int:
+    return current_generation(GENERATION_NAMESPACE)
+
+
+def bump_visibility_generation() -> None:
+    """Invalidate every cached scope (takes effect for all workers on commit)."""
+    bump_generation(GENERATION_NAMESPACE)
+
+
+def _cached_scope(viewer, name: str, compute) -> PersonScope:
+    timeout = getattr(settings, "PEOPLE_VISIBILITY_CACHE_SECONDS", DEFAULT_CACHE_SECONDS)
+    if not timeout:
+        return compute(viewer)
+    # date_joined guards against reused primary keys (e.g. a restored database).
+    joined = int(viewer.date_joined.timestamp() * 1_000_000) if viewer.date_joined else 0
+    key = (
+        f"{CACHE_KEY_PREFIX}:{current_visibility_generation()}:"
+        f"{viewer.pk}:{joined}:{viewer.role}:{name}"
+    )
+    scope = cache.get(key)
+    if scope is None:
+        scope = compute(viewer)
+        cache.set(key, scope, timeout)
+    return scope
+
+
+def people_scope(viewer, *, for_profile: bool = False) -> PersonScope:
+    """
+    People the viewer may list/search (``for_profile=False``) or open.
+
+    Cluster coordinators may list/search same-branch people (to find and
+    assign members), but profile retrieve/update stays limited to people in
+    their managed cluster(s) (plus other module scopes).
+    """
+    if viewer.role == "ADMIN":
+        return ALL_PEOPLE
+    if viewer.role == "PASTOR":
+        return PersonScope(branch_rule=VIEWER_BRANCHES, exclude_admins=True)
+    name = "profile" if for_profile else "list"
+    return _cached_scope(
+        viewer, name, lambda user: _compute_people_scope(user, for_profile=for_profile)
+    )
+
+
+def journey_scope(viewer) -> PersonScope:
+    """People whose journeys the viewer may see (always including their own)."""
+    if viewer.role == "ADMIN":
+        return ALL_PEOPLE
+    if viewer.role == "PASTOR":
+        return PersonScope(branch_rule=VIEWER_BRANCHES)
+    return _cached_scope(viewer, "journeys", _compute_journey_scope)
+
+
+def _compute_people_scope(user, *, for_profile: bool) -> PersonScope:
+    from apps.clusters.models import Cluster
+    from apps.clusters.permissions import is_non_senior_cluster_coordinator
+
+    # Senior Coordinator: Filter by branch unless from headquarters
+    if user.is_senior_coordinator():
+        return PersonScope(branch_rule=VIEWER_BRANCHES, exclude_admins=True)
+
+    assignments = list(
+        user.module_coordinator_assignments.values_list("module", "level", "resource_id")
+    )
+
+    def resource_ids(module, level):
+        return [
+            resource_id
+            for row_module, row_level, resource_id in assignments
+            if row_module == module and row_level == level and resource_id
+        ]
+
+    def has_assignment(module, level):
+        return any(
+            row_module == module and row_level == level
+            for row_module, row_level, _ in assignments
+        )
+
+    visible_ids = set()
+    matched = False
+
+    # 1. Cluster Coordinator
+    is_cluster_coord = has_assignment(
+        ModuleCoordinator.ModuleType.CLUSTER, ModuleCoordinator.CoordinatorLevel.COORDINATOR
+    ) or Cluster.objects.filter(coordinator=user).exists()
+    if is_cluster_coord and is_non_senior_cluster_coordinator(user):
+        if not for_profile:
+            # List/search: all same-branch people
+            return PersonScope(branch_rule=VIEWER_BRANCHES, exclude_admins=True)
+        # Profile: only members (and family members) of managed clusters
+        clusters = Cluster.objects.filter(coordinator=user)
+        cluster_ids = resource_ids(
+            ModuleCoordinator.ModuleType.CLUSTER, ModuleCoordinator.CoordinatorLevel.COORDINATOR
+        )
+        if cluster_ids:
+            clusters = (clusters | Cluster.objects.filter(id__in=cluster_ids)).distinct()
+        # One row per managed cluster even without members: having clusters
+        # is what matters here (an empty cluster hides the MEMBER fallback).
+        cluster_people = set(clusters.values_list("members__id", flat=True)) | set(
+            clusters.values_list("families__members__id", flat=True)
+        )
+        if cluster_people:
+            matched = True
+            visible_ids |= cluster_people
+
+    # 2. Sunday School Teacher: Students in classes where they are teacher/assistant
+    if has_assignment(
+        ModuleCoordinator.ModuleType.SUNDAY_SCHOOL, ModuleCoordinator.CoordinatorLevel.TEACHER
+    ):
+        from apps.sunday_school.models import SundaySchoolClassMember
+
+        class_ids = resource_ids(
+            ModuleCoordinator.ModuleType.SUNDAY_SCHOOL,
+            ModuleCoordinator.CoordinatorLevel.TEACHER,
+        )
+        if not class_ids:
+            # Module-wide: classes where user is teacher/assistant
+            class_ids = list(
+                SundaySchoolClassMember.objects.filter(
+                    person=user, role__in=["TEACHER", "ASSISTANT_TEACHER"]
+                ).values_list("sunday_school_class_id", flat=True)
+            )
+        if class_ids:
+            student_ids = set(
+                SundaySchoolClassMember.objects.filter(
+                    sunday_school_class_id__in=class_ids, role="STUDENT"
+                ).values_list("person_id", flat=True)
+            )
+            if student_ids:
+                matched = True
+                visible_ids |= student_ids
+
+    # 3. Lessons Teacher: Students in their lesson sessions
+    if has_assignment(
+        ModuleCoordinator.ModuleType.LESSONS, ModuleCoordinator.CoordinatorLevel.TEACHER
+    ):
+        from apps.lessons.models import LessonSessionReport
+
+        student_ids = set(
+            LessonSessionReport.objects.filter(teacher=user).values_list("student_id", flat=True)
+        )
+        if student_ids:
+            matched = True
+            visible_ids |= student_ids
+
+    # 4. Bible Sharer: Members of assigned evangelism groups
+    group_ids = resource_ids(
+        ModuleCoordinator.ModuleType.EVANGELISM, ModuleCoordinator.CoordinatorLevel.BIBLE_SHARER
+    )
+    if group_ids:
+        from apps.evangelism.models import EvangelismGroup
+
+        member_ids = set(
+            EvangelismGroup.objects.filter(id__in=group_ids).values_list("members__id", flat=True)
+        )
+        if member_ids:
+            matched = True
+            visible_ids |= member_ids
+
+    if matched:
+        return PersonScope(
+            ids=PersonIdSet(visible_ids), branch_rule=VIEWER_BRANCHES, exclude_admins=True
+        )
+
+    # MEMBER: Only themselves and family members
+    if user.role == "MEMBER":
+        family_ids = set(
+            Person.objects.filter(families__members=user).values_list("id", flat=True)
+        )
+        family_ids.add(user.id)
+        return PersonScope(
+            ids=PersonIdSet(family_ids), branch_rule=OWN_BRANCH_IF_SET, exclude_admins=True
+        )
+
+    # Default: nobody, for safety
+    return NOBODY
+
+
+def _compute_journey_scope(user) -> PersonScope:
+    """
+    Senior coordinators of the people-facing modules see their branch(es);
+    cluster coordinators see members of their cluster(s); everyone else only
+    their own journeys.
+    """
+    from apps.clusters.models import Cluster
+    from apps.clusters.permissions import managed_cluster_ids_for_coordinator
+
+    if user.module_coordinator_assignments.filter(
+        level=ModuleCoordinator.CoordinatorLevel.SENIOR_COORDINATOR,
+        module__in=[
+            ModuleCoordinator.ModuleType.CLUSTER,
+            ModuleCoordinator.ModuleType.EVANGELISM,
+            ModuleCoordinator.ModuleType.SUNDAY_SCHOOL,
+            ModuleCoordinator.ModuleType.LESSONS,
+        ],
+    ).exists():
+        return PersonScope(branch_rule=VIEWER_BRANCHES)
+
+    own = PersonScope(ids=PersonIdSet([user.id]))
+    if not user.is_module_coordinator(
+        ModuleCoordinator.ModuleType.CLUSTER,
+        level=ModuleCoordinator.CoordinatorLevel.COORDINATOR,
+    ):
+        return own
+    cluster_ids = managed_cluster_ids_for_coordinator(user)
+    if not cluster_ids:
+        return own
+    member_ids = set(
+        Cluster.objects.filter(id__in=cluster_ids).values_list("members__id", flat=True)
+    )
+    member_ids.add(user.id)
+    return PersonScope(ids=PersonIdSet(member_ids), branch_rule=OWN_BRANCH_IF_SET)
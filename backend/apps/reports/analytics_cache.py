@@ -0,0 +1,51 @@
+"""
+Shared cache for analytics payloads that look the same to every viewer.
+
+:func:`cached_analytics` stores a payload per namespace and parameters for
+``ANALYTICS_CACHE_SECONDS``. Cache keys embed the namespace's cache
+generation (``analytics.<namespace>`` in apps/people/cache_generation.py).
+Signal handlers call :func:`bump_analytics_generation` when the rows behind a
+namespace change, so all workers drop stale payloads at once. Changes that
+are not bumped (see each namespace's handlers) expire with the timeout.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, TypeVar
+
+from django.conf import settings
+from django.core.cache import cache
+
+from apps.people.cache_generation import bump_generation, current_generation
+
+CACHE_KEY_PREFIX = "analytics"
+DEFAULT_CACHE_SECONDS = 300
+
+T = TypeVar("T")
+
+
+def _generation_namespace(namespace: str) -> str:
+    return f"{CACHE_KEY_PREFIX}.{namespace}"
+
+
+def analytics_generation(namespace: str) -> int:
+    return current_generation(_generation_namespace(namespace))
+
+
+def bump_analytics_generation(*namespaces: str) -> None:
+    """Invalidate every cached payload of ``namespaces`` (for all workers on commit)."""
+    bump_generation(*(_generation_namespace(namespace) for namespace in namespaces))
+
+
+def cached_analytics(namespace: str, params: dict, compute: Callable[[], T]) -> T:
+    """Return the cached payload for ``namespace`` and ``params``, computing it on a miss."""
+    timeout = getattr(settings, "ANALYTICS_CACHE_SECONDS", DEFAULT_CACHE_SECONDS)
+    if not timeout:
+        return compute()
+    suffix = ":".join(f"{name}={params[name]}" for name in sorted(params))
+    key = f"{CACHE_KEY_PREFIX}:{namespace}:{analytics_generation(namespace)}:{suffix}"
+    payload = cache.get(key)
+    if payload is None:
+        payload = compute()
+        cache.set(key, payload, timeout)
+    return payload
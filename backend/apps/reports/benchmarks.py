@@ -0,0 +1,228 @@
+"""
+Endpoint benchmark harness.
+
+Drives the heavy read endpoints through DRF's test client and records, per
+endpoint, the median wall time, the query count and the peak Python memory
+allocated while serving the request (tracemalloc). Budgets are checked in as
+``benchmark_baseline.json`` next to this module; :func:`compare_to_baseline`
+reports every endpoint that exceeds its budget.
+
+Query counts must not exceed the budget at all. A budgeted count must not
+depend on the dataset size, so the same budget holds at any ``--scale``.
+Endpoints whose count still grows with the data (known N+1 patterns) are
+listed under ``unbudgeted`` with the reason instead: they are measured and
+reported but not checked, and ``--update-baseline`` keeps them there. Wall
+time and memory may exceed the budget by the baseline's ``tolerance``
+fraction, since they vary between machines and runs.
+
+Run through ``python manage.py run_benchmarks`` (see docs/RUNBOOK.md).
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+BASELINE_PATH = Path(__file__).resolve().parent / "benchmark_baseline.json"
+DEFAULT_TOLERANCE = 0.5
+BUDGET_METRICS = ("queries", "wall_ms", "peak_kb")
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    name: str
+    path: str
+    params: dict = field(default_factory=dict)
+
+
+@dataclass
+class Measurement:
+    name: str
+    status_code: int
+    queries: int
+    wall_ms: float
+    peak_kb: float
+
+
+def default_endpoints(as_of: date) -> list[Endpoint]:
+    """The heavy read endpoints, with parameters aimed at the dataset window."""
+    month_start = datetime.combine(as_of - timedelta(days=35), datetime.min.time())
+    month_end = datetime.combine(as_of, datetime.max.time().replace(microsecond=0))
+    return [
+        Endpoint("reports_overview", "/api/reports/overview/"),
+        Endpoint(
+            "reports_compliance",
+            "/api/reports/compliance/",
+            {
+                "start_date": (as_of - timedelta(weeks=4)).isoformat(),
+                "end_date": as_of.isoformat(),
+            },
+        ),
+        Endpoint("reports_engagement", "/api/reports/engagement/summary/", {"months": 12}),
+        Endpoint("reports_people_summary", "/api/reports/people/summary/", {"months": 12}),
+        Endpoint(
+            "evangelism_tally",
+            "/api/evangelism/weekly-reports/tally/",
+            {"year": as_of.year},
+        ),
+        Endpoint(
+            "evangelism_people_tally",
+            "/api/evangelism/weekly-reports/people_tally/",
+            {"year": as_of.year},
+        ),
+        Endpoint(
+            "cluster_analytics",
+            "/api/clusters/cluster-weekly-reports/analytics/",
+            {"year": as_of.year},
+        ),
+        Endpoint(
+            "lessons_progress_summary",
+            "/api/lessons/progress/summary/",
+            {"year": as_of.year},
+        ),
+        Endpoint(
+            "attendance_frequently_absent",
+            "/api/attendance/frequently-absent/",
+            {"as_of": as_of.isoformat(), "weeks": 12},
+        ),
+        Endpoint("people_list", "/api/people/people/"),
+        Endpoint("people_search", "/api/people/people/", {"search": "Santos"}),
+        Endpoint("notifications_feed", "/api/notifications/"),
+        Endpoint(
+            "events_calendar",
+            "/api/events/",
+            {"start": month_start.isoformat(), "end": month_end.isoformat(), "all": 1},
+        ),
+    ]
+
+
+def _consume(response) -> None:
+    # Streaming bodies (?all=1) run their queries while being read.
+    if response.streaming:
+        b"".join(response.streaming_content)
+    else:
+        response.content
+
+
+def measure_endpoint(client: APIClient, endpoint: Endpoint, repeat: int = 3) -> Measurement:
+    warmup = client.get(endpoint.path, endpoint.params)
+    _consume(warmup)
+    if warmup.status_code != 200:
+        return Measurement(endpoint.name, warmup.status_code, 0, 0.0, 0.0)
+
+    timings = []
+    queries = 0
+    for _ in range(max(repeat, 1)):
+        with CaptureQueriesContext(connection) as captured:
+            started = time.perf_counter()
+            _consume(client.get(endpoint.path, endpoint.params))
+            timings.append((time.perf_counter() - started) * 1000)
+        queries = max(queries, len(captured))
+
+    # Memory is measured on a separate pass: tracemalloc slows the request.
+    tracemalloc.start()
+    try:
+        _consume(client.get(endpoint.path, endpoint.params))
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Measurement(
+        name=endpoint.name,
+        status_code=warmup.status_code,
+        queries=queries,
+        wall_ms=round(statistics.median(timings), 1),
+        peak_kb=round(peak / 1024, 1),
+    )
+
+
+def run_benchmarks(user, endpoints: list[Endpoint], *, repeat: int = 3, log=None) -> list[Measurement]:
+    client = APIClient()
+    client.force_authenticate(user=user)
+    results = []
+    for endpoint in endpoints:
+        result = measure_endpoint(client, endpoint, repeat=repeat)
+        if log:
+            log(result)
+        results.append(result)
+    return results
+
+
+def load_baseline(path: Path = BASELINE_PATH) -> dict:
+    if not path.exists():
+        return {"tolerance": DEFAULT_TOLERANCE, "endpoints": {}, "unbudgeted": {}}
+    with path.open() as handle:
+        return json.load(handle)
+
+
+def write_baseline(results: list[Measurement], dataset: dict, path: Path = BASELINE_PATH, *, tolerance=None) -> dict:
+    previous = load_baseline(path)
+    unbudgeted = previous.get("unbudgeted", {})
+    baseline = {
+        "dataset": dataset,
+        "tolerance": previous.get("tolerance", DEFAULT_TOLERANCE) if tolerance is None else tolerance,
+        "endpoints": {
+            result.name: {metric: getattr(result, metric) for metric in BUDGET_METRICS}
+            for result in results
+            if result.status_code == 200 and result.name not in unbudgeted
+        },
+        "unbudgeted": unbudgeted,
+    }
+    with path.open("w") as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+    return baseline
+
+
+def compare_to_baseline(
+    results: list[Measurement],
+    baseline: dict,
+    *,
+    tolerance: float | None = None,
+    check_timing: bool = True,
+    check_memory: bool = True,
+) -> list[str]:
+    """Return one message per budget exceeded (empty when everything passes)."""
+    if tolerance is None:
+        tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+    budgets = baseline.get("endpoints", {})
+    unbudgeted = baseline.get("unbudgeted", {})
+    failures = []
+    for result in results:
+        if result.status_code != 200:
+            failures.append(f"{result.name}: HTTP {result.status_code}")
+            continue
+        budget = budgets.get(result.name)
+        if not budget or result.name in unbudgeted:
+            continue
+        if result.queries > budget["queries"]:
+            failures.append(
+                f"{result.name}: {result.queries} queries (budget {budget['queries']})"
+            )
+        limited = [
+            metric
+            for metric, checked in (("wall_ms", check_timing), ("peak_kb", check_memory))
+            if checked
+        ]
+        for metric in limited:
+            allowed = budget[metric] * (1 + tolerance)
+            value = getattr(result, metric)
+            if value > allowed:
+                failures.append(
+                    f"{result.name}: {metric} {value} exceeds {budget[metric]} "
+                    f"+{tolerance:.0%} ({allowed:.1f})"
+                )
+    return failures
+
+
+def results_as_dicts(results: list[Measurement]) -> list[dict]:
+    return [asdict(result) for result in results]
@@ -0,0 +1,226 @@
+"""
+Benchmark the heavy read endpoints against a generated load dataset.
+
+By default a throwaway test database is created, filled with
+generate_load_dataset at the baseline's seed/scale, benchmarked and dropped.
+
+Usage:
+    python manage.py run_benchmarks                       # check against the baseline
+    python manage.py run_benchmarks --ignore-timing       # CI on different hardware
+    python manage.py run_benchmarks --scale 0.04 --queries-only  # counts must not grow
+    python manage.py run_benchmarks --update-baseline     # record new budgets
+    python manage.py run_benchmarks --use-existing-db     # e.g. a Postgres load DB
+
+The dataset window and the endpoints' "today" are pinned to the baseline's
+``as_of`` date (or ``--as-of``), so query counts do not drift with the day
+the command runs.
+"""
+
+import json
+from datetime import date, datetime, time
+from pathlib import Path
+from unittest import mock
+
+from django.core.management.base import BaseCommand, CommandError
+from django.test.utils import (
+    setup_databases,
+    setup_test_environment,
+    teardown_databases,
+    teardown_test_environment,
+)
+
+from apps.people.load_dataset import LoadDatasetGenerator, scaled_counts
+from apps.people.models import Person
+from apps.reports.benchmarks import (
+    BASELINE_PATH,
+    compare_to_baseline,
+    default_endpoints,
+    load_baseline,
+    results_as_dicts,
+    run_benchmarks,
+    write_baseline,
+)
+from core.datetime_utils import get_church_timezone
+
+DEFAULT_SEED = 42
+DEFAULT_SCALE = 0.02
+DEFAULT_AS_OF = date(2026, 10, 19)
+BENCHMARK_USERNAME = "benchmark_admin"
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark heavy endpoints (wall time, queries, peak memory) and fail "
+        "when one exceeds its checked-in budget"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--baseline",
+            type=str,
+            default=str(BASELINE_PATH),
+            help="Baseline JSON file with per-endpoint budgets",
+        )
+        parser.add_argument(
+            "--seed", type=int, help="Dataset seed (default: baseline's, else 42)"
+        )
+        parser.add_argument(
+            "--scale",
+            type=float,
+            help=f"Dataset scale (default: baseline's, else {DEFAULT_SCALE})",
+        )
+        parser.add_argument(
+            "--as-of",
+            type=date.fromisoformat,
+            help=(
+                "Church date the dataset and endpoints are pinned to, YYYY-MM-DD "
+                f"(default: baseline's, else {DEFAULT_AS_OF.isoformat()})"
+            ),
+        )
+        parser.add_argument(
+            "--repeat", type=int, default=3, help="Timed runs per endpoint (default: 3)"
+        )
+        parser.add_argument(
+            "--only",
+            type=str,
+            help="Comma-separated endpoint names to run",
+        )
+        parser.add_argument(
+            "--tolerance",
+            type=float,
+            help="Allowed wall-time/memory regression as a fraction (default: baseline's)",
+        )
+        parser.add_argument(
+            "--ignore-timing",
+            action="store_true",
+            help="Check query counts and memory only",
+        )
+        parser.add_argument(
+            "--queries-only",
+            action="store_true",
+            help="Check query counts only, e.g. at another --scale than the baseline's",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Write the measured values as the new budgets instead of checking",
+        )
+        parser.add_argument(
+            "--use-existing-db",
+            action="store_true",
+            help="Benchmark the configured database as-is (no test DB, no generation)",
+        )
+        parser.add_argument(
+            "--json",
+            type=str,
+            help="Also write the measurements to this JSON file",
+        )
+
+    def handle(self, *args, **options):
+        baseline_path = Path(options["baseline"])
+        baseline = load_baseline(baseline_path)
+        dataset = dict(baseline.get("dataset") or {})
+        seed = options["seed"] if options["seed"] is not None else dataset.get("seed", DEFAULT_SEED)
+        scale = options["scale"] if options["scale"] is not None else dataset.get("scale", DEFAULT_SCALE)
+        if scale <= 0:
+            raise CommandError("--scale must be positive")
+
+        as_of = options["as_of"] or date.fromisoformat(
+            dataset.get("as_of", DEFAULT_AS_OF.isoformat())
+        )
+        endpoints = default_endpoints(as_of)
+        if options["only"]:
+            wanted = {name.strip() for name in options["only"].split(",") if name.strip()}
+            unknown = wanted - {endpoint.name for endpoint in endpoints}
+            if unknown:
+                raise CommandError(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+            endpoints = [endpoint for endpoint in endpoints if endpoint.name in wanted]
+
+        # Freeze the clock at noon church time on as_of: views derive their
+        # default windows from timezone.now(), not only from query params.
+        frozen_now = datetime.combine(as_of, time(12), tzinfo=get_church_timezone())
+        clock = mock.patch("django.utils.timezone.now", return_value=frozen_now)
+
+        setup_test_environment()
+        old_config = None
+        clock.start()
+        try:
+            if not options["use_existing_db"]:
+                self.stdout.write("Creating benchmark database...")
+                old_config = setup_databases(
+                    verbosity=0, interactive=False, aliases={"default"}
+                )
+                self.stdout.write(f"Generating load dataset (seed {seed}, scale {scale}, as of {as_of})...")
+                LoadDatasetGenerator(
+                    seed=seed,
+                    counts=scaled_counts(scale),
+                    end_date=as_of,
+                    log=lambda message: self.stdout.write(f"  {message}"),
+                ).run()
+
+            user = self._benchmark_user()
+            self.stdout.write(f"\n{'endpoint':<26}{'status':>7}{'queries':>9}{'ms':>10}{'peak KB':>11}")
+            results = run_benchmarks(
+                user,
+                endpoints,
+                repeat=options["repeat"],
+                log=lambda r: self.stdout.write(
+                    f"{r.name:<26}{r.status_code:>7}{r.queries:>9}{r.wall_ms:>10}{r.peak_kb:>11}"
+                ),
+            )
+        finally:
+            clock.stop()
+            if old_config is not None:
+                teardown_databases(old_config, verbosity=0)
+            teardown_test_environment()
+
+        if options["json"]:
+            with open(options["json"], "w") as handle:
+                json.dump(results_as_dicts(results), handle, indent=2)
+
+        if options["update_baseline"]:
+            write_baseline(
+                results,
+                {"seed": seed, "scale": scale, "as_of": as_of.isoformat()},
+                baseline_path,
+                tolerance=options["tolerance"],
+            )
+            self.stdout.write(self.style.SUCCESS(f"\nBaseline written to {baseline_path}"))
+            return
+
+        if dataset and not options["queries_only"] and (
+            dataset.get("seed"),
+            dataset.get("scale"),
+            dataset.get("as_of", DEFAULT_AS_OF.isoformat()),
+        ) != (seed, scale, as_of.isoformat()):
+            self.stdout.write(
+                self.style.WARNING(
+                    "Dataset differs from the baseline's; budgets may not be comparable"
+                )
+            )
+        failures = compare_to_baseline(
+            results,
+            baseline,
+            tolerance=options["tolerance"],
+            check_timing=not (options["ignore_timing"] or options["queries_only"]),
+            check_memory=not options["queries_only"],
+        )
+        for name, reason in sorted(baseline.get("unbudgeted", {}).items()):
+            self.stdout.write(self.style.WARNING(f"  {name}: unbudgeted ({reason})"))
+        if failures:
+            for failure in failures:
+                self.stdout.write(self.style.ERROR(f"  {failure}"))
+            raise CommandError(f"{len(failures)} benchmark budget(s) exceeded")
+        self.stdout.write(self.style.SUCCESS("\nAll endpoints within budget"))
+
+    def _benchmark_user(self):
+        user = Person.objects.filter(role="ADMIN", is_active=True).order_by("id").first()
+        if user is None:
+            user = Person.objects.create_user(
+                username=BENCHMARK_USERNAME,
+                password=None,
+                role="ADMIN",
+                first_name="Benchmark",
+                last_name="Admin",
+            )
+        return user
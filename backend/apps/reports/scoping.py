@@ -2,7 +2,8 @@
 
 Generalizes the per-module branch filtering (see
 ``apps.lessons.branch_scope``) so any future report endpoint can scope a
-queryset by a configurable lookup path while honoring the same access rules:
+queryset by a configurable lookup path while honoring the same access rules
+(:class:`ReportScope` resolves them once per request):
 
 - ADMIN and headquarters PASTOR can see every branch and may pick one.
 - Any other PASTOR (a "branch pastor") is locked to their own branch.
@@ -13,8 +14,14 @@ Access to the reports module itself is gated separately by
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Optional
 
+from apps.attendance.models import AttendanceRecord
+from apps.clusters.models import Cluster, ClusterWeeklyReport
+from apps.events.models import Event
+from apps.evangelism.models import EvangelismGroup, EvangelismWeeklyReport
+from apps.lessons.models import PersonLessonProgress
 from apps.people.models import Person
 
 
@@ -75,14 +82,132 @@ def apply_branch_filter(queryset, user: Person, request, *, branch_lookup: str):
     Branch-scoped users with no assigned branch get an empty queryset, matching
     the conservative default used elsewhere in the codebase.
     """
-    scope = resolve_branch_scope(user, request)
-    branch_id = scope["effective_branch_id"]
+    return ReportScope.for_request(request, user).filter(
+        queryset, branch_lookup=branch_lookup
+    )
+
+
+def _filter_ids(queryset, field: str, ids: Optional[tuple[int, ...]]):
+    if ids is None:
+        return queryset
+    if not ids:
+        return queryset.none()
+    return queryset.filter(**{f"{field}__in": ids})
+
+
+class ReportScope:
+    """Branch + RBAC scope of one reports request, resolved once.
+
+    Views build it with :meth:`for_request` and take every scoped queryset
+    from it. The id sets that define a branch (its clusters, their evangelism
+    groups, its Sunday Service events) are read once per request and kept as
+    sorted tuples, so report querysets filter on their own indexed foreign
+    keys (``cluster_id IN (...)``) instead of carrying the branch join into
+    every nested subquery a builder makes from them. An all-branches scope
+    reads no id sets and leaves those querysets unfiltered.
+    """
 
-    if scope["can_pick"]:
-        if branch_id is not None:
-            return queryset.filter(**{branch_lookup: branch_id})
+    def __init__(self, *, can_pick: bool, branch_id: Optional[int]):
+        self.can_pick = can_pick
+        self.locked = not can_pick
+        self.branch_id = branch_id
+
+    @classmethod
+    def for_request(cls, request, user: Optional[Person] = None) -> "ReportScope":
+        """The scope of ``user`` (default ``request.user``), memoized on the request per user."""
+        user = user or request.user
+        scopes = getattr(request, "_report_scopes", None)
+        if scopes is None:
+            scopes = request._report_scopes = {}
+        scope = scopes.get(user.pk)
+        if scope is None:
+            resolved = resolve_branch_scope(user, request)
+            scope = scopes[user.pk] = cls(
+                can_pick=resolved["can_pick"],
+                branch_id=resolved["effective_branch_id"],
+            )
+        return scope
+
+    @property
+    def single_branch_view(self) -> bool:
+        return self.branch_id is not None
+
+    @property
+    def empty(self) -> bool:
+        """Branch-locked user without a branch: sees nothing."""
+        return self.locked and self.branch_id is None
+
+    @property
+    def all_branches(self) -> bool:
+        return self.can_pick and self.branch_id is None
+
+    def filter(self, queryset, *, branch_lookup: str):
+        """Scope any queryset by the ORM path to its branch id."""
+        if self.empty:
+            return queryset.none()
+        if self.branch_id is not None:
+            return queryset.filter(**{branch_lookup: self.branch_id})
         return queryset
 
-    if branch_id is not None:
-        return queryset.filter(**{branch_lookup: branch_id})
-    return queryset.none()
+    def _ids(self, queryset) -> tuple[int, ...]:
+        return tuple(sorted(queryset.values_list("pk", flat=True)))
+
+    @cached_property
+    def cluster_ids(self) -> Optional[tuple[int, ...]]:
+        """Cluster ids in scope; ``None`` means every cluster."""
+        if self.all_branches:
+            return None
+        return self._ids(self.filter(Cluster.objects.all(), branch_lookup="branch_id"))
+
+    @cached_property
+    def evangelism_group_ids(self) -> Optional[tuple[int, ...]]:
+        """Evangelism groups attached to an in-scope cluster; ``None`` means all."""
+        if self.cluster_ids is None:
+            return None
+        return self._ids(
+            _filter_ids(EvangelismGroup.objects.all(), "cluster_id", self.cluster_ids)
+        )
+
+    @cached_property
+    def service_event_ids(self) -> Optional[tuple[int, ...]]:
+        """Sunday Service events in scope; ``None`` means every branch's."""
+        if self.all_branches:
+            return None
+        return self._ids(
+            self.filter(
+                Event.objects.filter(event_type_id="SUNDAY_SERVICE"),
+                branch_lookup="branch_id",
+            )
+        )
+
+    def people(self):
+        """People in scope, ADMIN accounts excluded."""
+        return self.filter(Person.objects.exclude(role="ADMIN"), branch_lookup="branch_id")
+
+    def clusters(self):
+        return self.filter(Cluster.objects.all(), branch_lookup="branch_id")
+
+    def cluster_reports(self):
+        return _filter_ids(ClusterWeeklyReport.objects.all(), "cluster_id", self.cluster_ids)
+
+    def evangelism_reports(self):
+        return _filter_ids(
+            EvangelismWeeklyReport.objects.all(),
+            "evangelism_group_id",
+            self.evangelism_group_ids,
+        )
+
+    def service_attendance(self):
+        """PRESENT attendance at in-scope Sunday Services."""
+        records = AttendanceRecord.objects.filter(
+            status=AttendanceRecord.AttendanceStatus.PRESENT
+        )
+        if self.service_event_ids is None:
+            return records.filter(event__event_type_id="SUNDAY_SERVICE")
+        return _filter_ids(records, "event_id", self.service_event_ids)
+
+    def lesson_progress(self):
+        return self.filter(
+            PersonLessonProgress.objects.select_related("person", "lesson"),
+            branch_lookup="person__branch_id",
+        )
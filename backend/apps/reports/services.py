@@ -11,11 +11,11 @@ import io
 from collections import Counter
 from datetime import date, datetime, timedelta
 
-from django.db.models import Count
+from django.db.models import BooleanField, Case, Count, F, Q, Value, When
 from django.db.models.functions import TruncMonth
 from django.utils import timezone
 
-from core.datetime_utils import church_today
+from core.datetime_utils import church_today, shift_years
 
 from apps.clusters.models import Cluster, ClusterComplianceNote, ClusterWeeklyReport
 from apps.events.models import EventType
@@ -26,13 +26,41 @@ from apps.clusters.serializers import (
     ClusterSerializer,
 )
 from apps.clusters.utils import (
-    calculate_cluster_compliance,
-    calculate_trend,
+    calculate_compliance_with_trend,
     get_weeks_in_range,
+    in_windows_q,
     is_at_risk,
 )
 
 
+def _compliance_summary(rows, start_date, end_date):
+    total_clusters = len(rows)
+    compliant_count = sum(1 for d in rows if d["status"] == "COMPLIANT")
+    non_compliant_count = sum(1 for d in rows if d["status"] == "NON_COMPLIANT")
+    partial_count = sum(1 for d in rows if d["status"] == "PARTIAL")
+
+    overall_compliance_rate = (
+        sum(d["compliance_rate"] for d in rows) / total_clusters
+        if total_clusters > 0
+        else 0.0
+    )
+
+    weeks_expected = len(get_weeks_in_range(start_date, end_date))
+
+    return {
+        "total_clusters": total_clusters,
+        "compliant_clusters": compliant_count,
+        "non_compliant_clusters": non_compliant_count,
+        "partial_compliant_clusters": partial_count,
+        "compliance_rate": round(overall_compliance_rate, 2),
+        "period": {
+            "start_date": start_date.isoformat(),
+            "end_date": end_date.isoformat(),
+            "weeks_expected": weeks_expected,
+        },
+    }
+
+
 def build_compliance_payload(
     clusters,
     start_date,
@@ -40,26 +68,34 @@ def build_compliance_payload(
     *,
     status=None,
     min_rate=None,
+    summary_only=False,
+    compare_years=0,
 ):
-    """Build the {summary, clusters, by_status} compliance payload."""
+    """Build the {summary, clusters, by_status, comparisons} compliance payload.
+
+    Every cluster's window, its trend window and the ``compare_years``
+    same-window-last-year periods come from a single report query.
+    ``comparisons`` holds one summary per earlier year, over the clusters
+    left after the status/rate filters. ``summary_only`` skips the notes, the
+    serialized cluster tables and comparisons (for the overview, which only
+    shows the headline rate).
+    """
+    clusters = list(clusters)
+    current, comparison_periods = calculate_compliance_with_trend(
+        clusters,
+        start_date,
+        end_date,
+        compare_years=0 if summary_only else compare_years,
+    )
+
     compliance_data = []
     for cluster in clusters:
-        cluster_compliance = calculate_cluster_compliance(
-            cluster, start_date, end_date
-        )
-
-        # Trend vs the immediately preceding period of equal length.
-        previous_start = start_date - timedelta(
-            days=(end_date - start_date).days + 1
-        )
-        previous_end = start_date - timedelta(days=1)
-        previous_compliance = calculate_cluster_compliance(
-            cluster, previous_start, previous_end
-        )
-        trend = calculate_trend(cluster_compliance, previous_compliance)
+        cluster_compliance = current[cluster.pk]
 
         notes = (
-            ClusterComplianceNote.objects.filter(
+            ClusterComplianceNote.objects.none()
+            if summary_only
+            else ClusterComplianceNote.objects.filter(
                 cluster=cluster,
                 period_start__lte=end_date,
                 period_end__gte=start_date,
@@ -83,7 +119,7 @@ def build_compliance_payload(
                 "consecutive_missing_weeks": cluster_compliance[
                     "consecutive_missing_weeks"
                 ],
-                "trend": trend,
+                "trend": cluster_compliance["trend"],
                 "compliance_notes": notes,
             }
         )
@@ -96,35 +132,10 @@ def build_compliance_payload(
             d for d in compliance_data if d["compliance_rate"] >= min_rate
         ]
 
-    total_clusters = len(compliance_data)
-    compliant_count = sum(
-        1 for d in compliance_data if d["status"] == "COMPLIANT"
-    )
-    non_compliant_count = sum(
-        1 for d in compliance_data if d["status"] == "NON_COMPLIANT"
-    )
-    partial_count = sum(1 for d in compliance_data if d["status"] == "PARTIAL")
+    summary = _compliance_summary(compliance_data, start_date, end_date)
 
-    overall_compliance_rate = (
-        sum(d["compliance_rate"] for d in compliance_data) / total_clusters
-        if total_clusters > 0
-        else 0.0
-    )
-
-    weeks_expected = len(get_weeks_in_range(start_date, end_date))
-
-    summary = {
-        "total_clusters": total_clusters,
-        "compliant_clusters": compliant_count,
-        "non_compliant_clusters": non_compliant_count,
-        "partial_compliant_clusters": partial_count,
-        "compliance_rate": round(overall_compliance_rate, 2),
-        "period": {
-            "start_date": start_date.isoformat(),
-            "end_date": end_date.isoformat(),
-            "weeks_expected": weeks_expected,
-        },
-    }
+    if summary_only:
+        return {"summary": summary}
 
     by_status = {
         "compliant": [d for d in compliance_data if d["status"] == "COMPLIANT"],
@@ -134,6 +145,16 @@ def build_compliance_payload(
         "partial": [d for d in compliance_data if d["status"] == "PARTIAL"],
     }
 
+    kept_ids = [d["cluster"].pk for d in compliance_data]
+    comparisons = [
+        _compliance_summary(
+            [by_cluster[cluster_id] for cluster_id in kept_ids],
+            period_start,
+            period_end,
+        )
+        for period_start, period_end, by_cluster in comparison_periods
+    ]
+
     return {
         "summary": summary,
         "clusters": ClusterComplianceSerializer(compliance_data, many=True).data,
@@ -148,6 +169,7 @@ def build_compliance_payload(
                 by_status["partial"], many=True
             ).data,
         },
+        "comparisons": comparisons,
     }
 
 
@@ -157,18 +179,12 @@ def build_at_risk(clusters, weeks_back):
     start_date = today - timedelta(weeks=weeks_back)
     end_date = today
 
+    clusters = list(clusters)
+    current, _ = calculate_compliance_with_trend(clusters, start_date, end_date)
+
     result = []
     for cluster in clusters:
-        compliance = calculate_cluster_compliance(cluster, start_date, end_date)
-
-        previous_start = start_date - timedelta(
-            days=(end_date - start_date).days + 1
-        )
-        previous_end = start_date - timedelta(days=1)
-        previous_compliance = calculate_cluster_compliance(
-            cluster, previous_start, previous_end
-        )
-        compliance["trend"] = calculate_trend(compliance, previous_compliance)
+        compliance = current[cluster.pk]
 
         is_risk, reason = is_at_risk(compliance, weeks_back)
         if not is_risk:
@@ -446,20 +462,30 @@ def build_people_summary(
     *,
     months: int = 12,
     single_branch_view: bool = False,
+    compare_years: int = 0,
 ):
-    """Aggregate people demographics for a pre-scoped Person queryset."""
+    """Aggregate people demographics for a pre-scoped Person queryset.
+
+    ``people_qs`` must be join-free (as :meth:`ReportScope.people` is), so the
+    counts below run as plain indexed counts rather than ``COUNT(DISTINCT)``
+    over a subquery. ``comparisons`` holds the baptism trend for the same
+    months ``1..compare_years`` years earlier (the other figures are current
+    state, with no history to compare).
+    """
     today = church_today()
-    people_qs = people_qs.distinct()
-
-    total_people = people_qs.count()
-    total_members = people_qs.filter(role="MEMBER").count()
-    total_visitors = people_qs.filter(role="VISITOR").count()
-    active_members = people_qs.filter(role="MEMBER", status="ACTIVE").count()
-    semiactive_members = people_qs.filter(role="MEMBER", status="SEMIACTIVE").count()
-    inactive_members = people_qs.filter(role="MEMBER", status="INACTIVE").count()
-    dormant_members = people_qs.filter(role="MEMBER", status="DORMANT").count()
-    fallaway_members = people_qs.filter(role="MEMBER", status="FALLAWAY").count()
-    deceased = people_qs.filter(status="DECEASED").count()
+
+    counts = people_qs.aggregate(
+        total_people=Count("id"),
+        total_members=Count("id", filter=Q(role="MEMBER")),
+        total_visitors=Count("id", filter=Q(role="VISITOR")),
+        active_members=Count("id", filter=Q(role="MEMBER", status="ACTIVE")),
+        semiactive_members=Count("id", filter=Q(role="MEMBER", status="SEMIACTIVE")),
+        inactive_members=Count("id", filter=Q(role="MEMBER", status="INACTIVE")),
+        dormant_members=Count("id", filter=Q(role="MEMBER", status="DORMANT")),
+        fallaway_members=Count("id", filter=Q(role="MEMBER", status="FALLAWAY")),
+        deceased=Count("id", filter=Q(status="DECEASED")),
+    )
+    total_people = counts["total_people"]
 
     with_family = (
         people_qs.annotate(_fam_count=Count("families"))
@@ -476,15 +502,7 @@ def build_people_summary(
     without_cluster = total_people - in_cluster
 
     summary = {
-        "total_people": total_people,
-        "total_members": total_members,
-        "total_visitors": total_visitors,
-        "active_members": active_members,
-        "semiactive_members": semiactive_members,
-        "inactive_members": inactive_members,
-        "dormant_members": dormant_members,
-        "fallaway_members": fallaway_members,
-        "deceased": deceased,
+        **counts,
         "with_family": with_family,
         "without_family": without_family,
         "in_cluster": in_cluster,
@@ -554,30 +572,9 @@ def build_people_summary(
             for row in branch_rows
         ]
 
-    periods = _month_periods(months, today)
-    water_trend = []
-    spirit_trend = []
-    for period in periods:
-        year_s, month_s = period.split("-")
-        year_i, month_i = int(year_s), int(month_s)
-        water_trend.append(
-            {
-                "period": period,
-                "count": people_qs.filter(
-                    water_baptism_date__year=year_i,
-                    water_baptism_date__month=month_i,
-                ).count(),
-            }
-        )
-        spirit_trend.append(
-            {
-                "period": period,
-                "count": people_qs.filter(
-                    spirit_baptism_date__year=year_i,
-                    spirit_baptism_date__month=month_i,
-                ).count(),
-            }
-        )
+    current, *comparisons = _baptism_trends(
+        people_qs, months=months, today=today, compare_years=compare_years
+    )
 
     return {
         "summary": summary,
@@ -587,14 +584,70 @@ def build_people_summary(
         "by_age_band": by_age_band,
         "by_entry_channel": by_entry_channel,
         "by_branch": by_branch,
-        "baptism_trend": {
-            "months": months,
-            "water": water_trend,
-            "spirit": spirit_trend,
-        },
+        "baptism_trend": current["baptism_trend"],
+        "comparisons": comparisons,
     }
 
 
+def _baptism_trends(
+    people_qs, *, months: int, today: date, compare_years: int
+) -> list[dict]:
+    """Monthly water/spirit baptism counts for the window and its earlier years.
+
+    Every month of every period is one conditional ``COUNT`` in a single
+    aggregate query. Returns one ``{period_start, period_end, summary,
+    baptism_trend}`` dict per period, the current window first.
+    """
+
+    def alias(kind: str, offset: int, period: str) -> str:
+        return f"{kind}_{offset}_{period.replace('-', '_')}"
+
+    windows = []
+    aggregates = {}
+    for offset in range(compare_years + 1):
+        end = shift_years(today, -offset)
+        periods = _month_periods(months, end)
+        windows.append((end, periods))
+        for period in periods:
+            month_start = date.fromisoformat(f"{period}-01")
+            next_month = (month_start + timedelta(days=31)).replace(day=1)
+            for kind in ("water", "spirit"):
+                aggregates[alias(kind, offset, period)] = Count(
+                    "id",
+                    filter=Q(
+                        **{
+                            f"{kind}_baptism_date__gte": month_start,
+                            f"{kind}_baptism_date__lt": next_month,
+                        }
+                    ),
+                )
+    counts = people_qs.aggregate(**aggregates)
+
+    results = []
+    for offset, (end, periods) in enumerate(windows):
+        trend = {"months": months}
+        for kind in ("water", "spirit"):
+            trend[kind] = [
+                {
+                    "period": period,
+                    "count": counts[alias(kind, offset, period)],
+                }
+                for period in periods
+            ]
+        results.append(
+            {
+                "period_start": f"{periods[0]}-01",
+                "period_end": end.isoformat(),
+                "summary": {
+                    "water_baptisms": sum(row["count"] for row in trend["water"]),
+                    "spirit_baptisms": sum(row["count"] for row in trend["spirit"]),
+                },
+                "baptism_trend": trend,
+            }
+        )
+    return results
+
+
 def build_people_summary_csv(payload: dict) -> str:
     """Render a people summary payload as CSV text."""
     output = io.StringIO()
@@ -644,12 +697,6 @@ def _engagement_start_date(months: int, end: date | None = None) -> date:
     return date(year, month, 1)
 
 
-def _filter_reports_by_window(reports_qs, months: int, today: date | None = None):
-    today = today or church_today()
-    start = _engagement_start_date(months, today)
-    return reports_qs.filter(meeting_date__gte=start, meeting_date__lte=today)
-
-
 def _entity_label_from_row(row: dict, *, name_key: str, code_key: str | None = None) -> str:
     name = row.get(name_key) or ""
     code = row.get(code_key) or "" if code_key else ""
@@ -663,9 +710,43 @@ def _entity_label_from_row(row: dict, *, name_key: str, code_key: str | None = N
     return f"Entity {entity_id}"
 
 
+def _engagement_windows(
+    months: int, today: date, compare_years: int = 0
+) -> list[tuple[date, date]]:
+    """The ``months`` window ending ``today``, then the same window each earlier year."""
+    ends = [shift_years(today, -offset) for offset in range(compare_years + 1)]
+    return [(_engagement_start_date(months, end), end) for end in ends]
+
+
+def _window_flags(field: str, windows) -> dict:
+    """``_in_window_<n>`` annotations, so grouped rows can be split per window.
+
+    Grouping on these as well as the month keeps the split exact for a month
+    only partly inside a window, and lets overlapping windows (longer than a
+    year) share rows.
+    """
+    return {
+        f"_in_window_{index}": Case(
+            When(Q(**{f"{field}__gte": start, f"{field}__lte": end}), then=Value(True)),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+        for index, (start, end) in enumerate(windows)
+    }
+
+
+def _row_windows(row: dict, windows) -> list[int]:
+    return [index for index in range(len(windows)) if row[f"_in_window_{index}"]]
+
+
+def _month_key(day: date) -> date:
+    return day.replace(day=1)
+
+
 def _build_weekly_report_section(
     reports_qs,
     *,
+    windows,
     member_through,
     visitor_through,
     report_fk: str,
@@ -673,182 +754,211 @@ def _build_weekly_report_section(
     entity_values: tuple[str, ...],
     entity_label_name_key: str,
     entity_label_code_key: str | None = None,
+    branch_id_field: str,
+    branch_name_field: str,
 ):
-    """Aggregate weekly report attendance (cluster or evangelism)."""
-    report_count = reports_qs.count()
-
-    member_links = member_through.objects.filter(**{f"{report_fk}__in": reports_qs})
-    visitor_links = visitor_through.objects.filter(**{f"{report_fk}__in": reports_qs})
-
-    total_members = member_links.count()
-    total_visitors = visitor_links.count()
-
-    avg_members = total_members / report_count if report_count > 0 else 0
-    avg_visitors = total_visitors / report_count if report_count > 0 else 0
-
-    monthly_members = (
-        member_links.annotate(_month=TruncMonth(f"{report_fk}__meeting_date"))
-        .values("_month")
-        .annotate(members=Count("id"))
-    )
-    monthly_visitors = (
-        visitor_links.annotate(_month=TruncMonth(f"{report_fk}__meeting_date"))
-        .values("_month")
-        .annotate(visitors=Count("id"))
-    )
-
-    members_by_month: dict = {}
-    for row in monthly_members:
-        mt = row["_month"]
-        if mt is not None:
-            members_by_month[mt] = row["members"]
-
-    visitors_by_month: dict = {}
-    for row in monthly_visitors:
-        mt = row["_month"]
-        if mt is not None:
-            visitors_by_month[mt] = row["visitors"]
-
-    all_months = sorted(set(members_by_month.keys()) | set(visitors_by_month.keys()))
-    monthly_trend = []
-    for mt in all_months:
-        monthly_trend.append(
-            {
-                "period": mt.strftime("%Y-%m"),
-                "members": int(members_by_month.get(mt, 0)),
-                "visitors": int(visitors_by_month.get(mt, 0)),
-            }
-        )
-
-    group_id_path = f"{report_fk}__{entity_id_field}"
-    member_counts_by_entity = {
-        row[group_id_path]: row["sum_members_attended"]
-        for row in member_links.values(group_id_path).annotate(
-            sum_members_attended=Count("id")
+    """Aggregate weekly report attendance (cluster or evangelism).
+
+    Returns one section per window. Three grouped queries feed every figure:
+    reports per (entity, branch, gathering type), and member and visitor
+    links per (entity, branch, month), each split by window and restricted
+    to the windowed reports. Totals, averages and monthly trends for every
+    window, and the first (current) window's gathering type, per-entity and
+    per-branch breakdowns, are tallied from those rows.
+    """
+    windowed_reports = reports_qs.filter(in_windows_q("meeting_date", windows))
+    report_flags = _window_flags("meeting_date", windows)
+    report_rows = (
+        windowed_reports.annotate(**report_flags)
+        .values(
+            *entity_values, branch_id_field, branch_name_field, "gathering_type", *report_flags
         )
-    }
-
-    value_fields = list(entity_values)
-    entity_qs = (
-        reports_qs.values(*value_fields)
         .annotate(report_count=Count("id"))
-        .order_by(entity_id_field)
+        .order_by()
     )
 
-    by_entity = []
-    for row in entity_qs:
-        eid = row[entity_id_field]
-        label_row = {
-            "entity_id": eid,
-            entity_label_name_key: row.get(entity_label_name_key, ""),
-        }
-        if entity_label_code_key:
-            label_row[entity_label_code_key] = row.get(entity_label_code_key, "")
-        by_entity.append(
-            {
-                "entity_id": eid,
+    date_path = f"{report_fk}__meeting_date"
+    link_flags = _window_flags(date_path, windows)
+
+    def link_rows(through):
+        return (
+            through.objects.filter(**{f"{report_fk}__in": windowed_reports})
+            .annotate(
+                entity_id=F(f"{report_fk}__{entity_id_field}"),
+                branch_id=F(f"{report_fk}__{branch_id_field}"),
+                _month=TruncMonth(date_path),
+                **link_flags,
+            )
+            .values("entity_id", "branch_id", "_month", *link_flags)
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+
+    sections = [
+        {"reports": 0, "members": 0, "visitors": 0, "monthly": {}} for _ in windows
+    ]
+    gathering_types: Counter = Counter()
+    entities: dict = {}
+    branches: dict = {}
+
+    for row in report_rows:
+        indexes = _row_windows(row, windows)
+        for index in indexes:
+            sections[index]["reports"] += row["report_count"]
+        if 0 not in indexes:
+            continue
+        gathering_types[row["gathering_type"]] += row["report_count"]
+        entity_id = row[entity_id_field]
+        if entity_id not in entities:
+            label_row = {
+                "entity_id": entity_id,
+                entity_label_name_key: row.get(entity_label_name_key, ""),
+            }
+            if entity_label_code_key:
+                label_row[entity_label_code_key] = row.get(entity_label_code_key, "")
+            entities[entity_id] = {
+                "entity_id": entity_id,
                 "label": _entity_label_from_row(
                     label_row,
                     name_key=entity_label_name_key,
                     code_key=entity_label_code_key,
                 ),
-                "report_count": row["report_count"],
-                "sum_members_attended": int(member_counts_by_entity.get(eid, 0)),
+                "report_count": 0,
+                "sum_members_attended": 0,
+            }
+        entities[entity_id]["report_count"] += row["report_count"]
+        branch_id = row[branch_id_field]
+        if branch_id:
+            branches.setdefault(
+                branch_id, {"branch_name": row[branch_name_field], "members": 0}
+            )
+
+    for kind, through in (("members", member_through), ("visitors", visitor_through)):
+        for row in link_rows(through):
+            month = row["_month"]
+            indexes = _row_windows(row, windows)
+            for index in indexes:
+                sections[index][kind] += row["count"]
+                monthly = sections[index]["monthly"].setdefault(
+                    month, {"members": 0, "visitors": 0}
+                )
+                monthly[kind] += row["count"]
+            if kind != "members" or 0 not in indexes:
+                continue
+            if row["entity_id"] in entities:
+                entities[row["entity_id"]]["sum_members_attended"] += row["count"]
+            if row["branch_id"] in branches:
+                branches[row["branch_id"]]["members"] += row["count"]
+
+    results = []
+    for tally in sections:
+        report_count = tally["reports"]
+        avg_members = tally["members"] / report_count if report_count > 0 else 0
+        avg_visitors = tally["visitors"] / report_count if report_count > 0 else 0
+        results.append(
+            {
+                "total_reports": report_count,
+                "total_attendance": {
+                    "members": tally["members"],
+                    "visitors": tally["visitors"],
+                },
+                "average_attendance": {
+                    "avg_members": round(avg_members, 2),
+                    "avg_visitors": round(avg_visitors, 2),
+                },
+                "monthly_trend": [
+                    {
+                        "period": month.strftime("%Y-%m"),
+                        "members": counts["members"],
+                        "visitors": counts["visitors"],
+                    }
+                    for month, counts in sorted(tally["monthly"].items())
+                ],
             }
         )
 
-    gathering_type_distribution = list(
-        reports_qs.values("gathering_type").annotate(count=Count("id"))
+    results[0]["gathering_type_distribution"] = [
+        {"gathering_type": gathering_type, "count": count}
+        for gathering_type, count in sorted(
+            gathering_types.items(), key=lambda item: item[0] or ""
+        )
+    ]
+    results[0]["by_entity"] = sorted(
+        entities.values(),
+        key=lambda row: (row["entity_id"] is None, row["entity_id"] or 0),
     )
-
-    return {
-        "total_reports": report_count,
-        "total_attendance": {
-            "members": total_members,
-            "visitors": total_visitors,
-        },
-        "average_attendance": {
-            "avg_members": round(avg_members, 2),
-            "avg_visitors": round(avg_visitors, 2),
-        },
-        "gathering_type_distribution": gathering_type_distribution,
-        "monthly_trend": monthly_trend,
-        "by_entity": by_entity,
-    }
+    results[0]["by_branch"] = branches
+    return results
 
 
-def _build_service_section(service_attendance_qs, *, months: int, today: date | None = None):
-    """Sunday Service headcount from pre-scoped PRESENT attendance records."""
-    today = today or church_today()
-    start = _engagement_start_date(months, today)
-    qs = service_attendance_qs.filter(
-        occurrence_date__gte=start,
-        occurrence_date__lte=today,
-    )
+def _build_service_section(service_attendance_qs, *, windows):
+    """Sunday Service headcount from pre-scoped PRESENT attendance records.
 
+    Returns one section per window from a single grouped query of headcount
+    per occurrence; only the first (current) window lists its recent
+    occurrences and its per-branch headcount.
+    """
     occurrence_rows = list(
-        qs.values("event_id", "event__title", "occurrence_date")
+        service_attendance_qs.filter(in_windows_q("occurrence_date", windows))
+        .values(
+            "event_id",
+            "event__title",
+            "occurrence_date",
+            "event__branch_id",
+            "event__branch__name",
+        )
         .annotate(headcount=Count("id"))
         .order_by("-occurrence_date")
     )
 
-    occurrence_count = len(occurrence_rows)
-    total_headcount = sum(row["headcount"] for row in occurrence_rows)
-    avg_headcount = (
-        round(total_headcount / occurrence_count, 2) if occurrence_count > 0 else 0
-    )
-
-    monthly_rows = (
-        qs.annotate(_month=TruncMonth("occurrence_date"))
-        .values("_month")
-        .annotate(headcount=Count("id"))
-        .order_by("_month")
-    )
-    monthly_trend = [
-        {
-            "period": row["_month"].strftime("%Y-%m"),
-            "headcount": row["headcount"],
-        }
-        for row in monthly_rows
-        if row["_month"] is not None
-    ]
-
-    recent_occurrences = [
-        {
-            "event_id": row["event_id"],
-            "event_title": row["event__title"] or f"Event {row['event_id']}",
-            "occurrence_date": row["occurrence_date"].isoformat(),
-            "headcount": row["headcount"],
-        }
-        for row in occurrence_rows[:20]
-    ]
-
-    return {
-        "occurrence_count": occurrence_count,
-        "avg_headcount": avg_headcount,
-        "monthly_trend": monthly_trend,
-        "occurrences": recent_occurrences,
-    }
-
+    sections = []
+    for index, (start, end) in enumerate(windows):
+        window_rows = [
+            row for row in occurrence_rows if start <= row["occurrence_date"] <= end
+        ]
+        occurrence_count = len(window_rows)
+        total_headcount = sum(row["headcount"] for row in window_rows)
+        avg_headcount = (
+            round(total_headcount / occurrence_count, 2) if occurrence_count > 0 else 0
+        )
+        headcount_by_month: Counter = Counter()
+        for row in window_rows:
+            headcount_by_month[_month_key(row["occurrence_date"])] += row["headcount"]
+        sections.append(
+            {
+                "occurrence_count": occurrence_count,
+                "avg_headcount": avg_headcount,
+                "monthly_trend": [
+                    {"period": month.strftime("%Y-%m"), "headcount": headcount}
+                    for month, headcount in sorted(headcount_by_month.items())
+                ],
+            }
+        )
+        if index == 0:
+            branches: dict = {}
+            for row in window_rows:
+                branch_id = row["event__branch_id"]
+                if branch_id:
+                    branch = branches.setdefault(
+                        branch_id,
+                        {"branch_name": row["event__branch__name"], "headcount": 0},
+                    )
+                    branch["headcount"] += row["headcount"]
+            sections[0]["occurrences"] = [
+                {
+                    "event_id": row["event_id"],
+                    "event_title": row["event__title"] or f"Event {row['event_id']}",
+                    "occurrence_date": row["occurrence_date"].isoformat(),
+                    "headcount": row["headcount"],
+                }
+                for row in window_rows[:20]
+            ]
+            sections[0]["by_branch"] = branches
+    return sections
 
-def _build_engagement_by_branch(
-    cluster_reports_qs,
-    evangelism_reports_qs,
-    service_attendance_qs,
-    *,
-    months: int,
-    today: date | None = None,
-) -> list[dict]:
-    today = today or church_today()
-    cluster_reports = _filter_reports_by_window(cluster_reports_qs, months, today)
-    evangelism_reports = _filter_reports_by_window(
-        evangelism_reports_qs, months, today
-    )
-    service_qs = service_attendance_qs.filter(
-        occurrence_date__gte=_engagement_start_date(months, today),
-        occurrence_date__lte=today,
-    )
 
+def _build_engagement_by_branch(cluster: dict, evangelism: dict, service: dict) -> list[dict]:
+    """Merge the current window's per-branch tallies of the three sections."""
     branch_data: dict[int, dict] = {}
 
     def ensure_branch(branch_id: int, branch_name: str):
@@ -860,56 +970,32 @@ def _build_engagement_by_branch(
                 "evangelism_members": 0,
                 "service_headcount": 0,
             }
+        return branch_data[branch_id]
 
-    cluster_member_links = (
-        ClusterWeeklyReport.members_attended.through.objects.filter(
-            clusterweeklyreport__in=cluster_reports
-        )
-        .values(
-            "clusterweeklyreport__cluster__branch_id",
-            "clusterweeklyreport__cluster__branch__name",
-        )
-        .annotate(count=Count("id"))
-    )
-    for row in cluster_member_links:
-        bid = row["clusterweeklyreport__cluster__branch_id"]
-        if bid:
-            ensure_branch(bid, row["clusterweeklyreport__cluster__branch__name"])
-            branch_data[bid]["cluster_members"] = row["count"]
-
-    ev_member_links = (
-        EvangelismWeeklyReport.members_attended.through.objects.filter(
-            evangelismweeklyreport__in=evangelism_reports
-        )
-        .values(
-            "evangelismweeklyreport__evangelism_group__cluster__branch_id",
-            "evangelismweeklyreport__evangelism_group__cluster__branch__name",
-        )
-        .annotate(count=Count("id"))
-    )
-    for row in ev_member_links:
-        bid = row["evangelismweeklyreport__evangelism_group__cluster__branch_id"]
-        if bid:
-            ensure_branch(
-                bid,
-                row["evangelismweeklyreport__evangelism_group__cluster__branch__name"],
-            )
-            branch_data[bid]["evangelism_members"] = row["count"]
-
-    service_by_branch = (
-        service_qs.values("event__branch_id", "event__branch__name")
-        .annotate(headcount=Count("id"))
-        .order_by("event__branch__name")
-    )
-    for row in service_by_branch:
-        bid = row["event__branch_id"]
-        if bid:
-            ensure_branch(bid, row["event__branch__name"])
-            branch_data[bid]["service_headcount"] = row["headcount"]
+    # Branches only reached through reports with no attendance stay out, as before.
+    for key, section in (("cluster_members", cluster), ("evangelism_members", evangelism)):
+        for branch_id, row in section["by_branch"].items():
+            if row["members"]:
+                ensure_branch(branch_id, row["branch_name"])[key] = row["members"]
+    for branch_id, row in service["by_branch"].items():
+        ensure_branch(branch_id, row["branch_name"])["service_headcount"] = row["headcount"]
 
     return sorted(branch_data.values(), key=lambda r: r["branch_name"])
 
 
+def _engagement_kpis(cluster: dict, evangelism: dict, service: dict) -> dict:
+    return {
+        "cluster_reports": cluster["total_reports"],
+        "cluster_avg_members": cluster["average_attendance"]["avg_members"],
+        "cluster_avg_visitors": cluster["average_attendance"]["avg_visitors"],
+        "evangelism_reports": evangelism["total_reports"],
+        "evangelism_avg_members": evangelism["average_attendance"]["avg_members"],
+        "evangelism_avg_visitors": evangelism["average_attendance"]["avg_visitors"],
+        "service_occurrences": service["occurrence_count"],
+        "service_avg_headcount": service["avg_headcount"],
+    }
+
+
 def build_engagement_summary(
     cluster_reports_qs,
     evangelism_reports_qs,
@@ -917,16 +1003,20 @@ def build_engagement_summary(
     *,
     months: int = 12,
     single_branch_view: bool = False,
+    compare_years: int = 0,
 ):
-    """Aggregate engagement & attendance for pre-scoped querysets."""
+    """Aggregate engagement & attendance for pre-scoped querysets.
+
+    ``comparisons`` repeats the KPIs and monthly trends for the same window
+    ``1..compare_years`` years earlier; they come from the same grouped
+    queries as the current window.
+    """
     today = church_today()
-    cluster_window = _filter_reports_by_window(cluster_reports_qs, months, today)
-    evangelism_window = _filter_reports_by_window(
-        evangelism_reports_qs, months, today
-    )
+    windows = _engagement_windows(months, today, compare_years)
 
-    cluster_raw = _build_weekly_report_section(
-        cluster_window,
+    cluster_sections = _build_weekly_report_section(
+        cluster_reports_qs,
+        windows=windows,
         member_through=ClusterWeeklyReport.members_attended.through,
         visitor_through=ClusterWeeklyReport.visitors_attended.through,
         report_fk="clusterweeklyreport",
@@ -934,7 +1024,10 @@ def build_engagement_summary(
         entity_values=("cluster_id", "cluster__name", "cluster__code"),
         entity_label_name_key="cluster__name",
         entity_label_code_key="cluster__code",
+        branch_id_field="cluster__branch_id",
+        branch_name_field="cluster__branch__name",
     )
+    cluster_raw = cluster_sections[0]
     cluster_section = {
         "total_reports": cluster_raw["total_reports"],
         "total_attendance": cluster_raw["total_attendance"],
@@ -952,8 +1045,9 @@ def build_engagement_summary(
         ],
     }
 
-    evangelism_raw = _build_weekly_report_section(
-        evangelism_window,
+    evangelism_sections = _build_weekly_report_section(
+        evangelism_reports_qs,
+        windows=windows,
         member_through=EvangelismWeeklyReport.members_attended.through,
         visitor_through=EvangelismWeeklyReport.visitors_attended.through,
         report_fk="evangelismweeklyreport",
@@ -961,7 +1055,10 @@ def build_engagement_summary(
         entity_values=("evangelism_group_id", "evangelism_group__name"),
         entity_label_name_key="evangelism_group__name",
         entity_label_code_key=None,
+        branch_id_field="evangelism_group__cluster__branch_id",
+        branch_name_field="evangelism_group__cluster__branch__name",
     )
+    evangelism_raw = evangelism_sections[0]
     evangelism_section = {
         "total_reports": evangelism_raw["total_reports"],
         "total_attendance": evangelism_raw["total_attendance"],
@@ -979,37 +1076,45 @@ def build_engagement_summary(
         ],
     }
 
-    service_section = _build_service_section(
-        service_attendance_qs, months=months, today=today
-    )
-
-    summary = {
-        "cluster_reports": cluster_section["total_reports"],
-        "cluster_avg_members": cluster_section["average_attendance"]["avg_members"],
-        "cluster_avg_visitors": cluster_section["average_attendance"]["avg_visitors"],
-        "evangelism_reports": evangelism_section["total_reports"],
-        "evangelism_avg_members": evangelism_section["average_attendance"]["avg_members"],
-        "evangelism_avg_visitors": evangelism_section["average_attendance"]["avg_visitors"],
-        "service_occurrences": service_section["occurrence_count"],
-        "service_avg_headcount": service_section["avg_headcount"],
+    service_sections = _build_service_section(service_attendance_qs, windows=windows)
+    service_section = {
+        key: value for key, value in service_sections[0].items() if key != "by_branch"
     }
 
+    summary = _engagement_kpis(cluster_section, evangelism_section, service_section)
+
     by_branch: list[dict] = []
     if not single_branch_view:
         by_branch = _build_engagement_by_branch(
-            cluster_reports_qs,
-            evangelism_reports_qs,
-            service_attendance_qs,
-            months=months,
-            today=today,
+            cluster_raw, evangelism_raw, service_sections[0]
         )
 
+    comparisons = [
+        {
+            "period_start": start.isoformat(),
+            "period_end": end.isoformat(),
+            "summary": _engagement_kpis(cluster, evangelism, service),
+            "monthly_trend": {
+                "cluster": cluster["monthly_trend"],
+                "evangelism": evangelism["monthly_trend"],
+                "service": service["monthly_trend"],
+            },
+        }
+        for (start, end), cluster, evangelism, service in zip(
+            windows[1:],
+            cluster_sections[1:],
+            evangelism_sections[1:],
+            service_sections[1:],
+        )
+    ]
+
     return {
         "summary": summary,
         "cluster": cluster_section,
         "evangelism": evangelism_section,
         "service": service_section,
         "by_branch": by_branch,
+        "comparisons": comparisons,
     }
 
 
@@ -1197,6 +1302,7 @@ def build_v2b_summary(
     branch_id: int | None = None,
     year: int,
     single_branch_view: bool = False,
+    compare_years: int = 0,
 ):
     """Build V2B (visitor-to-brethren) analytics for optional branch scope."""
     from apps.evangelism.services import generate_branch_scoped_v2b_summary
@@ -1205,6 +1311,7 @@ def build_v2b_summary(
         branch_id=branch_id,
         year=year,
         single_branch_view=single_branch_view,
+        compare_years=compare_years,
     )
 
 
@@ -1302,11 +1409,14 @@ def build_stewardship_summary(
     *,
     branch_id: int | None = None,
     year: int,
+    compare_years: int = 0,
 ):
     """Build stewardship (giving and pledges) analytics for optional branch scope."""
     from apps.finance.services import generate_branch_scoped_stewardship_summary
 
-    return generate_branch_scoped_stewardship_summary(branch_id=branch_id, year=year)
+    return generate_branch_scoped_stewardship_summary(
+        branch_id=branch_id, year=year, compare_years=compare_years
+    )
 
 
 def build_stewardship_summary_csv(payload: dict) -> str:
@@ -1409,34 +1519,34 @@ def _overview_module(
 
 
 def build_overview_summary(
+    scope,
     *,
-    people_qs,
-    cluster_reports_qs,
-    evangelism_reports_qs,
-    service_attendance_qs,
-    lesson_progress_qs,
-    clusters,
-    branch_id: int | None,
     year: int,
     months: int,
-    single_branch_view: bool,
     compliance_start_date: date,
     compliance_end_date: date,
 ):
-    """Compose headline KPIs from each live analytics module."""
+    """Compose headline KPIs from each live analytics module.
+
+    Every module reads through the same :class:`ReportScope`, so its branch
+    id sets are resolved once for the whole overview.
+    """
+    branch_id = scope.branch_id
+    single_branch_view = scope.single_branch_view
+    people_qs = scope.people()
     people = build_people_summary(
         people_qs,
         months=months,
         single_branch_view=single_branch_view,
     )
     engagement = build_engagement_summary(
-        cluster_reports_qs,
-        evangelism_reports_qs,
-        service_attendance_qs,
+        scope.cluster_reports(),
+        scope.evangelism_reports(),
+        scope.service_attendance(),
         months=months,
         single_branch_view=single_branch_view,
     )
-    ncc = build_ncc_summary(lesson_progress_qs, people_qs, year=year)
+    ncc = build_ncc_summary(scope.lesson_progress(), people_qs, year=year)
     cym = build_cym_summary(branch_id=branch_id, year=year, month=None)
     v2b = build_v2b_summary(
         branch_id=branch_id,
@@ -1445,9 +1555,10 @@ def build_overview_summary(
     )
     stewardship = build_stewardship_summary(branch_id=branch_id, year=year)
     compliance = build_compliance_payload(
-        clusters,
+        scope.clusters(),
         compliance_start_date,
         compliance_end_date,
+        summary_only=True,
     )
 
     people_summary = people["summary"]
@@ -1,10 +1,13 @@
 from datetime import datetime, timedelta
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
 
 from apps.attendance.models import AttendanceRecord
 from apps.clusters.models import Cluster, ClusterComplianceNote, ClusterWeeklyReport
@@ -13,19 +16,37 @@ from apps.evangelism.models import (
     DropOff,
     EvangelismGroup,
     EvangelismWeeklyReport,
+    MonthlyConversionTracking,
     Prospect,
 )
+from apps.evangelism.services import (
+    calculate_monthly_statistics,
+    calculate_monthly_trends_for_years,
+)
 from apps.events.models import Event
 from apps.lessons.models import Lesson, LessonSessionReport, PersonLessonProgress
 from apps.people.models import Branch, Family, Person
+from apps.people.load_dataset import LoadDatasetGenerator, clear_load_dataset, scaled_counts
+from apps.reports.benchmarks import (
+    Measurement,
+    compare_to_baseline,
+    default_endpoints,
+    load_baseline,
+    run_benchmarks,
+)
+from apps.reports.scoping import ReportScope
+from apps.reports.services import build_cym_summary
 from apps.sunday_school.models import (
     SundaySchoolCategory,
     SundaySchoolClass,
     SundaySchoolClassMember,
+    SundaySchoolSession,
 )
 from apps.finance.models import Donation, Offering, Pledge, PledgeContribution
 from decimal import Decimal
 
+from core.datetime_utils import church_today, shift_years
+
 
 class ReportsMetaScopeTests(TestCase):
     def setUp(self):
@@ -318,6 +339,43 @@ class ComplianceReportTests(TestCase):
                     res.status_code, status.HTTP_403_FORBIDDEN, f"{user.username} {name}"
                 )
 
+    def test_comparisons_share_the_report_query(self):
+        today = church_today()
+        last_year = shift_years(today, -1)
+        iso_year, iso_week, _ = last_year.isocalendar()
+        ClusterWeeklyReport.objects.create(
+            cluster=self.north_cluster,
+            year=iso_year,
+            week_number=iso_week,
+            meeting_date=last_year,
+            gathering_type="PHYSICAL",
+        )
+        self.client.force_authenticate(user=self.admin)
+        url = reverse("reports:compliance")
+
+        def weekly_report_queries(params):
+            with CaptureQueriesContext(connection) as queries:
+                res = self.client.get(url, {"branch_id": self.north.id, **params})
+            self.assertEqual(res.status_code, status.HTTP_200_OK)
+            count = sum("clusterweeklyreport" in q["sql"] for q in queries)
+            return res, count
+
+        res, single = weekly_report_queries({})
+        self.assertEqual(res.data["comparisons"], [])
+        res, compared = weekly_report_queries({"compare_years": 2})
+        self.assertEqual(compared, single)
+
+        last_year_summary, two_years_ago = res.data["comparisons"]
+        self.assertEqual(
+            last_year_summary["period"]["end_date"], last_year.isoformat()
+        )
+        self.assertEqual(last_year_summary["total_clusters"], 1)
+        self.assertGreater(last_year_summary["compliance_rate"], 0)
+        self.assertEqual(two_years_ago["compliance_rate"], 0)
+
+        res = self.client.get(url, {"compare_years": "9"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class PeopleSummaryTests(TestCase):
     def setUp(self):
@@ -450,6 +508,30 @@ class PeopleSummaryTests(TestCase):
         self.assertGreaterEqual(water_counts.get(period, 0), 1)
         self.assertGreaterEqual(spirit_counts.get(period, 0), 1)
 
+    def test_baptism_comparison_adds_no_queries(self):
+        last_year = shift_years(timezone.now().date(), -1)
+        Person.objects.create_user(
+            username="baptized_last_year",
+            password="pw",
+            role="MEMBER",
+            status="ACTIVE",
+            branch=self.north,
+            water_baptism_date=last_year,
+        )
+        self.client.force_authenticate(user=self.admin)
+        params = {"branch_id": self.north.id, "months": 3}
+
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(self.summary_url, params)
+        with CaptureQueriesContext(connection) as compared:
+            res = self.client.get(self.summary_url, {**params, "compare_years": 1})
+        self.assertEqual(len(compared), len(single))
+
+        (comparison,) = res.data["comparisons"]
+        self.assertEqual(comparison["period_end"], last_year.isoformat())
+        self.assertEqual(comparison["summary"]["water_baptisms"], 1)
+        self.assertEqual(len(comparison["baptism_trend"]["water"]), 3)
+
     def test_export_csv_returns_csv(self):
         self.client.force_authenticate(user=self.admin)
         res = self.client.get(self.csv_url)
@@ -689,6 +771,63 @@ class V2bSummaryTests(TestCase):
         )
         self.assertEqual(january["taken_ncc_count"], 0)
 
+    def test_yearly_trends_match_monthly_statistics(self):
+        last_year = self.year - 1
+        for year, month, prospect, stage in (
+            (self.year, 2, self.north_invited, "INVITED"),
+            (self.year, 2, self.north_attended, "INVITED"),
+            (self.year, 2, self.north_attended, "ATTENDED"),
+            (self.year, 3, self.north_attended, "BAPTIZED"),
+            (last_year, 7, self.north_invited, "INVITED"),
+            (last_year, 8, self.south_converted, "RECEIVED_HG"),
+        ):
+            MonthlyConversionTracking.objects.create(
+                cluster=prospect.inviter_cluster,
+                prospect=prospect,
+                year=year,
+                month=month,
+                stage=stage,
+                first_date_in_stage=timezone.now().date().replace(
+                    year=year, month=month, day=1
+                ),
+            )
+        # Reached in June (the NCC session is the latest milestone).
+        person = self.north_attended_person
+        person.date_first_invited = self.ncc_session_date.replace(month=1)
+        person.date_first_attended = self.ncc_session_date.replace(month=2)
+        person.water_baptism_date = self.ncc_session_date.replace(month=3)
+        person.spirit_baptism_date = self.ncc_session_date.replace(month=4)
+        person.save()
+
+        for branch_id in (None, self.north.id):
+            trends = calculate_monthly_trends_for_years(
+                branch_id=branch_id, years=[self.year, last_year]
+            )
+            for year in (self.year, last_year):
+                expected = [
+                    calculate_monthly_statistics(
+                        branch_id=branch_id, year=year, month=month
+                    )[0]
+                    for month in range(1, 13)
+                ]
+                self.assertEqual(trends[year], expected, (branch_id, year))
+        self.assertEqual(trends[self.year][5]["converted_count"], 1)
+
+        self.client.force_authenticate(user=self.admin)
+        with CaptureQueriesContext(connection) as single:
+            self.client.get(self.summary_url, {"year": self.year})
+        with CaptureQueriesContext(connection) as compared:
+            res = self.client.get(
+                self.summary_url, {"year": self.year, "compare_years": 1}
+            )
+        # Only the earlier years' drop-off totals need a query of their own.
+        self.assertEqual(len(compared), len(single) + 1)
+        self.assertEqual(res.data["summary"]["total_reached"], 1)
+        (comparison,) = res.data["comparisons"]
+        self.assertEqual(comparison["year"], last_year)
+        self.assertEqual(comparison["summary"]["drop_offs"], 0)
+        self.assertEqual(comparison["monthly_trend"][7]["received_hg_count"], 1)
+
     def test_leakage_populated(self):
         self.client.force_authenticate(user=self.admin)
         res = self.client.get(
@@ -946,6 +1085,82 @@ class CymSummaryTests(TestCase):
         res = self.client.get(self.summary_url)
         self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
 
+    def _session(self, class_obj, day, present=(), linked=True):
+        event = None
+        if linked:
+            start = timezone.make_aware(datetime.combine(day, datetime.min.time()))
+            event = Event.objects.create(
+                title=f"{class_obj.name} {day}",
+                start_date=start,
+                end_date=start + timedelta(hours=1),
+                event_type_id="SUNDAY_SCHOOL",
+                location="Room",
+            )
+        SundaySchoolSession.objects.create(
+            sunday_school_class=class_obj, event=event, session_date=day
+        )
+        for person in present:
+            AttendanceRecord.objects.create(
+                event=event,
+                person=person,
+                occurrence_date=day,
+                status=AttendanceRecord.AttendanceStatus.PRESENT,
+            )
+        return event
+
+    def test_attendance_rates_are_set_based(self):
+        second_student = Person.objects.create_user(
+            username="north_cym_student_2",
+            password="pw",
+            role="MEMBER",
+            branch=self.north,
+        )
+        SundaySchoolClassMember.objects.create(
+            sunday_school_class=self.north_class,
+            person=second_student,
+            role=SundaySchoolClassMember.Role.STUDENT,
+        )
+        today = timezone.now().date()
+        first = self._session(self.north_class, today - timedelta(days=14), [self.north_student])
+        self._session(
+            self.north_class,
+            today - timedelta(days=7),
+            [self.north_student, second_student, self.member],
+        )
+        self._session(self.north_class, today, linked=False)
+        # Another day's record on the same event is not this session's attendance.
+        AttendanceRecord.objects.create(
+            event=first,
+            person=second_student,
+            occurrence_date=today,
+            status=AttendanceRecord.AttendanceStatus.PRESENT,
+        )
+
+        with CaptureQueriesContext(connection) as few_classes:
+            payload = build_cym_summary()
+        rates = {row["class_id"]: row["attendance_rate"] for row in payload["by_class"]}
+        self.assertEqual(rates[self.north_class.id], 75.0)
+        self.assertIsNone(rates[self.south_class.id])
+        self.assertEqual(payload["average_attendance_rate"], 75.0)
+        self.assertEqual(
+            build_cym_summary(branch_id=self.north.id)["by_class"][0]["attendance_rate"],
+            75.0,
+        )
+
+        for i in range(3):
+            extra = SundaySchoolClass.objects.create(
+                name=f"Extra {i}", category=self.category, is_active=True
+            )
+            SundaySchoolClassMember.objects.create(
+                sunday_school_class=extra,
+                person=self.south_student,
+                role=SundaySchoolClassMember.Role.STUDENT,
+            )
+            self._session(extra, today, [self.south_student])
+        with CaptureQueriesContext(connection) as more_classes:
+            build_cym_summary()
+        self.assertEqual(len(more_classes), len(few_classes))
+
 
 class EngagementSummaryTests(TestCase):
     def setUp(self):
@@ -1177,6 +1392,132 @@ class EngagementSummaryTests(TestCase):
                     f"{user.username} {url}",
                 )
 
+    def test_comparison_windows_share_grouped_queries(self):
+        last_year = shift_years(timezone.now().date(), -1)
+        iso_year, iso_week, _ = last_year.isocalendar()
+        report = ClusterWeeklyReport.objects.create(
+            cluster=self.north_cluster,
+            year=iso_year,
+            week_number=iso_week,
+            meeting_date=last_year,
+            gathering_type="PHYSICAL",
+        )
+        report.members_attended.add(self.north_member, self.member)
+        AttendanceRecord.objects.create(
+            event=self.north_service,
+            person=self.north_member,
+            occurrence_date=last_year,
+            status=AttendanceRecord.AttendanceStatus.PRESENT,
+        )
+        self.client.force_authenticate(user=self.admin)
+        params = {"branch_id": self.north.id}
+
+        with CaptureQueriesContext(connection) as single:
+            current = self.client.get(self.summary_url, params)
+        with CaptureQueriesContext(connection) as compared:
+            res = self.client.get(self.summary_url, {**params, "compare_years": 1})
+        self.assertEqual(len(compared), len(single))
+        self.assertEqual(res.data["summary"], current.data["summary"])
+        self.assertEqual(res.data["cluster"], current.data["cluster"])
+
+        (comparison,) = res.data["comparisons"]
+        self.assertEqual(comparison["period_end"], last_year.isoformat())
+        self.assertEqual(comparison["summary"]["cluster_reports"], 1)
+        self.assertEqual(comparison["summary"]["cluster_avg_members"], 2.0)
+        self.assertEqual(comparison["summary"]["evangelism_reports"], 0)
+        self.assertEqual(comparison["summary"]["service_avg_headcount"], 1.0)
+        self.assertEqual(
+            comparison["monthly_trend"]["cluster"],
+            [{"period": last_year.strftime("%Y-%m"), "members": 2, "visitors": 0}],
+        )
+
+        res = self.client.get(self.summary_url, {"compare_years": "x"})
+        self.assertEqual(res.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_each_link_table_is_scanned_once(self):
+        self.north_cluster_report.members_attended.add(self.member)
+        self.client.force_authenticate(user=self.admin)
+
+        with CaptureQueriesContext(connection) as captured:
+            res = self.client.get(self.summary_url)
+        for table in (
+            "clusters_clusterweeklyreport_members_attended",
+            "clusters_clusterweeklyreport_visitors_attended",
+            "evangelism_evangelismweeklyreport_members_attended",
+            "evangelism_evangelismweeklyreport_visitors_attended",
+        ):
+            self.assertEqual(
+                sum(f'"{table}"' in q["sql"] for q in captured), 1, table
+            )
+
+        self.assertEqual(
+            [
+                (
+                    row["branch_name"],
+                    row["cluster_members"],
+                    row["evangelism_members"],
+                    row["service_headcount"],
+                )
+                for row in res.data["by_branch"]
+            ],
+            [("North", 2, 1, 2), ("South", 1, 1, 1)],
+        )
+        self.assertEqual(
+            [
+                (row["cluster_label"], row["report_count"], row["sum_members_attended"])
+                for row in res.data["cluster"]["by_cluster"]
+            ],
+            [("EN1 - North Cluster", 1, 2), ("ES1 - South Cluster", 1, 1)],
+        )
+        self.assertEqual(
+            res.data["cluster"]["gathering_type_distribution"],
+            [
+                {"gathering_type": "ONLINE", "count": 1},
+                {"gathering_type": "PHYSICAL", "count": 1},
+            ],
+        )
+        self.assertEqual(res.data["cluster"]["total_attendance"], {"members": 3, "visitors": 1})
+
+    def test_report_scope_materializes_branch_ids_once(self):
+        scope = ReportScope(can_pick=False, branch_id=self.north.id)
+        with self.assertNumQueries(1):
+            self.assertEqual(scope.cluster_ids, (self.north_cluster.id,))
+            self.assertEqual(scope.cluster_ids, (self.north_cluster.id,))
+
+        # Report querysets filter their own foreign keys: no branch joins.
+        with CaptureQueriesContext(connection) as queries:
+            cluster_reports = list(scope.cluster_reports())
+            evangelism_reports = list(scope.evangelism_reports())
+            service = list(scope.service_attendance())
+        self.assertEqual(cluster_reports, [self.north_cluster_report])
+        self.assertEqual(
+            {report.evangelism_group_id for report in evangelism_reports},
+            {self.north_group.id},
+        )
+        self.assertEqual({record.event_id for record in service}, {self.north_service.id})
+        report_sql = [q["sql"] for q in queries if "weeklyreport" in q["sql"]]
+        self.assertTrue(report_sql)
+        self.assertFalse(any("JOIN" in sql for sql in report_sql))
+
+        everywhere = ReportScope(can_pick=True, branch_id=None)
+        self.assertIsNone(everywhere.cluster_ids)
+        self.assertEqual(everywhere.cluster_reports().count(), 2)
+
+        branchless = ReportScope(can_pick=False, branch_id=None)
+        with self.assertNumQueries(0):
+            self.assertEqual(list(branchless.cluster_reports()), [])
+            self.assertEqual(list(branchless.people()), [])
+
+
+    def test_report_scope_is_memoized_per_user(self):
+        request = Request(APIRequestFactory().get("/", {"branch_id": self.south.id}))
+        admin_scope = ReportScope.for_request(request, self.admin)
+        pastor_scope = ReportScope.for_request(request, self.branch_pastor)
+
+        self.assertEqual((admin_scope.can_pick, admin_scope.branch_id), (True, self.south.id))
+        self.assertEqual((pastor_scope.locked, pastor_scope.branch_id), (True, self.north.id))
+        self.assertIs(ReportScope.for_request(request, self.admin), admin_scope)
+
 
 class OverviewSummaryTests(TestCase):
     EXPECTED_TABS = (
@@ -1482,3 +1823,77 @@ class StewardshipSummaryTests(TestCase):
             self.client.force_authenticate(user=user)
             res = self.client.get(self.summary_url)
             self.assertEqual(res.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class BenchmarkHarnessTests(TestCase):
+    def test_every_benchmarked_endpoint_serves_a_generated_dataset(self):
+        today = church_today()
+        counts = scaled_counts(
+            branches=1, people=40, clusters=2, years=1, prospects=5, donations=5, pledges=2
+        )
+        LoadDatasetGenerator(seed=1, counts=counts, end_date=today).run()
+        admin = Person.objects.create_user(
+            username="benchmark_test_admin", password="pw", role="ADMIN"
+        )
+
+        results = run_benchmarks(admin, default_endpoints(today), repeat=1)
+
+        self.assertEqual(
+            {r.name: r.status_code for r in results},
+            {r.name: 200 for r in results},
+        )
+        for result in results:
+            self.assertGreater(result.queries, 0, result.name)
+            self.assertGreater(result.peak_kb, 0, result.name)
+
+    def test_compare_to_baseline_flags_regressions_beyond_tolerance(self):
+        baseline = {
+            "tolerance": 0.5,
+            "endpoints": {
+                "a": {"queries": 10, "wall_ms": 100.0, "peak_kb": 1000.0},
+                "b": {"queries": 10, "wall_ms": 100.0, "peak_kb": 1000.0},
+            },
+        }
+        results = [
+            Measurement("a", 200, 10, 149.0, 1499.0),
+            Measurement("b", 200, 11, 151.0, 900.0),
+            Measurement("c", 500, 0, 0.0, 0.0),
+            Measurement("unbudgeted", 200, 99, 1.0, 1.0),
+        ]
+
+        failures = compare_to_baseline(results, baseline)
+        self.assertEqual(len(failures), 3)
+        self.assertTrue(failures[0].startswith("b: 11 queries"))
+        self.assertTrue(failures[1].startswith("b: wall_ms 151.0"))
+        self.assertEqual(failures[2], "c: HTTP 500")
+
+        failures = compare_to_baseline(results, baseline, check_timing=False)
+        self.assertEqual(len(failures), 2)
+
+        baseline["unbudgeted"] = {"b": "known N+1"}
+        failures = compare_to_baseline(results, baseline, check_memory=False)
+        self.assertEqual(failures, ["c: HTTP 500"])
+
+    def test_budgeted_query_counts_do_not_grow_with_the_dataset(self):
+        today = church_today()
+        admin = Person.objects.create_user(
+            username="benchmark_test_admin", password="pw", role="ADMIN"
+        )
+        budgeted = set(load_baseline()["endpoints"])
+        endpoints = [e for e in default_endpoints(today) if e.name in budgeted]
+
+        def query_counts(people, clusters):
+            clear_load_dataset()
+            counts = scaled_counts(
+                branches=1,
+                people=people,
+                clusters=clusters,
+                years=1,
+                prospects=5,
+                donations=5,
+                pledges=2,
+            )
+            LoadDatasetGenerator(seed=1, counts=counts, end_date=today).run()
+            return {r.name: r.queries for r in run_benchmarks(admin, endpoints, repeat=1)}
+
+        self.assertEqual(query_counts(80, 4), query_counts(40, 2))
@@ -8,16 +8,13 @@ from rest_framework import status as http_status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from apps.attendance.models import AttendanceRecord
-from apps.clusters.models import Cluster, ClusterComplianceNote, ClusterWeeklyReport
+from apps.clusters.models import Cluster, ClusterComplianceNote
 from apps.clusters.serializers import ClusterComplianceNoteSerializer
-from apps.evangelism.models import EvangelismWeeklyReport
-from apps.lessons.models import PersonLessonProgress
-from apps.people.models import Branch, Person
+from apps.people.models import Branch
 
 from . import services
 from .permissions import IsReportsViewer
-from .scoping import apply_branch_filter, resolve_branch_scope
+from .scoping import ReportScope
 
 
 def _parse_date(value):
@@ -33,65 +30,6 @@ def _parse_date(value):
         )
 
 
-def _scoped_clusters(request):
-    """Cluster queryset limited to the user's branch scope."""
-    return apply_branch_filter(
-        Cluster.objects.all(),
-        request.user,
-        request,
-        branch_lookup="branch_id",
-    )
-
-
-def _scoped_people(request):
-    """Person queryset limited to the user's branch scope (ADMIN excluded)."""
-    return apply_branch_filter(
-        Person.objects.exclude(role="ADMIN"),
-        request.user,
-        request,
-        branch_lookup="branch_id",
-    )
-
-
-def _scoped_cluster_reports(request):
-    return apply_branch_filter(
-        ClusterWeeklyReport.objects.all(),
-        request.user,
-        request,
-        branch_lookup="cluster__branch_id",
-    )
-
-
-def _scoped_evangelism_reports(request):
-    return apply_branch_filter(
-        EvangelismWeeklyReport.objects.all(),
-        request.user,
-        request,
-        branch_lookup="evangelism_group__cluster__branch_id",
-    )
-
-
-def _scoped_service_attendance(request):
-    return apply_branch_filter(
-        AttendanceRecord.objects.filter(
-            event__event_type_id="SUNDAY_SERVICE",
-            status=AttendanceRecord.AttendanceStatus.PRESENT,
-        ),
-        request.user,
-        request,
-        branch_lookup="event__branch_id",
-    )
-
-
-def _scoped_lesson_progress(request):
-    return apply_branch_filter(
-        PersonLessonProgress.objects.select_related("person", "lesson"),
-        request.user,
-        request,
-        branch_lookup="person__branch_id",
-    )
-
-
 def _parse_year_param(request, *, use_current_year_default: bool = True):
     year_param = request.query_params.get("year")
     if not year_param:
@@ -113,6 +51,29 @@ def _parse_year_param(request, *, use_current_year_default: bool = True):
     return year, None
 
 
+MAX_COMPARE_YEARS = 3
+
+
+def _parse_compare_years_param(request):
+    """How many preceding years to compare against (``compare_years``, default 0)."""
+    compare_param = request.query_params.get("compare_years")
+    if not compare_param:
+        return 0, None
+    try:
+        compare_years = int(compare_param)
+    except (TypeError, ValueError):
+        return None, Response(
+            {"error": "compare_years must be a valid integer."},
+            status=http_status.HTTP_400_BAD_REQUEST,
+        )
+    if not 0 <= compare_years <= MAX_COMPARE_YEARS:
+        return None, Response(
+            {"error": f"compare_years must be between 0 and {MAX_COMPARE_YEARS}."},
+            status=http_status.HTTP_400_BAD_REQUEST,
+        )
+    return compare_years, None
+
+
 def _parse_month_param(request):
     month_param = request.query_params.get("month")
     if not month_param:
@@ -144,9 +105,9 @@ class ReportsMetaView(APIView):
 
     def get(self, request):
         user = request.user
-        scope = resolve_branch_scope(user, request)
+        scope = ReportScope.for_request(request)
 
-        if scope["can_pick"]:
+        if scope.can_pick:
             branch_rows = Branch.objects.filter(is_active=True).values("id", "name")
         elif user.branch_id:
             branch_rows = Branch.objects.filter(id=user.branch_id).values("id", "name")
@@ -156,9 +117,9 @@ class ReportsMetaView(APIView):
         return Response(
             {
                 "role": user.role,
-                "can_pick_branch": scope["can_pick"],
-                "branch_locked": scope["locked"],
-                "effective_branch_id": scope["effective_branch_id"],
+                "can_pick_branch": scope.can_pick,
+                "branch_locked": scope.locked,
+                "effective_branch_id": scope.branch_id,
                 "branches": list(branch_rows),
             }
         )
@@ -182,8 +143,11 @@ class ComplianceView(APIView):
             start_date = today - timedelta(weeks=4)
         if end_date is None:
             end_date = today
+        compare_years, err = _parse_compare_years_param(request)
+        if err:
+            return err
 
-        clusters = _scoped_clusters(request)
+        clusters = ReportScope.for_request(request).clusters()
 
         coordinator_id = request.query_params.get("coordinator_id")
         if coordinator_id:
@@ -208,6 +172,7 @@ class ComplianceView(APIView):
             end_date,
             status=status_filter,
             min_rate=min_rate,
+            compare_years=compare_years,
         )
         return Response(payload)
 
@@ -218,7 +183,7 @@ class ComplianceOverdueView(APIView):
     permission_classes = [IsReportsViewer]
 
     def get(self, request):
-        return Response(services.build_overdue(_scoped_clusters(request)))
+        return Response(services.build_overdue(ReportScope.for_request(request).clusters()))
 
 
 class ComplianceAtRiskView(APIView):
@@ -232,7 +197,7 @@ class ComplianceAtRiskView(APIView):
         except (TypeError, ValueError):
             weeks_back = 4
         return Response(
-            services.build_at_risk(_scoped_clusters(request), weeks_back)
+            services.build_at_risk(ReportScope.for_request(request).clusters(), weeks_back)
         )
 
 
@@ -250,7 +215,7 @@ class ComplianceHistoryView(APIView):
         if group_by not in ("week", "month"):
             group_by = "week"
 
-        clusters = _scoped_clusters(request)
+        clusters = ReportScope.for_request(request).clusters()
 
         cluster_id = request.query_params.get("cluster_id")
         if cluster_id:
@@ -277,7 +242,7 @@ class ComplianceNotesView(APIView):
     permission_classes = [IsReportsViewer]
 
     def get(self, request):
-        clusters = _scoped_clusters(request)
+        clusters = ReportScope.for_request(request).clusters()
 
         cluster_id = request.query_params.get("cluster_id")
         cluster_id_int = None
@@ -326,7 +291,7 @@ class ComplianceNotesView(APIView):
             return err
 
         # Only allow notes on clusters within the user's branch scope.
-        clusters = _scoped_clusters(request)
+        clusters = ReportScope.for_request(request).clusters()
         try:
             cluster = clusters.get(id=int(cluster_id))
         except (ValueError, Cluster.DoesNotExist):
@@ -367,7 +332,7 @@ class ComplianceExportCsvView(APIView):
         if end_date is None:
             end_date = today
 
-        clusters = _scoped_clusters(request)
+        clusters = ReportScope.for_request(request).clusters()
         status_filter = request.query_params.get("status") or None
 
         payload = services.build_compliance_payload(
@@ -393,15 +358,19 @@ class PeopleSummaryView(APIView):
         except (TypeError, ValueError):
             months = 12
         months = max(1, min(months, 60))
+        compare_years, err = _parse_compare_years_param(request)
+        if err:
+            return err
 
-        people = _scoped_people(request)
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        people = scope.people()
+        single_branch_view = scope.single_branch_view
 
         payload = services.build_people_summary(
             people,
             months=months,
             single_branch_view=single_branch_view,
+            compare_years=compare_years,
         )
         return Response(payload)
 
@@ -418,9 +387,9 @@ class PeopleExportCsvView(APIView):
             months = 12
         months = max(1, min(months, 60))
 
-        people = _scoped_people(request)
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        people = scope.people()
+        single_branch_view = scope.single_branch_view
 
         payload = services.build_people_summary(
             people,
@@ -447,16 +416,20 @@ class EngagementSummaryView(APIView):
         except (TypeError, ValueError):
             months = 12
         months = max(1, min(months, 60))
+        compare_years, err = _parse_compare_years_param(request)
+        if err:
+            return err
 
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        single_branch_view = scope.single_branch_view
 
         payload = services.build_engagement_summary(
-            _scoped_cluster_reports(request),
-            _scoped_evangelism_reports(request),
-            _scoped_service_attendance(request),
+            scope.cluster_reports(),
+            scope.evangelism_reports(),
+            scope.service_attendance(),
             months=months,
             single_branch_view=single_branch_view,
+            compare_years=compare_years,
         )
         return Response(payload)
 
@@ -473,13 +446,13 @@ class EngagementExportCsvView(APIView):
             months = 12
         months = max(1, min(months, 60))
 
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        single_branch_view = scope.single_branch_view
 
         payload = services.build_engagement_summary(
-            _scoped_cluster_reports(request),
-            _scoped_evangelism_reports(request),
-            _scoped_service_attendance(request),
+            scope.cluster_reports(),
+            scope.evangelism_reports(),
+            scope.service_attendance(),
             months=months,
             single_branch_view=single_branch_view,
         )
@@ -502,9 +475,10 @@ class NccSummaryView(APIView):
         if err:
             return err
 
+        scope = ReportScope.for_request(request)
         payload = services.build_ncc_summary(
-            _scoped_lesson_progress(request),
-            _scoped_people(request),
+            scope.lesson_progress(),
+            scope.people(),
             year=year,
         )
         return Response(payload)
@@ -520,9 +494,10 @@ class NccExportCsvView(APIView):
         if err:
             return err
 
+        scope = ReportScope.for_request(request)
         payload = services.build_ncc_summary(
-            _scoped_lesson_progress(request),
-            _scoped_people(request),
+            scope.lesson_progress(),
+            scope.people(),
             year=year,
         )
         csv_text = services.build_ncc_summary_csv(payload)
@@ -547,9 +522,9 @@ class CymSummaryView(APIView):
         if month_err:
             return month_err
 
-        scope = resolve_branch_scope(request.user, request)
+        scope = ReportScope.for_request(request)
         payload = services.build_cym_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
             month=month,
         )
@@ -569,9 +544,9 @@ class CymExportCsvView(APIView):
         if month_err:
             return month_err
 
-        scope = resolve_branch_scope(request.user, request)
+        scope = ReportScope.for_request(request)
         payload = services.build_cym_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
             month=month,
         )
@@ -591,14 +566,18 @@ class V2bSummaryView(APIView):
 
     def get(self, request):
         year, err = _parse_year_param(request)
+        if err:
+            return err
+        compare_years, err = _parse_compare_years_param(request)
         if err:
             return err
 
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        single_branch_view = scope.single_branch_view
         payload = services.build_v2b_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
+            compare_years=compare_years,
             single_branch_view=single_branch_view,
         )
         return Response(payload)
@@ -614,10 +593,10 @@ class V2bExportCsvView(APIView):
         if err:
             return err
 
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
+        scope = ReportScope.for_request(request)
+        single_branch_view = scope.single_branch_view
         payload = services.build_v2b_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
             single_branch_view=single_branch_view,
         )
@@ -650,20 +629,10 @@ class OverviewSummaryView(APIView):
         compliance_start = today - timedelta(days=28)
         compliance_end = today
 
-        scope = resolve_branch_scope(request.user, request)
-        single_branch_view = scope["effective_branch_id"] is not None
-
         payload = services.build_overview_summary(
-            people_qs=_scoped_people(request),
-            cluster_reports_qs=_scoped_cluster_reports(request),
-            evangelism_reports_qs=_scoped_evangelism_reports(request),
-            service_attendance_qs=_scoped_service_attendance(request),
-            lesson_progress_qs=_scoped_lesson_progress(request),
-            clusters=_scoped_clusters(request),
-            branch_id=scope["effective_branch_id"],
+            ReportScope.for_request(request),
             year=year,
             months=months,
-            single_branch_view=single_branch_view,
             compliance_start_date=compliance_start,
             compliance_end_date=compliance_end,
         )
@@ -677,13 +646,17 @@ class StewardshipSummaryView(APIView):
 
     def get(self, request):
         year, err = _parse_year_param(request)
+        if err:
+            return err
+        compare_years, err = _parse_compare_years_param(request)
         if err:
             return err
 
-        scope = resolve_branch_scope(request.user, request)
+        scope = ReportScope.for_request(request)
         payload = services.build_stewardship_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
+            compare_years=compare_years,
         )
         return Response(payload)
 
@@ -698,9 +671,9 @@ class StewardshipExportCsvView(APIView):
         if err:
             return err
 
-        scope = resolve_branch_scope(request.user, request)
+        scope = ReportScope.for_request(request)
         payload = services.build_stewardship_summary(
-            branch_id=scope["effective_branch_id"],
+            branch_id=scope.branch_id,
             year=year,
         )
         csv_text = services.build_stewardship_summary_csv(payload)
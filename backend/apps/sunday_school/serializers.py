@@ -226,6 +226,7 @@ class SundaySchoolRecurringSessionSerializer(serializers.Serializer):
         required=False, min_value=0, max_value=6, help_text="0=Monday, 6=Sunday"
     )
     default_lesson_title = serializers.CharField(required=False, allow_blank=True, max_length=200)
+    dry_run = serializers.BooleanField(required=False, default=False)
 
     def validate(self, attrs):
         if not attrs.get("end_date") and not attrs.get("num_occurrences"):
@@ -257,6 +258,8 @@ class SundaySchoolUnenrolledByCategorySerializer(serializers.Serializer):
     age_range = serializers.CharField()
     unenrolled_count = serializers.IntegerField()
     unenrolled_people = SundaySchoolUnenrolledPersonSerializer(many=True)
+    page = serializers.IntegerField()
+    has_more = serializers.BooleanField()
 
 
 class SundaySchoolSummarySerializer(serializers.Serializer):
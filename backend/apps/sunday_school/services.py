@@ -2,12 +2,18 @@ import calendar
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Optional
 
-from django.db.models import Q
+from django.db.models import Count, Exists, F, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
-from core.datetime_utils import church_today
+from core.datetime_utils import church_today, shift_years
 
-from apps.people.models import Person
+from apps.events.services.recurrence import (
+    bulk_create_sessions_with_events,
+    iter_session_dates,
+)
+from apps.clusters.models import Cluster
+from apps.people.models import Family, Person
 
 from .models import (
     SundaySchoolCategory,
@@ -25,12 +31,7 @@ def calculate_age(date_of_birth: Optional[date]) -> Optional[int]:
     if date_of_birth is None:
         return None
 
-    today = church_today()
-    age = today.year - date_of_birth.year
-    # Adjust if birthday hasn't occurred this year
-    if (today.month, today.day) < (date_of_birth.month, date_of_birth.day):
-        age -= 1
-    return age
+    return _age_on(date_of_birth, church_today())
 
 
 def bulk_enroll_students(
@@ -70,172 +71,283 @@ def bulk_enroll_students(
     return created_count
 
 
-def calculate_attendance_rate(
-    sunday_school_class: SundaySchoolClass,
+def _count_subquery(queryset, group_field: str):
+    """COUNT(*) of ``queryset`` rows for the outer row, 0 when there are none."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values(group_field)
+            .annotate(total=Count("*"))
+            .values("total")[:1]
+        ),
+        0,
+    )
+
+
+def annotate_attendance_totals(
+    classes,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     branch_id: Optional[int] = None,
-) -> Optional[float]:
+):
     """
-    Calculate average attendance rate for a class.
-    Returns None if no sessions found.
+    Annotate a SundaySchoolClass queryset with what attendance rates need, in
+    the same query:
+
+    - ``student_total``: active students (in ``branch_id`` when set)
+    - ``session_total``: sessions in the window that have a linked Event
+    - ``present_total``: PRESENT records of those students on those sessions,
+      matched on (event, occurrence_date = session_date)
     """
     from apps.attendance.models import AttendanceRecord
 
-    sessions = sunday_school_class.sessions.all()
+    students = SundaySchoolClassMember.objects.filter(
+        sunday_school_class_id=OuterRef("pk"),
+        is_active=True,
+        role=SundaySchoolClassMember.Role.STUDENT,
+    )
+    enrolled_student = SundaySchoolClassMember.objects.filter(
+        sunday_school_class_id=OuterRef(
+            "event__sunday_school_session__sunday_school_class_id"
+        ),
+        person_id=OuterRef("person_id"),
+        is_active=True,
+        role=SundaySchoolClassMember.Role.STUDENT,
+    )
+    if branch_id is not None:
+        students = students.filter(person__branch_id=branch_id)
+        enrolled_student = enrolled_student.filter(person__branch_id=branch_id)
+
+    sessions = SundaySchoolSession.objects.filter(
+        sunday_school_class_id=OuterRef("pk"), event__isnull=False
+    )
+    present = AttendanceRecord.objects.filter(
+        event__sunday_school_session__sunday_school_class_id=OuterRef("pk"),
+        occurrence_date=F("event__sunday_school_session__session_date"),
+        status=AttendanceRecord.AttendanceStatus.PRESENT,
+    ).filter(Exists(enrolled_student))
     if start_date:
         sessions = sessions.filter(session_date__gte=start_date)
+        present = present.filter(occurrence_date__gte=start_date)
     if end_date:
         sessions = sessions.filter(session_date__lte=end_date)
+        present = present.filter(occurrence_date__lte=end_date)
+
+    return classes.annotate(
+        student_total=_count_subquery(students, "sunday_school_class_id"),
+        session_total=_count_subquery(sessions, "sunday_school_class_id"),
+        present_total=_count_subquery(
+            present, "event__sunday_school_session__sunday_school_class_id"
+        ),
+    )
 
-    if not sessions.exists():
-        return None
 
-    student_qs = sunday_school_class.members.filter(
-        is_active=True, role=SundaySchoolClassMember.Role.STUDENT
+def attendance_rate_from_totals(class_obj: SundaySchoolClass) -> Optional[float]:
+    """Average attendance % from ``annotate_attendance_totals`` values."""
+    if not class_obj.student_total or not class_obj.session_total:
+        return None
+    average_attendance = class_obj.present_total / (
+        class_obj.session_total * class_obj.student_total
     )
-    if branch_id is not None:
-        student_qs = student_qs.filter(person__branch_id=branch_id)
+    return round(average_attendance * 100, 2)
 
-    student_ids = list(student_qs.values_list("person_id", flat=True))
-    total_enrolled = len(student_ids)
 
-    if total_enrolled == 0:
-        return None
+def calculate_attendance_rate(
+    sunday_school_class: SundaySchoolClass,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None,
+    branch_id: Optional[int] = None,
+) -> Optional[float]:
+    """
+    Calculate average attendance rate for a class.
+    Returns None if no sessions found.
+    """
+    class_obj = annotate_attendance_totals(
+        SundaySchoolClass.objects.filter(pk=sunday_school_class.pk),
+        start_date,
+        end_date,
+        branch_id=branch_id,
+    ).first()
+    return attendance_rate_from_totals(class_obj) if class_obj else None
 
-    total_present = 0
-    total_sessions = 0
 
-    for session in sessions:
-        if not session.event:
-            continue
+def _age_on(date_of_birth: date, today: date) -> int:
+    age = today.year - date_of_birth.year
+    if (today.month, today.day) < (date_of_birth.month, date_of_birth.day):
+        age -= 1
+    return age
 
-        attendance_records = AttendanceRecord.objects.filter(
-            event=session.event,
-            occurrence_date=session.session_date,
-            status=AttendanceRecord.AttendanceStatus.PRESENT,
-            person_id__in=student_ids,
-        )
-        present_count = attendance_records.count()
-        total_present += present_count
-        total_sessions += 1
 
-    if total_sessions == 0:
-        return None
+def category_birth_date_filter(category: SundaySchoolCategory, today: date) -> Q:
+    """
+    Date-of-birth range for a category's age bracket, as of ``today``.
 
-    average_attendance = total_present / (total_sessions * total_enrolled)
-    return round(average_attendance * 100, 2)
+    ``age >= min_age`` means born on or before the ``min_age``-th birthday
+    cutoff, and ``age <= max_age`` means born after the ``max_age + 1`` cutoff,
+    so the bracket is matched in SQL exactly as :func:`calculate_age` would.
+    """
+    q = Q()
+    if category.min_age is not None:
+        q &= Q(date_of_birth__lte=shift_years(today, -category.min_age))
+    if category.max_age is not None:
+        q &= Q(date_of_birth__gt=shift_years(today, -(category.max_age + 1)))
+    return q
+
+
+def _category_age_range(category: SundaySchoolCategory) -> str:
+    if category.min_age is not None and category.max_age is not None:
+        return f"{category.min_age}-{category.max_age}"
+    if category.min_age is not None:
+        return f"{category.min_age}+"
+    return ""
+
+
+def _unenrolled_full_name(row: Dict) -> str:
+    """First "Nickname" M. Last Suffix, falling back to the username."""
+    name_parts = []
+    if row["first_name"]:
+        name_parts.append(row["first_name"].strip())
+    if row["nickname"]:
+        name_parts.append(f'"{row["nickname"].strip()}"')
+    middle_name = (row["middle_name"] or "").strip()
+    if middle_name:
+        name_parts.append(f"{middle_name[0].upper()}.")
+    if row["last_name"]:
+        name_parts.append(row["last_name"].strip())
+    if row["suffix"]:
+        name_parts.append(row["suffix"].strip())
+    return " ".join(name_parts).strip() or row["username"]
+
+
+UNENROLLED_PERSON_FIELDS = (
+    "id",
+    "username",
+    "first_name",
+    "nickname",
+    "middle_name",
+    "last_name",
+    "suffix",
+    "date_of_birth",
+    "status",
+)
 
 
 def get_unenrolled_by_category(
     status_filter: Optional[str] = None,
     role_filter: Optional[str] = None,
     branch_id: Optional[int] = None,
+    category_id: Optional[int] = None,
+    page: int = 1,
+    page_size: Optional[int] = None,
 ) -> List[Dict]:
     """
     Find unenrolled people by category based on age brackets.
-    Returns list of dictionaries with category info and unenrolled people.
+
+    Each active category's age bracket becomes a date-of-birth range, and
+    people with an active class membership are dropped by an anti-join, so
+    all category counts come from one aggregate query. ``unenrolled_people``
+    holds one page per category (``page``/``page_size``; ``page_size=None``
+    returns everyone, ``0`` only counts). Cluster and family names for every
+    returned person are then read in one query each.
     """
     categories = SundaySchoolCategory.objects.filter(is_active=True).order_by("order", "name")
+    if category_id is not None:
+        categories = categories.filter(pk=category_id)
+    categories = list(categories)
+    if not categories:
+        return []
 
-    # Get all enrolled person IDs
-    enrolled_person_ids = set(
-        SundaySchoolClassMember.objects.filter(is_active=True).values_list("person_id", flat=True)
+    today = church_today()
+    people = Person.objects.filter(date_of_birth__isnull=False).filter(
+        ~Exists(
+            SundaySchoolClassMember.objects.filter(
+                person_id=OuterRef("pk"), is_active=True
+            )
+        )
     )
-
-    # Get all people with date_of_birth
-    people_query = Person.objects.filter(date_of_birth__isnull=False)
     if branch_id is not None:
-        people_query = people_query.filter(branch_id=branch_id)
+        people = people.filter(branch_id=branch_id)
     if status_filter:
-        people_query = people_query.filter(status=status_filter)
+        people = people.filter(status=status_filter)
     if role_filter:
-        people_query = people_query.filter(role=role_filter)
+        people = people.filter(role=role_filter)
 
-    people = people_query.select_related().prefetch_related("clusters", "families").all()
+    brackets = {
+        category.id: category_birth_date_filter(category, today) for category in categories
+    }
+    counts = people.aggregate(
+        **{
+            f"category_{category_id}": Count("pk", filter=bracket)
+            for category_id, bracket in brackets.items()
+        }
+    )
 
-    result = []
+    page = max(page, 1)
+    pages: Dict[int, List[Dict]] = {}
     for category in categories:
-        unenrolled_people = []
-        for person in people:
-            # Skip if already enrolled
-            if person.id in enrolled_person_ids:
-                continue
-
-            age = calculate_age(person.date_of_birth)
-            if age is None:
-                continue
-
-            # Check if person matches category age bracket
-            matches = True
-            if category.min_age is not None and age < category.min_age:
-                matches = False
-            if category.max_age is not None and age > category.max_age:
-                matches = False
-
-            if matches:
-                # Format name with middle initial, nickname, and suffix
-                name_parts = []
-                if person.first_name:
-                    name_parts.append(person.first_name.strip())
-                if person.nickname:
-                    name_parts.append(f'"{person.nickname.strip()}"')
-                if person.middle_name:
-                    middle_initial = person.middle_name.strip()[0].upper() if person.middle_name.strip() else ""
-                    if middle_initial:
-                        name_parts.append(f"{middle_initial}.")
-                if person.last_name:
-                    name_parts.append(person.last_name.strip())
-                if person.suffix:
-                    name_parts.append(person.suffix.strip())
-                full_name = " ".join(name_parts).strip() or person.username
-                
-                # Get cluster information
-                clusters = person.clusters.all()
-                cluster_info = []
-                for cluster in clusters:
-                    cluster_display = []
-                    if cluster.code:
-                        cluster_display.append(cluster.code)
-                    if cluster.name:
-                        cluster_display.append(cluster.name)
-                    if cluster_display:
-                        cluster_info.append(" - ".join(cluster_display))
-                cluster_display_str = ", ".join(cluster_info) if cluster_info else ""
-                
-                # Get family names
-                family_names = list(person.families.values_list("name", flat=True))
-                family_display_str = ", ".join(family_names) if family_names else ""
-                
-                # Create a person object with age attribute
-                person_data = {
-                    "id": person.id,
-                    "full_name": full_name,
-                    "first_name": person.first_name,
-                    "middle_name": person.middle_name,
-                    "last_name": person.last_name,
-                    "suffix": person.suffix,
-                    "age": age,
-                    "date_of_birth": person.date_of_birth,
-                    "status": person.status,
-                    "cluster_info": cluster_display_str,
-                    "family_names": family_display_str,
-                }
-                unenrolled_people.append(person_data)
-
-        age_range = ""
-        if category.min_age is not None and category.max_age is not None:
-            age_range = f"{category.min_age}-{category.max_age}"
-        elif category.min_age is not None:
-            age_range = f"{category.min_age}+"
+        count = counts[f"category_{category.id}"]
+        if page_size == 0 or not count:
+            pages[category.id] = []
+            continue
+        rows = (
+            people.filter(brackets[category.id])
+            .order_by("last_name", "first_name", "pk")
+            .values(*UNENROLLED_PERSON_FIELDS)
+        )
+        if page_size is not None:
+            offset = (page - 1) * page_size
+            rows = rows[offset : offset + page_size]
+        pages[category.id] = list(rows)
+
+    person_ids = {row["id"] for rows in pages.values() for row in rows}
+    cluster_names: Dict[int, List[str]] = {}
+    family_names: Dict[int, List[str]] = {}
+    if person_ids:
+        memberships = (
+            Cluster.members.through.objects.filter(person_id__in=person_ids)
+            .order_by("cluster__code", "cluster__name")
+            .values_list("person_id", "cluster__code", "cluster__name")
+        )
+        for person_id, code, name in memberships:
+            display = " - ".join(part for part in (code, name) if part)
+            if display:
+                cluster_names.setdefault(person_id, []).append(display)
+        families = (
+            Family.members.through.objects.filter(person_id__in=person_ids)
+            .order_by("family__name")
+            .values_list("person_id", "family__name")
+        )
+        for person_id, name in families:
+            family_names.setdefault(person_id, []).append(name)
 
+    result = []
+    for category in categories:
+        unenrolled_people = [
+            {
+                "id": row["id"],
+                "full_name": _unenrolled_full_name(row),
+                "first_name": row["first_name"],
+                "middle_name": row["middle_name"],
+                "last_name": row["last_name"],
+                "suffix": row["suffix"],
+                "age": _age_on(row["date_of_birth"], today),
+                "date_of_birth": row["date_of_birth"],
+                "status": row["status"],
+                "cluster_info": ", ".join(cluster_names.get(row["id"], [])),
+                "family_names": ", ".join(family_names.get(row["id"], [])),
+            }
+            for row in pages[category.id]
+        ]
+        count = counts[f"category_{category.id}"]
         result.append(
             {
                 "category_id": category.id,
                 "category_name": category.name,
-                "age_range": age_range,
-                "unenrolled_count": len(unenrolled_people),
+                "age_range": _category_age_range(category),
+                "unenrolled_count": count,
                 "unenrolled_people": unenrolled_people,
+                "page": page,
+                "has_more": page_size is not None and page * page_size < count,
             }
         )
 
@@ -284,18 +396,14 @@ def generate_branch_scoped_summary_stats(
     classes_with_attendance = 0
     by_class = []
 
-    for class_obj in active_classes:
-        if window_start and window_end:
-            rate = calculate_attendance_rate(
-                class_obj, window_start, window_end, branch_id=branch_id
-            )
-        else:
-            rate = calculate_attendance_rate(class_obj, branch_id=branch_id)
-
-        student_count = students.filter(sunday_school_class=class_obj).count()
+    for class_obj in annotate_attendance_totals(
+        active_classes, window_start, window_end, branch_id=branch_id
+    ):
+        student_count = class_obj.student_total
         if student_count == 0:
             continue
 
+        rate = attendance_rate_from_totals(class_obj)
         if rate is not None:
             total_attendance_rate += rate
             classes_with_attendance += 1
@@ -319,7 +427,7 @@ def generate_branch_scoped_summary_stats(
         else None
     )
 
-    unenrolled = get_unenrolled_by_category(branch_id=branch_id)
+    unenrolled = get_unenrolled_by_category(branch_id=branch_id, page_size=0)
     unenrolled_summary = [
         {
             "category_id": row["category_id"],
@@ -388,87 +496,58 @@ def create_recurring_sessions(
     recurrence_pattern: str,
     day_of_week: Optional[int] = None,
     default_lesson_title: str = "",
+    dry_run: bool = False,
 ) -> List[SundaySchoolSession]:
     """
     Create multiple sessions based on recurrence pattern.
-    Returns list of created sessions.
+    Every date is planned up front; events and sessions are then bulk-inserted.
+    With ``dry_run`` the planned sessions are returned unsaved.
     """
     from apps.events.models import Event
 
-    sessions = []
-    current_date = start_date
-    occurrence_count = 0
     recurring_group_id = f"{sunday_school_class.id}_{timezone.now().timestamp()}"
 
-    # Determine end condition
-    if num_occurrences:
-        max_occurrences = num_occurrences
-    elif end_date:
-        max_occurrences = 1000  # Large number, will be limited by end_date
-    else:
-        max_occurrences = 52  # Default to 1 year of weekly sessions
-
     # Get class meeting time
     meeting_time = sunday_school_class.meeting_time or timezone.now().time()
 
-    while occurrence_count < max_occurrences:
-        if end_date and current_date > end_date:
-            break
-
-        # For weekly patterns, adjust to the correct day of week
-        if recurrence_pattern == "weekly" and day_of_week is not None:
-            # day_of_week: 0=Monday, 6=Sunday
-            current_weekday = current_date.weekday()
-            days_to_add = (day_of_week - current_weekday) % 7
-            if days_to_add > 0:
-                current_date += timedelta(days=days_to_add)
-            if end_date and current_date > end_date:
-                break
-
-        # Create session
-        session = SundaySchoolSession.objects.create(
-            sunday_school_class=sunday_school_class,
-            session_date=current_date,
-            session_time=meeting_time,
-            lesson_title=default_lesson_title,
-            is_recurring_instance=True,
-            recurring_group_id=recurring_group_id,
-        )
+    event_title = sunday_school_class.name
+    if default_lesson_title:
+        event_title = f"{event_title} - {default_lesson_title}"
 
-        # Create corresponding Event
-        session_datetime = datetime.combine(current_date, meeting_time)
-        session_datetime = timezone.make_aware(session_datetime)
-        end_datetime = session_datetime + timedelta(hours=1)  # Default 1 hour session
-
-        event_title = sunday_school_class.name
-        if default_lesson_title:
-            event_title = f"{event_title} - {default_lesson_title}"
-
-        event = Event.objects.create(
-            title=event_title,
-            description=f"Sunday School session for {sunday_school_class.name}",
-            start_date=session_datetime,
-            end_date=end_datetime,
-            event_type_id="SUNDAY_SCHOOL",
-            location=sunday_school_class.room_location or "",
-            is_recurring=False,
+    sessions = []
+    events = []
+    for session_date in iter_session_dates(
+        start_date,
+        recurrence_pattern,
+        end_date=end_date,
+        num_occurrences=num_occurrences,
+        day_of_week=day_of_week,
+    ):
+        sessions.append(
+            SundaySchoolSession(
+                sunday_school_class=sunday_school_class,
+                session_date=session_date,
+                session_time=meeting_time,
+                lesson_title=default_lesson_title,
+                is_recurring_instance=True,
+                recurring_group_id=recurring_group_id,
+            )
+        )
+        session_datetime = timezone.make_aware(
+            datetime.combine(session_date, meeting_time)
+        )
+        events.append(
+            Event(
+                title=event_title,
+                description=f"Sunday School session for {sunday_school_class.name}",
+                start_date=session_datetime,
+                end_date=session_datetime + timedelta(hours=1),  # Default 1 hour session
+                event_type_id="SUNDAY_SCHOOL",
+                location=sunday_school_class.room_location or "",
+                is_recurring=False,
+            )
         )
 
-        session.event = event
-        session.save()
-
-        sessions.append(session)
-        occurrence_count += 1
-
-        # Calculate next date based on pattern
-        if recurrence_pattern == "weekly":
-            current_date += timedelta(weeks=1)
-        elif recurrence_pattern == "bi_weekly":
-            current_date += timedelta(weeks=2)
-        elif recurrence_pattern == "monthly":
-            # Add approximately one month (30 days)
-            # For more accurate monthly calculation, we'd need dateutil
-            current_date += timedelta(days=30)
-
-    return sessions
-
+    if dry_run or not sessions:
+        return sessions
+    return bulk_create_sessions_with_events(SundaySchoolSession, sessions, events)
@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+from django.test import TestCase
+from rest_framework import status
+from rest_framework.test import APIClient
+
+from apps.clusters.models import Cluster
+from apps.people.models import Family, Person
+from apps.sunday_school.models import (
+    SundaySchoolCategory,
+    SundaySchoolClass,
+    SundaySchoolClassMember,
+)
+from apps.sunday_school.services import _age_on, get_unenrolled_by_category
+
+TODAY = date(2025, 3, 1)
+URL = "/api/sunday-school/classes/unenrolled_by_category/"
+
+
+@patch("apps.sunday_school.services.church_today", lambda: TODAY)
+class UnenrolledByCategoryTests(TestCase):
+    def setUp(self):
+        self.kids = SundaySchoolCategory.objects.create(name="Kids", min_age=5, max_age=12, order=1)
+        self.adults = SundaySchoolCategory.objects.create(name="Adults", min_age=18, order=2)
+        self.kids_class = SundaySchoolClass.objects.create(name="Kids Class", category=self.kids)
+        self.admin = Person.objects.create_user(username="ss_admin", password="x", role="ADMIN")
+
+    def _person(self, username, date_of_birth, **extra):
+        return Person.objects.create_user(
+            username=username,
+            password="x",
+            first_name=username.title(),
+            last_name="Unenrolled",
+            date_of_birth=date_of_birth,
+            **extra,
+        )
+
+    def _unenrolled_ids(self, rows, category):
+        row = next(row for row in rows if row["category_id"] == category.id)
+        return {person["id"] for person in row["unenrolled_people"]}
+
+    def test_birth_date_ranges_match_age_brackets(self):
+        # Every day around both bracket edges, including leap-day birthdays.
+        days = []
+        for edge in (date(2020, 2, 20), date(2012, 2, 20)):
+            days += [edge + timedelta(days=offset) for offset in range(14)]
+        people = [self._person(f"edge{index}", day) for index, day in enumerate(days)]
+
+        kids = self._unenrolled_ids(get_unenrolled_by_category(), self.kids)
+        expected = {
+            person.id for person in people if 5 <= _age_on(person.date_of_birth, TODAY) <= 12
+        }
+        self.assertEqual(kids, expected)
+        self.assertIn(date(2020, 3, 1), [p.date_of_birth for p in people if p.id in kids])
+        self.assertNotIn(date(2012, 2, 29), [p.date_of_birth for p in people if p.id in kids])
+
+    def test_enrolled_people_are_excluded_and_details_are_joined(self):
+        enrolled = self._person("enrolled", date(2016, 5, 1))
+        dropped = self._person("dropped", date(2016, 6, 1))
+        open_seat = self._person("open", date(2016, 7, 1), nickname="Ace", middle_name="bo", suffix="Jr")
+        SundaySchoolClassMember.objects.create(sunday_school_class=self.kids_class, person=enrolled)
+        SundaySchoolClassMember.objects.create(
+            sunday_school_class=self.kids_class, person=dropped, is_active=False
+        )
+        cluster = Cluster.objects.create(code="SS-1", name="Sunday Cluster")
+        cluster.members.add(open_seat)
+        family = Family.objects.create(name="Seat Family")
+        family.members.add(open_seat)
+
+        with self.assertNumQueries(5):
+            result = get_unenrolled_by_category(category_id=self.kids.id)
+        (kids,) = result
+        self.assertEqual(kids["unenrolled_count"], 2)
+        self.assertEqual(kids["age_range"], "5-12")
+        person = next(p for p in kids["unenrolled_people"] if p["id"] == open_seat.id)
+        self.assertEqual(person["full_name"], 'Open "Ace" B. Unenrolled Jr')
+        self.assertEqual(person["age"], 8)
+        self.assertEqual(person["cluster_info"], "SS-1 - Sunday Cluster")
+        self.assertEqual(person["family_names"], "Seat Family")
+        self.assertNotIn(enrolled.id, self._unenrolled_ids(result, self.kids))
+
+        # Growing the roster adds no queries.
+        for index in range(5):
+            self._person(f"extra{index}", date(2015, 1, index + 1))
+        with self.assertNumQueries(5):
+            get_unenrolled_by_category(category_id=self.kids.id)
+
+    def test_endpoint_pages_each_category(self):
+        for index in range(3):
+            self._person(f"kid{index}", date(2017, 1, index + 1))
+        client = APIClient()
+        client.force_authenticate(user=self.admin)
+
+        response = client.get(URL, {"page_size": 2})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        rows = {row["category_id"]: row for row in response.data}
+        kids = rows[self.kids.id]
+        self.assertEqual(kids["unenrolled_count"], 3)
+        self.assertEqual(len(kids["unenrolled_people"]), 2)
+        self.assertTrue(kids["has_more"])
+        # The admin has no date of birth, so matches no bracket.
+        self.assertEqual(rows[self.adults.id]["unenrolled_count"], 0)
+
+        rest = client.get(URL, {"category": self.kids.id, "page": 2, "page_size": 2})
+        self.assertEqual(len(rest.data), 1)
+        self.assertEqual([p["full_name"] for p in rest.data[0]["unenrolled_people"]], ["Kid2 Unenrolled"])
+        self.assertFalse(rest.data[0]["has_more"])
+
+        self.assertEqual(client.get(URL, {"page": "x"}).status_code, status.HTTP_400_BAD_REQUEST)
@@ -1,13 +1,17 @@
 from datetime import date, datetime, timedelta
 from typing import Optional
 
-from django.db.models import Prefetch, Q
+from django.conf import settings
+from django.db.models import F, Prefetch, Q
 from django.utils import timezone
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework import filters, status, viewsets
 from rest_framework.decorators import action
 from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from core.pagination import DEFAULT_MAX_PAGE_SIZE
 
 from apps.attendance.models import AttendanceRecord
 from apps.events.models import Event
@@ -40,7 +44,6 @@ from .serializers import (
 )
 from .services import (
     bulk_enroll_students,
-    calculate_attendance_rate,
     create_recurring_sessions,
     generate_summary_stats,
     get_unenrolled_by_category,
@@ -51,6 +54,7 @@ class SundaySchoolCategoryViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedAndNotVisitor, IsMemberOrAbove]
     queryset = SundaySchoolCategory.objects.all()
     serializer_class = SundaySchoolCategorySerializer
+    pagination_class = None  # Small reference table (age brackets)
     filter_backends = (
         DjangoFilterBackend,
         filters.SearchFilter,
@@ -247,32 +251,38 @@ class SundaySchoolClassViewSet(viewsets.ModelViewSet):
     def attendance(self, request, pk=None):
         """Get attendance records via linked Events."""
         sunday_school_class = self.get_object()
-        sessions = sunday_school_class.sessions.filter(
-            event__isnull=False
-        ).select_related("event")
+        records = (
+            AttendanceRecord.objects.filter(
+                event__sunday_school_session__sunday_school_class=sunday_school_class,
+                occurrence_date=F("event__sunday_school_session__session_date"),
+            )
+            .select_related("person", "event__sunday_school_session")
+            .order_by(
+                "-event__sunday_school_session__session_date",
+                "-event__sunday_school_session__session_time",
+                "-recorded_at",
+            )
+        )
 
         occurrence_date = request.query_params.get("occurrence_date")
         if occurrence_date:
-            sessions = sessions.filter(session_date=occurrence_date)
+            records = records.filter(occurrence_date=occurrence_date)
 
         attendance_records = []
-        for session in sessions:
-            records = AttendanceRecord.objects.filter(
-                event=session.event, occurrence_date=session.session_date
-            ).select_related("person")
-            for record in records:
-                attendance_records.append(
-                    {
-                        "session_id": session.id,
-                        "session_date": session.session_date,
-                        "lesson_title": session.lesson_title,
-                        "person_id": record.person.id,
-                        "person_name": record.person.get_full_name()
-                        or record.person.username,
-                        "status": record.status,
-                        "notes": record.notes,
-                    }
-                )
+        for record in records:
+            session = record.event.sunday_school_session
+            attendance_records.append(
+                {
+                    "session_id": session.id,
+                    "session_date": session.session_date,
+                    "lesson_title": session.lesson_title,
+                    "person_id": record.person.id,
+                    "person_name": record.person.get_full_name()
+                    or record.person.username,
+                    "status": record.status,
+                    "notes": record.notes,
+                }
+            )
 
         return Response(attendance_records)
 
@@ -294,48 +304,41 @@ class SundaySchoolClassViewSet(viewsets.ModelViewSet):
         if scoped_month is not None and not (1 <= scoped_month <= 12):
             scoped_month = None
 
-        if scoped_year is not None and scoped_month is not None:
-            stats = generate_summary_stats(
-                scoped_year=scoped_year, scoped_month=scoped_month
-            )
-            stats["most_attended_classes"] = []
-            stats["least_attended_classes"] = []
-        else:
-            stats = generate_summary_stats()
-            classes = SundaySchoolClass.objects.filter(is_active=True)
-            class_attendance = []
-            for class_obj in classes:
-                rate = calculate_attendance_rate(class_obj)
-                if rate is not None:
-                    class_attendance.append(
-                        {
-                            "class_id": class_obj.id,
-                            "class_name": class_obj.name,
-                            "attendance_rate": rate,
-                        }
-                    )
-
-            class_attendance.sort(
-                key=lambda x: x["attendance_rate"], reverse=True
-            )
-            stats["most_attended_classes"] = (
-                class_attendance[:5] if class_attendance else []
-            )
-            stats["least_attended_classes"] = (
-                class_attendance[-5:] if len(class_attendance) > 5 else []
-            )
+        # Most/least attended rollups come from the same set-based per-class
+        # rates (empty for month-scoped queries).
+        stats = generate_summary_stats(
+            scoped_year=scoped_year, scoped_month=scoped_month
+        )
 
         serializer = SundaySchoolSummarySerializer(stats)
         return Response(serializer.data)
 
     @action(detail=False, methods=["get"])
     def unenrolled_by_category(self, request):
-        """Get unenrolled people by category based on age brackets."""
+        """
+        Get unenrolled people by category based on age brackets.
+
+        Every category carries its full ``unenrolled_count`` and one page of
+        people (``?page``, ``?page_size``); ``?category`` narrows the response
+        to one category so the next page can be loaded on its own.
+        """
         status_filter = request.query_params.get("status")
         role_filter = request.query_params.get("role")
+        params = request.query_params
+        category_id = params.get("category")
+        page = params.get("page", "1")
+        page_size = params.get("page_size", str(api_settings.PAGE_SIZE))
+        for name, value in (("category", category_id), ("page", page), ("page_size", page_size)):
+            if value is not None and not value.isdigit():
+                raise ValidationError({name: "Must be a positive integer."})
+        max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", DEFAULT_MAX_PAGE_SIZE)
 
         result = get_unenrolled_by_category(
-            status_filter=status_filter, role_filter=role_filter
+            status_filter=status_filter,
+            role_filter=role_filter,
+            category_id=int(category_id) if category_id is not None else None,
+            page=max(int(page), 1),
+            page_size=min(max(int(page_size), 1), max_page_size),
         )
         serializer = SundaySchoolUnenrolledByCategorySerializer(result, many=True)
         return Response(serializer.data)
@@ -539,8 +542,21 @@ class SundaySchoolSessionViewSet(viewsets.ModelViewSet):
             recurrence_pattern=recurrence_pattern,
             day_of_week=day_of_week,
             default_lesson_title=default_lesson_title,
+            dry_run=serializer.validated_data["dry_run"],
         )
 
+        if serializer.validated_data["dry_run"]:
+            return Response(
+                {
+                    "dry_run": True,
+                    "count": len(sessions),
+                    "sessions": [
+                        {"session_date": s.session_date, "session_time": s.session_time}
+                        for s in sessions
+                    ],
+                }
+            )
+
         session_serializer = SundaySchoolSessionSerializer(sessions, many=True)
         return Response(
             {
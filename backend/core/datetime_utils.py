@@ -51,3 +51,11 @@ def church_today() -> date:
     today = church_calendar_date(timezone.now())
     assert today is not None
     return today
+
+
+def shift_years(value: date, years: int) -> date:
+    """``value`` moved by whole ``years`` (negative for earlier); Feb 29 falls back to Feb 28."""
+    try:
+        return value.replace(year=value.year + years)
+    except ValueError:
+        return value.replace(year=value.year + years, day=28)
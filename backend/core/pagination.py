@@ -0,0 +1,91 @@
+"""Project-wide list pagination.
+
+Every list endpoint is paginated by :class:`StandardPagination`
+(``REST_FRAMEWORK["DEFAULT_PAGINATION_CLASS"]``, ``PAGE_SIZE`` rows per page)
+unless its viewset opts out with ``pagination_class = None`` (small reference
+tables such as branches or event types). ``?page_size`` is capped at
+``settings.API_MAX_PAGE_SIZE``.
+
+``?all=1`` keeps the pre-pagination contract — a bare JSON array of every
+row — for clients that need the whole list, but streams it: rows are read and
+serialized ``API_STREAM_CHUNK_SIZE`` at a time, so the server never holds the
+full table in memory.
+"""
+
+from django.conf import settings
+from django.http import StreamingHttpResponse
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.renderers import JSONRenderer
+
+DEFAULT_MAX_PAGE_SIZE = 100
+DEFAULT_STREAM_CHUNK_SIZE = 200
+
+ALL_QUERY_PARAM = "all"
+_TRUTHY = {"1", "true", "yes"}
+
+
+def wants_all(request) -> bool:
+    value = request.query_params.get(ALL_QUERY_PARAM, "")
+    return value.strip().lower() in _TRUTHY
+
+
+class StandardPagination(PageNumberPagination):
+    """Page-number pagination with a hard page-size cap and ``?all=1`` streaming."""
+
+    page_size_query_param = "page_size"
+
+    def __init__(self):
+        # A subclass may lower the cap but never raise it past the project max.
+        project_max = getattr(settings, "API_MAX_PAGE_SIZE", DEFAULT_MAX_PAGE_SIZE)
+        self.max_page_size = min(self.max_page_size or project_max, project_max)
+        self._stream_queryset = None
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if wants_all(request):
+            # Nothing is read here: ListModelMixin serializes the empty page and
+            # hands it to get_paginated_response, which streams the queryset.
+            self.request = request
+            self._stream_queryset = queryset
+            self._stream_view = view
+            return []
+        return super().paginate_queryset(queryset, request, view=view)
+
+    def get_paginated_response(self, data):
+        if self._stream_queryset is not None:
+            return self._streaming_response()
+        return super().get_paginated_response(data)
+
+    def _streaming_response(self):
+        queryset = self._stream_queryset
+        view = self._stream_view
+        chunk_size = getattr(
+            settings, "API_STREAM_CHUNK_SIZE", DEFAULT_STREAM_CHUNK_SIZE
+        )
+        renderer = JSONRenderer()
+
+        def serialize(rows):
+            data = view.get_serializer(rows, many=True).data
+            # Strip the surrounding brackets; the stream adds its own.
+            return renderer.render(data)[1:-1]
+
+        def stream():
+            yield b"["
+            first = True
+            rows = []
+            iterator = (
+                queryset.iterator(chunk_size=chunk_size)
+                if hasattr(queryset, "iterator")
+                else iter(queryset)
+            )
+            for row in iterator:
+                rows.append(row)
+                if len(rows) < chunk_size:
+                    continue
+                yield (b"" if first else b",") + serialize(rows)
+                first = False
+                rows = []
+            if rows:
+                yield (b"" if first else b",") + serialize(rows)
+            yield b"]"
+
+        return StreamingHttpResponse(stream(), content_type="application/json")
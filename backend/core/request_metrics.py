@@ -0,0 +1,201 @@
+"""Per-request SQL and latency instrumentation.
+
+:class:`RequestMetricsMiddleware` is listed in ``MIDDLEWARE`` but only active
+when ``settings.REQUEST_METRICS_ENABLED`` is true. For each request it records
+wall time, query count, total SQL time and the slowest statements, and returns
+them in a ``Server-Timing`` header (visible in the browser's network panel).
+
+Resolved requests are also folded into :data:`registry`, an in-process rolling
+window per route (``"GET api/people/people/"``), which the admin endpoint
+``/api/auth/admin/request-metrics/`` summarises as p50/p95/p99 plus the worst
+requests seen. The registry is per worker process and resets on restart.
+
+Streaming responses (``?all=1`` lists, the notification stream) are measured
+up to the point the response is returned, not while the body is consumed.
+"""
+
+import threading
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+
+DEFAULT_WINDOW = 500
+DEFAULT_SLOW_QUERIES = 3
+DEFAULT_WORST_REQUESTS = 20
+SQL_PREVIEW_LENGTH = 300
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list (``None`` when empty)."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+class QueryRecorder:
+    """``connection.execute_wrapper`` hook that times every statement."""
+
+    def __init__(self, keep_slowest=DEFAULT_SLOW_QUERIES):
+        self.keep_slowest = keep_slowest
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest = []
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.count += 1
+            self.total_ms += elapsed_ms
+            self._keep(elapsed_ms, sql)
+
+    def _keep(self, elapsed_ms, sql):
+        if len(self.slowest) >= self.keep_slowest and elapsed_ms <= self.slowest[-1]["ms"]:
+            return
+        self.slowest.append({"ms": round(elapsed_ms, 2), "sql": sql[:SQL_PREVIEW_LENGTH]})
+        self.slowest.sort(key=lambda item: item["ms"], reverse=True)
+        del self.slowest[self.keep_slowest:]
+
+
+class RouteMetricsRegistry:
+    """Thread-safe rolling window of request samples per route."""
+
+    def __init__(self, window=DEFAULT_WINDOW, worst=DEFAULT_WORST_REQUESTS):
+        self.window = window
+        self.worst_limit = worst
+        self._lock = threading.Lock()
+        self._routes = {}
+        self._worst = []
+
+    def record(self, route, *, view_name, duration_ms, query_count, sql_ms, slowest):
+        sample = {
+            "route": route,
+            "view_name": view_name,
+            "duration_ms": round(duration_ms, 2),
+            "query_count": query_count,
+            "sql_ms": round(sql_ms, 2),
+            "slowest_queries": slowest,
+        }
+        with self._lock:
+            entry = self._routes.get(route)
+            if entry is None:
+                entry = self._routes[route] = {
+                    "view_name": view_name,
+                    "total_requests": 0,
+                    "samples": deque(maxlen=self.window),
+                }
+            entry["total_requests"] += 1
+            entry["samples"].append((duration_ms, query_count, sql_ms))
+
+            self._worst.append(sample)
+            self._worst.sort(key=lambda item: item["duration_ms"], reverse=True)
+            del self._worst[self.worst_limit:]
+
+    def reset(self):
+        with self._lock:
+            self._routes.clear()
+            self._worst.clear()
+
+    def snapshot(self):
+        """Per-route percentiles (slowest p95 first) and the worst requests seen."""
+        with self._lock:
+            routes = {
+                route: (entry["view_name"], entry["total_requests"], list(entry["samples"]))
+                for route, entry in self._routes.items()
+            }
+            worst = [dict(sample) for sample in self._worst]
+
+        rows = []
+        for route, (view_name, total_requests, samples) in routes.items():
+            durations = sorted(sample[0] for sample in samples)
+            queries = sorted(sample[1] for sample in samples)
+            sql_times = [sample[2] for sample in samples]
+            rows.append(
+                {
+                    "route": route,
+                    "view_name": view_name,
+                    "total_requests": total_requests,
+                    "window_requests": len(samples),
+                    "latency_ms": {
+                        "p50": _rounded(percentile(durations, 50)),
+                        "p95": _rounded(percentile(durations, 95)),
+                        "p99": _rounded(percentile(durations, 99)),
+                        "max": _rounded(durations[-1]),
+                    },
+                    "queries": {
+                        "p50": percentile(queries, 50),
+                        "p95": percentile(queries, 95),
+                        "p99": percentile(queries, 99),
+                        "max": queries[-1],
+                    },
+                    "avg_sql_ms": _rounded(sum(sql_times) / len(sql_times)),
+                }
+            )
+        rows.sort(key=lambda row: row["latency_ms"]["p95"], reverse=True)
+        return {"window": self.window, "routes": rows, "worst_requests": worst}
+
+
+def _rounded(value):
+    return None if value is None else round(value, 2)
+
+
+registry = RouteMetricsRegistry(
+    window=getattr(settings, "REQUEST_METRICS_WINDOW", DEFAULT_WINDOW)
+)
+
+
+def route_key(request):
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return None, None
+    view_name = match.view_name or f"{match.func.__module__}.{match.func.__name__}"
+    # Router routes are regexes ("api/people/people/$"); drop the anchors.
+    route = match.route.lstrip("^").rstrip("$")
+    return f"{request.method} {route}", view_name
+
+
+def server_timing_header(duration_ms, recorder):
+    parts = [
+        f"app;dur={duration_ms:.1f}",
+        f'db;dur={recorder.total_ms:.1f};desc="{recorder.count} queries"',
+    ]
+    if recorder.slowest:
+        parts.append(f"db-slowest;dur={recorder.slowest[0]['ms']:.1f}")
+    return ", ".join(parts)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, get_response):
+        if not getattr(settings, "REQUEST_METRICS_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.keep_slowest = getattr(
+            settings, "REQUEST_METRICS_SLOW_QUERIES", DEFAULT_SLOW_QUERIES
+        )
+
+    def __call__(self, request):
+        recorder = QueryRecorder(keep_slowest=self.keep_slowest)
+        start = time.perf_counter()
+        with connection.execute_wrapper(recorder):
+            response = self.get_response(request)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        response["Server-Timing"] = server_timing_header(duration_ms, recorder)
+
+        route, view_name = route_key(request)
+        if route is not None:
+            registry.record(
+                route,
+                view_name=view_name,
+                duration_ms=duration_ms,
+                query_count=recorder.count,
+                sql_ms=recorder.total_ms,
+                slowest=recorder.slowest,
+            )
+        return response
@@ -46,6 +46,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "core.request_metrics.RequestMetricsMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
@@ -58,7 +59,7 @@ MIDDLEWARE = [
 
 # Add WhiteNoise middleware only in production (when DEBUG=False)
 if not DEBUG:
-    MIDDLEWARE.insert(1, "whitenoise.middleware.WhiteNoiseMiddleware")
+    MIDDLEWARE.insert(2, "whitenoise.middleware.WhiteNoiseMiddleware")
 
 ROOT_URLCONF = "core.urls"
 
@@ -153,8 +154,34 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.BasicAuthentication",
     ],
     "EXCEPTION_HANDLER": "apps.authentication.exceptions.custom_exception_handler",
+    "DEFAULT_PAGINATION_CLASS": "core.pagination.StandardPagination",
+    "PAGE_SIZE": 50,
 }
 
+# Hard cap for ?page_size on every paginated list; ?all=1 streams in chunks instead.
+API_MAX_PAGE_SIZE = 100
+API_STREAM_CHUNK_SIZE = 200
+
+# Per-request SQL/latency instrumentation (Server-Timing header plus the
+# /api/auth/admin/request-metrics/ summary). Off unless enabled.
+REQUEST_METRICS_ENABLED = os.getenv("REQUEST_METRICS_ENABLED", "False") == "True"
+REQUEST_METRICS_WINDOW = 500  # samples kept per route
+REQUEST_METRICS_SLOW_QUERIES = 3  # slowest statements kept per request
+
+# Per-viewer people/journey visibility scopes (apps.people.visibility) are
+# cached this long; a DB generation counter invalidates them on membership
+# and coordinator changes. 0 disables the cache.
+PEOPLE_VISIBILITY_CACHE_SECONDS = int(os.getenv("PEOPLE_VISIBILITY_CACHE_SECONDS", "600"))
+
+# Shared analytics payloads (apps.reports.analytics_cache), e.g. Bible Sharers
+# coverage, are cached this long; signal handlers invalidate them when the
+# underlying rows change. 0 disables the cache.
+ANALYTICS_CACHE_SECONDS = int(os.getenv("ANALYTICS_CACHE_SECONDS", "300"))
+
+# Pre-summed monthly giving (apps.finance.ledger), kept in sync on save/delete
+# and read by the stewardship trend. Run rebuild_giving_ledger after enabling.
+GIVING_LEDGER_ENABLED = os.getenv("GIVING_LEDGER_ENABLED", "False") == "True"
+
 # JWT Settings
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=15),
@@ -173,3 +200,11 @@ SIMPLE_JWT = {
 }
 
 AUTH_USER_MODEL = "people.Person"
+
+# Notification stream (SSE, ASGI only). InProcessBroker suits a single worker;
+# use apps.notifications.pubsub.DatabasePollingBroker with several workers.
+NOTIFICATIONS_BROKER = os.getenv(
+    "NOTIFICATIONS_BROKER", "apps.notifications.pubsub.InProcessBroker"
+)
+NOTIFICATIONS_STREAM_HEARTBEAT_SECONDS = 15
+NOTIFICATIONS_STREAM_MAX_SECONDS = 300
@@ -0,0 +1,15 @@
+from datetime import date
+
+from django.test import SimpleTestCase
+
+from core.datetime_utils import shift_years
+
+
+class ShiftYearsTests(SimpleTestCase):
+    def test_moves_whole_years_both_ways(self):
+        self.assertEqual(shift_years(date(2026, 3, 15), -3), date(2023, 3, 15))
+        self.assertEqual(shift_years(date(2026, 3, 15), 2), date(2028, 3, 15))
+
+    def test_leap_day_falls_back_to_feb_28(self):
+        self.assertEqual(shift_years(date(2024, 2, 29), -1), date(2023, 2, 28))
+        self.assertEqual(shift_years(date(2024, 2, 29), -4), date(2020, 2, 29))
@@ -0,0 +1,140 @@
+import json
+
+from django.conf import settings
+from django.db.models.signals import post_init
+from django.test import TestCase, override_settings
+from django.urls import URLPattern, URLResolver, get_resolver
+from rest_framework.test import APIClient
+
+from apps.people.models import Person
+from core.pagination import StandardPagination
+
+# List endpoints that deliberately return every row (small reference tables).
+UNPAGINATED_VIEWSETS = {
+    "BranchViewSet",
+    "EventTypeViewSet",
+    "LessonViewSet",
+    "ModuleSettingViewSet",
+    "SundaySchoolCategoryViewSet",
+}
+
+
+def _list_viewsets(patterns=None):
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _list_viewsets(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            callback = pattern.callback
+            actions = getattr(callback, "actions", None) or {}
+            if actions.get("get") == "list":
+                yield callback.cls
+
+
+class PaginationPolicyTests(TestCase):
+    def test_every_list_endpoint_is_capped_or_explicitly_exempt(self):
+        viewsets = set(_list_viewsets())
+        self.assertTrue(viewsets)
+        exempt = set()
+        for viewset in viewsets:
+            if viewset.__name__ in UNPAGINATED_VIEWSETS:
+                exempt.add(viewset.__name__)
+                self.assertIsNone(viewset.pagination_class, viewset.__name__)
+                continue
+            paginator = viewset().paginator
+            self.assertIsInstance(paginator, StandardPagination, viewset.__name__)
+            self.assertLessEqual(
+                paginator.max_page_size, settings.API_MAX_PAGE_SIZE, viewset.__name__
+            )
+        # Keep the allowlist honest: every entry must still be routed.
+        self.assertEqual(exempt, UNPAGINATED_VIEWSETS)
+
+
+@override_settings(API_MAX_PAGE_SIZE=10, API_STREAM_CHUNK_SIZE=4)
+class PaginationBehaviourTests(TestCase):
+    url = "/api/people/people/"
+
+    def setUp(self):
+        self.admin = Person.objects.create_user(
+            username="pagination_admin", password="pw", role="ADMIN"
+        )
+        Person.objects.bulk_create(
+            Person(username=f"paged{i}", first_name="Paged", last_name=str(i), role="MEMBER")
+            for i in range(15)
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+        self.loaded = 0
+        post_init.connect(self._count, sender=Person)
+        self.addCleanup(post_init.disconnect, self._count, sender=Person)
+
+    def _count(self, **kwargs):
+        self.loaded += 1
+
+    def test_page_size_is_capped_and_rows_loaded_are_bounded(self):
+        response = self.client.get(self.url, {"page_size": 1000})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.data["results"]), 10)
+        self.assertGreaterEqual(response.data["count"], 15)
+        self.assertLessEqual(self.loaded, 10)
+
+    def test_all_streams_a_plain_array(self):
+        response = self.client.get(self.url, {"all": 1})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertEqual(self.loaded, 0)
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertIsInstance(rows, list)
+        self.assertEqual(
+            {row["username"] for row in rows if row["username"].startswith("paged")},
+            {f"paged{i}" for i in range(15)},
+        )
+
+    def test_page_size_pages_through_every_row(self):
+        first = self.client.get(self.url, {"page_size": 4})
+
+        self.assertEqual(first.status_code, 200)
+        self.assertFalse(first.streaming)
+        self.assertEqual(len(first.data["results"]), 4)
+        self.assertIsNone(first.data["previous"])
+        self.assertIn("page=2", first.data["next"])
+
+        seen = []
+        page = 1
+        while True:
+            response = self.client.get(self.url, {"page_size": 4, "page": page})
+            seen.extend(row["username"] for row in response.data["results"])
+            if response.data["next"] is None:
+                break
+            page += 1
+        self.assertEqual(len(seen), response.data["count"])
+        self.assertEqual(len(set(seen)), len(seen))
+
+    def test_default_page_uses_the_configured_page_size(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            len(response.data["results"]),
+            min(response.data["count"], settings.REST_FRAMEWORK["PAGE_SIZE"]),
+        )
+
+    def test_falsy_all_keeps_pagination(self):
+        response = self.client.get(self.url, {"all": 0, "page_size": 4})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(response.streaming)
+        self.assertEqual(len(response.data["results"]), 4)
+
+    def test_all_applies_the_viewset_filters(self):
+        response = self.client.get(self.url, {"all": 1, "search": "paged1"})
+
+        self.assertEqual(response.status_code, 200)
+        rows = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(
+            {row["username"] for row in rows},
+            {"paged1"} | {f"paged{i}" for i in range(10, 15)},
+        )
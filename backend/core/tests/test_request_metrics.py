@@ -0,0 +1,89 @@
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from apps.people.models import Person
+from core.request_metrics import RouteMetricsRegistry, percentile, registry
+
+
+class PercentileTests(SimpleTestCase):
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([7], 99), 7)
+        self.assertIsNone(percentile([], 50))
+
+    def test_registry_keeps_a_rolling_window_and_worst_requests(self):
+        metrics = RouteMetricsRegistry(window=3, worst=2)
+        for duration in (10, 20, 30, 40):
+            metrics.record(
+                "GET api/x/",
+                view_name="x-list",
+                duration_ms=duration,
+                query_count=duration // 10,
+                sql_ms=1,
+                slowest=[],
+            )
+
+        snapshot = metrics.snapshot()
+        (route,) = snapshot["routes"]
+        self.assertEqual(route["total_requests"], 4)
+        self.assertEqual(route["window_requests"], 3)
+        self.assertEqual(route["latency_ms"]["p50"], 30)
+        self.assertEqual(route["queries"]["max"], 4)
+        self.assertEqual([w["duration_ms"] for w in snapshot["worst_requests"]], [40, 30])
+
+
+@override_settings(REQUEST_METRICS_ENABLED=True)
+class RequestMetricsMiddlewareTests(TestCase):
+    def setUp(self):
+        registry.reset()
+        self.addCleanup(registry.reset)
+        self.admin = Person.objects.create_user(
+            username="metrics_admin", password="pw", role="ADMIN"
+        )
+        self.member = Person.objects.create_user(
+            username="metrics_member", password="pw", role="MEMBER"
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(user=self.admin)
+
+    def test_server_timing_header_and_route_histogram(self):
+        response = self.client.get("/api/people/branches/")
+
+        self.assertEqual(response.status_code, 200)
+        header = response["Server-Timing"]
+        self.assertIn("app;dur=", header)
+        self.assertRegex(header, r'db;dur=[\d.]+;desc="[1-9]\d* queries"')
+
+        response = self.client.get("/api/auth/admin/request-metrics/")
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.data["enabled"])
+        routes = {row["route"]: row for row in response.data["routes"]}
+        branches = routes["GET api/people/branches/"]
+        self.assertEqual(branches["view_name"], "people:branch-list")
+        self.assertEqual(branches["total_requests"], 1)
+        self.assertGreaterEqual(branches["queries"]["max"], 1)
+        self.assertTrue(response.data["worst_requests"][0]["slowest_queries"])
+
+    def test_endpoint_is_admin_only_and_resettable(self):
+        self.client.get("/api/people/branches/")
+
+        member = APIClient()
+        member.force_authenticate(user=self.member)
+        self.assertEqual(
+            member.get("/api/auth/admin/request-metrics/").status_code, 403
+        )
+
+        self.assertEqual(
+            self.client.delete("/api/auth/admin/request-metrics/").status_code, 204
+        )
+        routes = [row["route"] for row in registry.snapshot()["routes"]]
+        self.assertNotIn("GET api/people/branches/", routes)
+
+    @override_settings(REQUEST_METRICS_ENABLED=False)
+    def test_disabled_by_setting(self):
+        response = self.client.get("/api/people/branches/")
+        self.assertFalse(response.has_header("Server-Timing"))
+        self.assertEqual(registry.snapshot()["routes"], [])
@@ -0,0 +1,104 @@
+"""
+Field snapshots for change detection without re-fetching the row.
+
+A model lists the fields to watch in ``tracked_fields``. Their values are
+captured in ``from_db`` when the row is loaded and re-captured once a save has
+been written (the post_save receiver below), so signal handlers can compare
+old and new values without an extra SELECT. pre_save handlers stash
+:meth:`TrackedFieldsMixin.tracked_original_values` for their post_save
+counterparts; a save that raises leaves the snapshot alone, so retrying it
+still sees the change.
+
+Instances that were never loaded from the database (built with an explicit pk)
+or had a tracked field deferred fall back to a single ``values()`` query.
+``QuerySet.update()`` bypasses the snapshot: call ``refresh_from_db()`` before
+saving an instance whose row was updated that way.
+"""
+
+from django.db.models.signals import post_save
+
+_UNSET = object()
+
+
+class TrackedFieldsMixin:
+    tracked_fields: tuple = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._tracked_snapshot = instance._current_tracked_values()
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self.mark_tracked_fields_saved(fields)
+
+    @classmethod
+    def _tracked_attnames(cls) -> dict:
+        return {name: cls._meta.get_field(name).attname for name in cls.tracked_fields}
+
+    def _current_tracked_values(self) -> dict:
+        # Read __dict__ directly so deferred fields are not loaded here.
+        loaded = self.__dict__
+        return {
+            name: loaded.get(attname, _UNSET)
+            for name, attname in self._tracked_attnames().items()
+        }
+
+    def tracked_original_values(self) -> dict:
+        """
+        Tracked values as last loaded or saved, keyed by field name.
+
+        New instances (no pk) report None for every field.
+        """
+        if self.pk is None:
+            return {name: None for name in self.tracked_fields}
+        snapshot = getattr(self, "_tracked_snapshot", None) or {}
+        if all(snapshot.get(name, _UNSET) is not _UNSET for name in self.tracked_fields):
+            return dict(snapshot)
+
+        attnames = self._tracked_attnames()
+        row = (
+            type(self)._base_manager.using(self._state.db or "default")
+            .filter(pk=self.pk)
+            .values(*attnames.values())
+            .first()
+        )
+        if row is None:
+            return {name: None for name in self.tracked_fields}
+        return {name: row[attname] for name, attname in attnames.items()}
+
+    def tracked_changes(self, originals: dict) -> dict:
+        """``{field: (old, new)}`` for every tracked field that differs from ``originals``."""
+        current = self._current_tracked_values()
+        return {
+            name: (originals.get(name), value)
+            for name, value in current.items()
+            if value is not _UNSET and value != originals.get(name)
+        }
+
+    def mark_tracked_fields_saved(self, update_fields=None) -> None:
+        """Make the in-memory values the new baseline (only ``update_fields`` if given)."""
+        snapshot = getattr(self, "_tracked_snapshot", None) or {}
+        current = self._current_tracked_values()
+        attnames = self._tracked_attnames()
+        for name, value in current.items():
+            if update_fields is not None and not (
+                name in update_fields or attnames[name] in update_fields
+            ):
+                continue
+            if value is not _UNSET:
+                snapshot[name] = value
+        self._tracked_snapshot = snapshot
+
+
+def _mark_tracked_fields_after_save(sender, instance, update_fields=None, **kwargs):
+    if isinstance(instance, TrackedFieldsMixin):
+        instance.mark_tracked_fields_saved(update_fields)
+
+
+# Connected when the first tracked model is imported, i.e. before any app's
+# signals module, so it runs ahead of post_save handlers that save again.
+post_save.connect(
+    _mark_tracked_fields_after_save, dispatch_uid="core.tracked_fields.mark_after_save"
+)
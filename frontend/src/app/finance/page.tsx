@@ -49,6 +49,8 @@ const INITIAL_STATS: DonationStatsType = {
   purposeBreakdown: {},
 };
 
+const DONATION_PAGE_SIZE = 50;
+
 const formatCurrency = (value: number) =>
   `₱${value.toLocaleString(undefined, { maximumFractionDigits: 2 })}`;
 
@@ -69,6 +71,9 @@ export default function FinancePage() {
   const userCanHardDelete = canHardDelete(user);
   const action = searchParams.get("action");
   const [donations, setDonations] = useState<Donation[]>([]);
+  const [donationsPage, setDonationsPage] = useState(1);
+  const [donationsHasMore, setDonationsHasMore] = useState(false);
+  const [donationsLoadingMore, setDonationsLoadingMore] = useState(false);
   const [donationStats, setDonationStats] =
     useState<DonationStatsType>(INITIAL_STATS);
   const [offerings, setOfferings] = useState<Offering[]>([]);
@@ -361,6 +366,8 @@ export default function FinancePage() {
         financeApi.listDonations({
           start: dateRange.start,
           end: dateRange.end,
+          page: 1,
+          page_size: DONATION_PAGE_SIZE,
         }),
         financeApi.donationStats({
           start: dateRange.start,
@@ -381,7 +388,9 @@ export default function FinancePage() {
         }),
       ]);
 
-      setDonations(donationData);
+      setDonations(donationData.results);
+      setDonationsPage(1);
+      setDonationsHasMore(Boolean(donationData.next));
       setDonationStats(donationStatsData);
       setOfferings(offeringData);
       setPledges(pledgeData);
@@ -406,6 +415,36 @@ export default function FinancePage() {
     loadFinanceData();
   }, [loadFinanceData]);
 
+  const loadMoreDonations = useCallback(async () => {
+    if (donationsLoadingMore || !donationsHasMore) {
+      return;
+    }
+    setDonationsLoadingMore(true);
+    try {
+      const nextPage = donationsPage + 1;
+      const data = await financeApi.listDonations({
+        start: dateRange.start,
+        end: dateRange.end,
+        page: nextPage,
+        page_size: DONATION_PAGE_SIZE,
+      });
+      setDonations((prev) => {
+        const seen = new Set(prev.map((donation) => donation.id));
+        return [
+          ...prev,
+          ...data.results.filter((donation) => !seen.has(donation.id)),
+        ];
+      });
+      setDonationsPage(nextPage);
+      setDonationsHasMore(Boolean(data.next));
+    } catch (err) {
+      console.error(err);
+      setError("We couldn't load more donations. Please try again shortly.");
+    } finally {
+      setDonationsLoadingMore(false);
+    }
+  }, [dateRange, donationsHasMore, donationsLoadingMore, donationsPage]);
+
   useEffect(() => {
     loadPeople();
   }, [loadPeople]);
@@ -1017,6 +1056,9 @@ export default function FinancePage() {
               <DonationTable
                 donations={donations}
                 loading={loading.donations}
+                hasMore={donationsHasMore}
+                loadingMore={donationsLoadingMore}
+                onLoadMore={loadMoreDonations}
                 onAddDonation={() => {
                   setEditingDonation(null);
                   setIsDonationModalOpen(true);
@@ -78,6 +78,7 @@ export default function SundaySchoolPage() {
     loading: unenrolledLoading,
     error: unenrolledError,
     fetchUnenrolled,
+    loadMoreUnenrolled,
   } = useSundaySchoolUnenrolledByCategory();
 
   const [searchValue, setSearchValue] = useState(filters.search ?? "");
@@ -729,6 +730,7 @@ export default function SundaySchoolPage() {
               error={unenrolledError}
               classes={classes}
               onBulkEnroll={handleBulkEnrollFromCategory}
+              onLoadMore={loadMoreUnenrolled}
             />
           )}
         </div>
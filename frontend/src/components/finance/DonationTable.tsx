@@ -9,6 +9,9 @@ interface DonationTableProps {
   onAddDonation?: () => void;
   loading?: boolean;
   onEditDonation?: (donation: Donation) => void;
+  hasMore?: boolean;
+  loadingMore?: boolean;
+  onLoadMore?: () => void;
 }
 
 type SortColumn =
@@ -40,6 +43,9 @@ export default function DonationTable({
   onAddDonation,
   loading,
   onEditDonation,
+  hasMore,
+  loadingMore,
+  onLoadMore,
 }: DonationTableProps) {
   const [sortColumn, setSortColumn] = useState<SortColumn>("date");
   const [sortDirection, setSortDirection] = useState<SortDirection>("desc");
@@ -254,6 +260,18 @@ export default function DonationTable({
               </tbody>
             </table>
           </div>
+          {hasMore && onLoadMore && (
+            <div className="mt-3 text-center">
+              <button
+                type="button"
+                onClick={onLoadMore}
+                disabled={loadingMore}
+                className="rounded-md border border-gray-300 px-3 py-2 text-xs font-semibold text-gray-700 hover:bg-gray-50 focus:outline-none focus:ring-2 focus:ring-offset-2 focus:ring-primary disabled:opacity-50 min-h-[44px] md:min-h-0"
+              >
+                {loadingMore ? "Loading..." : "Load more"}
+              </button>
+            </div>
+          )}
         </div>
       )}
     </Card>
@@ -22,6 +22,7 @@ interface UnenrolledByCategoryProps {
     personIds: number[],
     role: ClassMemberRole
   ) => Promise<void>;
+  onLoadMore?: (categoryId: number) => Promise<void>;
 }
 
 export default function UnenrolledByCategory({
@@ -30,11 +31,13 @@ export default function UnenrolledByCategory({
   error,
   classes = [],
   onBulkEnroll,
+  onLoadMore,
 }: UnenrolledByCategoryProps) {
   const [expandedCategories, setExpandedCategories] = useState<Set<number>>(
     new Set()
   );
   const [isEnrolling, setIsEnrolling] = useState<number | null>(null);
+  const [loadingMore, setLoadingMore] = useState<number | null>(null);
 
   const toggleCategory = (categoryId: number) => {
     const newExpanded = new Set(expandedCategories);
@@ -56,6 +59,16 @@ export default function UnenrolledByCategory({
     }
   };
 
+  const handleLoadMore = async (categoryId: number) => {
+    if (!onLoadMore) return;
+    setLoadingMore(categoryId);
+    try {
+      await onLoadMore(categoryId);
+    } finally {
+      setLoadingMore(null);
+    }
+  };
+
   if (loading) {
     return (
       <Card title="Unenrolled Students by Category">
@@ -200,10 +213,13 @@ export default function UnenrolledByCategory({
                     <div className="border-t border-gray-200 bg-gray-50 p-4">
                       <div className="flex items-center justify-between mb-3">
                         <p className="text-sm font-medium text-gray-700">
-                          {category.unenrolled_people.length}{" "}
-                          {category.unenrolled_people.length === 1
-                            ? "person"
-                            : "people"}
+                          {category.has_more
+                            ? `Showing ${category.unenrolled_people.length} of ${category.unenrolled_count}`
+                            : `${category.unenrolled_people.length} ${
+                                category.unenrolled_people.length === 1
+                                  ? "person"
+                                  : "people"
+                              }`}
                         </p>
                         {onBulkEnroll && hasClassForCategory && (
                           <Button
@@ -227,6 +243,20 @@ export default function UnenrolledByCategory({
                         data={category.unenrolled_people}
                         columns={personColumns}
                       />
+                      {category.has_more && onLoadMore && (
+                        <div className="mt-3 text-center">
+                          <Button
+                            variant="secondary"
+                            onClick={() => handleLoadMore(category.category_id)}
+                            disabled={loadingMore === category.category_id}
+                            className="text-xs !px-3 !py-1"
+                          >
+                            {loadingMore === category.category_id
+                              ? "Loading..."
+                              : "Load more"}
+                          </Button>
+                        </div>
+                      )}
                     </div>
                   )}
 
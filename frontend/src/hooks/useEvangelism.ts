@@ -793,29 +793,89 @@ export const useFollowUpTasks = (filters?: {
   assigned_to?: number | string;
   status?: string;
   priority?: string;
+  page_size?: number;
 }) => {
   const [tasks, setTasks] = useState<FollowUpTask[]>([]);
   const [loading, setLoading] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
+  const [page, setPage] = useState(1);
   const [error, setError] = useState<string | null>(null);
+  const requestSeqRef = useRef(0);
+  const loadingMoreLockRef = useRef(false);
+
+  const prospect = filters?.prospect;
+  const assigned_to = filters?.assigned_to;
+  const status = filters?.status;
+  const priority = filters?.priority;
+  const pageSize = filters?.page_size ?? 20;
+
+  const fetchPage = useCallback(
+    async (targetPage: number, append: boolean) => {
+      const requestSeq = ++requestSeqRef.current;
+      try {
+        if (append) {
+          setIsLoadingMore(true);
+        } else {
+          setLoading(true);
+          setError(null);
+        }
+
+        const response = await evangelismApi.listFollowUpTasks({
+          prospect,
+          assigned_to,
+          status,
+          priority,
+          page: targetPage,
+          page_size: pageSize,
+        });
+        if (requestSeq !== requestSeqRef.current) {
+          return;
+        }
+
+        const rows = response.data.results || [];
+        setTasks((prev) => (append ? [...prev, ...rows] : rows));
+        setPage(targetPage);
+        setHasMore(Boolean(response.data.next));
+        setError(null);
+      } catch (err) {
+        if (requestSeq === requestSeqRef.current) {
+          console.error(err);
+          setError("Failed to load follow-up tasks");
+        }
+      } finally {
+        if (requestSeq === requestSeqRef.current) {
+          setLoading(false);
+          setIsLoadingMore(false);
+        }
+      }
+    },
+    [prospect, assigned_to, status, priority, pageSize]
+  );
 
   const fetchTasks = useCallback(async () => {
-    try {
-      setLoading(true);
-      const response = await evangelismApi.listFollowUpTasks(filters);
-      setTasks(response.data);
-      setError(null);
-    } catch (err) {
-      console.error(err);
-      setError("Failed to load follow-up tasks");
-    } finally {
-      setLoading(false);
-    }
-  }, [filters]);
+    setTasks([]);
+    setPage(1);
+    setHasMore(false);
+    await fetchPage(1, false);
+  }, [fetchPage]);
 
   useEffect(() => {
     fetchTasks();
   }, [fetchTasks]);
 
+  const loadMore = useCallback(async () => {
+    if (loading || isLoadingMore || !hasMore || loadingMoreLockRef.current) {
+      return;
+    }
+    loadingMoreLockRef.current = true;
+    try {
+      await fetchPage(page + 1, true);
+    } finally {
+      loadingMoreLockRef.current = false;
+    }
+  }, [fetchPage, hasMore, isLoadingMore, loading, page]);
+
   const createTask = async (data: Partial<FollowUpTask>) => {
     const response = await evangelismApi.createFollowUpTask(data);
     setTasks((prev) => [...prev, response.data]);
@@ -841,8 +901,12 @@ export const useFollowUpTasks = (filters?: {
   return {
     tasks,
     loading,
+    isLoadingMore,
+    hasMore,
     error,
+    page,
     fetchTasks,
+    loadMore,
     createTask,
     updateTask,
     completeTask,
@@ -853,29 +917,96 @@ export const useDropOffs = (filters?: {
   drop_off_stage?: string;
   reason?: string;
   recovered?: boolean;
+  page_size?: number;
 }) => {
   const [dropOffs, setDropOffs] = useState<DropOff[]>([]);
   const [loading, setLoading] = useState(false);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
+  const [hasMore, setHasMore] = useState(false);
+  const [page, setPage] = useState(1);
   const [error, setError] = useState<string | null>(null);
+  const requestSeqRef = useRef(0);
+  const loadingMoreLockRef = useRef(false);
+
+  const drop_off_stage = filters?.drop_off_stage;
+  const reason = filters?.reason;
+  const recovered = filters?.recovered;
+  const pageSize = filters?.page_size ?? 20;
+
+  const fetchPage = useCallback(
+    async (targetPage: number, append: boolean) => {
+      const requestSeq = ++requestSeqRef.current;
+      try {
+        if (append) {
+          setIsLoadingMore(true);
+        } else {
+          setLoading(true);
+          setError(null);
+        }
+
+        const response = await evangelismApi.listDropOffs({
+          drop_off_stage,
+          reason,
+          recovered,
+          page: targetPage,
+          page_size: pageSize,
+        });
+        if (requestSeq !== requestSeqRef.current) {
+          return;
+        }
+
+        const rows = response.data.results || [];
+        setDropOffs((prev) => (append ? [...prev, ...rows] : rows));
+        setPage(targetPage);
+        setHasMore(Boolean(response.data.next));
+        setError(null);
+      } catch (err) {
+        if (requestSeq === requestSeqRef.current) {
+          console.error(err);
+          setError("Failed to load drop-offs");
+        }
+      } finally {
+        if (requestSeq === requestSeqRef.current) {
+          setLoading(false);
+          setIsLoadingMore(false);
+        }
+      }
+    },
+    [drop_off_stage, reason, recovered, pageSize]
+  );
 
   const fetchDropOffs = useCallback(async () => {
-    try {
-      setLoading(true);
-      const response = await evangelismApi.listDropOffs(filters);
-      setDropOffs(response.data);
-      setError(null);
-    } catch (err) {
-      console.error(err);
-      setError("Failed to load drop-offs");
-    } finally {
-      setLoading(false);
-    }
-  }, [filters]);
+    setDropOffs([]);
+    setPage(1);
+    setHasMore(false);
+    await fetchPage(1, false);
+  }, [fetchPage]);
 
   useEffect(() => {
     fetchDropOffs();
   }, [fetchDropOffs]);
 
-  return { dropOffs, loading, error, fetchDropOffs };
+  const loadMore = useCallback(async () => {
+    if (loading || isLoadingMore || !hasMore || loadingMoreLockRef.current) {
+      return;
+    }
+    loadingMoreLockRef.current = true;
+    try {
+      await fetchPage(page + 1, true);
+    } finally {
+      loadingMoreLockRef.current = false;
+    }
+  }, [fetchPage, hasMore, isLoadingMore, loading, page]);
+
+  return {
+    dropOffs,
+    loading,
+    isLoadingMore,
+    hasMore,
+    error,
+    page,
+    fetchDropOffs,
+    loadMore,
+  };
 };
 
@@ -299,11 +299,45 @@ export const useSundaySchoolUnenrolledByCategory = (filters?: {
     }
   }, [filters]);
 
+  // Categories arrive one page at a time; append the next page of one category.
+  const loadMoreUnenrolled = useCallback(
+    async (categoryId: number) => {
+      const current = unenrolled.find((row) => row.category_id === categoryId);
+      if (!current?.has_more) return;
+      try {
+        const response = await sundaySchoolApi.unenrolledByCategory({
+          ...filters,
+          category: categoryId,
+          page: current.page + 1,
+        });
+        const next = response.data[0];
+        if (!next) return;
+        setUnenrolled((rows) =>
+          rows.map((row) =>
+            row.category_id === categoryId
+              ? {
+                  ...next,
+                  unenrolled_people: [
+                    ...row.unenrolled_people,
+                    ...next.unenrolled_people,
+                  ],
+                }
+              : row
+          )
+        );
+      } catch (err) {
+        console.error(err);
+        setError("Failed to load unenrolled students");
+      }
+    },
+    [filters, unenrolled]
+  );
+
   useEffect(() => {
     fetchUnenrolled();
   }, [fetchUnenrolled]);
 
-  return { unenrolled, loading, error, fetchUnenrolled };
+  return { unenrolled, loading, error, fetchUnenrolled, loadMoreUnenrolled };
 };
 
 export const useSundaySchoolAttendanceReport = (
@@ -277,6 +277,16 @@ export interface PaginatedResponse<T> {
   results: T[];
 }
 
+/**
+ * List endpoints are paginated server-side (`page` / `page_size`). Only calls
+ * that genuinely need every row - pickers, exclusion sets, per-person
+ * timelines and date-bounded views that total rows client-side - ask for the
+ * full list with `all=1` (streamed by the backend), unless they request a
+ * specific page. Tables load page by page instead.
+ */
+const allRows = <P extends object>(params?: P) =>
+  params && "page" in params && params.page ? params : { ...params, all: 1 };
+
 /** Query params for paginated people list / directory filters. */
 export type PeopleListParams = {
   search?: string;
@@ -508,7 +518,9 @@ export const moduleCoordinatorsApi = {
     resource_type?: string;
     search?: string;
   }) =>
-    api.get<ModuleCoordinator[]>("/people/module-coordinators/", { params }),
+    api.get<ModuleCoordinator[]>("/people/module-coordinators/", {
+      params: allRows(params),
+    }),
   getById: (id: number) =>
     api.get<ModuleCoordinator>(`/people/module-coordinators/${id}/`),
   create: (data: {
@@ -796,7 +808,7 @@ export const eventsApi = {
     page_size?: number;
   }) =>
     api.get<Event[]>("/events/", {
-      params,
+      params: allRows(params),
     }),
   listTypes: () => api.get<EventTypeOption[]>("/events/types/"),
   getById: (
@@ -859,8 +871,10 @@ export const attendanceApi = {
     person?: string;
     occurrence_date?: string;
     status?: AttendanceStatus;
+    page?: number;
+    page_size?: number;
   }) =>
-    api.get<EventAttendanceRecord[]>("/attendance/", {
+    api.get<PaginatedResponse<EventAttendanceRecord>>("/attendance/", {
       params,
     }),
   byEvent: (eventId: string, params?: { occurrence_date?: string }) =>
@@ -886,7 +900,8 @@ export const attendanceApi = {
 };
 
 export const journeysApi = {
-  getAll: () => api.get<Journey[]>("/people/journeys/"),
+  getAll: (params?: { page?: number; page_size?: number }) =>
+    api.get<PaginatedResponse<Journey>>("/people/journeys/", { params }),
   getById: (id: string) => api.get<Journey>(`/people/journeys/${id}/`),
   create: (data: Partial<Journey>) =>
     api.post<Journey>("/people/journeys/", data),
@@ -894,7 +909,9 @@ export const journeysApi = {
     api.put<Journey>(`/people/journeys/${id}/`, data),
   delete: (id: string) => api.delete(`/people/journeys/${id}/`),
   getByUser: (userId: string) =>
-    api.get<Journey[]>(`/people/journeys/?user=${userId}`),
+    api.get<Journey[]>("/people/journeys/", {
+      params: allRows({ user: userId }),
+    }),
 };
 
 export const lessonsApi = {
@@ -914,7 +931,7 @@ export const lessonsApi = {
     branch_id?: string | number;
   }) =>
     api.get<PersonLessonProgress[]>("/lessons/progress/", {
-      params,
+      params: allRows(params),
     }),
   updateProgress: (id: number | string, data: Partial<PersonLessonProgress>) =>
     api.patch<PersonLessonProgress>(`/lessons/progress/${id}/`, data),
@@ -922,13 +939,25 @@ export const lessonsApi = {
     lesson_id: number | string;
     person_ids: Array<number | string>;
     teacher_id?: number | string;
-  }) => api.post<{ created: number }>("/lessons/progress/assign/", payload),
+  }) =>
+    api.post<{
+      created: number;
+      enrollments_created: number;
+      changes: Array<{
+        person: number;
+        enrollment_created: boolean;
+        progress: "created" | "reactivated" | "updated" | "unchanged";
+        fields: Record<string, [unknown, unknown]>;
+      }>;
+    }>("/lessons/progress/assign/", payload),
   listEnrollments: (params?: {
     student?: string | number;
     teacher?: string | number;
     branch_id?: string | number;
   }) =>
-    api.get<LessonStudentEnrollment[]>("/lessons/enrollments/", { params }),
+    api.get<LessonStudentEnrollment[]>("/lessons/enrollments/", {
+      params: allRows(params),
+    }),
   createEnrollment: (payload: {
     student_id: number | string;
     teacher_id: number | string;
@@ -980,7 +1009,10 @@ export const lessonsApi = {
     date_from?: string;
     date_to?: string;
     branch_id?: string | number;
-  }) => api.get<LessonSessionReport[]>("/lessons/session-reports/", { params }),
+  }) =>
+    api.get<LessonSessionReport[]>("/lessons/session-reports/", {
+      params: allRows(params),
+    }),
   getSessionReport: (id: number | string) =>
     api.get<LessonSessionReport>(`/lessons/session-reports/${id}/`),
   createSessionReport: (payload: LessonSessionReportInput) =>
@@ -1009,7 +1041,7 @@ export const ministriesApi = {
     activity_cadence?: string;
     category?: string;
     is_active?: boolean;
-  }) => api.get<Ministry[]>("/ministries/", { params }),
+  }) => api.get<Ministry[]>("/ministries/", { params: allRows(params) }),
   retrieve: (id: number | string) => api.get<Ministry>(`/ministries/${id}/`),
   create: (data: MinistryCreateInput) =>
     api.post<Ministry>("/ministries/", data),
@@ -1025,7 +1057,12 @@ export const ministryMembersApi = {
     ministry?: number | string;
     role?: string;
     is_active?: boolean;
-  }) => api.get<MinistryMember[]>("/ministries/members/", { params }),
+    page?: number;
+    page_size?: number;
+  }) =>
+    api.get<PaginatedResponse<MinistryMember>>("/ministries/members/", {
+      params,
+    }),
   create: (data: Partial<MinistryMember>) =>
     api.post<MinistryMember>("/ministries/members/", data),
   update: (id: number | string, data: Partial<MinistryMember>) =>
@@ -1159,11 +1196,19 @@ const toPledgeContributionPayload = (
 });
 
 export const financeApi = {
-  listDonations: (params?: { start?: string; end?: string }) =>
+  listDonations: (params?: {
+    start?: string;
+    end?: string;
+    page?: number;
+    page_size?: number;
+  }) =>
     api
-      .get("/finance/donations/", { params })
+      .get<PaginatedResponse<any>>("/finance/donations/", { params })
       .then(
-        (response) => (response.data as any[]).map(mapDonation) as Donation[]
+        (response): PaginatedResponse<Donation> => ({
+          ...response.data,
+          results: response.data.results.map(mapDonation),
+        })
       ),
   createDonation: (payload: Partial<Donation>) =>
     api
@@ -1184,7 +1229,7 @@ export const financeApi = {
     })),
   listOfferings: (params?: { start?: string; end?: string }) =>
     api
-      .get("/finance/offerings/", { params })
+      .get("/finance/offerings/", { params: allRows(params) })
       .then(
         (response) => (response.data as any[]).map(mapOffering) as Offering[]
       ),
@@ -1211,11 +1256,13 @@ export const financeApi = {
   listPledges: (params?: { status?: PledgeStatus | PledgeStatus[] }) =>
     api
       .get("/finance/pledges/", {
-        params: Array.isArray(params?.status)
-          ? { status: params?.status }
-          : params?.status
-          ? { status: [params.status] }
-          : undefined,
+        params: allRows(
+          Array.isArray(params?.status)
+            ? { status: params?.status }
+            : params?.status
+            ? { status: [params.status] }
+            : undefined
+        ),
       })
       .then((response) => (response.data as any[]).map(mapPledge) as Pledge[]),
   createPledge: (payload: Partial<Pledge>) =>
@@ -1230,7 +1277,7 @@ export const financeApi = {
   listPledgeContributions: (pledgeId: number | string) =>
     api
       .get("/finance/pledge-contributions/", {
-        params: { pledge: pledgeId },
+        params: allRows({ pledge: pledgeId }),
       })
       .then((response) => {
         const data = response.data;
@@ -1242,7 +1289,7 @@ export const financeApi = {
       }),
   listAllPledgeContributions: (params?: { start?: string; end?: string }) =>
     api
-      .get("/finance/pledge-contributions/", { params })
+      .get("/finance/pledge-contributions/", { params: allRows(params) })
       .then(
         (response) =>
           (response.data as any[]).map(
@@ -1317,7 +1364,10 @@ export const sundaySchoolApi = {
     search?: string;
     branch_id?: number | string;
     branch?: number | string;
-  }) => api.get<SundaySchoolClass[]>("/sunday-school/classes/", { params }),
+  }) =>
+    api.get<SundaySchoolClass[]>("/sunday-school/classes/", {
+      params: allRows(params),
+    }),
   getClass: (id: number | string) =>
     api.get<SundaySchoolClass>(`/sunday-school/classes/${id}/`),
   createClass: (data: Partial<SundaySchoolClass>) =>
@@ -1353,7 +1403,13 @@ export const sundaySchoolApi = {
     api.get<SundaySchoolSummary>("/sunday-school/classes/summary/", {
       params,
     }),
-  unenrolledByCategory: (params?: { status?: string; role?: string }) =>
+  unenrolledByCategory: (params?: {
+    status?: string;
+    role?: string;
+    category?: number;
+    page?: number;
+    page_size?: number;
+  }) =>
     api.get<UnenrolledByCategory[]>(
       "/sunday-school/classes/unenrolled_by_category/",
       { params }
@@ -1364,8 +1420,12 @@ export const sundaySchoolApi = {
     sunday_school_class?: number | string;
     role?: string;
     is_active?: boolean;
+    page?: number;
+    page_size?: number;
   }) =>
-    api.get<SundaySchoolClassMember[]>("/sunday-school/members/", { params }),
+    api.get<PaginatedResponse<SundaySchoolClassMember>>("/sunday-school/members/", {
+      params,
+    }),
   getMember: (id: number | string) =>
     api.get<SundaySchoolClassMember>(`/sunday-school/members/${id}/`),
   createMember: (data: Partial<SundaySchoolClassMember>) =>
@@ -1380,7 +1440,12 @@ export const sundaySchoolApi = {
     sunday_school_class?: number | string;
     session_date?: string;
     search?: string;
-  }) => api.get<SundaySchoolSession[]>("/sunday-school/sessions/", { params }),
+    page?: number;
+    page_size?: number;
+  }) =>
+    api.get<PaginatedResponse<SundaySchoolSession>>("/sunday-school/sessions/", {
+      params,
+    }),
   getSession: (id: number | string) =>
     api.get<SundaySchoolSession>(`/sunday-school/sessions/${id}/`),
   createSession: (data: Partial<SundaySchoolSession>) =>
@@ -1415,7 +1480,7 @@ export const evangelismApi = {
   ): Promise<AxiosResponse<EvangelismGroup[]>> => {
     const response = await api.get<
       EvangelismGroup[] | { results: EvangelismGroup[] }
-    >("/evangelism/groups/", { params, ...config });
+    >("/evangelism/groups/", { params: allRows(params), ...config });
     const raw = response.data;
     const rows = Array.isArray(raw) ? raw : raw.results;
     return {
@@ -1448,8 +1513,8 @@ export const evangelismApi = {
     api.get<Prospect[]>(`/evangelism/groups/${groupId}/visitors/`),
   getGroupSummary: (groupId: number | string) =>
     api.get<any>(`/evangelism/groups/${groupId}/summary/`),
-  getBibleSharersCoverage: () =>
-    api.get<BibleSharersCoverage>("/evangelism/groups/bible_sharers_coverage/"),
+  getBibleSharersCoverage: (params?: { branch?: number }) =>
+    api.get<BibleSharersCoverage>("/evangelism/groups/bible_sharers_coverage/", { params }),
   getDashboardStats: (params?: { year?: number }) =>
     api.get<EvangelismSummary>("/evangelism/groups/dashboard-stats/", { params }),
 
@@ -1458,7 +1523,12 @@ export const evangelismApi = {
     evangelism_group?: number | string;
     session_date?: string;
     search?: string;
-  }) => api.get<EvangelismSession[]>("/evangelism/sessions/", { params }),
+    page?: number;
+    page_size?: number;
+  }) =>
+    api.get<PaginatedResponse<EvangelismSession>>("/evangelism/sessions/", {
+      params,
+    }),
   getSession: (id: number | string) =>
     api.get<EvangelismSession>(`/evangelism/sessions/${id}/`),
   createSession: (data: Partial<EvangelismSession>) =>
@@ -1580,7 +1650,8 @@ export const evangelismApi = {
     search?: string;
     page?: number;
     page_size?: number;
-  }) => api.get<Prospect[]>("/evangelism/prospects/", { params }),
+  }) =>
+    api.get<Prospect[]>("/evangelism/prospects/", { params: allRows(params) }),
   getProspect: (id: number | string) =>
     api.get<Prospect>(`/evangelism/prospects/${id}/`),
   createProspect: (data: Partial<Prospect>) =>
@@ -1628,7 +1699,12 @@ export const evangelismApi = {
     assigned_to?: number | string;
     status?: string;
     priority?: string;
-  }) => api.get<FollowUpTask[]>("/evangelism/follow-up-tasks/", { params }),
+    page?: number;
+    page_size?: number;
+  }) =>
+    api.get<PaginatedResponse<FollowUpTask>>("/evangelism/follow-up-tasks/", {
+      params,
+    }),
   getFollowUpTask: (id: number | string) =>
     api.get<FollowUpTask>(`/evangelism/follow-up-tasks/${id}/`),
   createFollowUpTask: (data: Partial<FollowUpTask>) =>
@@ -1649,7 +1725,10 @@ export const evangelismApi = {
     recovered?: boolean;
     start_date?: string;
     end_date?: string;
-  }) => api.get<DropOff[]>("/evangelism/drop-offs/", { params }),
+    page?: number;
+    page_size?: number;
+  }) =>
+    api.get<PaginatedResponse<DropOff>>("/evangelism/drop-offs/", { params }),
   getDropOff: (id: number | string) =>
     api.get<DropOff>(`/evangelism/drop-offs/${id}/`),
   recoverDropOff: (id: number | string) =>
@@ -1663,7 +1742,10 @@ export const evangelismApi = {
     cluster?: number | string;
     evangelism_group?: number | string;
     year?: number;
-  }) => api.get<Conversion[]>("/evangelism/conversions/", { params }),
+  }) =>
+    api.get<Conversion[]>("/evangelism/conversions/", {
+      params: allRows(params),
+    }),
   getConversion: (id: number | string) =>
     api.get<Conversion>(`/evangelism/conversions/${id}/`),
   createConversion: (data: ConversionWritePayload) =>
@@ -1679,8 +1761,10 @@ export const evangelismApi = {
     year?: number;
     month?: number;
     stage?: string;
+    page?: number;
+    page_size?: number;
   }) =>
-    api.get<MonthlyConversionTracking[]>("/evangelism/monthly-tracking/", {
+    api.get<PaginatedResponse<MonthlyConversionTracking>>("/evangelism/monthly-tracking/", {
       params,
     }),
   getMonthlyStatistics: (params?: {
@@ -1992,6 +2076,7 @@ export const reportsApi = {
     status?: string;
     min_compliance_rate?: number;
     coordinator_id?: number;
+    compare_years?: number;
   }) => api.get<ComplianceData>("/reports/compliance/", { params }),
   getComplianceOverdue: (params?: { branch_id?: number | string }) =>
     api.get<OverdueClusters>("/reports/compliance/overdue/", { params }),
@@ -2031,6 +2116,7 @@ export const reportsApi = {
   getPeopleSummary: (params?: {
     branch_id?: number | string;
     months?: number;
+    compare_years?: number;
   }) => api.get<PeopleSummary>("/reports/people/summary/", { params }),
   exportPeopleCSV: (params?: {
     branch_id?: number | string;
@@ -2043,6 +2129,7 @@ export const reportsApi = {
   getEngagementSummary: (params?: {
     branch_id?: number | string;
     months?: number;
+    compare_years?: number;
   }) => api.get<EngagementSummary>("/reports/engagement/summary/", { params }),
   exportEngagementCSV: (params?: {
     branch_id?: number | string;
@@ -2073,14 +2160,22 @@ export const reportsApi = {
       params,
       responseType: "blob",
     }),
-  getV2bSummary: (params?: { branch_id?: number | string; year?: number }) =>
+  getV2bSummary: (params?: {
+    branch_id?: number | string;
+    year?: number;
+    compare_years?: number;
+  }) =>
     api.get<V2bSummary>("/reports/v2b/summary/", { params }),
   exportV2bCSV: (params?: { branch_id?: number | string; year?: number }) =>
     api.get("/reports/v2b/export/csv/", {
       params,
       responseType: "blob",
     }),
-  getStewardshipSummary: (params?: { branch_id?: number | string; year?: number }) =>
+  getStewardshipSummary: (params?: {
+    branch_id?: number | string;
+    year?: number;
+    compare_years?: number;
+  }) =>
     api.get<StewardshipSummary>("/reports/stewardship/summary/", { params }),
   exportStewardshipCSV: (params?: { branch_id?: number | string; year?: number }) =>
     api.get("/reports/stewardship/export/csv/", {
@@ -299,6 +299,8 @@ export interface ComplianceData {
     non_compliant: ClusterCompliance[];
     partial: ClusterCompliance[];
   };
+  /** Reports hub only: same window 1..compare_years years earlier. */
+  comparisons?: ComplianceSummary[];
 }
 
 export interface ComplianceHistoryPoint {
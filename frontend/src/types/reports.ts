@@ -67,6 +67,18 @@ export interface PeopleSummary {
   by_entry_channel: PeopleBreakdownItem[];
   by_branch: PeopleBranchBreakdownItem[];
   baptism_trend: PeopleBaptismTrend;
+  /** Same months 1..compare_years years earlier (empty unless requested). */
+  comparisons: PeopleComparison[];
+}
+
+export interface PeopleComparison {
+  period_start: string;
+  period_end: string;
+  summary: {
+    water_baptisms: number;
+    spirit_baptisms: number;
+  };
+  baptism_trend: PeopleBaptismTrend;
 }
 
 export interface EngagementSummaryKpis {
@@ -160,6 +172,19 @@ export interface EngagementSummary {
   evangelism: EngagementEvangelismSection;
   service: EngagementServiceSection;
   by_branch: EngagementBranchRow[];
+  /** Same window 1..compare_years years earlier (empty unless requested). */
+  comparisons: EngagementComparison[];
+}
+
+export interface EngagementComparison {
+  period_start: string;
+  period_end: string;
+  summary: EngagementSummaryKpis;
+  monthly_trend: {
+    cluster: EngagementMonthlyTrendPoint[];
+    evangelism: EngagementMonthlyTrendPoint[];
+    service: EngagementServiceTrendPoint[];
+  };
 }
 
 export type NccProgressStatus =
@@ -278,6 +303,17 @@ export interface V2bSummary {
   monthly_trend: V2bMonthlyTrendPoint[];
   leakage: V2bLeakageSection;
   by_cluster: V2bClusterRow[];
+  /** Preceding years, most recent first (empty unless compare_years is set). */
+  comparisons: V2bComparison[];
+}
+
+export interface V2bComparison {
+  year: number;
+  summary: Pick<
+    V2bSummaryKpis,
+    "completed_conversions" | "total_reached" | "drop_offs" | "recovery_rate"
+  >;
+  monthly_trend: V2bMonthlyTrendPoint[];
 }
 
 export interface StewardshipSummaryKpis {
@@ -328,6 +364,17 @@ export interface StewardshipSummary {
   offerings_weekly: StewardshipOfferingWeeklyRow[];
   monthly_trend: StewardshipMonthlyTrendPoint[];
   pledges: StewardshipPledgeRow[];
+  /** Preceding years, most recent first (empty unless compare_years is set). */
+  comparisons: StewardshipComparison[];
+}
+
+export interface StewardshipComparison {
+  year: number;
+  summary: Omit<
+    StewardshipSummaryKpis,
+    "total_pledged" | "outstanding_balance" | "includes_offerings"
+  >;
+  monthly_trend: StewardshipMonthlyTrendPoint[];
 }
 
 export type OverviewModuleTab =
@@ -91,6 +91,8 @@ export interface UnenrolledByCategory {
   age_range: string;
   unenrolled_count: number;
   unenrolled_people: UnenrolledPerson[];
+  page: number;
+  has_more: boolean;
 }
 
 export interface SundaySchoolSummary {